@@ -0,0 +1,138 @@
+"""Benchmark split-APK extraction against a throttled fake adb.
+
+Usage:
+    python scripts/benchmark_apk_extraction.py [--splits 8] [--split-mb 25] [--rate-mb 40]
+
+The fake adb serves ``pm path``, ``sha256sum``, ``exec-out cat`` and ``pull``
+for a synthetic split install, limiting each transfer to ``--rate-mb`` MB/s
+to mimic adb's per-stream throughput. The script times the previous
+approach (sequential ``adb pull`` to per-split files, then re-zipping with
+deflate) against MobSFManager.extract_apk_from_device with a cold and a
+warm APK store.
+"""
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from unittest.mock import Mock
+
+FAKE_ADB = """#!{python}
+import hashlib, os, shutil, sys, time
+ROOT, RATE = {root!r}, {rate!r}
+args = sys.argv[1:]
+if args[:1] == ["-s"]:
+    args = args[2:]
+def local(path):
+    return os.path.join(ROOT, os.path.basename(path))
+def copy(src, dst):
+    started = time.monotonic()
+    sent = 0
+    with open(src, "rb") as f:
+        while chunk := f.read(1 << 20):
+            dst.write(chunk)
+            sent += len(chunk)
+            ahead = sent / RATE - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+if args[:3] == ["shell", "pm", "path"]:
+    for name in sorted(os.listdir(ROOT)):
+        print(f"package:/data/app/{{args[3]}}-1/{{name}}")
+elif args[:2] == ["shell", "sha256sum"]:
+    for path in args[2:]:
+        digest = hashlib.sha256()
+        with open(local(path), "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+        print(digest.hexdigest() + "  " + path)
+elif args[:2] == ["exec-out", "cat"]:
+    copy(local(args[2]), sys.stdout.buffer)
+elif args[:1] == ["pull"]:
+    with open(args[2], "wb") as out:
+        copy(local(args[1]), out)
+else:
+    sys.exit(1)
+"""
+
+
+def make_fake_device(workdir, splits, split_mb, rate_mb):
+    device_dir = os.path.join(workdir, "device")
+    os.makedirs(device_dir)
+    for index in range(splits):
+        name = "base.apk" if index == 0 else f"split_config.part{index}.apk"
+        with open(os.path.join(device_dir, name), "wb") as f:
+            for _ in range(split_mb):
+                f.write(os.urandom(1024 * 1024))
+    adb_path = os.path.join(workdir, "adb")
+    with open(adb_path, "w") as f:
+        f.write(FAKE_ADB.format(python=sys.executable, root=device_dir, rate=rate_mb * 1024 * 1024))
+    os.chmod(adb_path, 0o755)
+    return adb_path
+
+
+def legacy_extract(adb_path, package_name, output_dir):
+    """The pre-store implementation: sequential pulls, then a deflated archive."""
+    result = subprocess.run([adb_path, "shell", "pm", "path", package_name], capture_output=True, text=True)
+    apk_paths = [p.strip() for p in re.findall(r"package:(.*)", result.stdout) if p.strip()]
+    pulled = []
+    for index, remote_apk in enumerate(apk_paths):
+        local_apk = os.path.join(output_dir, f"{index:02d}_{os.path.basename(remote_apk)}")
+        subprocess.run([adb_path, "pull", remote_apk, local_apk], check=True, capture_output=True)
+        pulled.append(local_apk)
+    archive_path = os.path.join(output_dir, f"{package_name}.apks")
+    with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path in pulled:
+            archive.write(path, arcname=os.path.basename(path))
+    return archive_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--splits", type=int, default=8)
+    parser.add_argument("--split-mb", type=int, default=25)
+    parser.add_argument("--rate-mb", type=int, default=40, help="Per-transfer throughput in MB/s")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    from mobile_crawler.infrastructure.mobsf_manager import MobSFManager
+
+    workdir = tempfile.mkdtemp()
+    try:
+        adb_path = make_fake_device(workdir, args.splits, args.split_mb, args.rate_mb)
+        settings = {
+            "enable_mobsf_analysis": True,
+            "mobsf_api_url": "http://localhost:8000",
+            "adb_executable_path": adb_path,
+            "mobsf_apk_store_dir": os.path.join(workdir, "store"),
+            "mobsf_apk_pull_workers": args.workers,
+        }
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        manager = MobSFManager(config_manager=config)
+        package = "com.example.bench"
+
+        print(f"{args.splits} splits x {args.split_mb} MB at {args.rate_mb} MB/s per transfer")
+        runs = [
+            ("sequential pull + deflate", lambda out: legacy_extract(adb_path, package, out)),
+            (f"store, cold, {args.workers} workers", lambda out: manager.extract_apk_from_device(package, out)),
+            ("store, warm", lambda out: manager.extract_apk_from_device(package, out)),
+        ]
+        for index, (label, extract) in enumerate(runs):
+            output_dir = os.path.join(workdir, f"out{index}")
+            os.makedirs(output_dir)
+            start = time.perf_counter()
+            archive = extract(output_dir)
+            elapsed = time.perf_counter() - start
+            size_mb = os.path.getsize(archive) / 1e6
+            print(f"{label:<28} {elapsed:8.2f}s {size_mb:9.1f} MB archive")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Benchmark relational element queries on a large synthetic a11y tree.
+
+Usage:
+    python scripts/benchmark_element_search.py [--rows 1250] [--repeat 5]
+
+Builds a scrolling list of ``--rows`` rows under one root, each row a
+clickable container with a title, a subtitle and an icon (5k nodes at the
+default). Runs spatial and hierarchy filters, alone and composed, with the
+previous flatten-and-rescan implementation and with the spatial index, and
+checks that both return the same nodes in the same order. The
+``clickable | below`` query feeds a list holding rows and their own icons,
+as compose() does after a trait filter. Index build time
+is reported separately since it is paid once per UI state.
+"""
+
+import argparse
+import time
+
+
+def build_tree(rows: int) -> dict:
+    row_height = 120
+    children = []
+    for i in range(rows):
+        top = 200 + i * row_height
+        row = {
+            "className": "android.widget.LinearLayout",
+            "resourceId": "com.example:id/row",
+            "isClickable": True,
+            "boundsInScreen": {"left": 0, "top": top, "right": 1080, "bottom": top + row_height},
+            "children": [
+                {
+                    "className": "android.widget.TextView",
+                    "resourceId": "com.example:id/title",
+                    "text": f"Item {i}",
+                    "boundsInScreen": {"left": 160, "top": top + 10, "right": 900, "bottom": top + 60},
+                    "children": [],
+                },
+                {
+                    "className": "android.widget.TextView",
+                    "resourceId": "com.example:id/subtitle",
+                    "text": f"Details for item {i}",
+                    "boundsInScreen": {"left": 160, "top": top + 64, "right": 900, "bottom": top + 110},
+                    "children": [],
+                },
+                {
+                    "className": "android.widget.ImageView",
+                    "resourceId": "com.example:id/icon",
+                    "contentDescription": "Open",
+                    "isClickable": True,
+                    "boundsInScreen": {"left": 940, "top": top + 30, "right": 1040, "bottom": top + 90},
+                    "children": [],
+                },
+            ],
+        }
+        children.append(row)
+    return {
+        "className": "androidx.recyclerview.widget.RecyclerView",
+        "boundsInScreen": {"left": 0, "top": 200, "right": 1080, "bottom": 200 + rows * row_height},
+        "children": children,
+    }
+
+
+def legacy_filters():
+    """The pre-index spatial and hierarchy filters: flatten, then scan every node."""
+
+    def flatten(nodes):
+        def walk(root):
+            results = [root]
+            for child in root.get("children", []):
+                results.extend(walk(child))
+            return results
+
+        all_nodes = []
+        for node in nodes:
+            all_nodes.extend(walk(node))
+        return all_nodes
+
+    def center(node):
+        b = node.get("boundsInScreen", {})
+        return ((b.get("left", 0) + b.get("right", 0)) // 2, (b.get("top", 0) + b.get("bottom", 0)) // 2)
+
+    def relative(anchor_filter, test):
+        def filter_fn(nodes):
+            anchors = anchor_filter(nodes)
+            if not anchors:
+                return []
+            anchor = anchors[0]
+            ax, ay = center(anchor)
+            candidates = []
+            for node in flatten(nodes):
+                if node != anchor and test(node.get("boundsInScreen", {}), anchor.get("boundsInScreen", {})):
+                    x, y = center(node)
+                    candidates.append((((x - ax) ** 2 + (y - ay) ** 2) ** 0.5, node))
+            candidates.sort(key=lambda c: c[0])
+            return [node for _, node in candidates]
+
+        return filter_fn
+
+    def text_matches(text):
+        fields = ("text", "contentDescription", "hint")
+        return lambda nodes: [
+            n for n in flatten(nodes) if any(text.lower() in (n.get(f) or "").lower() for f in fields)
+        ]
+
+    def contains_child(child_filter):
+        return lambda nodes: [
+            n for n in flatten(nodes) if n.get("children") and child_filter(n["children"])
+        ]
+
+    return {
+        "text_matches": text_matches,
+        "below": lambda f: relative(f, lambda b, a: b.get("top", 0) > a.get("bottom", 0)),
+        "left_of": lambda f: relative(f, lambda b, a: b.get("right", 0) < a.get("left", 0)),
+        "contains_child": contains_child,
+    }
+
+
+def queries(text_matches, below, left_of, contains_child, rows):
+    target = f"Item {rows // 2}"
+
+    def clickable(nodes):
+        # Rows and their icons: the overlapping input a compose() pipeline produces
+        return [n for n in nodes[0]["children"] if n.get("isClickable")] + [
+            c for n in nodes[0]["children"] for c in n["children"] if c.get("isClickable")
+        ]
+
+    def below_clickable(nodes):
+        return below(text_matches(target))(clickable(nodes))
+
+    return {
+        "below(text)": below(text_matches(target)),
+        "clickable | below(text)": below_clickable,
+        "left_of(text)": left_of(text_matches("Open")),
+        "contains_child(text)": contains_child(text_matches(target)),
+        "contains_child(below(text))": contains_child(below(text_matches(f"Item {rows - 3}"))),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1250, help="List rows (4 nodes each)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from mobile_crawler.domain.crawler_agent.tools.helpers.element_search import Filters, SpatialIndex
+
+    tree = build_tree(args.rows)
+    nodes = [tree]
+
+    start = time.perf_counter()
+    index = SpatialIndex(nodes)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"nodes: {len(index)}  index build: {build_ms:.1f}ms (once per UI state)")
+
+    old = queries(rows=args.rows, **legacy_filters())
+    new = queries(Filters.text_matches, Filters.below, Filters.left_of, Filters.contains_child, args.rows)
+
+    print(f"{'query':<30} {'scan':>10} {'indexed':>10} {'speedup':>8}")
+    for name in old:
+        # contains_child(below(...)) rescans per node; one run is plenty for the baseline
+        repeat = 1 if name.startswith("contains_child(below") else args.repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            expected = old[name](nodes)
+        scan = (time.perf_counter() - start) / repeat
+
+        new[name](nodes)  # warm the index cache, as the second filter on a UI state would
+        start = time.perf_counter()
+        for _ in range(repeat):
+            actual = new[name](nodes)
+        indexed = (time.perf_counter() - start) / repeat
+
+        same = [id(n) for n in expected] == [id(n) for n in actual]
+        print(f"{name:<30} {scan * 1000:>8.1f}ms {indexed * 1000:>8.1f}ms {scan / indexed:>7.1f}x"
+              f"{'' if same else '  MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
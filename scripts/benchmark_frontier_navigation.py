@@ -0,0 +1,134 @@
+"""Benchmark LLM steps saved by frontier navigation on a simulated app.
+
+Usage:
+    python scripts/benchmark_frontier_navigation.py [--screens 60] [--elements 5] [--flaky 0.05]
+
+Builds a random app of N screens, each with K clickable elements leading
+to other screens, and explores it until every element has been tried or
+the step budget runs out. Each agent step costs one manager and one
+executor LLM call. On an exhausted screen the baseline agent walks back to
+the nearest screen with untried elements one LLM step per hop (assuming
+it always picks the shortest path). The navigator run replays that path
+through FrontierNavigator instead. ``--flaky`` is the chance that a
+replayed hop lands somewhere unexpected, which exercises the hand-back to
+the agent.
+"""
+
+import argparse
+import asyncio
+import random
+from types import SimpleNamespace
+
+LLM_CALLS_PER_STEP = 2
+
+
+class SimulatedApp:
+    def __init__(self, screens: int, elements: int, flaky: float, rng: random.Random):
+        self.targets = {s: [rng.randrange(screens) for _ in range(elements)] for s in range(screens)}
+        self.elements = elements
+        self.flaky = flaky
+        self.rng = rng
+        self.screen = 0
+        self.replaying = False
+
+    def tap(self, index: int) -> None:
+        self.screen = self.targets[self.screen][index]
+        if self.replaying and self.rng.random() < self.flaky:
+            self.screen = self.rng.randrange(len(self.targets))
+
+    def ui_state(self):
+        return SimpleNamespace(
+            layout_hash=f"screen{self.screen}",
+            phone_state={"packageName": "com.example.app", "currentApp": "Main"},
+            elements=[{"index": i} for i in range(self.elements)],
+        )
+
+
+def explore(args, use_navigator: bool) -> dict[str, int]:
+    from mobile_crawler.domain.frontier_navigator import FrontierNavigator
+    from mobile_crawler.domain.state_graph import StateGraphTracker, count_clickable
+
+    rng = random.Random(args.seed)
+    app = SimulatedApp(args.screens, args.elements, args.flaky, rng)
+    tracker = StateGraphTracker(run_id=1)
+    tried: dict[str, set[int]] = {}
+
+    async def execute(command):
+        app.replaying = True
+        app.tap(command["index"])
+        app.replaying = False
+        return True
+
+    async def capture():
+        return app.ui_state()
+
+    navigator = FrontierNavigator(tracker, execute, capture, max_hops=args.max_hops)
+    steps = 0
+    walk_back_steps = 0
+
+    def record(from_hash, command):
+        state = app.ui_state()
+        if from_hash is not None:
+            tracker.record_transition(from_hash, state.layout_hash, command, steps, duration_ms=rng.uniform(150, 600))
+        tracker.record_state(state.layout_hash, steps, "com.example.app", "Main", count_clickable(state.elements))
+        return state.layout_hash
+
+    current = record(None, None)
+    while steps < args.max_steps:
+        untried = [i for i in range(args.elements) if i not in tried.setdefault(current, set())]
+        if untried:
+            index = untried[0]
+            tried[current].add(index)
+            app.tap(index)
+            steps += 1
+            current = record(current, {"action": "click", "index": index})
+            continue
+
+        path = tracker.path_to_frontier(current)
+        if path is None:
+            break
+        if use_navigator:
+            result = asyncio.run(navigator.navigate(current, steps))
+            current = result.final_state.layout_hash
+        else:
+            # The agent finds the same path, but each hop is a full LLM step
+            hop = path[0]
+            app.tap(hop["command"]["index"])
+            steps += 1
+            walk_back_steps += 1
+            current = record(current, hop["command"])
+
+    return {
+        "agent_steps": steps,
+        "llm_calls": steps * LLM_CALLS_PER_STEP,
+        "walk_back_steps": walk_back_steps,
+        "replayed_hops": navigator.total_hops,
+        "divergences": navigator.total_divergences,
+        "elements_tried": sum(len(v) for v in tried.values()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--screens", type=int, default=60)
+    parser.add_argument("--elements", type=int, default=5, help="Clickable elements per screen")
+    parser.add_argument("--flaky", type=float, default=0.05, help="Chance a replayed hop diverges")
+    parser.add_argument("--max-hops", type=int, default=6)
+    parser.add_argument("--max-steps", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    baseline = explore(args, use_navigator=False)
+    navigated = explore(args, use_navigator=True)
+
+    print(f"{args.screens} screens x {args.elements} elements, flaky={args.flaky}, max hops={args.max_hops}")
+    print(f"{'':>10}  {'tried':>6}  {'steps':>6}  {'LLM calls':>9}  {'walk-back':>9}  {'replayed':>8}  {'diverged':>8}")
+    for name, r in (("agent", baseline), ("navigator", navigated)):
+        print(f"{name:>10}  {r['elements_tried']:>6}  {r['agent_steps']:>6}  {r['llm_calls']:>9}  "
+              f"{r['walk_back_steps']:>9}  {r['replayed_hops']:>8}  {r['divergences']:>8}")
+    saved = baseline["llm_calls"] - navigated["llm_calls"]
+    print(f"LLM calls saved: {saved} ({saved / max(baseline['llm_calls'], 1):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Benchmark per-screen grounding latency with and without the OCR worker.
+
+Usage:
+    python scripts/benchmark_grounding.py [FIXTURE_DIR] [--screens 20] [--repeat 1]
+
+FIXTURE_DIR should contain PNG screenshots; without it a synthetic set of
+phone-sized screens with rows of labelled buttons is generated. The script
+times GroundingManager with the previous in-process engine (EasyOCR built
+with gpu=True, one recognizer pass per text crop, screenshot re-read from
+disk for OCR, drawing and sizing) against the persistent worker fed
+in-memory bytes with batched recognition. Model loading is reported
+separately from the per-screen numbers, and so is the crawler-side cost of
+importing the grounding package (which should not pull in easyocr or
+torch; only the worker process loads them). EasyOCR downloads its models
+on first use, so the first run needs network access.
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+
+def make_fixture_screens(output_dir, count):
+    try:
+        font = ImageFont.truetype("DejaVuSans.ttf", 34)
+    except OSError:
+        font = ImageFont.load_default()
+    paths = []
+    for index in range(count):
+        img = Image.new("RGB", (1080, 2400), color=(250, 250, 250))
+        draw = ImageDraw.Draw(img)
+        for row in range(12):
+            y = 150 + row * 180
+            draw.rectangle((60, y, 1020, y + 120), outline=(200, 200, 200), fill=(255, 255, 255))
+            draw.text((100, y + 40), f"Screen {index} item {row}: Settings", fill=(20, 20, 20), font=font)
+        path = os.path.join(output_dir, f"screen_{index:03d}.png")
+        img.save(path)
+        paths.append(path)
+    return paths
+
+
+class LegacyEngine:
+    """The pre-worker engine: GPU requested unconditionally, batch_size=1, file input."""
+
+    def __init__(self):
+        import easyocr
+
+        self.reader = easyocr.Reader(["en"], gpu=True)
+
+    def detect_text(self, image_path):
+        from mobile_crawler.domain.grounding.ocr_engine import to_ocr_results
+
+        return to_ocr_results(self.reader.readtext(image_path))
+
+
+def legacy_process(manager, screenshot_path):
+    """The pre-worker pipeline: OCR, drawing and sizing each re-open the file."""
+    results = manager.ocr_engine.detect_text(screenshot_path)
+    manager.mapper.assign_labels(results)
+    base, ext = os.path.splitext(screenshot_path)
+    manager.drawer.draw(screenshot_path, results, f"{base}_grounded{ext}")
+    with Image.open(screenshot_path) as img:
+        return img.size
+
+
+def time_grounding_import():
+    """Import the grounding package in a fresh interpreter, as the crawler does."""
+    code = (
+        "import sys, time; start = time.perf_counter(); import mobile_crawler.domain.grounding; "
+        "print(time.perf_counter() - start, 'easyocr' in sys.modules, 'torch' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    seconds, easyocr_loaded, torch_loaded = output.stdout.split()
+    print(f"{'grounding import (crawler side)':<34} {float(seconds):8.2f} s "
+          f"(easyocr={easyocr_loaded}, torch={torch_loaded})")
+
+
+def time_screens(label, process, screens, repeat):
+    timings = []
+    for _ in range(repeat):
+        for path in screens:
+            start = time.perf_counter()
+            process(path)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{label:<34} median {statistics.median(timings):8.1f} ms   p95 {p95:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture_dir", nargs="?")
+    parser.add_argument("--screens", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    from mobile_crawler.domain.grounding.manager import GroundingManager
+    from mobile_crawler.domain.grounding.ocr_worker import WorkerOCREngine
+
+    workdir = tempfile.mkdtemp()
+    try:
+        if args.fixture_dir:
+            screens = sorted(glob.glob(os.path.join(args.fixture_dir, "*.png")))[:args.screens]
+            copied = []
+            for path in screens:
+                target = os.path.join(workdir, os.path.basename(path))
+                shutil.copyfile(path, target)
+                copied.append(target)
+            screens = copied
+        else:
+            screens = make_fixture_screens(workdir, args.screens)
+        if not screens:
+            sys.exit("No PNG screenshots found")
+        print(f"{len(screens)} screens x {args.repeat}")
+        time_grounding_import()
+
+        start = time.perf_counter()
+        legacy = GroundingManager(ocr_engine=LegacyEngine())
+        print(f"{'in-process model load':<34} {time.perf_counter() - start:8.2f} s")
+        time_screens("in-process, file round trips", lambda p: legacy_process(legacy, p), screens, args.repeat)
+
+        engine = WorkerOCREngine()
+        start = time.perf_counter()
+        engine.worker.start()
+        print(f"{'worker model load':<34} {time.perf_counter() - start:8.2f} s (gpu={engine.worker.on_gpu})")
+        manager = GroundingManager(ocr_engine=engine)
+        try:
+            time_screens("worker, in-memory, batched", manager.process_screenshot, screens, args.repeat)
+        finally:
+            manager.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
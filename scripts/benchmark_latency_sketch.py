@@ -0,0 +1,73 @@
+"""Benchmark latency tracking memory and read cost over a long synthetic run.
+
+Usage:
+    python scripts/benchmark_latency_sketch.py [--samples 1000000] [--report-every 100000]
+
+Feeds log-normally distributed latencies (a 2 s median LLM call with a
+heavy tail) into both the previous unbounded list and LatencySketch. At
+each checkpoint it reports the retained memory of each (tracemalloc), the
+time a dashboard refresh takes to read a mean from the list versus a
+p50/p95/p99 summary from the sketch, and the sketch's relative error
+against exact percentiles.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+
+def retained_bytes(build):
+    """Return (object, bytes still allocated after build() returns)."""
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--report-every", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    from mobile_crawler.domain.latency_sketch import LatencySketch
+
+    rng = random.Random(args.seed)
+    samples = [rng.lognormvariate(7.6, 0.8) for _ in range(args.samples)]
+
+    print(f"{'samples':>9}  {'list KB':>9}  {'sketch KB':>9}  {'buckets':>7}  "
+          f"{'list read':>10}  {'sketch read':>11}  {'p99 err':>7}")
+    for end in range(args.report_every, args.samples + 1, args.report_every):
+        chunk = samples[:end]
+
+        # Fresh float objects, as each recorded span duration is in the real collector
+        latencies, list_bytes = retained_bytes(lambda chunk=chunk: [value * 1.0 for value in chunk])
+
+        def build_sketch(chunk=chunk):
+            sketch = LatencySketch()
+            for value in chunk:
+                sketch.add(value)
+            return sketch
+
+        sketch, sketch_bytes = retained_bytes(build_sketch)
+
+        start = time.perf_counter()
+        _ = sum(latencies) / len(latencies)
+        list_read = time.perf_counter() - start
+
+        sketch.add(chunk[-1])  # invalidate the cache so the read below pays for a recompute
+        start = time.perf_counter()
+        summary = sketch.summary()
+        sketch_read = time.perf_counter() - start
+
+        exact_p99 = sorted(chunk)[int(0.99 * (len(chunk) - 1))]
+        error = abs(summary.p99 - exact_p99) / exact_p99
+        print(f"{end:>9}  {list_bytes / 1024:>9.0f}  {sketch_bytes / 1024:>9.1f}  {sketch.bucket_count:>7}  "
+              f"{list_read * 1000:>8.2f}ms  {sketch_read * 1000:>9.3f}ms  {error:>6.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark the GUI log viewer headlessly.
+
+Usage:
+    python scripts/benchmark_log_viewer.py [--lines 100000] [--burst 100]
+
+Runs under the offscreen Qt platform. Log lines are pushed in bursts of
+``--burst`` with the event loop processed between bursts, as happens when
+the crawler forwards output through Qt signals. Reports total throughput,
+the slowest event-loop tick, the time for a level-filter change over the
+full buffer, and how many rows the view holds at the end.
+"""
+
+import argparse
+import os
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--burst", type=int, default=100, help="Lines appended between event-loop ticks")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+
+    from mobile_crawler.core.logging_service import LogLevel
+    from mobile_crawler.ui.widgets.log_viewer import LogViewer
+
+    viewer = LogViewer()
+    viewer.resize(900, 600)
+    viewer.show()
+    app.processEvents()
+
+    levels = [LogLevel.DEBUG, LogLevel.INFO, LogLevel.ACTION, LogLevel.WARNING, LogLevel.ERROR]
+    messages = [
+        "Step {step}: tapping element at (540, {i})",
+        "[stdout] Manager response:\n{{\n  \"action\": \"tap\",\n  \"label_id\": {i}\n}}",
+        "Screenshot captured in {i} ms",
+        "retry {i}: device slow to respond",
+        "failed to parse element {i}",
+    ]
+
+    worst_tick = 0.0
+    start = time.perf_counter()
+    for i in range(args.lines):
+        viewer.append_log(levels[i % len(levels)], messages[i % len(messages)].format(step=i // 50, i=i))
+        if (i + 1) % args.burst == 0:
+            tick = time.perf_counter()
+            app.processEvents()
+            worst_tick = max(worst_tick, time.perf_counter() - tick)
+    tick = time.perf_counter()
+    viewer.flush()
+    app.processEvents()
+    worst_tick = max(worst_tick, time.perf_counter() - tick)
+    total = time.perf_counter() - start
+
+    filter_start = time.perf_counter()
+    viewer.set_level_filter(LogLevel.WARNING)
+    app.processEvents()
+    filter_time = time.perf_counter() - filter_start
+
+    rows = viewer.log_list.model().rowCount()
+    print(f"{args.lines} lines in bursts of {args.burst}")
+    print(f"total          {total:8.2f} s   ({total / args.lines * 1e6:.1f} us/line)")
+    print(f"slowest tick   {worst_tick * 1000:8.1f} ms")
+    print(f"filter change  {filter_time * 1000:8.1f} ms   ({rows} rows at WARNING+)")
+    viewer.close()
+
+
+if __name__ == "__main__":
+    main()
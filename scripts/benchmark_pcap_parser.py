@@ -0,0 +1,128 @@
+"""Benchmark the PCAP parsers on a synthesized capture.
+
+Usage:
+    python scripts/benchmark_pcap_parser.py [--size-mb 500] [--keep PATH]
+
+Writes an Ethernet pcap mixing HTTP requests, TLS ClientHellos, DNS
+lookups and bulk TLS application data, then parses it with each parser in
+a separate process and reports wall time, peak RSS and request count.
+"""
+
+import argparse
+import os
+import resource
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+import dpkt
+
+PARSERS = ("DpktPcapParser", "StreamingPcapParser")
+
+
+def _ipv4(src, dst, proto, payload):
+    header = struct.pack(
+        ">BBHHHBBH4s4s", 0x45, 0, 20 + len(payload), 0, 0, 64, proto, 0,
+        socket.inet_aton(src), socket.inet_aton(dst),
+    )
+    return b"\x00" * 12 + b"\x08\x00" + header + payload
+
+
+def _tcp(sport, dport, payload):
+    return struct.pack(">HHIIBBHHH", sport, dport, 1, 0, 5 << 4, 0x18, 65535, 0, 0) + payload
+
+
+def _udp(sport, dport, payload):
+    return struct.pack(">HHHH", sport, dport, 8 + len(payload), 0) + payload
+
+
+def _client_hello(sni):
+    name = sni.encode()
+    server_name = struct.pack(">BH", 0, len(name)) + name
+    extension = struct.pack(">HHH", 0, len(server_name) + 2, len(server_name)) + server_name
+    body = (
+        b"\x03\x03" + os.urandom(32) + b"\x00" + b"\x00\x02\x13\x01" + b"\x01\x00"
+        + struct.pack(">H", len(extension)) + extension
+    )
+    handshake = b"\x01" + len(body).to_bytes(3, "big") + body
+    return b"\x16\x03\x01" + struct.pack(">H", len(handshake)) + handshake
+
+
+def _dns(name, txid, answer=None):
+    message = dpkt.dns.DNS(id=txid, qd=[dpkt.dns.DNS.Q(name=name)])
+    if answer:
+        message.qr = dpkt.dns.DNS_R
+        message.an = [dpkt.dns.DNS.RR(name=name, type=dpkt.dns.DNS_A, rdata=socket.inet_aton(answer))]
+    return bytes(message)
+
+
+def synthesize(path, size_mb):
+    """Write a capture of roughly ``size_mb`` megabytes."""
+    target = size_mb * 1024 * 1024
+    bulk = _ipv4("93.184.216.34", "10.0.0.2", 6, _tcp(443, 40000, b"\x17\x03\x03" + os.urandom(1400)))
+    written = 0
+    ts = 1_700_000_000.0
+    i = 0
+    with open(path, "wb") as f:
+        f.write(struct.pack("<IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1))
+        while written < target:
+            host = f"host{i % 5000}.example"
+            port = 40000 + i % 20000
+            frames = [
+                _ipv4("10.0.0.2", "10.0.0.1", 17, _udp(port, 53, _dns(host, i & 0xFFFF))),
+                _ipv4("10.0.0.1", "10.0.0.2", 17, _udp(53, port, _dns(host, i & 0xFFFF, "93.184.216.34"))),
+                _ipv4("10.0.0.2", "93.184.216.34", 6, _tcp(port, 443, _client_hello(host))),
+                _ipv4("10.0.0.2", "93.184.216.34", 6, _tcp(port, 80, (
+                    f"GET /item/{i} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+                ))),
+            ] + [bulk] * 40
+            for frame in frames:
+                ts += 0.0001
+                seconds = int(ts)
+                f.write(struct.pack("<IIII", seconds, int((ts - seconds) * 1e6), len(frame), len(frame)))
+                f.write(frame)
+                written += 16 + len(frame)
+            i += 1
+
+
+def run_one(parser_name, path):
+    from mobile_crawler.reporting.parsers import pcap_parser
+
+    parser = getattr(pcap_parser, parser_name)()
+    start = time.perf_counter()
+    count = len(parser.parse(path))
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{parser_name:<22} {elapsed:8.2f}s {peak_mb:9.1f} MB {count:>10} requests")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=500)
+    parser.add_argument("--keep", help="Write the capture here and keep it")
+    parser.add_argument("--run-one", nargs=2, metavar=("PARSER", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        run_one(*args.run_one)
+        return
+
+    path = args.keep or os.path.join(tempfile.mkdtemp(), "bench.pcap")
+    if not os.path.exists(path):
+        start = time.perf_counter()
+        synthesize(path, args.size_mb)
+        print(f"Synthesized {os.path.getsize(path) / 1e6:.0f} MB in {time.perf_counter() - start:.1f}s")
+    print(f"{'parser':<22} {'time':>9} {'peak RSS':>12} {'extracted':>10}")
+    try:
+        for name in PARSERS:
+            subprocess.run([sys.executable, __file__, "--run-one", name, path], check=True)
+    finally:
+        if not args.keep:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
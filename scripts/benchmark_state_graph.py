@@ -0,0 +1,87 @@
+"""Benchmark state graph persistence cost over a long synthetic crawl.
+
+Usage:
+    python scripts/benchmark_state_graph.py [--transitions 10000] [--screens 300]
+
+Records one state visit and one transition per step and saves after each,
+as the manager agents do. Compares the previous behaviour (rewrite the
+whole graph as indented JSON every step) with the append-only journal plus
+periodic compacted snapshots, reporting total serialization time, total
+bytes written, and the cost of the last save. It then checks that
+StateGraphTracker.load() reproduces the graph from the journal files.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+
+def legacy_save(tracker) -> None:
+    """The pre-journal save(): rewrite the whole graph as indented JSON."""
+    with open(tracker.logs_dir / "state_graph.json", "w", encoding="utf-8") as f:
+        json.dump(tracker.to_dict(), f, indent=2, ensure_ascii=True)
+
+
+def dir_bytes(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.iterdir() if path.is_file())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transitions", type=int, default=10_000)
+    parser.add_argument("--screens", type=int, default=300, help="Distinct screen hashes to visit")
+    parser.add_argument("--compact-every", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    from mobile_crawler.domain.state_graph import DEFAULT_COMPACT_EVERY, StateGraphTracker
+
+    compact_every = args.compact_every or DEFAULT_COMPACT_EVERY
+    rng = random.Random(args.seed)
+    hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(args.screens)]
+    walk = [rng.choice(hashes) for _ in range(args.transitions + 1)]
+
+    def run(logs_dir: Path, save) -> tuple[float, int, float, StateGraphTracker]:
+        logs_dir.mkdir()
+        tracker = StateGraphTracker(run_id=1, logs_dir=logs_dir, compact_every=compact_every)
+        tracker.record_state(walk[0], 0, "com.example.app", "MainActivity")
+        elapsed = 0.0
+        written = 0
+        last = 0.0
+        size = 0
+        for step in range(1, args.transitions + 1):
+            tracker.record_state(walk[step], step, "com.example.app", "MainActivity")
+            tracker.record_transition(walk[step - 1], walk[step], {"action": "click", "label_id": step % 40}, step)
+            start = time.perf_counter()
+            save(tracker)
+            last = time.perf_counter() - start
+            elapsed += last
+            # A rewrite or compaction writes the whole snapshot; an append only its record
+            new_size = dir_bytes(logs_dir)
+            rewrote = save is legacy_save or tracker._journal_records == 0
+            written += new_size if rewrote else new_size - size
+            size = new_size
+        return elapsed, written, last, tracker
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = run(Path(tmp) / "legacy", legacy_save)
+        journal_dir = Path(tmp) / "journal"
+        journal = run(journal_dir, StateGraphTracker.save)
+
+        loaded = StateGraphTracker(run_id=1, logs_dir=journal_dir)
+        loaded.load()
+        assert loaded.to_dict() == journal[3].to_dict(), "journal replay does not match the live graph"
+
+    print(f"{args.transitions} transitions over {args.screens} screens, snapshot every {compact_every} saves")
+    print(f"{'':>9}  {'total time':>10}  {'MB written':>10}  {'last save':>9}")
+    for name, (elapsed, written, last, _) in (("rewrite", legacy), ("journal", journal)):
+        print(f"{name:>9}  {elapsed:>9.2f}s  {written / 1e6:>10.1f}  {last * 1000:>7.2f}ms")
+    print(f"speedup {legacy[0] / journal[0]:.1f}x, {legacy[1] / journal[1]:.1f}x fewer bytes; load() replay verified")
+
+
+if __name__ == "__main__":
+    main()
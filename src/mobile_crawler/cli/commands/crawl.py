@@ -8,13 +8,19 @@ import click
 from mobile_crawler.config import get_app_data_dir
 from mobile_crawler.config.config_manager import ConfigManager
 from mobile_crawler.core.crawler_event_listener import CrawlerEventListener
-from mobile_crawler.core.crawler_loop import CrawlerLoop
 from mobile_crawler.domain.models import ActionResult
 from mobile_crawler.infrastructure.database import DatabaseManager
 from mobile_crawler.infrastructure.run_repository import Run, RunRepository
 from mobile_crawler.infrastructure.session_folder_manager import SessionFolderManager
 
 
+def _get_crawler_loop_class():
+    """Import CrawlerLoop on first use; it pulls in the whole agent stack."""
+    from mobile_crawler.core.crawler_loop import CrawlerLoop
+
+    return CrawlerLoop
+
+
 class JSONEventListener(CrawlerEventListener):
     """Event listener that outputs JSON events to stdout."""
 
@@ -201,17 +207,23 @@ class JSONEventListener(CrawlerEventListener):
 
 
 @click.command()
-@click.option('--device', required=True, help='Device ID to crawl')
-@click.option('--package', required=True, help='App package name to crawl')
-@click.option('--model', required=True, help='AI model to use')
+@click.option('--device', help='Device ID to crawl')
+@click.option('--package', help='App package name to crawl')
+@click.option('--model', help='AI model to use')
 @click.option('--steps', type=int, help='Maximum number of crawl steps')
 @click.option('--duration', type=int, help='Maximum crawl duration in seconds')
 @click.option('--provider', help='AI provider (gemini, openrouter, ollama)')
 @click.option('--enable-traffic-capture', is_flag=True, help='Enable PCAPdroid traffic capture during crawl')
 @click.option('--enable-video-recording', is_flag=True, help='Enable video recording during crawl')
 @click.option('--enable-mobsf-analysis', is_flag=True, help='Enable MobSF static analysis after crawl')
-def crawl(device: str, package: str, model: str, steps: int | None, duration: int | None, provider: str | None, enable_traffic_capture: bool, enable_video_recording: bool, enable_mobsf_analysis: bool) -> None:
+@click.option('--resume', 'resume_run_id', type=int, help='Resume an interrupted run from its saved checkpoint')
+def crawl(device: str | None, package: str | None, model: str | None, steps: int | None, duration: int | None, provider: str | None, enable_traffic_capture: bool, enable_video_recording: bool, enable_mobsf_analysis: bool, resume_run_id: int | None) -> None:
     """Start a crawl on the specified device and app."""
+    if resume_run_id is None:
+        missing = [name for name, value in (('--device', device), ('--package', package), ('--model', model)) if not value]
+        if missing:
+            raise click.UsageError(f"Missing option(s): {', '.join(missing)} (required unless --resume is given)")
+
     try:
         # Ensure app data directory exists
         app_data_dir = get_app_data_dir()
@@ -221,6 +233,24 @@ def crawl(device: str, package: str, model: str, steps: int | None, duration: in
         config_manager = ConfigManager()
         config_manager.user_config_store.create_schema()
 
+        # Initialize database
+        db_manager = DatabaseManager()
+        db_manager.migrate_schema()
+
+        # Create run repository
+        run_repo = RunRepository(db_manager)
+
+        resumed_run = None
+        if resume_run_id is not None:
+            resumed_run = run_repo.get_run_by_id(resume_run_id)
+            if resumed_run is None:
+                click.echo(f"Error: Run {resume_run_id} not found", err=True)
+                sys.exit(1)
+            device = device or resumed_run.device_id
+            package = package or resumed_run.app_package
+            model = model or resumed_run.ai_model
+            provider = provider or resumed_run.ai_provider
+
         # Override config with command line options
         if steps:
             config_manager.set('max_crawl_steps', steps)
@@ -228,7 +258,8 @@ def crawl(device: str, package: str, model: str, steps: int | None, duration: in
             config_manager.set('max_crawl_duration_seconds', duration)
         if provider:
             config_manager.set('ai_provider', provider)
-        config_manager.set('ai_model', model)
+        if model:
+            config_manager.set('ai_model', model)
         config_manager.set('app_package', package)  # Set app package for features
         if enable_traffic_capture:
             config_manager.set('enable_traffic_capture', True)
@@ -238,31 +269,30 @@ def crawl(device: str, package: str, model: str, steps: int | None, duration: in
         if enable_mobsf_analysis:
             config_manager.set('enable_mobsf_analysis', True)
 
-        # Initialize database
-        db_manager = DatabaseManager()
-        db_manager.migrate_schema()
-
-        # Create run repository
-        run_repo = RunRepository(db_manager)
-
-        # Create run record
-        run = Run(
-            id=None,
-            device_id=device,
-            app_package=package,
-            start_activity=None,  # Will be determined during crawl
-            start_time=datetime.now(),
-            end_time=None,
-            status='RUNNING',
-            ai_provider=provider,
-            ai_model=model,
-            total_steps=0,
-            unique_screens=0
-        )
-        run_id = run_repo.create_run(run)
+        if resumed_run is not None:
+            run_id = resume_run_id
+            resumed_run.status = 'RUNNING'
+            resumed_run.end_time = None
+            run_repo.update_run(resumed_run)
+        else:
+            # Create run record
+            run = Run(
+                id=None,
+                device_id=device,
+                app_package=package,
+                start_activity=None,  # Will be determined during crawl
+                start_time=datetime.now(),
+                end_time=None,
+                status='RUNNING',
+                ai_provider=provider,
+                ai_model=model,
+                total_steps=0,
+                unique_screens=0
+            )
+            run_id = run_repo.create_run(run)
 
         session_folder_manager = SessionFolderManager()
-        crawler_loop = CrawlerLoop(
+        crawler_loop = _get_crawler_loop_class()(
             config_manager=config_manager,
             run_repository=run_repo,
             session_folder_manager=session_folder_manager,
@@ -270,7 +300,10 @@ def crawl(device: str, package: str, model: str, steps: int | None, duration: in
         )
 
         # Run the crawl
-        crawler_loop.run(run_id)
+        if resumed_run is not None:
+            crawler_loop.run(run_id, resume=True)
+        else:
+            crawler_loop.run(run_id)
 
     except Exception as e:
         click.echo(f"Error starting crawl: {e}", err=True)
@@ -1,13 +1,9 @@
 """Main CLI entry point using Click."""
 
 
-import click
+import importlib
 
-from mobile_crawler.cli.commands.config import config
-from mobile_crawler.cli.commands.crawl import crawl
-from mobile_crawler.cli.commands.delete import delete
-from mobile_crawler.cli.commands.list import list
-from mobile_crawler.cli.commands.report import report
+import click
 
 try:
     from importlib.metadata import version
@@ -17,7 +13,39 @@ except ImportError:
     __version__ = "0.1.0"
 
 
-@click.group()
+# Subcommand name -> "module:attribute". Modules are imported only when the
+# command is resolved, so `list` or `config get` never load the crawl stack.
+LAZY_COMMANDS: dict[str, str] = {
+    "crawl": "mobile_crawler.cli.commands.crawl:crawl",
+    "config": "mobile_crawler.cli.commands.config:config",
+    "report": "mobile_crawler.cli.commands.report:report",
+    "list": "mobile_crawler.cli.commands.list:list",
+    "delete": "mobile_crawler.cli.commands.delete:delete",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+
+        module_name, attr_name = self.lazy_commands[cmd_name].split(":", 1)
+        command = getattr(importlib.import_module(module_name), attr_name)
+        self.add_command(command, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(__version__, prog_name="mobile-crawler")
 def cli():
     """Mobile Crawler - AI-powered Android exploration tool.
@@ -28,12 +56,6 @@ def cli():
     pass
 
 
-cli.add_command(crawl)
-cli.add_command(config)
-cli.add_command(report)
-cli.add_command(list)
-cli.add_command(delete)
-
 
 def run():
     """Run the CLI application."""
@@ -1,11 +1,13 @@
 """Configuration manager with precedence: SQLite → environment variables → module defaults."""
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ..infrastructure.user_config_store import UserConfigStore
 from .defaults import DEFAULTS
 
+if TYPE_CHECKING:
+    from ..infrastructure.user_config_store import UserConfigStore
+
 
 class ConfigManager:
     """Configuration manager with precedence order.
@@ -16,13 +18,15 @@ class ConfigManager:
     3. Module defaults
     """
 
-    def __init__(self, user_config_store: UserConfigStore | None = None):
+    def __init__(self, user_config_store: "UserConfigStore | None" = None):
         """Initialize configuration manager.
 
         Args:
             user_config_store: User config store instance. If None, creates default.
         """
         if user_config_store is None:
+            from ..infrastructure.user_config_store import UserConfigStore
+
             user_config_store = UserConfigStore()
         self.user_config_store = user_config_store
 
@@ -99,8 +103,9 @@ class ConfigManager:
         return value
 
 
-# Global config instance
-_config = ConfigManager()
+# Global config instance, created on first get_config() call so importing
+# this module does not open user_config.db
+_config: ConfigManager | None = None
 
 
 def get_config() -> ConfigManager:
@@ -109,4 +114,7 @@ def get_config() -> ConfigManager:
     Returns:
         Configuration manager instance
     """
+    global _config
+    if _config is None:
+        _config = ConfigManager()
     return _config
@@ -45,6 +45,16 @@ DEFAULTS: dict[str, Any] = {
     "pcapdroid_init_wait": 3.0,
     # Wait for PCAPdroid to finalize the file after stop
     "pcapdroid_finalize_wait": 2.0,
+    # Stream packets to a local UDP collector instead of a device PCAP file, so
+    # traffic is attributed to crawl steps live and stop needs no finalize/pull
+    "pcapdroid_live_traffic": False,
+    # Address the device uses to reach the collector (10.0.2.2 = emulator host)
+    "pcapdroid_collector_host": "10.0.2.2",
+    # Local address and UDP port the collector binds
+    "pcapdroid_collector_bind_address": "0.0.0.0",
+    "pcapdroid_collector_port": 5123,
+    # Number of recent steps whose traffic is kept for the prompt
+    "pcapdroid_live_traffic_history_steps": 50,
     # Best-effort approval of PCAPdroid/API/VPN consent during capture startup
     "pcapdroid_auto_accept_consent": True,
     "pcapdroid_consent_timeout_seconds": 15.0,
@@ -73,8 +83,29 @@ DEFAULTS: dict[str, Any] = {
     "mobsf_scan_timeout": 900,  # 15 minutes (scans can take 5-10+ minutes for complex apps)
     # Interval between scan status polls (in seconds)
     "mobsf_poll_interval": 2,
+    # Upper bound for the exponential backoff between scan status polls (in seconds)
+    "mobsf_poll_max_interval": 30,
     # HTTP request timeout for MobSF API calls (in seconds)
     "mobsf_request_timeout": 300,  # 5 minutes for large report downloads
+    # Directory of pulled APKs keyed by SHA-256, reused across runs (None uses output_data/apk_store)
+    "mobsf_apk_store_dir": None,
+    # Number of split APKs pulled from the device concurrently
+    "mobsf_apk_pull_workers": 4,
+    # Reuse MobSF reports for byte-identical APKs instead of uploading and scanning again
+    "mobsf_report_cache_enabled": True,
+    # Directory holding cached MobSF reports keyed by APK SHA-256 (None uses output_data/mobsf_cache)
+    "mobsf_report_cache_dir": None,
+    # Live telemetry
+    # Serve crawl metrics in OpenMetrics/Prometheus text format at /metrics while a crawl runs
+    "metrics_endpoint_enabled": False,
+    # Bind address for the metrics endpoint (keep on localhost; there is no authentication)
+    "metrics_endpoint_host": "127.0.0.1",
+    # TCP port for the metrics endpoint
+    "metrics_endpoint_port": 9464,
+    # Sample the crawl thread's stack per step phase; writes collapsed stacks to logs/profile
+    "phase_profiler_enabled": False,
+    # Interval between profiler stack samples (milliseconds)
+    "phase_profiler_interval_ms": 10,
     # Test credentials
     # Crawler Agent Integration settings
     # Enable the internalized crawler-agent system for multi-step planning
@@ -89,8 +120,19 @@ DEFAULTS: dict[str, Any] = {
     "crawler_max_cycles": 5,
     # Agent streaming output (for real-time updates)
     "crawler_streaming": False,
+    # On an exhausted screen, replay recorded actions to the nearest screen with untried elements (no LLM)
+    "frontier_navigation_enabled": False,
+    # Longest recorded path frontier navigation will replay
+    "frontier_navigation_max_hops": 6,
     # Crawler agent retry count for failed operations
     "crawler_retry_count": 2,
+    # Persist agent state + state graph position every N steps so restarts can resume
+    # (app crashes always checkpoint before relaunching)
+    "crawl_checkpoint_interval_steps": 10,
+    # Agent trajectory saving ("none" disables); screenshots are stored in the session blob store
+    "crawler_save_trajectory": "none",
+    # Re-encode stored screenshot blobs: "" keeps PNG, or "webp" / "jpeg"
+    "blob_image_format": "",
     # UI parser strategy: accessibility-first with OmniParser fallback
     "ui_parser_mode": "boost",
     "omniparser_backend": "replicate",
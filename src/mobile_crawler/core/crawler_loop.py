@@ -4,6 +4,7 @@ import asyncio
 import inspect
 import json
 import logging
+import os
 import threading
 import time
 from datetime import datetime
@@ -11,6 +12,7 @@ from datetime import datetime
 from mobile_crawler.config.config_manager import ConfigManager
 from mobile_crawler.core.crawler_event_listener import CrawlerEventListener
 from mobile_crawler.core.log_sinks import LogLevel, capture_stdout_to_ui
+from mobile_crawler.core.metrics_endpoint import CrawlMetrics, MetricsEndpoint
 from mobile_crawler.domain.crawler_agent_service import CrawlerAgentService
 from mobile_crawler.domain.errors import (
     CheckpointError,
@@ -19,8 +21,10 @@ from mobile_crawler.domain.errors import (
     FatalError,
     RecorderError,
 )
+from mobile_crawler.domain.phase_profiler import PhaseProfiler
 from mobile_crawler.domain.traffic_capture_manager import TrafficCaptureManager
 from mobile_crawler.domain.video_recording_manager import VideoRecordingManager
+from mobile_crawler.infrastructure.database import commit_latency_summary, reset_commit_latency
 from mobile_crawler.infrastructure.mobsf_manager import MobSFManager
 from mobile_crawler.infrastructure.run_repository import RunRepository
 from mobile_crawler.infrastructure.session_folder_manager import SessionFolderManager
@@ -59,6 +63,10 @@ class CrawlerLoop:
         self._crawler_agent_service: CrawlerAgentService | None = None
         self._traffic_capture_manager: TrafficCaptureManager | None = None
         self._video_recording_manager: VideoRecordingManager | None = None
+        self._crawl_metrics: CrawlMetrics | None = None
+        self._metrics_endpoint: MetricsEndpoint | None = None
+        self._phase_profiler: PhaseProfiler | None = None
+        self._phase_profile_dir: str | None = None
         self._cancel_requested = False
         self._state = "IDLE"
 
@@ -71,17 +79,18 @@ class CrawlerLoop:
         if listener in self.event_listeners:
             self.event_listeners.remove(listener)
 
-    def start(self, run_id: int) -> None:
+    def start(self, run_id: int, resume: bool = False) -> None:
         """Start the crawler loop in a background thread.
 
         Args:
             run_id: The run ID to execute
+            resume: Continue from the run's saved crawl checkpoint
         """
         if self._crawl_thread and self._crawl_thread.is_alive():
             raise RuntimeError("Crawler is already running")
 
         self._current_run_id = run_id
-        self._crawl_thread = threading.Thread(target=self.run, args=(run_id,), daemon=True)
+        self._crawl_thread = threading.Thread(target=self.run, args=(run_id, resume), daemon=True)
         self._crawl_thread.start()
 
     def pause(self) -> None:
@@ -138,11 +147,13 @@ class CrawlerLoop:
             "Advance step not supported in internalized crawler mode."
         )
 
-    def run(self, run_id: int) -> None:
+    def run(self, run_id: int, resume: bool = False) -> None:
         """Run the crawler loop for the given run.
 
         Args:
             run_id: The run ID to execute
+            resume: Reuse the run's session folder and restore its crawl
+                    checkpoint (agent state, state graph, step counters)
 
         Raises:
             Exception: If the crawl fails
@@ -155,10 +166,15 @@ class CrawlerLoop:
             if not run:
                 raise ValueError(f"Run {run_id} not found")
 
-            session_path = self.session_folder_manager.create_session_folder(run_id)
-            self.run_repository.update_session_path(run_id, session_path)
-            run.session_path = session_path
+            session_path = run.session_path if resume else None
+            if not session_path:
+                session_path = self.session_folder_manager.create_session_folder(run_id)
+                self.run_repository.update_session_path(run_id, session_path)
+                run.session_path = session_path
 
+            # Commit timings are process-wide; keep earlier runs out of this one's percentiles
+            reset_commit_latency()
+            self._start_metrics_endpoint(run_id)
             self._transition_state("RUNNING", run_id)
             self._emit_event("on_crawl_started", run_id, run.app_package)
 
@@ -167,6 +183,8 @@ class CrawlerLoop:
                 ai_interaction_repository=self._ai_interaction_repository,
                 device_id=run.device_id
             )
+            if self._crawl_metrics is not None:
+                self._crawler_agent_service.configure_timing_sink(self._crawl_metrics.record_latency)
 
             # Initialize step phase tracking per D-01 (wrap at action level)
             self._crawler_agent_service.begin_step_tracking(
@@ -174,7 +192,22 @@ class CrawlerLoop:
                 emit_step_phase_event=self._emit_event,
             )
 
+            checkpoint_dir = self.session_folder_manager.get_subfolder(run, "data")
+            checkpoint = self._crawler_agent_service.configure_checkpointing(checkpoint_dir, resume=resume)
+            if resume:
+                message = (
+                    f"Resuming from checkpoint at step {checkpoint.step_number}"
+                    if checkpoint
+                    else "No crawl checkpoint found; starting from scratch"
+                )
+                self._emit_event("on_debug_log", run_id, 0, message)
+
+            self._crawler_agent_service.configure_blob_store(
+                self.session_folder_manager.get_subfolder(run, "blobs")
+            )
+
             logs_dir = self.session_folder_manager.get_subfolder(run, "logs")
+            self._start_phase_profiler(logs_dir)
             self._crawler_agent_service.configure_run_logging(
                 run_id,
                 logs_dir,
@@ -196,6 +229,12 @@ class CrawlerLoop:
             # Run both execute and cleanup in the same event loop to ensure proper
             # cleanup of async resources (e.g., google.genai.AsyncClient instances)
             async def run_and_cleanup():
+                # Static analysis only needs the installed APK, so it runs
+                # alongside the crawl and is awaited (or cancelled) at the end.
+                mobsf_task = None
+                if self.config_manager.get("enable_mobsf_analysis", False) is True:
+                    mobsf_task = asyncio.create_task(self._run_mobsf_analysis(run, run_id))
+
                 if self.config_manager.get("enable_traffic_capture", False) is True:
                     self._traffic_capture_manager = TrafficCaptureManager(
                         config_manager=self.config_manager,
@@ -215,6 +254,10 @@ class CrawlerLoop:
                             0,
                             f"Traffic capture {status_text}: {message}",
                         )
+                        if started and self._traffic_capture_manager.traffic_attributor:
+                            self._crawler_agent_service.configure_traffic_attribution(
+                                self._traffic_capture_manager.traffic_attributor
+                            )
                     except Exception as e:
                         logger.warning("Failed to start traffic capture: %s", e)
                         self._emit_event(
@@ -241,16 +284,23 @@ class CrawlerLoop:
                         0,
                         f"Video recording {status_text}: {message}",
                     )
+                    if started:
+                        self._crawler_agent_service.configure_video_step_index(
+                            self._video_recording_manager
+                        )
+                crawl_result = None
                 try:
-                    return await self._crawler_agent_service.execute_exploration_task(
+                    crawl_result = await self._crawler_agent_service.execute_exploration_task(
                         run_id=run_id,
                         app_package=run.app_package,
                         max_steps=actual_max_steps,
                         exploration_objective=exploration_objective,
                         max_duration_seconds=max_duration if limit_type == "duration" else None
                     )
+                    return crawl_result
                 finally:
                     if self._video_recording_manager:
+                        self._crawler_agent_service.configure_video_step_index(None)
                         try:
                             video_path = await self._video_recording_manager.stop_recording_and_save_async()
                             if video_path:
@@ -279,6 +329,7 @@ class CrawlerLoop:
                             self._video_recording_manager = None
 
                     if self._traffic_capture_manager:
+                        self._crawler_agent_service.configure_traffic_attribution(None)
                         try:
                             pcap_path = await self._traffic_capture_manager.stop_capture_and_pull_async(
                                 run_id=run_id,
@@ -309,6 +360,14 @@ class CrawlerLoop:
                         finally:
                             self._traffic_capture_manager = None
 
+                    if mobsf_task:
+                        crawl_completed = (
+                            crawl_result is not None
+                            and crawl_result.success
+                            and not self._cancel_requested
+                        )
+                        await self._finish_mobsf_analysis(mobsf_task, run_id, crawl_completed)
+
                     # Always cleanup, even if execute fails
                     cleanup_result = self._crawler_agent_service.cleanup()
                     if inspect.isawaitable(cleanup_result):
@@ -355,6 +414,8 @@ class CrawlerLoop:
             elif result.success:
                 status = "COMPLETED"
                 reason = completion_reason or "Crawler agent completed"
+                # A finished crawl has nothing left to resume
+                self._crawler_agent_service.clear_checkpoint()
             else:
                 status = "ERROR"
                 reason = result.error_message or "Crawler agent failed"
@@ -367,9 +428,6 @@ class CrawlerLoop:
                 end_time=datetime.now()
             )
 
-            if status == "COMPLETED" and self.config_manager.get("enable_mobsf_analysis", False) is True:
-                self._run_mobsf_analysis(run, run_id)
-
             # Emit crawl completed with action stats encoded in reason for backward compatibility
             # Format: "reason | successful=X failed=Y total=Z"
             stats_suffix = f" | successful={successful_actions} failed={failed_actions} total={total_actions}"
@@ -398,6 +456,8 @@ class CrawlerLoop:
             self._transition_state("ERROR", run_id)
             self._emit_event("on_error", run_id, None, wrapped)
         finally:
+            self._stop_phase_profiler(run_id)
+            self._stop_metrics_endpoint()
             self._video_recording_manager = None
             self._traffic_capture_manager = None
             if self._crawler_agent_service:
@@ -405,15 +465,15 @@ class CrawlerLoop:
                 self._crawler_agent_service = None
             self._transition_state("STOPPED", run_id)
 
-    def _run_mobsf_analysis(self, run, run_id: int) -> None:
-        """Run MobSF after a successful crawl without affecting crawl completion."""
+    async def _run_mobsf_analysis(self, run, run_id: int) -> None:
+        """Run MobSF for the crawled app without affecting crawl completion."""
         self._emit_event("on_debug_log", run_id, 0, "Starting MobSF static analysis...")
         try:
             mobsf_manager = MobSFManager(
                 config_manager=self.config_manager,
                 session_folder_manager=self.session_folder_manager,
             )
-            result = mobsf_manager.analyze_run(run, run.device_id)
+            result = await mobsf_manager.analyze_run_async(run, run.device_id)
             if result.success:
                 details = [f"MobSF analysis completed. Hash: {result.scan_id}"]
                 if result.json_path:
@@ -432,6 +492,83 @@ class CrawlerLoop:
             logger.warning("MobSF analysis failed for run %s: %s", run_id, e)
             self._emit_event("on_debug_log", run_id, 0, f"MobSF analysis failed: {e}")
 
+    async def _finish_mobsf_analysis(
+        self, task: "asyncio.Task[None]", run_id: int, crawl_completed: bool
+    ) -> None:
+        """Wait for the background MobSF scan, or cancel it if the crawl did not complete."""
+        if crawl_completed:
+            if not task.done():
+                self._emit_event("on_debug_log", run_id, 0, "Waiting for MobSF analysis to finish...")
+            await task
+            return
+        if not task.done():
+            task.cancel()
+            self._emit_event(
+                "on_debug_log", run_id, 0, "MobSF analysis cancelled: crawl did not complete"
+            )
+        await asyncio.gather(task, return_exceptions=True)
+
+    def _start_metrics_endpoint(self, run_id: int) -> None:
+        """Serve live metrics for this run when metrics_endpoint_enabled is set."""
+        if self.config_manager.get("metrics_endpoint_enabled", False) is not True:
+            return
+        metrics = CrawlMetrics(
+            run_id,
+            span_stats=self.get_span_stats,
+            writer_queue_depth=self._writer_queue_depth,
+            commit_latency=commit_latency_summary,
+        )
+        endpoint = MetricsEndpoint(
+            metrics.render,
+            host=self.config_manager.get("metrics_endpoint_host", "127.0.0.1"),
+            port=int(self.config_manager.get("metrics_endpoint_port", 9464)),
+        )
+        try:
+            endpoint.start()
+        except OSError as e:
+            self._emit_event("on_debug_log", run_id, 0, f"Metrics endpoint not started: {e}")
+            return
+        self._crawl_metrics = metrics
+        self._metrics_endpoint = endpoint
+        self.add_event_listener(metrics)
+        self._emit_event("on_debug_log", run_id, 0, f"Metrics endpoint serving {endpoint.url}")
+
+    def _stop_metrics_endpoint(self) -> None:
+        if self._metrics_endpoint is not None:
+            self._metrics_endpoint.stop()
+            self._metrics_endpoint = None
+        if self._crawl_metrics is not None:
+            self.remove_event_listener(self._crawl_metrics)
+            self._crawl_metrics = None
+
+    def _start_phase_profiler(self, logs_dir: str) -> None:
+        """Sample this (crawl) thread per step phase when phase_profiler_enabled is set."""
+        if self.config_manager.get("phase_profiler_enabled", False) is not True:
+            return
+        interval_ms = float(self.config_manager.get("phase_profiler_interval_ms", 10) or 10)
+        self._phase_profiler = PhaseProfiler(interval_seconds=interval_ms / 1000)
+        self._phase_profile_dir = os.path.join(logs_dir, "profile")
+        self._crawler_agent_service.configure_phase_profiler(self._phase_profiler)
+
+    def _stop_phase_profiler(self, run_id: int) -> None:
+        profiler = self._phase_profiler
+        if profiler is None:
+            return
+        self._phase_profiler = None
+        profiler.stop()
+        try:
+            profiler.write(self._phase_profile_dir)
+            self._emit_event(
+                "on_debug_log", run_id, 0,
+                f"Phase profile ({profiler.sample_count} samples) written to {self._phase_profile_dir}",
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write phase profile: {e}")
+
+    def _writer_queue_depth(self) -> int | None:
+        svc = self._crawler_agent_service
+        return svc.writer_queue_depth() if svc is not None else None
+
     def get_span_stats(self):
         """Return current OTel span stats from the active agent service, or None."""
         svc = self._crawler_agent_service
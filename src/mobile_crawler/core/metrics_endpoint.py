@@ -0,0 +1,228 @@
+"""Opt-in local OpenMetrics endpoint for live crawl telemetry.
+
+:class:`CrawlMetrics` listens to crawler events and keeps running totals in
+a :class:`RuntimeStatsCollector`; recording is a counter bump or a sketch
+insert. Everything else (rates, percentiles, queue depth, token totals) is
+read only when :class:`MetricsEndpoint` is scraped, on the HTTP thread, so
+an idle endpoint costs the crawl nothing.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mobile_crawler.core.runtime_stats_collector import RuntimeStatsCollector
+from mobile_crawler.domain.latency_sketch import LatencySummary
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_QUANTILES = (("0.5", "p50"), ("0.95", "p95"), ("0.99", "p99"))
+
+
+class CrawlMetrics:
+    """Crawler event listener that accumulates metrics for one run.
+
+    Event handlers run on the crawl thread and scrapes on the endpoint's
+    thread; a lock keeps the collector's sketches consistent between them.
+    """
+
+    def __init__(
+        self,
+        run_id: int,
+        span_stats: Callable[[], object] | None = None,
+        writer_queue_depth: Callable[[], int | None] | None = None,
+        commit_latency: Callable[[], LatencySummary] | None = None,
+    ):
+        """Initialize the metrics listener.
+
+        Args:
+            run_id: Run being measured
+            span_stats: Returns the current SpanStats (tokens, LLM latency), or None
+            writer_queue_depth: Returns pending trajectory writer jobs, or None
+            commit_latency: Returns the SQLite commit latency summary
+        """
+        self.run_id = run_id
+        self.collector = RuntimeStatsCollector(run_id)
+        self._span_stats = span_stats
+        self._writer_queue_depth = writer_queue_depth
+        self._commit_latency = commit_latency
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._error_count = 0
+
+    # -- CrawlerEventListener hooks -------------------------------------------
+
+    def on_crawl_started(self, run_id: int, target_package: str) -> None:
+        with self._lock:
+            self._started = time.monotonic()
+            self.collector.start_session()
+            self.collector.set_app_info(target_package)
+
+    def on_step_phase_transition(
+        self, run_id: int, step_number: int, from_phase: str, to_phase: str, duration_ms: float
+    ) -> None:
+        with self._lock:
+            if duration_ms > 0:
+                self.collector.record_phase_duration(from_phase, duration_ms)
+            # Every step, including skipped ones, passes through CHECKPOINT once
+            if to_phase == "checkpoint":
+                self.collector.record_step_start()
+
+    def on_error(self, run_id: int, step_number: int | None, error: Exception) -> None:
+        with self._lock:
+            self._error_count += 1
+
+    def record_latency(self, name: str, duration_ms: float) -> None:
+        """Timing sink for CrawlerAgentService sub-phase timings."""
+        with self._lock:
+            self.collector.record_latency(name, duration_ms)
+
+    # -- Rendering -------------------------------------------------------------
+
+    def render(self) -> str:
+        """Render all metrics in OpenMetrics text format."""
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        lines: list[str] = []
+
+        with self._lock:
+            stats = self.collector.stats
+            total_steps = stats.total_steps
+            errors = self._error_count
+            latencies = self.collector.latency_summaries()
+
+        _counter(lines, "crawler_steps", "Crawl steps completed", total_steps)
+        _gauge(lines, "crawler_steps_per_minute", "Steps per minute since crawl start", total_steps / elapsed * 60)
+        _counter(lines, "crawler_errors", "Crawl errors reported to listeners", errors)
+        _gauge(lines, "crawler_elapsed_seconds", "Seconds since crawl start", elapsed)
+
+        span_stats = self._span_stats() if self._span_stats else None
+        if span_stats is not None:
+            lines.append("# TYPE crawler_llm_tokens counter")
+            lines.append("# HELP crawler_llm_tokens LLM tokens reported by OTel spans")
+            lines.append(f'crawler_llm_tokens_total{{direction="input"}} {span_stats.total_input_tokens}')
+            lines.append(f'crawler_llm_tokens_total{{direction="output"}} {span_stats.total_output_tokens}')
+            _gauge(lines, "crawler_llm_tokens_per_second", "LLM tokens per second since crawl start",
+                   span_stats.total_tokens / elapsed)
+            latencies = {**latencies, "llm": span_stats.latency_summary}
+
+        _summary(lines, "crawler_latency_milliseconds", "Latency by timing (phases, tool execution, LLM)", latencies)
+
+        depth = self._writer_queue_depth() if self._writer_queue_depth else None
+        if depth is not None:
+            _gauge(lines, "crawler_trajectory_writer_queue_depth", "Pending trajectory writer jobs", depth)
+
+        if self._commit_latency is not None:
+            _summary(lines, "crawler_sqlite_commit_latency_milliseconds", "crawler.db commit latency",
+                     {"": self._commit_latency()})
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _counter(lines: list[str], name: str, help_text: str, value: float) -> None:
+    lines.append(f"# TYPE {name} counter")
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"{name}_total {_format(value)}")
+
+
+def _gauge(lines: list[str], name: str, help_text: str, value: float) -> None:
+    lines.append(f"# TYPE {name} gauge")
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"{name} {_format(value)}")
+
+
+def _summary(lines: list[str], name: str, help_text: str, summaries: dict[str, LatencySummary]) -> None:
+    """Render summaries keyed by ``timing`` label value ("" for an unlabelled series)."""
+    lines.append(f"# TYPE {name} summary")
+    lines.append(f"# HELP {name} {help_text}")
+    for timing, summary in sorted(summaries.items()):
+        label = f'timing="{_escape(timing)}"' if timing else ""
+        for quantile, attr in _QUANTILES:
+            labels = f"{label},quantile=\"{quantile}\"" if label else f'quantile="{quantile}"'
+            lines.append(f"{name}{{{labels}}} {_format(getattr(summary, attr))}")
+        suffix = f"{{{label}}}" if label else ""
+        lines.append(f"{name}_count{suffix} {summary.count}")
+        lines.append(f"{name}_sum{suffix} {_format(summary.mean * summary.count)}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsEndpoint:
+    """Serves ``GET /metrics`` on a local address from a daemon thread."""
+
+    def __init__(self, render: Callable[[], str], host: str = "127.0.0.1", port: int = 9464):
+        """Initialize the endpoint.
+
+        Args:
+            render: Returns the OpenMetrics text for each scrape
+            host: Bind address; keep the default to stay local-only
+            port: TCP port (0 picks a free port; see ``port`` after start())
+        """
+        self._render = render
+        self._host = host
+        self._port = port
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1] if self._server else self._port
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self.port}/metrics"
+
+    def start(self) -> None:
+        """Bind and start serving; raises OSError if the port is taken."""
+        if self._server is not None:
+            return
+        render = self._render
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                try:
+                    body = render().encode("utf-8")
+                except Exception as e:
+                    logger.warning(f"Metrics render failed: {e}")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # noqa: A002
+                logger.debug("metrics endpoint: " + format, *args)
+
+        self._server = ThreadingHTTPServer((self._host, self._port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-endpoint", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Metrics endpoint listening on {self.url}")
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from mobile_crawler.domain.latency_sketch import EMPTY_SUMMARY, LatencySketch, LatencySummary
+
 logger = logging.getLogger(__name__)
 
 
@@ -191,12 +193,51 @@ class RuntimeStatsCollector:
         self._screen_visit_counts: dict[int, int] = {}
         self._transition_set: set = set()
         self._batch_results: list[bool] = []  # Track batch success/failure
+        # Bounded quantile sketches keyed by timing name ("llm", "adb", "omniparser", "phase.decide", ...)
+        self._latency_sketches: dict[str, LatencySketch] = {}
 
     @property
     def stats(self) -> RuntimeStats:
         """Get the current statistics."""
         return self._stats
 
+    def record_latency(self, name: str, duration_ms: float) -> None:
+        """Record a timing sample into the named latency sketch.
+
+        Args:
+            name: Timing name, e.g. "llm", "adb", "omniparser"
+            duration_ms: Duration in milliseconds
+        """
+        sketch = self._latency_sketches.get(name)
+        if sketch is None:
+            sketch = self._latency_sketches[name] = LatencySketch()
+        sketch.add(duration_ms)
+
+    def record_phase_duration(self, phase: str, duration_ms: float) -> None:
+        """Record how long a step phase took.
+
+        Args:
+            phase: Step phase name (capture, decide, execute, ...)
+            duration_ms: Time spent in the phase
+        """
+        self.record_latency(f"phase.{phase}", duration_ms)
+
+    def latency_summary(self, name: str) -> LatencySummary:
+        """Get count, mean and p50/p95/p99 for a named timing.
+
+        Args:
+            name: Timing name passed to record_latency
+
+        Returns:
+            Cached summary; an all-zero summary if nothing was recorded
+        """
+        sketch = self._latency_sketches.get(name)
+        return sketch.summary() if sketch is not None else EMPTY_SUMMARY
+
+    def latency_summaries(self) -> dict[str, LatencySummary]:
+        """Get summaries for every timing recorded so far."""
+        return {name: sketch.summary() for name, sketch in self._latency_sketches.items()}
+
     def record_step_start(self) -> None:
         """Record that a new step has started."""
         self._stats.total_steps += 1
@@ -309,6 +350,7 @@ class RuntimeStatsCollector:
 
         # Update response time stats
         if success:
+            self.record_latency("llm", response_time_ms)
             self._stats.avg_ai_response_time_ms = (
                 (self._stats.avg_ai_response_time_ms * (self._stats.total_ai_calls - 1) + response_time_ms)
                 / self._stats.total_ai_calls
@@ -549,4 +591,8 @@ class RuntimeStatsCollector:
             "avg_ai_response_time_ms": round(self._stats.avg_ai_response_time_ms, 2) if self._stats.avg_ai_response_time_ms else 0,
             "crawl_duration_seconds": round(self._stats.crawl_duration_seconds, 2),
             "screens_per_minute": round(self._stats.screens_per_minute, 2) if self._stats.screens_per_minute else 0,
+            "latency_percentiles_ms": {
+                name: {"p50": round(summary.p50, 2), "p95": round(summary.p95, 2), "p99": round(summary.p99, 2)}
+                for name, summary in self.latency_summaries().items()
+            },
         }
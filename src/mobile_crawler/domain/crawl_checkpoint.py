@@ -0,0 +1,195 @@
+"""Crash-resumable crawl checkpoints persisted in the session folder."""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from mobile_crawler.domain.errors import CheckpointError, ErrorContext
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "crawl_checkpoint.json"
+CHECKPOINT_VERSION = 1
+# App crashes are checkpointed before relaunching, so the interval only bounds
+# how much progress a killed process loses
+DEFAULT_CHECKPOINT_INTERVAL_STEPS = 10
+
+# CrawlerAgentState fields that carry exploration progress. Device snapshots
+# (a11y tree, screenshot, phone state) are intentionally excluded: they are
+# stale after a relaunch and are re-captured on the first resumed step.
+AGENT_STATE_FIELDS: tuple[str, ...] = (
+    "step_number",
+    "visited_packages",
+    "visited_activities",
+    "last_thought",
+    "previous_plan",
+    "progress_summary",
+    "plan",
+    "current_subgoal",
+    "action_history",
+    "summary_history",
+    "action_outcomes",
+    "error_descriptions",
+    "last_action",
+    "last_summary",
+    "manager_memory",
+    "fast_memory",
+)
+
+_SET_FIELDS = frozenset({"visited_packages", "visited_activities"})
+
+
+@dataclass
+class CrawlCheckpoint:
+    """Snapshot of crawl progress that survives an app crash or process restart.
+
+    The state graph is normally not copied into the checkpoint: it is
+    journaled next to it (see :class:`~mobile_crawler.domain.state_graph.StateGraphTracker`)
+    and ``state_graph_seq`` records how far that journal had got. ``state_graph``
+    only holds the full graph when it is not journaled (no checkpoint
+    directory) or when reading a checkpoint written before the journal existed.
+    """
+
+    run_id: int
+    step_number: int = 0
+    agent_state: dict[str, Any] = field(default_factory=dict)
+    state_graph_seq: int = 0
+    state_graph: dict[str, Any] = field(default_factory=dict)
+    saved_at: float = field(default_factory=time.time)
+    version: int = CHECKPOINT_VERSION
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {
+            "version": self.version,
+            "run_id": self.run_id,
+            "step_number": self.step_number,
+            "saved_at": self.saved_at,
+            "agent_state": self.agent_state,
+            "state_graph_seq": self.state_graph_seq,
+        }
+        if self.state_graph:
+            data["state_graph"] = self.state_graph
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CrawlCheckpoint":
+        return cls(
+            run_id=int(data["run_id"]),
+            step_number=int(data.get("step_number", 0) or 0),
+            agent_state=dict(data.get("agent_state") or {}),
+            state_graph_seq=int(data.get("state_graph_seq", 0) or 0),
+            state_graph=dict(data.get("state_graph") or {}),
+            saved_at=float(data.get("saved_at", 0.0) or 0.0),
+            version=int(data.get("version", CHECKPOINT_VERSION)),
+        )
+
+
+def snapshot_agent_state(shared_state: Any) -> dict[str, Any]:
+    """Extract the JSON-serializable progress fields from a CrawlerAgentState.
+
+    Args:
+        shared_state: The agent's shared state (any object exposing the fields).
+
+    Returns:
+        Dict of field name -> plain JSON value.
+    """
+    snapshot: dict[str, Any] = {}
+    for name in AGENT_STATE_FIELDS:
+        if not hasattr(shared_state, name):
+            continue
+        value = getattr(shared_state, name)
+        if name in _SET_FIELDS:
+            value = sorted(value or [])
+        snapshot[name] = value
+    return snapshot
+
+
+def restore_agent_state(shared_state: Any, snapshot: dict[str, Any]) -> None:
+    """Apply a snapshot onto an existing CrawlerAgentState in place.
+
+    The state object is shared by reference with the Manager and Executor
+    sub-agents, so fields are assigned individually rather than replacing it.
+
+    Args:
+        shared_state: The freshly created agent's shared state.
+        snapshot: Dict produced by :func:`snapshot_agent_state`.
+    """
+    for name in AGENT_STATE_FIELDS:
+        if name not in snapshot:
+            continue
+        value = snapshot[name]
+        if name in _SET_FIELDS:
+            value = set(value or [])
+        try:
+            setattr(shared_state, name, value)
+        except Exception as e:
+            logger.warning(f"Could not restore agent state field '{name}': {e}")
+
+
+class CrawlCheckpointStore:
+    """Reads and writes the crawl checkpoint file for a single session.
+
+    Writes go to a temporary file followed by ``os.replace`` so a crash in the
+    middle of a save never leaves a truncated checkpoint behind.
+    """
+
+    def __init__(self, checkpoint_dir: str):
+        """Initialize the store.
+
+        Args:
+            checkpoint_dir: Directory inside the session folder (usually ``data``).
+        """
+        self.checkpoint_dir = checkpoint_dir
+        self.path = os.path.join(checkpoint_dir, CHECKPOINT_FILENAME)
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    def save(self, checkpoint: CrawlCheckpoint) -> None:
+        """Persist a checkpoint atomically.
+
+        Raises:
+            CheckpointError: If the checkpoint cannot be written.
+        """
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(checkpoint.to_dict(), f, ensure_ascii=True, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            raise CheckpointError(
+                f"Failed to write crawl checkpoint to {self.path}: {e}",
+                context=ErrorContext(run_id=checkpoint.run_id, step_id=checkpoint.step_number),
+                cause=e,
+            ) from e
+
+    def load(self) -> CrawlCheckpoint | None:
+        """Load the checkpoint if present.
+
+        Returns:
+            The checkpoint, or None when missing or unreadable.
+        """
+        if not self.exists():
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if int(data.get("version", 0)) != CHECKPOINT_VERSION:
+                logger.warning(f"Ignoring crawl checkpoint with unsupported version: {data.get('version')}")
+                return None
+            return CrawlCheckpoint.from_dict(data)
+        except Exception as e:
+            logger.warning(f"Failed to read crawl checkpoint {self.path}: {e}")
+            return None
+
+    def clear(self) -> None:
+        """Remove the checkpoint file if present."""
+        try:
+            if self.exists():
+                os.remove(self.path)
+        except OSError as e:
+            logger.warning(f"Failed to remove crawl checkpoint {self.path}: {e}")
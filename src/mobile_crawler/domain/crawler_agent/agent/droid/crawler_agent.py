@@ -7,6 +7,7 @@ Architecture:
 - When reasoning=True: Uses Manager (planning) + Executor (action) workflows
 """
 
+import asyncio
 import logging
 import os
 import traceback
@@ -34,6 +35,7 @@ from mobile_crawler.domain.crawler_agent.agent.common.events import (
     RecordUIStateEvent,
     ResultEvent,
     ScreenshotEvent,
+    ToolExecutionEvent,
 )
 from mobile_crawler.domain.crawler_agent.agent.droid.state import CrawlerAgentState, QueuedUserMessage
 from mobile_crawler.domain.crawler_agent.agent.executor import ExecutorAgent
@@ -268,11 +270,25 @@ class CrawlerAgent(Workflow):
             self.structured_output_llm = None
 
         if not self._using_external_agent and self.config.logging.save_trajectory != "none":
+            blob_store = None
+            if self.config.logging.blob_store_path:
+                from mobile_crawler.infrastructure.blob_store import BlobStore
+
+                blob_store = BlobStore(
+                    self.config.logging.blob_store_path,
+                    image_format=self.config.logging.blob_image_format or None,
+                )
             self.trajectory = Trajectory(
                 goal=self.shared_state.instruction,
                 base_path=self.config.logging.trajectory_path,
+                blob_store=blob_store,
+            )
+            self.trajectory_writer = TrajectoryWriter(
+                queue_size=300,
+                stream_animation=self.config.logging.trajectory_gifs,
+                animation_max_width=self.config.logging.trajectory_gif_max_width,
+                animation_format=self.config.logging.trajectory_animation_format,
             )
-            self.trajectory_writer = TrajectoryWriter(queue_size=300)
         else:
             self.trajectory = None
             self.trajectory_writer = None
@@ -464,6 +480,10 @@ class CrawlerAgent(Workflow):
                 target_package=self.config.target_package,
             )
 
+        # Replay needs the same parser settings to reproduce recorded layout hashes
+        if self.trajectory is not None and hasattr(self.state_provider, "layout_hash_settings"):
+            self.trajectory.layout_hash_settings = self.state_provider.layout_hash_settings()
+
         # ── 3. Build tool registry ────────────────────────────────────
         registry, standard_tool_names = await build_tool_registry(
             supported_buttons=driver.supported_buttons,
@@ -518,6 +538,8 @@ class CrawlerAgent(Workflow):
             self.manager_agent.save_trajectory = self.config.logging.save_trajectory
             self.manager_agent.standard_tool_names = self.standard_tool_names
             self.manager_agent.state_graph_tracker = self.state_graph_tracker
+            if self.config.agent.frontier_navigation and self.state_graph_tracker is not None:
+                self.manager_agent.frontier_navigator = self._build_frontier_navigator()
             self.executor_agent.registry = self.registry
             self.executor_agent.action_ctx = self.action_ctx
 
@@ -572,6 +594,34 @@ class CrawlerAgent(Workflow):
         ctx.write_event_to_stream(event)
         return event
 
+    def _build_frontier_navigator(self):
+        """Create a FrontierNavigator that replays hops through the tool registry.
+
+        Hops run with the manager's workflow context, so each one streams a
+        ToolExecutionEvent like an executor action.
+        """
+        from mobile_crawler.domain.frontier_navigator import FrontierNavigator
+
+        async def execute(command: dict, workflow_ctx=None) -> bool:
+            action_args = {k: v for k, v in command.items() if k != "action"}
+            result = await self.registry.execute(
+                command["action"], action_args, self.action_ctx, workflow_ctx=workflow_ctx
+            )
+            await asyncio.sleep(self.config.agent.after_sleep_action)
+            return result.success
+
+        async def capture():
+            ui_state = await self.state_provider.get_state()
+            self.action_ctx.ui = ui_state
+            return ui_state
+
+        return FrontierNavigator(
+            self.state_graph_tracker,
+            execute=execute,
+            capture=capture,
+            max_hops=self.config.agent.frontier_max_hops,
+        )
+
     # ========================================================================
     # External user message injection
     # ========================================================================
@@ -905,6 +955,9 @@ class CrawlerAgent(Workflow):
         if not isinstance(ev, StopEvent):
             ctx.write_event_to_stream(ev)
 
+            if isinstance(ev, ToolExecutionEvent):
+                self.shared_state.last_action_duration_ms = ev.duration_ms
+
             if self.trajectory:
                 if isinstance(ev, ScreenshotEvent):
                     self.trajectory.screenshot_queue.append(ev.screenshot)
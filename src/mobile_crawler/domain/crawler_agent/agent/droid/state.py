@@ -77,6 +77,7 @@ class CrawlerAgentState(BaseModel):
     action_outcomes: list[bool] = Field(default_factory=list)
     error_descriptions: list[str] = Field(default_factory=list)
     last_action: dict = Field(default_factory=dict)
+    last_action_duration_ms: float | None = None
     last_summary: str = ""
 
     # ========================================================================
@@ -115,6 +116,8 @@ class CrawlerAgentState(BaseModel):
     output_dir: str = ""
     loop_warning: str = ""
     loop_hint: str = ""
+    # JSON summary of recent captured network traffic (empty without live capture)
+    network_activity: str = ""
 
     # ========================================================================
     # Methods for action functions
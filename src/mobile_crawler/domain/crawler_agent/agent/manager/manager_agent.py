@@ -53,6 +53,7 @@ from mobile_crawler.domain.crawler_agent.app_cards.providers import (
 )
 from mobile_crawler.domain.crawler_agent.config_manager.prompt_loader import PromptLoader
 from mobile_crawler.domain.crawler_agent.tools.driver.base import DeviceDisconnectedError
+from mobile_crawler.domain.state_graph import count_clickable
 
 if TYPE_CHECKING:
     from mobile_crawler.domain.crawler_agent.agent.action_context import ActionContext
@@ -216,6 +217,7 @@ class ManagerAgent(Workflow):
             "platform": self.shared_state.platform,
             "loop_warning": self.shared_state.loop_warning,
             "loop_hint": self.shared_state.loop_hint,
+            "network_activity": self.shared_state.network_activity,
         }
 
         custom_prompt = self.prompt_resolver.get_prompt("manager_system")
@@ -438,10 +440,26 @@ class ManagerAgent(Workflow):
                     last_action = self.shared_state.last_action
                     if last_action:
                         self.state_graph_tracker.record_transition(
-                            from_hash, current_hash, last_action, step_num
+                            from_hash, current_hash, last_action, step_num,
+                            duration_ms=self.shared_state.last_action_duration_ms,
                         )
 
-                self.state_graph_tracker.record_state(current_hash, step_num, pkg, act)
+                self.state_graph_tracker.record_state(
+                    current_hash, step_num, pkg, act, clickable_count=count_clickable(ui_state.elements)
+                )
+
+                # Exhausted screen: replay the known path to unexplored screens without the LLM
+                navigator = getattr(self, "frontier_navigator", None)
+                if navigator is not None and navigator.should_navigate(current_hash):
+                    navigation = await navigator.navigate(current_hash, step_num, workflow_ctx=ctx)
+                    if navigation.final_state is not None:
+                        ui_state = navigation.final_state
+                        self.action_ctx.ui = ui_state
+                        current_hash = ui_state.layout_hash
+                        if screenshot is not None:
+                            screenshot = await self.action_ctx.driver.screenshot()
+                            if screenshot:
+                                ctx.write_event_to_stream(ScreenshotEvent(screenshot=screenshot))
 
                 if self.state_graph_tracker.detect_loop(window_size=4):
                     hint = self.state_graph_tracker.get_loop_recovery_hint(current_hash, ui_state.elements)
@@ -0,0 +1,176 @@
+"""Incremental trajectory animation encoding.
+
+Frames are appended to the GIF on disk one at a time, so memory use does not
+grow with the number of steps and a partially written trajectory is already
+a valid, viewable GIF.
+"""
+
+import io
+import logging
+import struct
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageStat
+
+logger = logging.getLogger("crawler_agent")
+
+# Mean per-channel error (0-255) on a thumbnail above which the shared
+# palette no longer fits the frame and a fresh one is built.
+PALETTE_REUSE_MAX_ERROR = 12.0
+
+_GIF_TRAILER = b"\x3b"
+_NETSCAPE_LOOP = b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00"
+
+
+def _skip_sub_blocks(data: bytes, pos: int) -> int:
+    """Return the position just past a GIF sub-block chain starting at ``pos``."""
+    while True:
+        size = data[pos]
+        pos += 1
+        if size == 0:
+            return pos
+        pos += size
+
+
+def _extract_image_block(gif_bytes: bytes) -> bytes:
+    """Extract a single frame's image block from a one-frame GIF.
+
+    The returned bytes start at the image descriptor and always carry a
+    local color table (copied from the global one when needed), so they can
+    be spliced into another GIF stream regardless of its global palette.
+    """
+    packed = gif_bytes[10]
+    pos = 13
+    global_table = b""
+    global_size_bits = 0
+    if packed & 0x80:
+        global_size_bits = packed & 0x07
+        table_len = 3 * (2 ** (global_size_bits + 1))
+        global_table = gif_bytes[pos:pos + table_len]
+        pos += table_len
+
+    while pos < len(gif_bytes):
+        marker = gif_bytes[pos]
+        if marker == 0x21:
+            pos = _skip_sub_blocks(gif_bytes, pos + 2)
+        elif marker == 0x2C:
+            descriptor = bytearray(gif_bytes[pos:pos + 10])
+            pos += 10
+            local_table = b""
+            if descriptor[9] & 0x80:
+                table_len = 3 * (2 ** ((descriptor[9] & 0x07) + 1))
+                local_table = gif_bytes[pos:pos + table_len]
+                pos += table_len
+            else:
+                descriptor[9] |= 0x80 | global_size_bits
+                local_table = global_table
+            data_start = pos
+            pos = _skip_sub_blocks(gif_bytes, pos + 1)
+            return bytes(descriptor) + local_table + gif_bytes[data_start:pos]
+        else:
+            break
+
+    raise ValueError("No image block found in GIF data")
+
+
+class StreamingGifEncoder:
+    """Appends frames to an animated GIF as they arrive.
+
+    Each frame is optionally downscaled to ``max_width``, quantized against
+    the palette of an earlier frame while that palette still fits (so
+    per-frame quantization is cheap and colors do not flicker between
+    similar screens), and written straight to disk. The trailer byte is
+    rewritten after every frame so the file on disk is always complete.
+
+    Only the shared palette image and the current frame are held in memory.
+    """
+
+    def __init__(self, target_path: Path, duration: int = 1000, max_width: int | None = None):
+        """Initialize the encoder.
+
+        Args:
+            target_path: Output GIF path
+            duration: Display time per frame in milliseconds
+            max_width: Downscale frames wider than this (keeps aspect ratio)
+        """
+        self.target_path = Path(target_path)
+        self.duration = duration
+        self.max_width = max_width if max_width and max_width > 0 else None
+        self.frame_count = 0
+        self._size: tuple[int, int] | None = None
+        self._palette_image: Image.Image | None = None
+
+    def add_frame(self, image_bytes: bytes) -> None:
+        """Encode one screenshot and append it to the GIF on disk."""
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            frame = self._prepare_frame(img)
+        self.add_image(frame)
+
+    def add_image(self, frame: Image.Image) -> None:
+        """Append an already-decoded image as the next frame."""
+        if frame.mode != "RGB":
+            frame = frame.convert("RGB")
+        if self._size is None:
+            self._size = frame.size
+        elif frame.size != self._size:
+            frame = frame.resize(self._size)
+
+        if self._palette_fits(frame):
+            quantized = frame.quantize(palette=self._palette_image, dither=Image.Dither.NONE)
+        else:
+            quantized = frame.quantize(colors=256)
+            self._palette_image = quantized
+
+        single = io.BytesIO()
+        quantized.save(single, format="GIF")
+        image_block = _extract_image_block(single.getvalue())
+
+        delay_cs = max(1, int(round(self.duration / 10)))
+        control = b"\x21\xf9\x04\x04" + struct.pack("<H", delay_cs) + b"\x00\x00"
+
+        if self.frame_count == 0:
+            self.target_path.parent.mkdir(parents=True, exist_ok=True)
+            width, height = self._size
+            header = b"GIF89a" + struct.pack("<HHBBB", width, height, 0, 0, 0) + _NETSCAPE_LOOP
+            with open(self.target_path, "wb") as f:
+                f.write(header + control + image_block + _GIF_TRAILER)
+        else:
+            with open(self.target_path, "r+b") as f:
+                f.seek(-1, io.SEEK_END)
+                f.write(control + image_block + _GIF_TRAILER)
+
+        self.frame_count += 1
+
+    def _palette_fits(self, frame: Image.Image) -> bool:
+        """Check on a thumbnail whether the shared palette represents ``frame`` well."""
+        if self._palette_image is None:
+            return False
+        probe = frame.resize((32, 32), Image.Resampling.NEAREST)
+        mapped = probe.quantize(palette=self._palette_image, dither=Image.Dither.NONE)
+        diff = ImageChops.difference(probe, mapped.convert("RGB"))
+        error = sum(ImageStat.Stat(diff).mean) / 3
+        return error <= PALETTE_REUSE_MAX_ERROR
+
+    def _prepare_frame(self, img: Image.Image) -> Image.Image:
+        frame = img.convert("RGB")
+        if self.max_width and frame.width > self.max_width:
+            height = max(1, round(frame.height * self.max_width / frame.width))
+            frame = frame.resize((self.max_width, height), Image.Resampling.BILINEAR)
+        return frame
+
+
+def convert_gif_to_webp(gif_path: Path, webp_path: Path, quality: int = 70) -> None:
+    """Re-encode a trajectory GIF as animated WebP.
+
+    Pillow reads GIF frames lazily while saving, so this also runs in memory
+    independent of the frame count.
+    """
+    with Image.open(gif_path) as gif:
+        gif.save(
+            webp_path,
+            format="WEBP",
+            save_all=True,
+            quality=quality,
+            duration=gif.info.get("duration", 1000),
+            loop=0,
+        )
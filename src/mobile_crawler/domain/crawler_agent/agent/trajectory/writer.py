@@ -5,10 +5,15 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import aiofiles
 from aiofiles import ospath
-from PIL import Image
+
+from mobile_crawler.domain.crawler_agent.agent.trajectory.animation import (
+    StreamingGifEncoder,
+    convert_gif_to_webp,
+)
 
 logger = logging.getLogger("crawler_agent")
 
@@ -101,53 +106,119 @@ class ScreenshotWriteJob(WriteJob):
             await f.write(self.screenshot_bytes)
 
 
+@dataclass(frozen=True)
+class BlobWriteJob(WriteJob):
+    """Stores a screenshot in the content-addressed blob store.
+
+    The store skips the write when a blob with the same digest exists, so
+    an unchanged screen across consecutive steps hits the disk only once.
+    """
+
+    blob_store: Any
+    digest: str
+    payload: bytes
+    extension: str = "png"
+
+    async def execute(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self.blob_store.put, self.payload, self.extension, self.digest
+        )
+
+
+@dataclass(frozen=True)
+class ScreenshotIndexWriteJob(WriteJob):
+    """Appends blob digests to screenshots.txt, one line per screenshot in capture order."""
+
+    target_path: Path
+    digests: tuple[str, ...]
+
+    async def execute(self) -> None:
+        async with aiofiles.open(self.target_path, "a") as f:
+            await f.write("".join(f"{digest}\n" for digest in self.digests))
+
+
 @dataclass(frozen=True)
 class GifWriteJob(WriteJob):
-    """Creates animated GIF from screenshots on disk."""
+    """Creates animated GIF from screenshots on disk.
+
+    Fallback for trajectories that were not streamed frame by frame.
+    Screenshots are read as ``NNNN.png`` from ``screenshots_folder`` unless
+    ``screenshot_digests`` is given, in which case they are resolved through
+    ``blob_store``. Frames are encoded one at a time, so memory use does not
+    depend on the screenshot count.
+    """
 
     target_path: Path
     screenshots_folder: Path
     screenshot_count: int
     duration: int = 1000
+    blob_store: Any = None
+    screenshot_digests: tuple[str, ...] = ()
+    max_width: int | None = None
+    animation_format: str = "gif"
+
+    def _screenshot_paths(self) -> list[Path | None]:
+        if self.blob_store is not None and self.screenshot_digests:
+            paths = []
+            for digest in self.screenshot_digests:
+                blob_path = self.blob_store.path(digest)
+                paths.append(Path(blob_path) if blob_path else None)
+            return paths
+        return [
+            self.screenshots_folder / f"{idx:04d}.png"
+            for idx in range(self.screenshot_count)
+        ]
 
     async def execute(self) -> None:
         def _create_gif():
-            images = []
+            encoder = StreamingGifEncoder(
+                self.target_path, duration=self.duration, max_width=self.max_width
+            )
 
-            for idx in range(self.screenshot_count):
-                screenshot_path = self.screenshots_folder / f"{idx:04d}.png"
-                if not screenshot_path.exists():
-                    logger.warning(f"Screenshot {idx:04d}.png not found, skipping")
+            for idx, screenshot_path in enumerate(self._screenshot_paths()):
+                if screenshot_path is None or not screenshot_path.exists():
+                    logger.warning(f"Screenshot {idx:04d} not found, skipping")
                     continue
 
                 try:
-                    img = Image.open(screenshot_path)
-                    images.append(img.copy())
-                    img.close()
+                    encoder.add_frame(screenshot_path.read_bytes())
                 except Exception as e:
                     logger.warning(f"Failed to load screenshot {idx}: {e}")
                     continue
 
-            if images:
-                try:
-                    images[0].save(
-                        str(self.target_path),
-                        save_all=True,
-                        append_images=images[1:],
-                        duration=self.duration,
-                        loop=0,
-                    )
-                finally:
-                    for img in images:
-                        try:
-                            img.close()
-                        except Exception:
-                            pass
+            if encoder.frame_count and self.animation_format == "webp":
+                convert_gif_to_webp(self.target_path, self.target_path.with_suffix(".webp"))
 
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, _create_gif)
 
 
+@dataclass(frozen=True)
+class GifFrameWriteJob(WriteJob):
+    """Appends one screenshot to the trajectory's streaming GIF."""
+
+    encoder: StreamingGifEncoder
+    screenshot_bytes: bytes
+
+    async def execute(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.encoder.add_frame, self.screenshot_bytes)
+
+
+@dataclass(frozen=True)
+class AnimationFinalizeJob(WriteJob):
+    """Converts the finished streaming GIF to animated WebP."""
+
+    gif_path: Path
+
+    async def execute(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, convert_gif_to_webp, self.gif_path, self.gif_path.with_suffix(".webp")
+        )
+
+
 @dataclass(frozen=True)
 class UIStateWriteJob(WriteJob):
     """Writes UI state JSON."""
@@ -243,6 +314,10 @@ class TrajectoryWriter:
     Manages a single async worker that processes write jobs from a queue.
     All writes happen in the background - agent never blocks on I/O.
 
+    With ``stream_animation`` enabled, every screenshot is appended to
+    ``screenshots/trajectory.gif`` as it is written, so the GIF is viewable
+    mid-crawl and no end-of-run pass over all screenshots is needed.
+
     Usage:
         writer = TrajectoryWriter(queue_size=300)
         await writer.start()
@@ -255,9 +330,27 @@ class TrajectoryWriter:
         await writer.stop()
     """
 
-    def __init__(self, queue_size: int = 300):
+    def __init__(
+        self,
+        queue_size: int = 300,
+        stream_animation: bool = False,
+        animation_max_width: int | None = None,
+        animation_format: str = "gif",
+    ):
+        """Initialize the writer.
+
+        Args:
+            queue_size: Maximum number of pending write jobs
+            stream_animation: Append screenshots to the trajectory GIF as they arrive
+            animation_max_width: Downscale animation frames wider than this
+            animation_format: "gif", or "webp" to also emit an animated WebP at the end
+        """
         self.worker = WriterWorker(max_queue_size=queue_size)
         self._started = False
+        self.stream_animation = stream_animation
+        self.animation_max_width = animation_max_width
+        self.animation_format = animation_format
+        self._encoders: dict[str, StreamingGifEncoder] = {}
 
     async def start(self) -> None:
         """Start the background worker."""
@@ -313,6 +406,13 @@ class TrajectoryWriter:
         )
         jobs.extend(ui_jobs)
 
+        if self.stream_animation:
+            jobs.extend(
+                self._create_gif_frame_jobs(
+                    screenshot_queue_snapshot, trajectory, trajectory_id, stage
+                )
+            )
+
         for job in jobs:
             self.worker.submit(job)
 
@@ -329,12 +429,26 @@ class TrajectoryWriter:
             trajectory: Trajectory instance to finalize
         """
         self.write(trajectory, stage="final")
-        # GIF is only created at finalize (all screenshots available)
-        if trajectory_gifs is True:
-            trajectory_id = trajectory.trajectory_folder.name
-            gif_job = self._create_gif_job(trajectory, trajectory_id, "final")
-            if gif_job:
-                self.worker.submit(gif_job)
+        if trajectory_gifs is not True:
+            return
+
+        trajectory_id = trajectory.trajectory_folder.name
+        encoder = self._encoders.pop(trajectory_id, None)
+        if encoder is not None:
+            # Frames were streamed during the crawl; the GIF is already complete
+            if self.animation_format == "webp":
+                self.worker.submit(
+                    AnimationFinalizeJob(
+                        trajectory_id=trajectory_id,
+                        stage="final",
+                        gif_path=encoder.target_path,
+                    )
+                )
+            return
+
+        gif_job = self._create_gif_job(trajectory, trajectory_id, "final")
+        if gif_job:
+            self.worker.submit(gif_job)
 
     def _create_events_job(
         self, events_snapshot, trajectory, trajectory_id, stage
@@ -377,6 +491,9 @@ class TrajectoryWriter:
             "total_actions": len(macro_snapshot),
             "actions": macro_snapshot,  # already list[dict] from RecordingDriver.log
         }
+        layout_hash_settings = getattr(trajectory, "layout_hash_settings", None)
+        if layout_hash_settings:
+            macro_data["layout_hash"] = layout_hash_settings
 
         return MacroWriteJob(
             trajectory_id=trajectory_id,
@@ -387,7 +504,13 @@ class TrajectoryWriter:
 
     def _create_screenshot_jobs(
         self, screenshot_queue_snapshot, trajectory, trajectory_id, stage
-    ) -> list[ScreenshotWriteJob]:
+    ) -> list[WriteJob]:
+        blob_store = getattr(trajectory, "blob_store", None)
+        if blob_store is not None:
+            return self._create_blob_screenshot_jobs(
+                screenshot_queue_snapshot, trajectory, trajectory_id, stage
+            )
+
         jobs = []
         screenshots_folder = trajectory.trajectory_folder / "screenshots"
         screenshots_folder.mkdir(exist_ok=True)
@@ -408,6 +531,70 @@ class TrajectoryWriter:
 
         return jobs
 
+    def _create_blob_screenshot_jobs(
+        self, screenshot_queue_snapshot, trajectory, trajectory_id, stage
+    ) -> list[WriteJob]:
+        from mobile_crawler.infrastructure.blob_store import compute_digest
+
+        if not screenshot_queue_snapshot:
+            return []
+
+        jobs: list[WriteJob] = []
+        seen: set[str] = set()
+        digests = []
+        for screenshot_bytes in screenshot_queue_snapshot:
+            digest = compute_digest(screenshot_bytes)
+            digests.append(digest)
+            if digest in seen:
+                continue
+            seen.add(digest)
+            jobs.append(
+                BlobWriteJob(
+                    trajectory_id=trajectory_id,
+                    stage=stage,
+                    blob_store=trajectory.blob_store,
+                    digest=digest,
+                    payload=screenshot_bytes,
+                )
+            )
+
+        trajectory.screenshot_digests.extend(digests)
+        jobs.append(
+            ScreenshotIndexWriteJob(
+                trajectory_id=trajectory_id,
+                stage=stage,
+                target_path=trajectory.trajectory_folder / "screenshots.txt",
+                digests=tuple(digests),
+            )
+        )
+        return jobs
+
+    def _create_gif_frame_jobs(
+        self, screenshot_queue_snapshot, trajectory, trajectory_id, stage
+    ) -> list[GifFrameWriteJob]:
+        if not screenshot_queue_snapshot:
+            return []
+
+        encoder = self._encoders.get(trajectory_id)
+        if encoder is None:
+            screenshots_folder = trajectory.trajectory_folder / "screenshots"
+            screenshots_folder.mkdir(exist_ok=True)
+            encoder = StreamingGifEncoder(
+                screenshots_folder / "trajectory.gif",
+                max_width=self.animation_max_width,
+            )
+            self._encoders[trajectory_id] = encoder
+
+        return [
+            GifFrameWriteJob(
+                trajectory_id=trajectory_id,
+                stage=stage,
+                encoder=encoder,
+                screenshot_bytes=screenshot_bytes,
+            )
+            for screenshot_bytes in screenshot_queue_snapshot
+        ]
+
     def _create_gif_job(
         self, trajectory, trajectory_id, stage
     ) -> GifWriteJob | None:
@@ -423,6 +610,10 @@ class TrajectoryWriter:
             target_path=screenshots_folder / "trajectory.gif",
             screenshots_folder=screenshots_folder,
             screenshot_count=trajectory.screenshot_count,
+            blob_store=getattr(trajectory, "blob_store", None),
+            screenshot_digests=tuple(getattr(trajectory, "screenshot_digests", ())),
+            max_width=self.animation_max_width,
+            animation_format=self.animation_format,
         )
 
     def _create_ui_state_jobs(
@@ -20,18 +20,25 @@ logger = logging.getLogger("crawler_agent")
 
 
 class Trajectory:
-    def __init__(self, goal: str = None, base_path: str = "trajectories"):
+    def __init__(self, goal: str = None, base_path: str = "trajectories", blob_store=None):
         """Initialize trajectory with incremental saving.
 
         Args:
             goal: The goal/prompt that this trajectory is trying to achieve
             base_path: Directory for saving (absolute or relative to cwd)
+            blob_store: Optional content-addressed store for screenshots. When
+                set, screenshots are deduplicated into the store and listed by
+                digest in screenshots.txt instead of written as NNNN.png files.
         """
         self.events: list[Event] = []
         self.screenshot_count: int = 0
         self.screenshot_queue: list[bytes] = []
+        self.screenshot_digests: list[str] = []
+        self.blob_store = blob_store
         self.ui_states: list[dict[str, Any]] = []
         self.macro: list[dict[str, Any]] = []  # populated from RecordingDriver.log
+        # How the macro's expected_layout_hash values were computed (see AndroidStateProvider)
+        self.layout_hash_settings: dict[str, Any] | None = None
         self.goal = goal or "Droidrun automation sequence"
 
         self.base_path = self._resolve_path(base_path)
@@ -94,6 +101,7 @@ class Trajectory:
             "trajectory_data": None,
             "macro_data": None,
             "gif_path": None,
+            "screenshot_digests": None,
             "folder_path": trajectory_folder,
         }
 
@@ -112,6 +120,17 @@ class Trajectory:
                     result["macro_data"] = json.load(f)
                 logger.debug(f"📖 Loaded macro data from {macro_json_path}")
 
+            # Load blob digests for screenshots stored in a blob store
+            screenshots_index_path = os.path.join(trajectory_folder, "screenshots.txt")
+            screenshots_json_path = os.path.join(trajectory_folder, "screenshots.json")
+            if os.path.exists(screenshots_index_path):
+                with open(screenshots_index_path) as f:
+                    result["screenshot_digests"] = [line.strip() for line in f if line.strip()]
+            elif os.path.exists(screenshots_json_path):
+                # Trajectories saved before the index became append-only
+                with open(screenshots_json_path) as f:
+                    result["screenshot_digests"] = json.load(f).get("screenshots", [])
+
             # Check for GIF
             gif_path = os.path.join(trajectory_folder, "screenshots", "trajectory.gif")
             if os.path.exists(gif_path):
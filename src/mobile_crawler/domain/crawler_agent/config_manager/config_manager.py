@@ -79,6 +79,8 @@ class AgentConfig:
     after_sleep_action: float = 1.0
     wait_for_stable_ui: float = 0.3
     use_normalized_coordinates: bool = False
+    frontier_navigation: bool = False
+    frontier_max_hops: int = 6
 
     fast_agent: FastAgentConfig = field(default_factory=FastAgentConfig)
     manager: ManagerConfig = field(default_factory=ManagerConfig)
@@ -140,6 +142,10 @@ class LoggingConfig:
     trajectory_path: str = "trajectories"
     rich_text: bool = False
     trajectory_gifs: bool = True
+    trajectory_gif_max_width: int = 540  # Downscale animation frames; 0 = full size
+    trajectory_animation_format: str = "gif"  # "gif" or "webp" (GIF plus animated WebP)
+    blob_store_path: str = ""  # Empty = screenshots written as NNNN.png per trajectory
+    blob_image_format: str = ""  # "", "webp" or "jpeg"
 
 
 def _default_disabled_tools() -> list[str]:
@@ -282,6 +288,8 @@ class CrawlerConfig:
             after_sleep_action=agent_data.get("after_sleep_action", 1.0),
             wait_for_stable_ui=agent_data.get("wait_for_stable_ui", 0.3),
             use_normalized_coordinates=agent_data.get("use_normalized_coordinates", False),
+            frontier_navigation=agent_data.get("frontier_navigation", False),
+            frontier_max_hops=agent_data.get("frontier_max_hops", 6),
             fast_agent=fast_agent_config,
             manager=manager_config,
             executor=executor_config,
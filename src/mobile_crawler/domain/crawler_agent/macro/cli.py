@@ -12,7 +12,7 @@ from rich.table import Table
 
 from mobile_crawler.domain.crawler_agent.agent.utils.trajectory import Trajectory
 from mobile_crawler.domain.crawler_agent.config_manager.path_resolver import PathResolver
-from mobile_crawler.domain.crawler_agent.macro.replay import MacroPlayer
+from mobile_crawler.domain.crawler_agent.macro.replay import DEFAULT_SETTLE_TIMEOUT, MacroPlayer
 
 console = Console()
 
@@ -49,7 +49,32 @@ def macro_cli():
 @click.argument("path", type=click.Path(exists=True))
 @click.option("--device", "-d", help="Device serial number", default=None)
 @click.option(
-    "--delay", "-t", help="Delay between actions (seconds)", default=1.0, type=float
+    "--delay", "-t", help="Fixed delay between actions (seconds)", default=1.0, type=float
+)
+@click.option(
+    "--settle", is_flag=True, help="Wait for the UI to stop changing after each action instead of --delay",
+    default=False,
+)
+@click.option(
+    "--settle-timeout",
+    help="Longest wait for the UI to stop changing after each action with --settle (seconds)",
+    default=DEFAULT_SETTLE_TIMEOUT,
+    type=float,
+)
+@click.option(
+    "--verify-drift", is_flag=True, default=False,
+    help="Compare the screen after each action with the layout hash recorded in the macro",
+)
+@click.option(
+    "--stop-on-drift", is_flag=True, help="Abort on the first layout drift (implies --verify-drift)", default=False
+)
+@click.option(
+    "--ui-parser-mode", type=click.Choice(["boost", "omniparser", "accessibility"]), default=None,
+    help="UI parser for drift hashes (default: the one recorded in the macro)",
+)
+@click.option(
+    "--tree-filter", type=click.Choice(["detailed", "concise"]), default=None,
+    help="UI tree filter for drift hashes (default: the one recorded in the macro)",
 )
 @click.option(
     "--start-from", "-s", help="Start from step number (1-based)", default=1, type=int
@@ -65,6 +90,12 @@ def replay(
     path: str,
     device: str | None,
     delay: float,
+    settle: bool,
+    settle_timeout: float,
+    verify_drift: bool,
+    stop_on_drift: bool,
+    ui_parser_mode: str | None,
+    tree_filter: str | None,
     start_from: int,
     max_steps: int | None,
     debug: bool,
@@ -77,6 +108,16 @@ def replay(
 
     # Convert start_from from 1-based to 0-based
     start_from_zero = max(0, start_from - 1)
+    settle_timeout = settle_timeout if settle else None
+    player_options = {
+        "verify_drift": verify_drift or stop_on_drift,
+        "stop_on_drift": stop_on_drift,
+        "layout_hash_settings": {
+            key: value
+            for key, value in (("ui_parser_mode", ui_parser_mode), ("tree_filter", tree_filter))
+            if value
+        },
+    }
 
     async def get_device():
         if device is None:
@@ -93,7 +134,8 @@ def replay(
 
     asyncio.run(
         _replay_with_device(
-            path, device, delay, start_from_zero, max_steps, dry_run, logger, get_device
+            path, device, delay, settle_timeout, player_options, start_from_zero, max_steps, dry_run, logger,
+            get_device,
         )
     )
 
@@ -102,6 +144,8 @@ async def _replay_with_device(
     path: str,
     device: str,
     delay: float,
+    settle_timeout: float | None,
+    player_options: dict,
     start_from: int,
     max_steps: int | None,
     dry_run: bool,
@@ -109,17 +153,21 @@ async def _replay_with_device(
     get_device,
 ):
     device = await get_device()
-    await _replay_async(path, device, delay, start_from, max_steps, dry_run, logger)
+    await _replay_async(
+        path, device, delay, settle_timeout, start_from, max_steps, dry_run, logger, player_options
+    )
 
 
 async def _replay_async(
     path: str,
     device: str,
     delay: float,
+    settle_timeout: float | None,
     start_from: int,
     max_steps: int | None,
     dry_run: bool,
     logger: logging.Logger,
+    player_options: dict | None = None,
 ):
     """Async function to handle macro replay."""
     try:
@@ -128,11 +176,17 @@ async def _replay_async(
 
         if resolved_path.is_file():
             logger.info(f"📄 Loading macro from file: {resolved_path}")
-            player = MacroPlayer(device_serial=device, delay_between_actions=delay)
+            player = MacroPlayer(
+                device_serial=device, delay_between_actions=delay, settle_timeout=settle_timeout,
+                **(player_options or {}),
+            )
             macro_data = player.load_macro_from_file(str(resolved_path))
         elif resolved_path.is_dir():
             logger.info(f"📁 Loading macro from folder: {resolved_path}")
-            player = MacroPlayer(device_serial=device, delay_between_actions=delay)
+            player = MacroPlayer(
+                device_serial=device, delay_between_actions=delay, settle_timeout=settle_timeout,
+                **(player_options or {}),
+            )
             macro_data = player.load_macro_from_folder(str(resolved_path))
         else:
             logger.error(f"❌ Invalid path: {resolved_path}")
@@ -152,7 +206,12 @@ async def _replay_async(
         logger.info(f"   Version: {version}")
         logger.info(f"   Total actions: {total_actions}")
         logger.info(f"   Device: {device}")
-        logger.info(f"   Delay between actions: {delay}s")
+        if settle_timeout is None:
+            logger.info(f"   Delay between actions: {delay}s")
+        else:
+            logger.info(f"   Wait for UI to settle: up to {settle_timeout}s")
+        if player.verify_drift:
+            logger.info("   Verify layout drift: yes")
 
         if start_from > 0:
             logger.info(f"   Starting from step: {start_from + 1}")
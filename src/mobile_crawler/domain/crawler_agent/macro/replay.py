@@ -6,17 +6,30 @@ that were generated during CrawlerAgent trajectory recording.
 """
 
 import asyncio
+import hashlib
 import logging
+import time
 from typing import Any
 
 from mobile_crawler.domain.crawler_agent.agent.utils.trajectory import Trajectory
 from mobile_crawler.domain.crawler_agent.tools.driver.android import AndroidDriver
+from mobile_crawler.domain.crawler_agent.tools.filters import get_filter
+from mobile_crawler.domain.crawler_agent.tools.formatters import IndexedFormatter
+from mobile_crawler.domain.crawler_agent.tools.ui.provider import AndroidStateProvider
+from mobile_crawler.domain.state_graph import EMPTY_LAYOUT_HASH
 
 logger = logging.getLogger("crawler_agent-macro")
 
 # Reverse map for legacy key_press macro entries
 _KEYCODE_TO_BUTTON = {4: "back", 3: "home", 66: "enter"}
 
+# Ceiling on how long to wait for the UI to settle after an action
+DEFAULT_SETTLE_TIMEOUT = 3.0
+# Pause between UI fingerprint polls while waiting to settle
+DEFAULT_SETTLE_POLL_INTERVAL = 0.1
+# Consecutive identical fingerprints that count as "settled"
+DEFAULT_SETTLE_STABLE_POLLS = 2
+
 
 class MacroPlayer:
     """
@@ -26,16 +39,48 @@ class MacroPlayer:
     on Android devices using AndroidDriver.
     """
 
-    def __init__(self, device_serial: str = None, delay_between_actions: float = 1.0):
+    def __init__(
+        self,
+        device_serial: str = None,
+        delay_between_actions: float = 1.0,
+        settle_timeout: float | None = None,
+        state_provider: Any = None,
+        stop_on_drift: bool = False,
+        verify_drift: bool = False,
+        layout_hash_settings: dict[str, Any] | None = None,
+    ):
         """
         Initialize the MacroPlayer.
 
         Args:
             device_serial: Serial number of the target device. If None, will use first available device.
-            delay_between_actions: Delay in seconds between each action (default: 1.0s)
+            delay_between_actions: Fixed delay in seconds between actions, used when
+                settle_timeout is None (default: 1.0s)
+            settle_timeout: When set, wait until the UI stops changing (up to this many
+                seconds) instead of sleeping a fixed delay after each action
+            state_provider: Optional object with async ``get_state()`` returning a state
+                with ``layout_hash``. Settling then compares layout hashes instead of
+                screenshots, and actions recorded with ``expected_layout_hash`` are verified.
+            stop_on_drift: Abort the replay on the first layout hash mismatch
+            verify_drift: Without a state_provider, check recorded layout hashes with an
+                AndroidStateProvider built like the recording's (the macro's
+                ``layout_hash`` settings). It is queried once per action after the
+                wait; settling keeps comparing screenshots.
+            layout_hash_settings: Overrides for the recorded settings, e.g.
+                ``{"ui_parser_mode": "omniparser", "tree_filter": "concise"}``
         """
         self.device_serial = device_serial
         self.delay_between_actions = delay_between_actions
+        self.settle_timeout = settle_timeout
+        self.state_provider = state_provider
+        self.stop_on_drift = stop_on_drift
+        self.verify_drift = verify_drift
+        self.layout_hash_settings = dict(layout_hash_settings or {})
+        self.drift_provider: AndroidStateProvider | None = None
+        self._last_layout_hash: str | None = None
+        self.settle_poll_interval = DEFAULT_SETTLE_POLL_INTERVAL
+        self.settle_stable_polls = DEFAULT_SETTLE_STABLE_POLLS
+        self.drifted_steps: list[int] = []
         self.driver: AndroidDriver | None = None
 
     async def _initialize_driver(self) -> AndroidDriver:
@@ -46,6 +91,51 @@ class MacroPlayer:
             logger.info(f"🤖 Initialized driver for device: {self.device_serial}")
         return self.driver
 
+    async def _prepare_drift_check(self, macro_data: dict[str, Any]) -> None:
+        """Build the drift provider from the recorded hash settings, or turn verification off.
+
+        Verification is refused when the macro does not say how its hashes were
+        computed, or when the rebuilt provider sees no elements on the device:
+        every screen would then hash to the empty state and report drift.
+        """
+        if not self.verify_drift or self.state_provider is not None:
+            return
+        settings = {**(macro_data.get("layout_hash") or {}), **self.layout_hash_settings}
+        if not settings.get("ui_parser_mode") or not settings.get("tree_filter"):
+            logger.warning(
+                "⚠️  Macro does not record how its layout hashes were computed; drift is not verified"
+            )
+            self.verify_drift = False
+            return
+
+        driver = await self._initialize_driver()
+        provider = AndroidStateProvider(
+            driver,
+            tree_filter=get_filter(settings["tree_filter"]),
+            tree_formatter=IndexedFormatter(),
+            use_normalized=settings.get("use_normalized", False),
+            ui_parser_mode=settings["ui_parser_mode"],
+            omniparser_backend=settings.get("omniparser_backend", "replicate"),
+            omniparser_local_url=settings.get("omniparser_local_url", "http://localhost:8000"),
+            omniparser_box_threshold=settings.get("omniparser_box_threshold", 0.05),
+            omniparser_a11y_threshold=settings.get("omniparser_a11y_threshold", 5),
+        )
+        try:
+            layout_hash = await self._layout_hash(provider)
+        except Exception as e:
+            logger.warning(f"⚠️  Cannot verify drift: UI state capture failed ({e})")
+            self.verify_drift = False
+            return
+        if layout_hash is None:
+            logger.warning(
+                f"⚠️  Cannot verify drift: the {settings['ui_parser_mode']} parser found no UI "
+                "elements on this device"
+            )
+            self.verify_drift = False
+            return
+        self.drift_provider = provider
+        logger.info(f"🔎 Verifying layout drift ({settings['ui_parser_mode']}, {settings['tree_filter']} filter)")
+
     def load_macro_from_file(self, macro_file_path: str) -> dict[str, Any]:
         """
         Load macro data from a JSON file.
@@ -108,8 +198,9 @@ class MacroPlayer:
                     f"👆 Swiping from ({start_x}, {start_y}) to ({end_x}, {end_y}) in {duration_ms}ms"
                 )
                 await driver.swipe(start_x, start_y, end_x, end_y, duration_ms)
-                # Additional wait after swipe for UI to settle
-                await asyncio.sleep(2)
+                if self.settle_timeout is None:
+                    # Fixed-delay mode: additional wait after swipe for UI to settle
+                    await asyncio.sleep(2)
                 return True
 
             elif action_type == "drag":
@@ -169,6 +260,97 @@ class MacroPlayer:
             logger.error(f"❌ Error executing action {action_type}: {e}")
             return False
 
+    @staticmethod
+    async def _layout_hash(provider) -> str | None:
+        """Layout hash of the current screen, or None if the provider saw no elements."""
+        ui_state = await provider.get_state()
+        layout_hash = getattr(ui_state, "layout_hash", None)
+        return None if layout_hash == EMPTY_LAYOUT_HASH else layout_hash
+
+    async def _ui_fingerprint(self) -> str | None:
+        """Layout hash from the state provider, else a digest of the current screenshot."""
+        if self.state_provider is not None:
+            self._last_layout_hash = await self._layout_hash(self.state_provider)
+            if self._last_layout_hash is not None:
+                return self._last_layout_hash
+        driver = await self._initialize_driver()
+        screenshot = await driver.screenshot()
+        return hashlib.blake2b(screenshot, digest_size=16).hexdigest() if screenshot else None
+
+    async def wait_until_settled(self, timeout: float | None = None) -> tuple[bool, str | None]:
+        """
+        Poll the UI until its fingerprint stops changing, with a ceiling timeout.
+
+        Args:
+            timeout: Ceiling in seconds (default: settle_timeout)
+
+        Returns:
+            (settled, last fingerprint); settled is False if the ceiling was hit
+        """
+        timeout = self.settle_timeout if timeout is None else timeout
+        deadline = time.monotonic() + (timeout or 0)
+        previous = None
+        stable = 0
+        fingerprint = None
+        while True:
+            try:
+                fingerprint = await self._ui_fingerprint()
+            except Exception as e:
+                logger.debug(f"UI fingerprint failed (will retry): {e}")
+                fingerprint = None
+            if fingerprint is not None and fingerprint == previous:
+                stable += 1
+                if stable >= self.settle_stable_polls - 1:
+                    return True, fingerprint
+            else:
+                stable = 0
+            previous = fingerprint
+            if time.monotonic() + self.settle_poll_interval >= deadline:
+                return False, fingerprint
+            await asyncio.sleep(self.settle_poll_interval)
+
+    async def _after_action(self, step: int, action: dict[str, Any], is_last: bool) -> bool:
+        """Wait for the UI after an action and verify drift; returns False to abort."""
+        expected = action.get("expected_layout_hash")
+        provider = self.state_provider or self.drift_provider
+        # A recorded empty-state hash says nothing about the screen
+        verify = bool(expected) and expected != EMPTY_LAYOUT_HASH and provider is not None
+
+        self._last_layout_hash = None
+        if self.settle_timeout is None:
+            # Wait between actions (except for the last one, unless it is verified)
+            if not is_last or verify:
+                logger.debug(f"   ⏳ Waiting {self.delay_between_actions}s...")
+                await asyncio.sleep(self.delay_between_actions)
+        else:
+            started = time.monotonic()
+            settled, _ = await self.wait_until_settled()
+            waited = time.monotonic() - started
+            if settled:
+                logger.debug(f"   ⏳ UI settled in {waited:.2f}s")
+            else:
+                logger.info(f"   ⏳ UI still changing after {waited:.2f}s; continuing")
+        if not verify:
+            return True
+
+        # Settling on the state provider already read the layout hash
+        actual = self._last_layout_hash
+        if actual is None:
+            try:
+                actual = await self._layout_hash(provider)
+            except Exception as e:
+                logger.debug(f"UI state capture failed: {e}")
+        if actual is None:
+            logger.info("   ⚠️  No UI elements captured; layout drift not checked for this step")
+            return True
+
+        if actual != expected:
+            self.drifted_steps.append(step)
+            logger.warning(f"   ⚠️  Layout drift: expected {expected[:8]}, got {actual[:8]}")
+            if self.stop_on_drift:
+                return False
+        return True
+
     async def replay_macro(
         self,
         macro_data: dict[str, Any],
@@ -206,8 +388,13 @@ class MacroPlayer:
         logger.info(f"🎬 Starting macro replay: '{description}'")
         logger.info(f"📊 Total actions to execute: {len(actions)} / {total_actions}")
 
+        await self._prepare_drift_check(macro_data)
+
         success_count = 0
         failed_count = 0
+        self.drifted_steps = []
+        aborted = False
+        started = time.monotonic()
 
         for i, action in enumerate(actions, start=start_from_step + 1):
             action_type = action.get("action_type", action.get("type", "unknown"))
@@ -227,10 +414,10 @@ class MacroPlayer:
                 failed_count += 1
                 logger.error("   ❌ Action failed")
 
-            # Wait between actions (except for the last one)
-            if i < len(actions):
-                logger.debug(f"   ⏳ Waiting {self.delay_between_actions}s...")
-                await asyncio.sleep(self.delay_between_actions)
+            if not await self._after_action(i, action, is_last=i >= start_from_step + len(actions)):
+                logger.error(f"🛑 Stopping replay: UI drifted from the recording at step {i}")
+                aborted = True
+                break
 
         # Summary
         total_executed = success_count + failed_count
@@ -238,15 +425,17 @@ class MacroPlayer:
             (success_count / total_executed * 100) if total_executed > 0 else 0
         )
 
-        logger.info("\n🎉 Macro replay completed!")
+        logger.info(f"\n🎉 Macro replay completed in {time.monotonic() - started:.1f}s!")
         logger.info(
             f"📊 Success: {success_count}/{total_executed} ({success_rate:.1f}%)"
         )
+        if self.drifted_steps:
+            logger.warning(f"⚠️  Layout drift at steps: {self.drifted_steps}")
 
         if failed_count > 0:
             logger.warning(f"⚠️  Failed actions: {failed_count}")
 
-        return failed_count == 0
+        return failed_count == 0 and not aborted
 
 
 # Utility functions for convenience
@@ -258,6 +447,9 @@ async def replay_macro_file(
     delay_between_actions: float = 1.0,
     start_from_step: int = 0,
     max_steps: int | None = None,
+    settle_timeout: float | None = None,
+    verify_drift: bool = False,
+    stop_on_drift: bool = False,
 ) -> bool:
     """
     Convenience function to replay a macro from a file.
@@ -268,12 +460,20 @@ async def replay_macro_file(
         delay_between_actions: Delay between actions in seconds
         start_from_step: Step to start from (0-based)
         max_steps: Maximum steps to execute
+        settle_timeout: Wait for the UI to settle (up to this many seconds) instead
+            of sleeping delay_between_actions
+        verify_drift: Check each action's recorded layout hash on the device
+        stop_on_drift: Abort on the first layout hash mismatch
 
     Returns:
         True if replay was successful, False otherwise
     """
     player = MacroPlayer(
-        device_serial=device_serial, delay_between_actions=delay_between_actions
+        device_serial=device_serial,
+        delay_between_actions=delay_between_actions,
+        settle_timeout=settle_timeout,
+        verify_drift=verify_drift,
+        stop_on_drift=stop_on_drift,
     )
 
     try:
@@ -292,6 +492,9 @@ async def replay_macro_folder(
     delay_between_actions: float = 1.0,
     start_from_step: int = 0,
     max_steps: int | None = None,
+    settle_timeout: float | None = None,
+    verify_drift: bool = False,
+    stop_on_drift: bool = False,
 ) -> bool:
     """
     Convenience function to replay a macro from a trajectory folder.
@@ -302,12 +505,20 @@ async def replay_macro_folder(
         delay_between_actions: Delay between actions in seconds
         start_from_step: Step to start from (0-based)
         max_steps: Maximum steps to execute
+        settle_timeout: Wait for the UI to settle (up to this many seconds) instead
+            of sleeping delay_between_actions
+        verify_drift: Check each action's recorded layout hash on the device
+        stop_on_drift: Abort on the first layout hash mismatch
 
     Returns:
         True if replay was successful, False otherwise
     """
     player = MacroPlayer(
-        device_serial=device_serial, delay_between_actions=delay_between_actions
+        device_serial=device_serial,
+        delay_between_actions=delay_between_actions,
+        settle_timeout=settle_timeout,
+        verify_drift=verify_drift,
+        stop_on_drift=stop_on_drift,
     )
 
     try:
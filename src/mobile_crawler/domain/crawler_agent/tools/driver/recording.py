@@ -39,6 +39,16 @@ class RecordingDriver:
         """Delegate all non-overridden attribute lookups to the inner driver."""
         return getattr(self.inner, name)
 
+    def note_layout_hash(self, layout_hash: str | None) -> None:
+        """Attach the layout hash observed after the latest action to its log entry.
+
+        Called on every state capture; the last capture before the next action
+        wins, so the entry ends up with the settled screen the agent acted on.
+        Replay uses it as ``expected_layout_hash`` to detect drift.
+        """
+        if layout_hash and self.log:
+            self.log[-1]["expected_layout_hash"] = layout_hash
+
     # -- recorded actions ----------------------------------------------------
 
     async def tap(self, x: int, y: int) -> None:
@@ -1,7 +1,9 @@
 """StealthDriver — human-like interaction wrapper for device drivers.
 
 Wraps any ``DeviceDriver`` to provide:
-- Curved Bezier swipe paths with easing and micro-jitter
+- Curved Bezier swipe paths with easing and micro-jitter, sent as one
+  on-device shell script so gesture timing does not pay an adb round trip
+  per point
 - Word-by-word typing with random inter-word delays
 
 Non-overridden methods delegate to the inner driver via ``__getattr__``.
@@ -12,6 +14,7 @@ from __future__ import annotations
 import asyncio
 import math
 import random
+import time
 from typing import Any
 
 from mobile_crawler.domain.crawler_agent.tools.driver.base import DeviceDriver
@@ -104,6 +107,55 @@ def generate_curved_path(
     return points
 
 
+# Sleeps shorter than this are dropped from motion scripts; each ``input``
+# invocation already takes longer than that on device
+_MIN_SCRIPT_SLEEP_S = 0.005
+
+# Weight of the newest swipe in the running ``input`` overhead estimate
+_OVERHEAD_SMOOTHING = 0.3
+
+
+def motion_sleep_seconds(
+    points: list[tuple[int, int]],
+    duration_ms: float,
+    command_overhead_s: float = 0.0,
+) -> float:
+    """Return the on-device sleep between path points (0 when too short to bother)."""
+    delay = duration_ms / 1000 / len(points) - command_overhead_s
+    return round(delay, 3) if delay >= _MIN_SCRIPT_SLEEP_S else 0.0
+
+
+def build_motion_script(
+    points: list[tuple[int, int]],
+    duration_ms: float,
+    command_overhead_s: float = 0.0,
+) -> str:
+    """Compile a path into one shell command line of chained ``input motionevent`` calls.
+
+    The first point is a DOWN, the rest are MOVEs spaced by on-device
+    ``sleep``, and the last point is also released with an UP, so the
+    whole gesture is a single ``device.shell()`` call.
+
+    Args:
+        points: Path to trace, first point pressed and last point released
+        duration_ms: Intended gesture duration
+        command_overhead_s: Time one ``input`` invocation takes on device; it is
+            subtracted from each sleep so the gesture lasts ``duration_ms``
+    """
+    delay = motion_sleep_seconds(points, duration_ms, command_overhead_s)
+    sleep = f"sleep {delay:.3f}" if delay else None
+
+    x0, y0 = points[0]
+    commands = [f"input motionevent DOWN {x0} {y0}"]
+    for x, y in points[1:]:
+        if sleep:
+            commands.append(sleep)
+        commands.append(f"input motionevent MOVE {x} {y}")
+    x_end, y_end = points[-1]
+    commands.append(f"input motionevent UP {x_end} {y_end}")
+    return "; ".join(commands)
+
+
 # ---------------------------------------------------------------------------
 # StealthDriver
 # ---------------------------------------------------------------------------
@@ -113,7 +165,7 @@ class StealthDriver:
     """Transparent proxy that adds human-like randomness to device I/O.
 
     Overrides:
-    - ``swipe()`` → curved Bezier path via ``input motionevent``
+    - ``swipe()`` → curved Bezier path via one chained ``input motionevent`` script
     - ``input_text()`` → word-by-word typing with random delays
 
     Everything else delegates to the inner driver.
@@ -121,6 +173,8 @@ class StealthDriver:
 
     def __init__(self, inner: DeviceDriver) -> None:
         self.inner = inner
+        # Running estimate of one on-device ``input`` invocation, learned from swipes
+        self._motion_overhead_s = 0.0
 
     @property
     def platform(self) -> str:
@@ -147,20 +201,30 @@ class StealthDriver:
         y2: int,
         duration_ms: float = 1000,
     ) -> None:
-        """Perform a curved swipe using motionevent commands."""
+        """Perform a curved swipe as a single on-device motionevent script.
+
+        Every ``input`` call costs a process start on the device. The time
+        each swipe overran ``duration_ms`` is spread over its commands and
+        subtracted from the sleeps of later swipes, so gesture timing
+        converges on the requested duration.
+        """
         await self.inner.ensure_connected()
         path_points = generate_curved_path(x1, y1, x2, y2)
-
-        x0, y0 = path_points[0]
-        await self.inner.device.shell(f"input motionevent DOWN {x0} {y0}")
-
-        delay = duration_ms / 1000 / len(path_points)
-        for x, y in path_points[1:]:
-            await asyncio.sleep(delay)
-            await self.inner.device.shell(f"input motionevent MOVE {x} {y}")
-
-        x_end, y_end = path_points[-1]
-        await self.inner.device.shell(f"input motionevent UP {x_end} {y_end}")
+        overhead = self._motion_overhead_s
+        script = build_motion_script(path_points, duration_ms, overhead)
+
+        started = time.perf_counter()
+        await self.inner.device.shell(script)
+        elapsed = time.perf_counter() - started
+
+        # DOWN + MOVEs + UP, with one sleep before each MOVE
+        slept = motion_sleep_seconds(path_points, duration_ms, overhead) * (len(path_points) - 1)
+        observed = max(0.0, (elapsed - slept) / (len(path_points) + 1))
+        self._motion_overhead_s = (
+            observed
+            if overhead == 0.0
+            else (1 - _OVERHEAD_SMOOTHING) * overhead + _OVERHEAD_SMOOTHING * observed
+        )
 
     async def input_text(self, text: str, clear: bool = False) -> bool:
         """Type text word-by-word with random delays between words."""
@@ -3,23 +3,35 @@ Element search and filtering for Android accessibility trees.
 
 Provides composable filters to search elements by text, ID, spatial relationships, and traits.
 Works with raw a11y tree data from Portal before index assignment.
+
+Spatial and hierarchy filters query a :class:`SpatialIndex` built once per
+tree (bounds sorted on each edge, pre-order subtree ranges and parent
+links) instead of rescanning every node. Indexes are cached by node
+identity, so a tree must not be mutated after it has been searched.
 """
 
 import re
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable
 from typing import Any
 
 ElementFilter = Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
 
+# Trees kept indexed at once (the current UI state plus a few recent ones)
+_MAX_CACHED_INDEXES = 4
+
 
 # ========== HELPER FUNCTIONS ==========
 
 
 def flatten_tree(root: dict[str, Any]) -> list[dict[str, Any]]:
-    """Recursively flatten tree to list of all nodes."""
-    results = [root]
-    for child in root.get("children", []):
-        results.extend(flatten_tree(child))
+    """Flatten tree to list of all nodes in pre-order."""
+    results = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        results.append(node)
+        stack.extend(reversed(node.get("children", [])))
     return results
 
 
@@ -49,6 +61,312 @@ def sort_by_position(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return sorted(nodes, key=get_sort_key)
 
 
+def _bounds(node: dict[str, Any]) -> tuple[int, int, int, int]:
+    bounds = node.get("boundsInScreen", {})
+    return (
+        bounds.get("left", 0),
+        bounds.get("top", 0),
+        bounds.get("right", 0),
+        bounds.get("bottom", 0),
+    )
+
+
+def _sorted_edge(values: list[int]) -> tuple[list[int], list[int]]:
+    """Return (positions ordered by value, the values in that order)."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    return order, [values[i] for i in order]
+
+
+# ========== SPATIAL INDEX ==========
+
+
+class SpatialIndex:
+    """Bounds and hierarchy index over one a11y tree.
+
+    Nodes are stored in ``flatten_tree`` pre-order, so every subtree is the
+    contiguous position range ``[pos, end[pos])``. Each bounds edge is kept
+    sorted, which turns "everything below y" into a bisect plus a slice.
+    """
+
+    def __init__(self, roots: list[dict[str, Any]]):
+        """Index the trees under ``roots``.
+
+        Args:
+            roots: Top-level nodes, in the order filters receive them
+        """
+        self.nodes: list[dict[str, Any]] = []
+        self.parents: list[int] = []
+        self.ends: list[int] = []
+        self._positions: dict[int, int] = {}
+
+        for root in roots:
+            # (node, parent position); a None node closes the subtree opened below it
+            stack: list[tuple[dict[str, Any] | None, int]] = [(root, -1)]
+            while stack:
+                node, parent = stack.pop()
+                if node is None:
+                    self.ends[parent] = len(self.nodes)
+                    continue
+                pos = len(self.nodes)
+                self.nodes.append(node)
+                self.parents.append(parent)
+                self.ends.append(pos + 1)
+                self._positions.setdefault(id(node), pos)
+                stack.append((None, pos))
+                stack.extend((child, pos) for child in reversed(node.get("children", [])))
+
+        # A node object reachable twice cannot be mapped back to one position
+        self.usable = len(self._positions) == len(self.nodes)
+
+        lefts, tops, rights, bottoms = [], [], [], []
+        self.centers: list[tuple[int, int]] = []
+        for node in self.nodes:
+            left, top, right, bottom = _bounds(node)
+            lefts.append(left)
+            tops.append(top)
+            rights.append(right)
+            bottoms.append(bottom)
+            self.centers.append(((left + right) // 2, (top + bottom) // 2))
+        self.bounds = list(zip(lefts, tops, rights, bottoms, strict=True))
+        self._by_left = _sorted_edge(lefts)
+        self._by_top = _sorted_edge(tops)
+        self._by_right = _sorted_edge(rights)
+        self._by_bottom = _sorted_edge(bottoms)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def contains(self, node: dict[str, Any]) -> bool:
+        pos = self._positions.get(id(node))
+        return pos is not None and self.nodes[pos] is node
+
+    def ranges(self, nodes: list[dict[str, Any]]) -> list[tuple[int, int]] | None:
+        """Map ``nodes`` to their subtree ranges, in input order.
+
+        Ranges may overlap (a filtered list often holds a node and some of
+        its descendants); flattening then repeats nodes, as ``flatten_tree``
+        over the same list would.
+
+        Returns:
+            One ``(start, end)`` per input node, or None when a node is not
+            in this tree
+        """
+        if not self.usable:
+            return None
+        ranges = []
+        for node in nodes:
+            pos = self._positions.get(id(node))
+            if pos is None or self.nodes[pos] is not node:
+                return None
+            ranges.append((pos, self.ends[pos]))
+        return ranges
+
+    def flatten(self, ranges: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        """Nodes covered by ``ranges`` in the order ``flatten_tree`` yields them."""
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            return self.nodes[start:end]
+        result = []
+        for start, end in ranges:
+            result.extend(self.nodes[start:end])
+        return result
+
+    def relative_to(
+        self, anchor: dict[str, Any], side: str, ranges: list[tuple[int, int]]
+    ) -> list[dict[str, Any]]:
+        """Nodes entirely on one side of ``anchor``, nearest center first.
+
+        Args:
+            anchor: Reference node (need not belong to this tree)
+            side: One of "below", "above", "left_of", "right_of"
+            ranges: Subtree ranges to search, from :meth:`ranges`
+
+        Returns:
+            Matching nodes ordered by center distance, ties in flatten order
+        """
+        anchor_left, anchor_top, anchor_right, anchor_bottom = _bounds(anchor)
+        # (sorted edge, cut point, whether matches are the suffix, bounds test)
+        if side == "below":
+            (order, keys), suffix = self._by_top, True
+            cut = bisect_right(keys, anchor_bottom)
+            inside = lambda b: b[1] > anchor_bottom  # noqa: E731
+        elif side == "above":
+            (order, keys), suffix = self._by_bottom, False
+            cut = bisect_left(keys, anchor_top)
+            inside = lambda b: b[3] < anchor_top  # noqa: E731
+        elif side == "left_of":
+            (order, keys), suffix = self._by_right, False
+            cut = bisect_left(keys, anchor_left)
+            inside = lambda b: b[2] < anchor_left  # noqa: E731
+        elif side == "right_of":
+            (order, keys), suffix = self._by_left, True
+            cut = bisect_right(keys, anchor_right)
+            inside = lambda b: b[0] > anchor_right  # noqa: E731
+        else:
+            raise ValueError(f"Unknown side: {side}")
+
+        # Yield (rank of the input range, position) for every node on that side
+        candidate_count = len(order) - cut if suffix else cut
+        covered = sum(end - start for start, end in ranges)
+        ordered = sorted((start, end, rank) for rank, (start, end) in enumerate(ranges))
+        overlapping = any(
+            start < prev_end
+            for (_, prev_end, _), (start, _, _) in zip(ordered, ordered[1:], strict=False)
+        )
+        if overlapping or covered < candidate_count:
+            # Small or overlapping subtrees: test their nodes in flatten order
+            bounds = self.bounds
+            hits = [
+                (rank, pos)
+                for rank, (start, end) in enumerate(ranges)
+                for pos in range(start, end)
+                if inside(bounds[pos])
+            ]
+        else:
+            candidates = order[cut:] if suffix else order[:cut]
+            if covered == len(self.nodes):
+                hits = [(0, pos) for pos in candidates]
+            else:
+                starts = [start for start, _, _ in ordered]
+                hits = []
+                for pos in candidates:
+                    i = bisect_right(starts, pos) - 1
+                    if i >= 0 and pos < ordered[i][1]:
+                        hits.append((ordered[i][2], pos))
+
+        anchor_x = (anchor_left + anchor_right) // 2
+        anchor_y = (anchor_top + anchor_bottom) // 2
+        anchor_bounds = (anchor_left, anchor_top, anchor_right, anchor_bottom)
+        keyed = []
+        for rank, pos in hits:
+            node = self.nodes[pos]
+            if node is anchor or (self.bounds[pos] == anchor_bounds and node == anchor):
+                continue
+            x, y = self.centers[pos]
+            keyed.append(((x - anchor_x) ** 2 + (y - anchor_y) ** 2, rank, pos))
+
+        keyed.sort()
+        return [self.nodes[pos] for _, _, pos in keyed]
+
+    def with_matching_descendant(
+        self, predicate: Callable[[dict[str, Any]], bool], ranges: list[tuple[int, int]]
+    ) -> list[dict[str, Any]]:
+        """Nodes in ``ranges`` with a strict descendant satisfying ``predicate``."""
+        marked = bytearray(len(self.nodes))
+        for start, end in ranges:
+            for pos in range(start, end):
+                if not predicate(self.nodes[pos]):
+                    continue
+                parent = self.parents[pos]
+                while parent >= 0 and not marked[parent]:
+                    marked[parent] = 1
+                    parent = self.parents[parent]
+        return [
+            self.nodes[pos]
+            for start, end in ranges
+            for pos in range(start, end)
+            if marked[pos]
+        ]
+
+
+_index_cache: list[SpatialIndex] = []
+
+
+def _cached_index(nodes: list[dict[str, Any]]) -> SpatialIndex | None:
+    if not nodes:
+        return None
+    for index in _index_cache:
+        if index.contains(nodes[0]):
+            return index
+    return None
+
+
+def spatial_index_for(nodes: list[dict[str, Any]]) -> SpatialIndex | None:
+    """Return the index of the tree ``nodes`` belong to, building it if needed.
+
+    A list whose nodes are not in any cached tree is indexed as a forest of
+    its own. Returns None for an empty list.
+    """
+    index = _cached_index(nodes)
+    if index is None and nodes:
+        index = SpatialIndex(nodes)
+        _index_cache.insert(0, index)
+        del _index_cache[_MAX_CACHED_INDEXES:]
+    return index
+
+
+def _flatten_nodes(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Flatten ``nodes``, slicing an existing index instead of walking when possible."""
+    index = _cached_index(nodes)
+    ranges = index.ranges(nodes) if index is not None else None
+    if ranges is not None:
+        return index.flatten(ranges)
+    all_nodes = []
+    for node in nodes:
+        all_nodes.extend(flatten_tree(node))
+    return all_nodes
+
+
+def _node_filter(predicate: Callable[[dict[str, Any]], bool]) -> ElementFilter:
+    """Build a filter that keeps every flattened node satisfying ``predicate``.
+
+    The predicate is exposed as ``filter_fn.node_predicate`` so hierarchy
+    filters can evaluate it against an index in one pass.
+    """
+
+    def filter_fn(nodes: list[dict]) -> list[dict]:
+        return [node for node in _flatten_nodes(nodes) if predicate(node)]
+
+    filter_fn.node_predicate = predicate
+    return filter_fn
+
+
+def _relative_filter(anchor_filter: ElementFilter, side: str) -> ElementFilter:
+    """Build a filter returning nodes on ``side`` of the first anchor match, nearest first."""
+
+    def filter_fn(nodes: list[dict]) -> list[dict]:
+        anchor_results = anchor_filter(nodes)
+
+        if not anchor_results:
+            return []
+
+        anchor = anchor_results[0]
+        index = spatial_index_for(nodes)
+        ranges = index.ranges(nodes) if index is not None else None
+        if ranges is None:
+            return _scan_relative(nodes, anchor, side)
+        return index.relative_to(anchor, side, ranges)
+
+    return filter_fn
+
+
+def _scan_relative(nodes: list[dict], anchor: dict, side: str) -> list[dict]:
+    """Unindexed relational query, for nodes no single index can map."""
+    anchor_left, anchor_top, anchor_right, anchor_bottom = _bounds(anchor)
+    anchor_center_x, anchor_center_y = get_element_center(anchor)
+
+    candidates = []
+    for node in _flatten_nodes(nodes):
+        if node == anchor:
+            continue
+        left, top, right, bottom = _bounds(node)
+        if (
+            (side == "below" and top > anchor_bottom)
+            or (side == "above" and bottom < anchor_top)
+            or (side == "left_of" and right < anchor_left)
+            or (side == "right_of" and left > anchor_right)
+        ):
+            node_center_x, node_center_y = get_element_center(node)
+            distance = (
+                (node_center_x - anchor_center_x) ** 2
+                + (node_center_y - anchor_center_y) ** 2
+            )
+            candidates.append((distance, node))
+
+    candidates.sort(key=lambda x: x[0])
+    return [node for dist, node in candidates]
+
+
 # ========== FILTERS CLASS ==========
 
 
@@ -70,41 +388,31 @@ class Filters:
             regex = pattern
             pattern_str = pattern.pattern
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            results = []
-
-            for node in all_nodes:
-                text = node.get("text", "")
-                content_desc = node.get("contentDescription", "")
-                hint = node.get("hint", "")
+        def matches(node: dict) -> bool:
+            text = node.get("text", "")
+            content_desc = node.get("contentDescription", "")
+            hint = node.get("hint", "")
 
-                for field_value in [text, content_desc, hint]:
-                    if not field_value:
-                        continue
+            for field_value in [text, content_desc, hint]:
+                if not field_value:
+                    continue
 
-                    # Exact match
-                    if pattern_str == field_value:
-                        results.append(node)
-                        break
+                # Exact match
+                if pattern_str == field_value:
+                    return True
 
-                    # Regex match
-                    if regex.search(field_value):
-                        results.append(node)
-                        break
+                # Regex match
+                if regex.search(field_value):
+                    return True
 
-                    # Newline-normalized match
-                    normalized = field_value.replace("\n", " ")
-                    if pattern_str == normalized or regex.search(normalized):
-                        results.append(node)
-                        break
+                # Newline-normalized match
+                normalized = field_value.replace("\n", " ")
+                if pattern_str == normalized or regex.search(normalized):
+                    return True
 
-            return results
+            return False
 
-        return filter_fn
+        return _node_filter(matches)
 
     @staticmethod
     def id_matches(pattern: str | re.Pattern) -> ElementFilter:
@@ -116,197 +424,46 @@ class Filters:
             regex = pattern
             pattern_str = pattern.pattern
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
+        def matches(node: dict) -> bool:
+            resource_id = node.get("resourceId", "")
 
-            results = []
+            if not resource_id:
+                return False
 
-            for node in all_nodes:
-                resource_id = node.get("resourceId", "")
-
-                if not resource_id:
-                    continue
+            short_id = (
+                resource_id.split("/")[-1] if "/" in resource_id else resource_id
+            )
 
-                short_id = (
-                    resource_id.split("/")[-1] if "/" in resource_id else resource_id
-                )
+            # Check full ID
+            if pattern_str == resource_id or regex.search(resource_id):
+                return True
 
-                # Check full ID
-                if pattern_str == resource_id or regex.search(resource_id):
-                    results.append(node)
-                    continue
+            # Check short ID
+            return pattern_str == short_id or bool(regex.search(short_id))
 
-                # Check short ID
-                if pattern_str == short_id or regex.search(short_id):
-                    results.append(node)
-
-            return results
-
-        return filter_fn
+        return _node_filter(matches)
 
     # ========== SPATIAL FILTERS ==========
 
     @staticmethod
     def below(anchor_filter: ElementFilter) -> ElementFilter:
         """Find elements positioned below the anchor element."""
-
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            anchor_results = anchor_filter(nodes)
-
-            if not anchor_results:
-                return []
-
-            anchor = anchor_results[0]
-            anchor_bounds = anchor.get("boundsInScreen", {})
-            anchor_bottom = anchor_bounds.get("bottom", 0)
-            anchor_center_x, anchor_center_y = get_element_center(anchor)
-
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            candidates = []
-            for node in all_nodes:
-                if node == anchor:
-                    continue
-
-                node_bounds = node.get("boundsInScreen", {})
-                node_top = node_bounds.get("top", 0)
-
-                if node_top > anchor_bottom:
-                    node_center_x, node_center_y = get_element_center(node)
-                    distance = (
-                        (node_center_x - anchor_center_x) ** 2
-                        + (node_center_y - anchor_center_y) ** 2
-                    ) ** 0.5
-                    candidates.append((distance, node))
-
-            candidates.sort(key=lambda x: x[0])
-            return [node for dist, node in candidates]
-
-        return filter_fn
+        return _relative_filter(anchor_filter, "below")
 
     @staticmethod
     def above(anchor_filter: ElementFilter) -> ElementFilter:
         """Find elements positioned above the anchor element."""
-
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            anchor_results = anchor_filter(nodes)
-
-            if not anchor_results:
-                return []
-
-            anchor = anchor_results[0]
-            anchor_bounds = anchor.get("boundsInScreen", {})
-            anchor_top = anchor_bounds.get("top", 0)
-            anchor_center_x, anchor_center_y = get_element_center(anchor)
-
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            candidates = []
-            for node in all_nodes:
-                if node == anchor:
-                    continue
-
-                node_bounds = node.get("boundsInScreen", {})
-                node_bottom = node_bounds.get("bottom", 0)
-
-                if node_bottom < anchor_top:
-                    node_center_x, node_center_y = get_element_center(node)
-                    distance = (
-                        (node_center_x - anchor_center_x) ** 2
-                        + (node_center_y - anchor_center_y) ** 2
-                    ) ** 0.5
-                    candidates.append((distance, node))
-
-            candidates.sort(key=lambda x: x[0])
-            return [node for dist, node in candidates]
-
-        return filter_fn
+        return _relative_filter(anchor_filter, "above")
 
     @staticmethod
     def left_of(anchor_filter: ElementFilter) -> ElementFilter:
         """Find elements positioned left of the anchor element."""
-
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            anchor_results = anchor_filter(nodes)
-
-            if not anchor_results:
-                return []
-
-            anchor = anchor_results[0]
-            anchor_bounds = anchor.get("boundsInScreen", {})
-            anchor_left = anchor_bounds.get("left", 0)
-            anchor_center_x, anchor_center_y = get_element_center(anchor)
-
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            candidates = []
-            for node in all_nodes:
-                if node == anchor:
-                    continue
-
-                node_bounds = node.get("boundsInScreen", {})
-                node_right = node_bounds.get("right", 0)
-
-                if node_right < anchor_left:
-                    node_center_x, node_center_y = get_element_center(node)
-                    distance = (
-                        (node_center_x - anchor_center_x) ** 2
-                        + (node_center_y - anchor_center_y) ** 2
-                    ) ** 0.5
-                    candidates.append((distance, node))
-
-            candidates.sort(key=lambda x: x[0])
-            return [node for dist, node in candidates]
-
-        return filter_fn
+        return _relative_filter(anchor_filter, "left_of")
 
     @staticmethod
     def right_of(anchor_filter: ElementFilter) -> ElementFilter:
         """Find elements positioned right of the anchor element."""
-
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            anchor_results = anchor_filter(nodes)
-
-            if not anchor_results:
-                return []
-
-            anchor = anchor_results[0]
-            anchor_bounds = anchor.get("boundsInScreen", {})
-            anchor_right = anchor_bounds.get("right", 0)
-            anchor_center_x, anchor_center_y = get_element_center(anchor)
-
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            candidates = []
-            for node in all_nodes:
-                if node == anchor:
-                    continue
-
-                node_bounds = node.get("boundsInScreen", {})
-                node_left = node_bounds.get("left", 0)
-
-                if node_left > anchor_right:
-                    node_center_x, node_center_y = get_element_center(node)
-                    distance = (
-                        (node_center_x - anchor_center_x) ** 2
-                        + (node_center_y - anchor_center_y) ** 2
-                    ) ** 0.5
-                    candidates.append((distance, node))
-
-            candidates.sort(key=lambda x: x[0])
-            return [node for dist, node in candidates]
-
-        return filter_fn
+        return _relative_filter(anchor_filter, "right_of")
 
     # ========== TRAIT FILTERS ==========
 
@@ -314,87 +471,37 @@ class Filters:
     def clickable() -> ElementFilter:
         """Match clickable elements."""
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            return [node for node in all_nodes if node.get("isClickable", False)]
-
-        return filter_fn
+        return _node_filter(lambda node: node.get("isClickable", False))
 
     @staticmethod
     def non_clickable() -> ElementFilter:
         """Match non-clickable elements."""
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            return [node for node in all_nodes if not node.get("isClickable", False)]
-
-        return filter_fn
+        return _node_filter(lambda node: not node.get("isClickable", False))
 
     @staticmethod
     def enabled(expected: bool = True) -> ElementFilter:
         """Match elements by enabled state."""
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            return [
-                node for node in all_nodes if node.get("isEnabled", False) == expected
-            ]
-
-        return filter_fn
+        return _node_filter(lambda node: node.get("isEnabled", False) == expected)
 
     @staticmethod
     def selected(expected: bool = True) -> ElementFilter:
         """Match elements by selected state."""
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            return [
-                node for node in all_nodes if node.get("isSelected", False) == expected
-            ]
-
-        return filter_fn
+        return _node_filter(lambda node: node.get("isSelected", False) == expected)
 
     @staticmethod
     def checked(expected: bool = True) -> ElementFilter:
         """Match elements by checked state."""
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            return [
-                node for node in all_nodes if node.get("isChecked", False) == expected
-            ]
-
-        return filter_fn
+        return _node_filter(lambda node: node.get("isChecked", False) == expected)
 
     @staticmethod
     def focused(expected: bool = True) -> ElementFilter:
         """Match elements by focused state."""
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            return [
-                node for node in all_nodes if node.get("isFocused", False) == expected
-            ]
-
-        return filter_fn
+        return _node_filter(lambda node: node.get("isFocused", False) == expected)
 
     # ========== SIZE MATCHING ==========
 
@@ -404,43 +511,41 @@ class Filters:
     ) -> ElementFilter:
         """Match elements by size (width and/or height with tolerance)."""
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
+        def matches(node: dict) -> bool:
+            bounds = node.get("boundsInScreen", {})
 
-            results = []
-            for node in all_nodes:
-                bounds = node.get("boundsInScreen", {})
-
-                actual_width = bounds.get("right", 0) - bounds.get("left", 0)
-                actual_height = bounds.get("bottom", 0) - bounds.get("top", 0)
+            actual_width = bounds.get("right", 0) - bounds.get("left", 0)
+            actual_height = bounds.get("bottom", 0) - bounds.get("top", 0)
 
-                if width is not None:
-                    if abs(actual_width - width) > tolerance:
-                        continue
+            if width is not None:
+                if abs(actual_width - width) > tolerance:
+                    return False
 
-                if height is not None:
-                    if abs(actual_height - height) > tolerance:
-                        continue
+            if height is not None:
+                if abs(actual_height - height) > tolerance:
+                    return False
 
-                results.append(node)
+            return True
 
-            return results
-
-        return filter_fn
+        return _node_filter(matches)
 
     # ========== HIERARCHY FILTERS ==========
 
     @staticmethod
     def contains_child(child_filter: ElementFilter) -> ElementFilter:
         """Match elements that contain at least one direct child matching the filter."""
+        predicate = getattr(child_filter, "node_predicate", None)
 
         def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
+            if predicate is not None:
+                # Node-level filters flatten each child's subtree, so this is
+                # "has a matching descendant": one pass over the index
+                index = spatial_index_for(nodes)
+                ranges = index.ranges(nodes) if index is not None else None
+                if ranges is not None:
+                    return index.with_matching_descendant(predicate, ranges)
+
+            all_nodes = _flatten_nodes(nodes)
             results = []
 
             for node in all_nodes:
@@ -463,9 +568,7 @@ class Filters:
         """Match elements that contain ALL specified descendants at any depth."""
 
         def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
+            all_nodes = _flatten_nodes(nodes)
 
             results = []
 
@@ -512,31 +615,20 @@ class Filters:
     def has_text() -> ElementFilter:
         """Match elements that have non-empty text content."""
 
-        def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
-
-            return [
-                node
-                for node in all_nodes
-                if (
-                    node.get("text")
-                    or node.get("contentDescription")
-                    or node.get("hint")
-                )
-            ]
-
-        return filter_fn
+        return _node_filter(
+            lambda node: bool(
+                node.get("text")
+                or node.get("contentDescription")
+                or node.get("hint")
+            )
+        )
 
     @staticmethod
     def clickable_first() -> ElementFilter:
         """Sort elements to put clickable ones first."""
 
         def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
+            all_nodes = _flatten_nodes(nodes)
 
             return sorted(all_nodes, key=lambda n: not n.get("isClickable", False))
 
@@ -549,9 +641,7 @@ class Filters:
         """Select element at index position (supports negative indices)."""
 
         def filter_fn(nodes: list[dict]) -> list[dict]:
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
+            all_nodes = _flatten_nodes(nodes)
 
             sorted_nodes = sort_by_position(all_nodes)
 
@@ -597,9 +687,7 @@ class Filters:
 
             common_ids = result_sets[0].intersection(*result_sets[1:])
 
-            all_nodes = []
-            for node in nodes:
-                all_nodes.extend(flatten_tree(node))
+            all_nodes = _flatten_nodes(nodes)
 
             return [n for n in all_nodes if id(n) in common_ids]
 
@@ -13,6 +13,7 @@ from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from mobile_crawler.domain.crawler_agent.tools.driver.base import DeviceDisconnectedError
+from mobile_crawler.domain.crawler_agent.tools.driver.recording import RecordingDriver
 from mobile_crawler.domain.crawler_agent.tools.ui.state import UIState
 from mobile_crawler.domain.crawler_agent.tools.ui.stealth_state import StealthUIState
 
@@ -182,6 +183,22 @@ class AndroidStateProvider(StateProvider):
         self._omni_client = None
         self._omni_initialized = False
 
+    def layout_hash_settings(self) -> dict[str, Any]:
+        """Settings that determine this provider's layout hashes.
+
+        Stored with recorded macros so replay can rebuild an equivalent
+        provider (see ``MacroPlayer``); the API key is not included.
+        """
+        return {
+            "ui_parser_mode": self.ui_parser_mode,
+            "tree_filter": self.tree_filter.get_name(),
+            "use_normalized": self.use_normalized,
+            "omniparser_backend": self.omniparser_backend,
+            "omniparser_local_url": self.omniparser_local_url,
+            "omniparser_box_threshold": self.omniparser_box_threshold,
+            "omniparser_a11y_threshold": self.omniparser_a11y_threshold,
+        }
+
     async def get_state(self) -> UIState:
         state_started = time.perf_counter()
         await self._ensure_target_package_active()
@@ -270,6 +287,10 @@ class AndroidStateProvider(StateProvider):
         except Exception as hash_err:
             logger.warning(f"Failed to compute layout hash in StateProvider: {hash_err}")
 
+        # Recorded macros remember the screen each action led to, for replay drift checks
+        if isinstance(self.driver, RecordingDriver):
+            self.driver.note_layout_hash(layout_hash)
+
         ui_state = self._ui_cls(
             elements=elements,
             formatted_text=formatted_text,
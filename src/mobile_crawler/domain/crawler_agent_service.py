@@ -7,6 +7,7 @@ import os
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from mobile_crawler.config.config_manager import ConfigManager
@@ -17,7 +18,14 @@ from mobile_crawler.domain.context_guard import (
     StepSkipReason,
     UIDumpValidator,
 )
-from mobile_crawler.domain.errors import ErrorContext, FatalError
+from mobile_crawler.domain.crawl_checkpoint import (
+    DEFAULT_CHECKPOINT_INTERVAL_STEPS,
+    CrawlCheckpoint,
+    CrawlCheckpointStore,
+    restore_agent_state,
+    snapshot_agent_state,
+)
+from mobile_crawler.domain.errors import CrawlerError, ErrorContext, FatalError
 from mobile_crawler.domain.models import AIAction, BoundingBox
 from mobile_crawler.domain.stats_collector_span_processor import OTEL_AVAILABLE, StatsCollectorSpanProcessor
 from mobile_crawler.domain.step_phase import StepPhase, StepPhaseStateMachine
@@ -171,6 +179,23 @@ class CrawlerAgentService:
         self._phase_metadata: dict[str, dict[str, Any]] = {}
         self._pending_step_timing: dict[str, Any] = {}
 
+        # Crash-resumable checkpoints (set per-run via configure_checkpointing)
+        self._checkpoint_store: CrawlCheckpointStore | None = None
+        self._checkpoint_interval_steps: int = DEFAULT_CHECKPOINT_INTERVAL_STEPS
+        self._pending_checkpoint: CrawlCheckpoint | None = None
+
+        # Content-addressed screenshot storage (set per-run via configure_blob_store)
+        self._blob_store_dir: str | None = None
+
+        # Live traffic attribution (set per-run via configure_traffic_attribution)
+        self._traffic_attributor = None
+
+        # Step -> video offset index (set per-run via configure_video_step_index)
+        self._video_recorder = None
+
+        # Receives (timing_name, duration_ms) for every sub-phase timing (set via configure_timing_sink)
+        self._timing_sink = None
+
         # Initialize OmniParser if available
         if OMNIPARSER_AVAILABLE:
             self._initialize_omni_parser()
@@ -226,6 +251,8 @@ class CrawlerAgentService:
                 "max_steps": max_steps,
                 "reasoning": self.config_manager.get("crawler_reasoning_mode", True),
                 "streaming": self.config_manager.get("crawler_streaming", False),
+                "frontier_navigation": self.config_manager.get("frontier_navigation_enabled", False) is True,
+                "frontier_max_hops": int(self.config_manager.get("frontier_navigation_max_hops", 6) or 6),
             },
             "device": {
                 "platform": "android",
@@ -258,6 +285,13 @@ class CrawlerAgentService:
         }
         config["telemetry"] = {"enabled": False}  # PostHog telemetry always off
 
+        if self._blob_store_dir:
+            config["logging"] = {
+                "save_trajectory": self.config_manager.get("crawler_save_trajectory", "none"),
+                "blob_store_path": self._blob_store_dir,
+                "blob_image_format": self.config_manager.get("blob_image_format", "") or "",
+            }
+
         # Configure Tracing (Arize Phoenix / Langfuse)
         enable_tracing = self.config_manager.get("enable_tracing", False)
         tracing_provider = self.config_manager.get("tracing_provider", "phoenix")
@@ -554,6 +588,217 @@ class CrawlerAgentService:
 
         logger.info(f"Step phase tracking initialized for run {run_id}")
 
+    def configure_blob_store(self, blob_dir: str) -> None:
+        """Route agent trajectory screenshots into the session's blob store.
+
+        Args:
+            blob_dir: ``blobs`` directory inside the session folder.
+        """
+        self._blob_store_dir = blob_dir
+        if self._crawler_agent_config is not None:
+            self._crawler_agent_config.logging.blob_store_path = blob_dir
+
+    def configure_traffic_attribution(self, attributor) -> None:
+        """Attribute live captured traffic to the step counter of this service.
+
+        Args:
+            attributor: LiveTrafficAttributor fed by the traffic collector, or None.
+        """
+        if self._traffic_attributor is not None and attributor is None:
+            self._record_step_network(self._current_step_number)
+        self._traffic_attributor = attributor
+        if attributor is not None:
+            attributor.begin_step(self._current_step_number)
+
+    def _record_step_network(self, step_number: int) -> None:
+        """Persist the traffic attributed to a finished step on its phase transition row."""
+        if not self._current_run_id or not self._step_phase_repository:
+            return
+        traffic = self._traffic_attributor.step_summary(step_number)
+        if traffic is None or not traffic.request_count:
+            return
+        try:
+            self._step_phase_repository.record_step_network(
+                self._current_run_id, step_number, json.dumps(traffic.to_dict())
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record step network traffic: {e}")
+
+    def _publish_network_activity(self) -> None:
+        """Expose the network summary to the manager prompt through shared state."""
+        shared_state = getattr(self._crawler_agent, "shared_state", None)
+        if shared_state is None:
+            return
+        try:
+            shared_state.network_activity = json.dumps(self.get_network_activity())
+        except Exception as e:
+            logger.debug(f"Failed to publish network activity: {e}")
+
+    def configure_video_step_index(self, recorder) -> None:
+        """Stamp each step's start on the active screen recording.
+
+        Args:
+            recorder: VideoRecordingManager that is recording this run, or None.
+        """
+        self._video_recorder = recorder
+        if recorder is not None:
+            recorder.mark_step(self._current_step_number)
+
+    def configure_phase_profiler(self, profiler) -> None:
+        """Tag profiler samples with the current step phase and step number.
+
+        Must be called after begin_step_tracking(), from the crawl thread
+        that the profiler samples.
+
+        Args:
+            profiler: PhaseProfiler to start, or None.
+        """
+        if profiler is None or self._step_phase_machine is None:
+            return
+        profiler.start(self._step_phase_machine.current_phase.value, self._current_step_number)
+        self._step_phase_machine.add_listener(
+            lambda _old_phase, new_phase: profiler.set_phase(new_phase.value, self._current_step_number)
+        )
+
+    def configure_timing_sink(self, sink) -> None:
+        """Forward every sub-phase timing to a metrics collector.
+
+        Args:
+            sink: Callable taking (timing_name, duration_ms), e.g.
+                  RuntimeStatsCollector.record_latency, or None to stop.
+        """
+        self._timing_sink = sink
+
+    def writer_queue_depth(self) -> int | None:
+        """Pending jobs in the trajectory writer queue, or None when no writer runs."""
+        writer = getattr(self._crawler_agent, "trajectory_writer", None)
+        if writer is None:
+            return None
+        return writer.worker.queue.qsize()
+
+    def get_network_activity(self) -> dict[str, Any] | None:
+        """Per-step network summary (new hosts contacted) for prompts, if live capture runs."""
+        if self._traffic_attributor is None:
+            return None
+        return self._traffic_attributor.prompt_summary()
+
+    def configure_checkpointing(self, checkpoint_dir: str, resume: bool = False) -> CrawlCheckpoint | None:
+        """Enable periodic crawl checkpoints in the session folder.
+
+        Args:
+            checkpoint_dir: Directory in the session folder that holds the checkpoint.
+            resume: When True, load an existing checkpoint so the next agent
+                    starts from the saved plan, memory, and state graph.
+
+        Returns:
+            The checkpoint that will be restored, or None.
+        """
+        self._checkpoint_store = CrawlCheckpointStore(checkpoint_dir)
+        self._checkpoint_interval_steps = max(
+            1,
+            int(
+                self.config_manager.get("crawl_checkpoint_interval_steps", DEFAULT_CHECKPOINT_INTERVAL_STEPS)
+                or DEFAULT_CHECKPOINT_INTERVAL_STEPS
+            ),
+        )
+        self._pending_checkpoint = self._checkpoint_store.load() if resume else None
+        if self._pending_checkpoint is not None:
+            logger.info(
+                f"Resuming run {self._pending_checkpoint.run_id} from checkpoint at "
+                f"step {self._pending_checkpoint.step_number}"
+            )
+        return self._pending_checkpoint
+
+    def clear_checkpoint(self) -> None:
+        """Delete the run's checkpoint once the crawl has completed normally."""
+        self._pending_checkpoint = None
+        if self._checkpoint_store is not None:
+            self._checkpoint_store.clear()
+
+    def _capture_checkpoint(self) -> CrawlCheckpoint | None:
+        """Snapshot the active agent's progress, state graph position, and step counter.
+
+        A journaled state graph is only flushed (one appended delta line) and
+        referenced by its journal sequence number; full graph snapshots are
+        left to the tracker's own compaction.
+        """
+        if self._crawler_agent is None or self._current_run_id is None:
+            return None
+
+        shared_state = getattr(self._crawler_agent, "shared_state", None)
+        tracker = getattr(self._crawler_agent, "state_graph_tracker", None)
+        state_graph_seq = 0
+        state_graph: dict[str, Any] = {}
+        if tracker is not None and getattr(tracker, "logs_dir", None) is not None:
+            tracker.save()
+            state_graph_seq = tracker.journal_seq
+        elif hasattr(tracker, "to_dict"):
+            # Not journaled (no checkpoint directory); carry the graph in memory instead
+            state_graph = tracker.to_dict()
+        return CrawlCheckpoint(
+            run_id=self._current_run_id,
+            step_number=self._current_step_number,
+            agent_state=snapshot_agent_state(shared_state) if shared_state is not None else {},
+            state_graph_seq=state_graph_seq,
+            state_graph=state_graph,
+        )
+
+    def _save_checkpoint(self, checkpoint: CrawlCheckpoint | None = None) -> CrawlCheckpoint | None:
+        """Capture (if needed) and persist a checkpoint; failures are logged, not raised."""
+        checkpoint = checkpoint or self._capture_checkpoint()
+        if checkpoint is None or self._checkpoint_store is None:
+            return checkpoint
+        try:
+            self._checkpoint_store.save(checkpoint)
+        except CrawlerError as e:
+            logger.warning(str(e))
+        return checkpoint
+
+    def _maybe_checkpoint(self) -> None:
+        """Persist a checkpoint every ``crawl_checkpoint_interval_steps`` steps."""
+        if self._checkpoint_store is None or self._current_step_number <= 0:
+            return
+        if self._current_step_number % self._checkpoint_interval_steps == 0:
+            self._save_checkpoint()
+
+    def _restore_pending_checkpoint(self) -> None:
+        """Apply a pending checkpoint to a freshly created CrawlerAgent.
+
+        Called after a crash relaunch or on ``crawl --resume`` so the new agent
+        continues with the previous plan, memory, visited screens, and step
+        budget instead of re-exploring from scratch.
+        """
+        checkpoint = self._pending_checkpoint
+        if checkpoint is None or self._crawler_agent is None:
+            return
+        self._pending_checkpoint = None
+
+        shared_state = getattr(self._crawler_agent, "shared_state", None)
+        if shared_state is not None:
+            restore_agent_state(shared_state, checkpoint.agent_state)
+        tracker = getattr(self._crawler_agent, "state_graph_tracker", None)
+        screens = 0
+        if tracker is not None:
+            if getattr(tracker, "logs_dir", None) is not None and tracker.load():
+                if tracker.journal_seq < checkpoint.state_graph_seq:
+                    logger.warning(
+                        f"State graph journal ends at record {tracker.journal_seq}, "
+                        f"checkpoint expected {checkpoint.state_graph_seq}"
+                    )
+            elif checkpoint.state_graph:
+                tracker.restore(checkpoint.state_graph)
+            screens = len(tracker.states)
+        self._current_step_number = checkpoint.step_number
+        logger.info(f"Restored crawl checkpoint: step={checkpoint.step_number}, screens={screens}")
+
+    def _attach_state_graph_journal(self) -> None:
+        """Journal the active agent's state graph next to the crawl checkpoint."""
+        if self._checkpoint_store is None or self._crawler_agent is None:
+            return
+        tracker = getattr(self._crawler_agent, "state_graph_tracker", None)
+        if tracker is not None:
+            tracker.logs_dir = Path(self._checkpoint_store.checkpoint_dir)
+
     def _wire_observers_to_agent(self) -> None:
         """Wire UIWaitPredicate, ActionVerifier, and DeviceContextCapture to the agent.
 
@@ -676,6 +921,9 @@ class CrawlerAgentService:
         sub_phases = metadata.setdefault("sub_phases", {})
         sub_phases[key] = normalized_duration_ms
 
+        if self._timing_sink is not None:
+            self._timing_sink(key.removesuffix("_ms"), normalized_duration_ms)
+
     def _add_validation_retry(
         self,
         reason: str,
@@ -835,6 +1083,12 @@ class CrawlerAgentService:
 
         # Increment step number on each tool execution
         self._current_step_number += 1
+        if self._traffic_attributor is not None:
+            self._record_step_network(self._current_step_number - 1)
+            self._traffic_attributor.begin_step(self._current_step_number)
+            self._publish_network_activity()
+        if self._video_recorder is not None:
+            self._video_recorder.mark_step(self._current_step_number)
         self._apply_pending_step_timing()
         self._add_sub_phase_timing(
             "tool_execution_ms",
@@ -1077,6 +1331,8 @@ class CrawlerAgentService:
                 f"Phase transition error at step {self._current_step_number}: {e}"
             )
 
+        self._maybe_checkpoint()
+
     def _create_exploration_goal(
         self, app_package: str, max_steps: int, exploration_objective: str | None = None
     ) -> CrawlerGoal:
@@ -1181,6 +1437,10 @@ class CrawlerAgentService:
 
                 self._crawler_agent = CrawlerAgent(goal=goal.description, config=self._crawler_agent_config)
 
+                # Fast-path resume after a crash relaunch or `crawl --resume`
+                self._attach_state_graph_journal()
+                self._restore_pending_checkpoint()
+
                 # Wire observers to the Crawler agent's state_provider and driver
                 self._wire_observers_to_agent()
 
@@ -1343,6 +1603,9 @@ class CrawlerAgentService:
                 if is_app_crash and attempt < max_crash_retries:
                     logger.warning(f"App crash detected (attempt {attempt + 1}/{max_crash_retries}): {error_msg}")
 
+                    # Keep exploration progress so the next agent resumes instead of restarting
+                    self._pending_checkpoint = self._save_checkpoint()
+
                     # Attempt to relaunch the app
                     try:
                         from mobile_crawler.domain.adb_action_executor import ADBActionExecutor
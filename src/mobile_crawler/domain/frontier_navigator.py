@@ -0,0 +1,146 @@
+"""LLM-free navigation to the nearest screen with untried elements.
+
+When the crawler is on an exhausted screen (every clickable element already
+tried) or stuck in a loop, the agent would otherwise spend a full
+manager/executor LLM round trip per hop walking back to a screen it knows
+still has work. :class:`FrontierNavigator` instead asks the
+:class:`StateGraphTracker` for the cheapest recorded path to the nearest
+frontier state and replays it through the device, checking the layout hash
+after every hop. On the first mismatch it stops and hands control back to
+the agent on whatever screen it reached.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from mobile_crawler.domain.state_graph import StateGraphTracker, count_clickable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_HOPS = 6
+
+
+@dataclass
+class FrontierNavigationResult:
+    """Outcome of one navigation attempt."""
+
+    target: str | None = None
+    hops_planned: int = 0
+    hops_completed: int = 0
+    reached: bool = False
+    diverged: bool = False
+    final_state: Any = None
+
+    @property
+    def llm_steps_saved(self) -> int:
+        """Agent steps that replay made unnecessary (one per completed hop)."""
+        return self.hops_completed
+
+
+class FrontierNavigator:
+    """Replays recorded transitions to reach the nearest frontier state.
+
+    ``execute`` runs one recorded command dict (``{"action": "click", ...}``)
+    with the caller's workflow context (so tool events reach the run) and
+    returns whether it succeeded; ``capture`` returns the new UI state,
+    whose ``layout_hash`` is compared against the recorded destination.
+    Replayed hops are recorded in the tracker like any other step.
+    """
+
+    def __init__(
+        self,
+        tracker: StateGraphTracker,
+        execute: Callable[[dict[str, Any], Any], Awaitable[bool]],
+        capture: Callable[[], Awaitable[Any]],
+        max_hops: int = DEFAULT_MAX_HOPS,
+    ):
+        """Initialize the navigator.
+
+        Args:
+            tracker: State graph with recorded transitions
+            execute: Runs one recorded command on the device, given the workflow context
+            capture: Returns the current UI state (with a ``layout_hash``)
+            max_hops: Longest path worth replaying
+        """
+        self.tracker = tracker
+        self._execute = execute
+        self._capture = capture
+        self.max_hops = max_hops
+        self.total_hops = 0
+        self.total_divergences = 0
+
+    def should_navigate(self, current_hash: str, loop_detected: bool = False) -> bool:
+        """Navigate when the current screen is exhausted or the crawler is looping."""
+        state = self.tracker.states.get(current_hash)
+        if state is None:
+            return False
+        exhausted = "clickable_count" in state and not self.tracker.is_frontier(current_hash)
+        return exhausted or loop_detected
+
+    async def navigate(
+        self, current_hash: str, step_number: int, workflow_ctx: Any = None
+    ) -> FrontierNavigationResult:
+        """Replay the cheapest known path from ``current_hash`` to a frontier state.
+
+        Args:
+            current_hash: Layout hash of the exhausted screen
+            step_number: Step the replayed hops are recorded under
+            workflow_ctx: Workflow context handed to ``execute`` for each hop
+
+        Returns:
+            Result with the last captured UI state in ``final_state`` (None if
+            nothing was executed).
+        """
+        path = self.tracker.path_to_frontier(current_hash, max_hops=self.max_hops)
+        if not path:
+            return FrontierNavigationResult()
+
+        target = path[-1]["to_state"]
+        result = FrontierNavigationResult(target=target, hops_planned=len(path))
+        logger.info(f"Frontier navigation: replaying {len(path)} hop(s) to {target[:8]}")
+
+        from_hash = current_hash
+        for transition in path:
+            command = transition["command"]
+            if not await self._execute(command, workflow_ctx):
+                logger.info(f"Frontier navigation: {transition['action']} failed; handing back to agent")
+                result.diverged = True
+                break
+            ui_state = await self._capture()
+            result.final_state = ui_state
+            actual = getattr(ui_state, "layout_hash", None)
+            if not actual:
+                result.diverged = True
+                break
+
+            # Record what really happened so a stale edge is replaced by the observed one
+            self.tracker.record_transition(
+                from_hash, actual, command, step_number, duration_ms=transition.get("duration_ms")
+            )
+            phone_state = getattr(ui_state, "phone_state", None) or {}
+            elements = getattr(ui_state, "elements", None)
+            self.tracker.record_state(
+                actual,
+                step_number,
+                phone_state.get("packageName", "Unknown"),
+                phone_state.get("currentApp", "Unknown"),
+                clickable_count=count_clickable(elements) if elements is not None else None,
+            )
+            from_hash = actual
+
+            if actual != transition["to_state"]:
+                logger.info(
+                    f"Frontier navigation diverged after {transition['action']}: expected "
+                    f"{transition['to_state'][:8]}, got {actual[:8]}; handing back to agent"
+                )
+                result.diverged = True
+                break
+            result.hops_completed += 1
+
+        result.reached = not result.diverged and from_hash == target
+        self.total_hops += result.hops_completed
+        self.total_divergences += int(result.diverged)
+        self.tracker.save()
+        return result
@@ -5,5 +5,7 @@ Grounding module for visual interaction mapping.
 from .dtos import GroundingOverlay, OCRResult
 from .interfaces import GroundingService
 from .manager import GroundingManager
+from .ocr_worker import OCRWorker, OCRWorkerError, WorkerOCREngine
 
-__all__ = ["OCRResult", "GroundingOverlay", "GroundingService", "GroundingManager"]
+__all__ = ["OCRResult", "GroundingOverlay", "GroundingService", "GroundingManager",
+           "OCRWorker", "OCRWorkerError", "WorkerOCREngine"]
@@ -9,6 +9,10 @@ class OCREngine(Protocol):
         """Detects text in the given image."""
         ...
 
+    def detect_text_bytes(self, image_bytes: bytes) -> list[OCRResult]:
+        """Detects text in an encoded image already held in memory."""
+        ...
+
 class GroundingService(Protocol):
     """Protocol for the grounding service."""
     def process(self, screenshot_path: str) -> GroundingOverlay:
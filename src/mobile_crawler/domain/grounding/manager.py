@@ -1,3 +1,4 @@
+import io
 import logging
 import os
 
@@ -6,7 +7,7 @@ from PIL import Image
 from .dtos import GroundingOverlay
 from .interfaces import GroundingService, OCREngine
 from .mapper import LabelMapper
-from .ocr_engine import EasyOCREngine
+from .ocr_worker import WorkerOCREngine
 from .overlay import OverlayDrawer
 
 logger = logging.getLogger(__name__)
@@ -18,44 +19,53 @@ class GroundingManager(GroundingService):
     """
 
     def __init__(self, ocr_engine: OCREngine | None = None):
-        self.ocr_engine = ocr_engine or EasyOCREngine()
+        self.ocr_engine = ocr_engine or WorkerOCREngine()
         self.drawer = OverlayDrawer()
         self.mapper = LabelMapper()
 
     def process_screenshot(self, screenshot_path: str) -> GroundingOverlay:
         """
-        Executes the grounding pipeline on a screenshot.
+        Executes the grounding pipeline on a screenshot file.
+        The file is read once; OCR, drawing and sizing all use the in-memory copy.
         """
-        import time
-        start_time = time.time()
-
         if not os.path.exists(screenshot_path):
             raise FileNotFoundError(f"Screenshot not found: {screenshot_path}")
 
+        with open(screenshot_path, "rb") as f:
+            image_bytes = f.read()
+
+        base, ext = os.path.splitext(screenshot_path)
+        return self.process_image_bytes(image_bytes, f"{base}_grounded{ext}")
+
+    def process_image_bytes(self, image_bytes: bytes, output_path: str) -> GroundingOverlay:
+        """
+        Executes the grounding pipeline on an encoded screenshot held in memory.
+
+        Args:
+            image_bytes: Encoded screenshot (PNG/JPEG/WebP)
+            output_path: Where to write the marked image
+        """
+        import time
+        start_time = time.time()
+
         # 1. OCR Detection
-        logger.info(f"Running OCR on {screenshot_path}...")
-        results = self.ocr_engine.detect_text(screenshot_path)
+        logger.info(f"Running OCR on {len(image_bytes)} byte screenshot...")
+        results = self.ocr_engine.detect_text_bytes(image_bytes)
         ocr_duration = time.time() - start_time
         logger.info(f"Detected {len(results)} text regions in {ocr_duration:.2f}s.")
 
         # 2. Label Mapping
         label_map = self.mapper.assign_labels(results)
 
-        # 3. Generate Output Path
-        base, ext = os.path.splitext(screenshot_path)
-        output_path = f"{base}_grounded{ext}"
-
-        # 4. Draw Overlays
-        self.drawer.draw(screenshot_path, results, output_path)
-
-        # 5. Get Original Dimensions
-        with Image.open(screenshot_path) as img:
+        # 3. Draw Overlays and get Original Dimensions
+        with Image.open(io.BytesIO(image_bytes)) as img:
             dims = img.size
+            self.drawer.draw_image(img, results, output_path)
 
         total_duration = time.time() - start_time
         logger.info(f"Grounding completed in {total_duration:.2f}s (OCR: {ocr_duration:.2f}s).")
 
-        # 6. Build ocr_elements for prompt context
+        # 4. Build ocr_elements for prompt context
         ocr_elements = []
         # LabelMapper assigns labels sequentially to the results list
         for i, result in enumerate(results):
@@ -76,3 +86,9 @@ class GroundingManager(GroundingService):
     def process(self, screenshot_path: str) -> GroundingOverlay:
         """Alias for process_screenshot adhering to GroundingService interface."""
         return self.process_screenshot(screenshot_path)
+
+    def close(self) -> None:
+        """Release the OCR engine (stops a worker process, if one is used)."""
+        close = getattr(self.ocr_engine, "close", None)
+        if close is not None:
+            close()
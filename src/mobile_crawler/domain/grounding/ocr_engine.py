@@ -1,53 +1,112 @@
+import io
 import logging
 
-import easyocr
+import numpy as np
+from PIL import Image
 
 from .dtos import OCRResult
 from .interfaces import OCREngine
 
 logger = logging.getLogger(__name__)
 
+# Number of detected text regions recognized per forward pass. EasyOCR's
+# default of 1 runs the recognizer once per crop.
+DEFAULT_RECOGNITION_BATCH_SIZE = 16
+
+
+def cuda_available() -> bool:
+    """Check whether torch can see a CUDA device."""
+    try:
+        import torch
+
+        return bool(torch.cuda.is_available())
+    except Exception:
+        return False
+
+
+def create_reader(languages: list[str], gpu: bool | None = None):
+    """Build an ``easyocr.Reader``, falling back to CPU if GPU setup fails.
+
+    Args:
+        languages: EasyOCR language codes
+        gpu: True to request CUDA, False for CPU, None to use CUDA only if available
+
+    Returns:
+        Tuple of (reader, whether the reader runs on the GPU)
+    """
+    # Imported here so only the OCR worker process (or an in-process engine)
+    # pays for easyocr and torch; the crawler just imports this module.
+    import easyocr
+
+    use_gpu = cuda_available() if gpu is None else bool(gpu)
+    if use_gpu:
+        try:
+            return easyocr.Reader(languages, gpu=True), True
+        except Exception as e:
+            logger.warning(f"EasyOCR GPU initialization failed, falling back to CPU: {e}")
+    return easyocr.Reader(languages, gpu=False), False
+
+
+def decode_image(image_bytes: bytes) -> np.ndarray:
+    """Decode encoded image bytes (PNG/JPEG/WebP) into an RGB array for EasyOCR."""
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        return np.asarray(img.convert("RGB"))
+
+
+def to_ocr_results(raw_results) -> list[OCRResult]:
+    """
+    Convert EasyOCR output to OCRResult objects.
+    EasyOCR output format: [([[x,y], [x,y], [x,y], [x,y]], text, confidence), ...]
+    """
+    results = []
+    for bbox, text, confidence in raw_results:
+        # bbox is list of 4 points: tl, tr, br, bl
+        # Convert to x_min, y_min, x_max, y_max
+        xs = [p[0] for p in bbox]
+        ys = [p[1] for p in bbox]
+        x_min, x_max = int(min(xs)), int(max(xs))
+        y_min, y_max = int(min(ys)), int(max(ys))
+
+        center = ((x_min + x_max) // 2, (y_min + y_max) // 2)
+
+        results.append(OCRResult(
+            text=text,
+            box=(x_min, y_min, x_max, y_max),
+            confidence=float(confidence),
+            center=center
+        ))
+    return results
+
+
 class EasyOCREngine(OCREngine):
-    """Wrapper for EasyOCR detection."""
+    """Wrapper for EasyOCR detection running in the current process."""
 
-    def __init__(self, languages=None, gpu=True):
+    def __init__(self, languages=None, gpu=None, batch_size=DEFAULT_RECOGNITION_BATCH_SIZE):
         if languages is None:
             languages = ['en']
+        self.batch_size = max(1, int(batch_size))
         try:
-            self.reader = easyocr.Reader(languages, gpu=gpu)
-            logger.info(f"EasyOCR initialized with languages={languages}, gpu={gpu}")
+            self.reader, self.gpu = create_reader(languages, gpu)
+            logger.info(f"EasyOCR initialized with languages={languages}, gpu={self.gpu}")
         except Exception as e:
             logger.error(f"Failed to initialize EasyOCR: {e}")
             raise
 
     def detect_text(self, image_path: str) -> list[OCRResult]:
-        """
-        Detects text and converts result to OCRResult objects.
-        EasyOCR output format: [([[x,y], [x,y], [x,y], [x,y]], text, confidence), ...]
-        """
+        """Detects text in an image file and converts the result to OCRResult objects."""
         try:
             # detail=1 returns bounding box, text, confidence
-            raw_results = self.reader.readtext(image_path)
-
-            results = []
-            for bbox, text, confidence in raw_results:
-                # bbox is list of 4 points: tl, tr, br, bl
-                # Convert to x_min, y_min, x_max, y_max
-                xs = [p[0] for p in bbox]
-                ys = [p[1] for p in bbox]
-                x_min, x_max = int(min(xs)), int(max(xs))
-                y_min, y_max = int(min(ys)), int(max(ys))
-
-                center = ((x_min + x_max) // 2, (y_min + y_max) // 2)
-
-                results.append(OCRResult(
-                    text=text,
-                    box=(x_min, y_min, x_max, y_max),
-                    confidence=float(confidence),
-                    center=center
-                ))
-
-            return results
+            raw_results = self.reader.readtext(image_path, batch_size=self.batch_size)
+            return to_ocr_results(raw_results)
         except Exception as e:
             logger.error(f"OCR detection error for {image_path}: {e}")
             return []
+
+    def detect_text_bytes(self, image_bytes: bytes) -> list[OCRResult]:
+        """Detects text in an encoded image held in memory."""
+        try:
+            raw_results = self.reader.readtext(decode_image(image_bytes), batch_size=self.batch_size)
+            return to_ocr_results(raw_results)
+        except Exception as e:
+            logger.error(f"OCR detection error for in-memory image: {e}")
+            return []
@@ -0,0 +1,278 @@
+"""Long-lived OCR worker process.
+
+Loading EasyOCR's detector and recognizer takes seconds and several hundred
+MB, so the model is loaded once in a dedicated process and screens are sent
+to it as encoded image bytes over a pipe. Running OCR out of process also
+keeps torch's thread pool from competing with the crawler's event loop.
+"""
+
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+
+from .dtos import OCRResult
+from .interfaces import OCREngine
+from .ocr_engine import DEFAULT_RECOGNITION_BATCH_SIZE, create_reader, decode_image, to_ocr_results
+
+logger = logging.getLogger(__name__)
+
+
+class OCRWorkerError(RuntimeError):
+    """Raised when the OCR worker process fails to start or answer."""
+
+
+def _serve(conn, reader_factory, languages, gpu, batch_size) -> None:
+    """Worker process entry point: load the model once, then answer requests.
+
+    Requests are ``(op, payload)`` tuples; ``None`` asks the worker to exit.
+    Replies are ``("ok", result)`` or ``("error", message)``.
+    """
+    try:
+        reader, on_gpu = reader_factory(languages, gpu)
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+    conn.send(("ready", on_gpu))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        op, payload = message
+        try:
+            if op == "detect":
+                result = [
+                    to_ocr_results(reader.readtext(decode_image(data), batch_size=batch_size))
+                    for data in payload
+                ]
+            elif op == "recognize":
+                image_bytes, boxes = payload
+                # recognize() takes boxes as [x_min, x_max, y_min, y_max] and
+                # runs all crops through the recognizer in shared batches.
+                grey = decode_image(image_bytes).mean(axis=2).astype("uint8")
+                horizontal_list = [[x0, x1, y0, y1] for x0, y0, x1, y1 in boxes]
+                result = to_ocr_results(reader.recognize(
+                    grey,
+                    horizontal_list=horizontal_list,
+                    free_list=[],
+                    batch_size=max(batch_size, len(horizontal_list)),
+                ))
+            else:
+                raise ValueError(f"Unknown OCR worker operation: {op}")
+            conn.send(("ok", result))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class OCRWorker:
+    """Client for a persistent OCR process.
+
+    The process is started on first use (or by :meth:`start`) and serves
+    requests one at a time; calls from several threads are serialized. If
+    the process dies it is restarted on the next request. When the GPU was
+    requested but the worker cannot come up with it, it is started again on
+    the CPU.
+    """
+
+    def __init__(
+        self,
+        languages: list[str] | None = None,
+        gpu: bool | None = False,
+        batch_size: int = DEFAULT_RECOGNITION_BATCH_SIZE,
+        startup_timeout: float = 300.0,
+        request_timeout: float = 120.0,
+        reader_factory: Callable = create_reader,
+    ):
+        """Initialize the worker client.
+
+        Args:
+            languages: EasyOCR language codes (default: English)
+            gpu: True to request CUDA, False for CPU, None to use CUDA if available
+            batch_size: Text regions recognized per forward pass
+            startup_timeout: Seconds to wait for the model to load
+            request_timeout: Seconds to wait for a single request
+            reader_factory: Picklable callable ``(languages, gpu) -> (reader, on_gpu)``
+        """
+        self.languages = languages or ['en']
+        self.gpu = gpu
+        self.batch_size = max(1, int(batch_size))
+        self.startup_timeout = startup_timeout
+        self.request_timeout = request_timeout
+        self.reader_factory = reader_factory
+        self.on_gpu = False
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker process is alive."""
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Start the worker process and wait until its model is loaded."""
+        with self._lock:
+            self._ensure_started()
+
+    def detect(self, images: list[bytes]) -> list[list[OCRResult]]:
+        """Run detection and recognition on one or more encoded images.
+
+        Args:
+            images: Encoded screenshots (PNG/JPEG/WebP bytes)
+
+        Returns:
+            One list of OCRResult per input image, in order
+        """
+        if not images:
+            return []
+        return self._request("detect", list(images))
+
+    def recognize(self, image_bytes: bytes, boxes: list[tuple[int, int, int, int]]) -> list[OCRResult]:
+        """Recognize text inside known regions of an image in a single batch.
+
+        Args:
+            image_bytes: Encoded screenshot
+            boxes: Regions as (x_min, y_min, x_max, y_max)
+
+        Returns:
+            OCRResult per region that produced text
+        """
+        if not boxes:
+            return []
+        return self._request("recognize", (image_bytes, [tuple(int(v) for v in box) for box in boxes]))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Ask the worker to exit, terminating it if it does not."""
+        with self._lock:
+            self._stop(timeout)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _request(self, op: str, payload):
+        with self._lock:
+            self._ensure_started()
+            try:
+                self._conn.send((op, payload))
+                if not self._conn.poll(self.request_timeout):
+                    raise OCRWorkerError(f"OCR worker did not answer within {self.request_timeout}s")
+                status, result = self._conn.recv()
+            except (EOFError, OSError) as e:
+                self._stop(0)
+                raise OCRWorkerError(f"OCR worker connection lost: {e}") from e
+            except OCRWorkerError:
+                # A late reply would be read as the answer to the next request
+                self._stop(0)
+                raise
+
+        if status != "ok":
+            raise OCRWorkerError(f"OCR worker request failed: {result}")
+        return result
+
+    def _ensure_started(self) -> None:
+        if self.running:
+            return
+        self._stop(0)
+        try:
+            self._spawn(self.gpu)
+        except OCRWorkerError as e:
+            if self.gpu is False:
+                raise
+            logger.warning(f"OCR worker failed to start with GPU, retrying on CPU: {e}")
+            self._spawn(False)
+
+    def _spawn(self, gpu: bool | None) -> None:
+        # spawn rather than fork: torch and CUDA are not fork-safe
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(
+            target=_serve,
+            args=(child_conn, self.reader_factory, self.languages, gpu, self.batch_size),
+            name="ocr-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+
+        try:
+            if not parent_conn.poll(self.startup_timeout):
+                raise OCRWorkerError(f"OCR worker did not load within {self.startup_timeout}s")
+            status, detail = parent_conn.recv()
+        except (EOFError, OSError) as e:
+            self._stop(0)
+            raise OCRWorkerError(f"OCR worker exited during startup: {e}") from e
+        except OCRWorkerError:
+            self._stop(0)
+            raise
+        if status != "ready":
+            self._stop(0)
+            raise OCRWorkerError(f"OCR worker failed to load: {detail}")
+
+        self.on_gpu = bool(detail)
+        logger.info(f"OCR worker started (pid={process.pid}, languages={self.languages}, gpu={self.on_gpu})")
+
+    def _stop(self, timeout: float) -> None:
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if conn is not None:
+            try:
+                if process is not None and process.is_alive():
+                    conn.send(None)
+            except (EOFError, OSError):
+                pass
+            conn.close()
+        if process is not None:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join(1.0)
+
+
+class WorkerOCREngine(OCREngine):
+    """OCREngine backed by a persistent :class:`OCRWorker` process."""
+
+    def __init__(self, worker: OCRWorker | None = None, **worker_options):
+        """Initialize the engine.
+
+        Args:
+            worker: Existing worker to use; one is created from ``worker_options`` otherwise
+            **worker_options: Keyword arguments for :class:`OCRWorker`
+        """
+        self.worker = worker or OCRWorker(**worker_options)
+
+    def detect_text(self, image_path: str) -> list[OCRResult]:
+        """Detects text in an image file by sending its bytes to the worker."""
+        with open(image_path, "rb") as f:
+            return self.detect_text_bytes(f.read())
+
+    def detect_text_bytes(self, image_bytes: bytes) -> list[OCRResult]:
+        """Detects text in an encoded image held in memory."""
+        try:
+            return self.worker.detect([image_bytes])[0]
+        except OCRWorkerError as e:
+            logger.error(f"OCR detection error: {e}")
+            return []
+
+    def detect_many(self, images: list[bytes]) -> list[list[OCRResult]]:
+        """Detects text in several screens with a single worker round trip."""
+        try:
+            return self.worker.detect(images)
+        except OCRWorkerError as e:
+            logger.error(f"OCR detection error: {e}")
+            return [[] for _ in images]
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        self.worker.close()
@@ -20,10 +20,18 @@ class OverlayDrawer:
 
     def draw(self, image_path: str, results: list[OCRResult], output_path: str) -> str:
         """
-        Draws boxes and numeric IDs on the image.
+        Draws boxes and numeric IDs on the image file.
         Returns the path to the saved image.
         """
-        with Image.open(image_path).convert("RGBA") as base:
+        with Image.open(image_path) as img:
+            return self.draw_image(img, results, output_path)
+
+    def draw_image(self, image: Image.Image, results: list[OCRResult], output_path: str) -> str:
+        """
+        Draws boxes and numeric IDs on an already-decoded image.
+        Returns the path to the saved image.
+        """
+        with image.convert("RGBA") as base:
             # Create an overlay layer for transparency
             overlay = Image.new("RGBA", base.size, (255, 255, 255, 0))
             draw = ImageDraw.Draw(overlay)
@@ -0,0 +1,214 @@
+"""Fixed-memory, mergeable quantile sketch for latency tracking.
+
+A DDSketch-style histogram: each sample lands in a logarithmic bucket whose
+width is a fixed fraction of its value, so any quantile is reported within
+``relative_accuracy`` of the true sample. The number of buckets is capped;
+once the cap is hit the lowest buckets are folded together, which only
+costs accuracy at the fast end of the distribution where nobody looks.
+Memory therefore stays constant no matter how many samples are recorded.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+# Samples at or below this value (ms) are counted in a dedicated zero bucket
+_MIN_TRACKED_VALUE = 1e-3
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Point-in-time view of a sketch, cheap to read from the UI thread."""
+
+    count: int = 0
+    mean: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+
+EMPTY_SUMMARY = LatencySummary()
+
+
+class LatencySketch:
+    """Bounded quantile sketch over non-negative latencies in milliseconds.
+
+    Not thread-safe; owners that record from worker threads guard it with
+    their own lock (see StatsCollectorSpanProcessor).
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ):
+        """Create an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            max_buckets: Upper bound on buckets kept before collapsing
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 2:
+            raise ValueError("max_buckets must be at least 2")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = 0.0
+        self._summary: LatencySummary | None = EMPTY_SUMMARY
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0.0
+
+    @property
+    def min(self) -> float:
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+    def add(self, value: float) -> None:
+        """Record one latency sample (negative values are ignored)."""
+        if value < 0 or value != value:  # NaN check
+            return
+        self._count += 1
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        if value <= _MIN_TRACKED_VALUE:
+            self._zero_count += 1
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            buckets = self._buckets
+            if key in buckets:
+                buckets[key] += 1
+            else:
+                buckets[key] = 1
+                if len(buckets) > self.max_buckets:
+                    self._collapse()
+        self._summary = None
+
+    def merge(self, other: LatencySketch) -> None:
+        """Fold another sketch with the same accuracy into this one."""
+        if other._count == 0:
+            return
+        if not math.isclose(self._gamma, other._gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self._zero_count += other._zero_count
+        self._count += other._count
+        self._sum += other._sum
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+        self._summary = None
+
+    def quantile(self, q: float) -> float:
+        """Return the estimated value at quantile ``q`` (0..1)."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self._count == 0:
+            return 0.0
+        return self._quantiles((q,))[0]
+
+    def summary(self) -> LatencySummary:
+        """Return count, mean, p50/p95/p99 and max.
+
+        The result is cached until the next add/merge, so repeated reads
+        (a dashboard refreshing every second) do no work at all.
+        """
+        if self._summary is None:
+            p50, p95, p99 = self._quantiles((0.5, 0.95, 0.99))
+            self._summary = LatencySummary(
+                count=self._count,
+                mean=self.mean,
+                p50=p50,
+                p95=p95,
+                p99=p99,
+                max=self._max,
+            )
+        return self._summary
+
+    def copy(self) -> LatencySketch:
+        """Return an independent copy (bounded by max_buckets, not sample count)."""
+        clone = LatencySketch(self.relative_accuracy, self.max_buckets)
+        clone._buckets = dict(self._buckets)
+        clone._zero_count = self._zero_count
+        clone._count = self._count
+        clone._sum = self._sum
+        clone._min = self._min
+        clone._max = self._max
+        clone._summary = self._summary
+        return clone
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._buckets.clear()
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = 0.0
+        self._summary = EMPTY_SUMMARY
+
+    def _quantiles(self, qs: tuple[float, ...]) -> list[float]:
+        """Walk the buckets once in value order and answer every quantile."""
+        if self._count == 0:
+            return [0.0] * len(qs)
+        ranks = [q * (self._count - 1) for q in qs]
+        values = [0.0] * len(qs)
+        pending = sorted(range(len(qs)), key=lambda i: ranks[i])
+        cumulative = self._zero_count
+        while pending and ranks[pending[0]] < cumulative:
+            values[pending.pop(0)] = 0.0
+        for key in sorted(self._buckets):
+            if not pending:
+                break
+            cumulative += self._buckets[key]
+            while pending and ranks[pending[0]] < cumulative:
+                values[pending.pop(0)] = self._bucket_value(key)
+        # Bucket midpoints can overshoot the extremes; clamp to what was seen
+        return [min(max(v, self.min), self._max) if v else v for v in values]
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets together until the cap holds again."""
+        keys = sorted(self._buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        folded = 0
+        for key in keys[:excess]:
+            folded += self._buckets.pop(key)
+        self._buckets[target] += folded
@@ -0,0 +1,261 @@
+"""Live per-step attribution of captured network traffic.
+
+PCAPdroid's UDP exporter streams every captured packet to a collector while
+the crawl runs. :class:`PcapUdpCollector` receives those datagrams, appends
+them to the session's PCAP file and decodes them incrementally on a worker
+thread, off the crawl's event loop; :class:`LiveTrafficAttributor` assigns
+each decoded request to the step that was current when it arrived, so the
+prompt can tell the agent which hosts its last actions made the app contact.
+"""
+
+import asyncio
+import logging
+import struct
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from mobile_crawler.reporting.contracts import NetworkRequest
+from mobile_crawler.reporting.parsers.pcap_parser import (
+    LINKTYPE_RAW,
+    PcapStreamDecoder,
+    is_pcap_file_header,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StepTraffic:
+    """Network activity attributed to one crawl step (one ``step_logs`` row)."""
+
+    step_number: int
+    request_count: int = 0
+    total_bytes: int = 0
+    hosts: list[str] = field(default_factory=list)
+    new_hosts: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "step": self.step_number,
+            "requests": self.request_count,
+            "bytes": self.total_bytes,
+            "hosts": list(self.hosts),
+            "new_hosts": list(self.new_hosts),
+        }
+
+
+class LiveTrafficAttributor:
+    """Assigns requests to the current crawl step as they are decoded.
+
+    Thread-safe: requests arrive on the collector's event loop while the step
+    counter is advanced by the crawler agent service. Only the most recent
+    ``history_size`` steps are retained.
+    """
+
+    def __init__(self, history_size: int = 50):
+        self._lock = threading.Lock()
+        self._steps: deque[StepTraffic] = deque(maxlen=max(1, history_size))
+        self._current = StepTraffic(step_number=0)
+        self._steps.append(self._current)
+        self._seen_hosts: set[str] = set()
+        self.total_requests = 0
+
+    @property
+    def current_step(self) -> int:
+        return self._current.step_number
+
+    def begin_step(self, step_number: int) -> None:
+        """Route subsequent requests to ``step_number``."""
+        with self._lock:
+            if step_number == self._current.step_number:
+                return
+            self._current = StepTraffic(step_number=step_number)
+            self._steps.append(self._current)
+
+    def add_request(self, request: NetworkRequest, step_number: int | None = None) -> None:
+        """Attribute a decoded request to ``step_number`` (default: the current step).
+
+        Requests for a step no longer retained go to the current step.
+        """
+        host = request.host
+        with self._lock:
+            step = self._find_step(step_number)
+            step.request_count += 1
+            step.total_bytes += request.size_bytes
+            self.total_requests += 1
+            if host and host not in step.hosts:
+                step.hosts.append(host)
+            if host and host not in self._seen_hosts:
+                self._seen_hosts.add(host)
+                step.new_hosts.append(host)
+
+    def add_requests(self, requests: list[NetworkRequest], step_number: int | None = None) -> None:
+        for request in requests:
+            self.add_request(request, step_number)
+
+    def _find_step(self, step_number: int | None) -> StepTraffic:
+        if step_number is None or step_number == self._current.step_number:
+            return self._current
+        for step in reversed(self._steps):
+            if step.step_number == step_number:
+                return step
+        return self._current
+
+    def step_summary(self, step_number: int) -> StepTraffic | None:
+        """Return a copy of the traffic recorded for ``step_number``, if retained."""
+        with self._lock:
+            for step in self._steps:
+                if step.step_number == step_number:
+                    return StepTraffic(
+                        step.step_number, step.request_count, step.total_bytes,
+                        list(step.hosts), list(step.new_hosts),
+                    )
+        return None
+
+    def prompt_summary(self, recent_steps: int = 5) -> dict[str, Any]:
+        """Build the ``network_activity`` block for the AI prompt.
+
+        Args:
+            recent_steps: Number of most recent steps with traffic to include
+
+        Returns:
+            Dict with the hosts first contacted during the last completed step,
+            per-step activity for recent steps, and run totals.
+        """
+        with self._lock:
+            steps = list(self._steps)
+            distinct_hosts = len(self._seen_hosts)
+            total_requests = self.total_requests
+        completed = [s for s in steps if s is not self._current]
+        last = completed[-1] if completed else None
+        active = [s.to_dict() for s in steps if s.request_count][-recent_steps:]
+        return {
+            "new_hosts_last_step": list(last.new_hosts) if last else [],
+            "recent_steps": active,
+            "distinct_hosts": distinct_hosts,
+            "total_requests": total_requests,
+        }
+
+
+class _CollectorProtocol(asyncio.DatagramProtocol):
+    def __init__(self, collector: "PcapUdpCollector"):
+        self._collector = collector
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self._collector.handle_datagram(data)
+
+    def error_received(self, exc: Exception) -> None:
+        logger.debug(f"Traffic collector socket error: {exc}")
+
+
+class PcapUdpCollector:
+    """Receives PCAPdroid UDP-exporter datagrams on the running event loop.
+
+    Each datagram carries one or more pcap records (optionally preceded by a
+    file header). Records are appended to ``output_path`` as they arrive, so
+    the PCAP is complete the moment capture stops. Decoding runs in order on
+    a single worker thread and each decoded request is attributed to the step
+    that was current when its datagram arrived.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        attributor: LiveTrafficAttributor,
+        host: str = "0.0.0.0",
+        port: int = 0,
+        linktype: int = LINKTYPE_RAW,
+    ):
+        """Initialize the collector.
+
+        Args:
+            output_path: Local PCAP file to write
+            attributor: Receives decoded requests
+            host: Local address to bind
+            port: Local UDP port to bind (0 picks a free port)
+            linktype: Link type of the exported records unless a header says otherwise
+        """
+        self.output_path = output_path
+        self.attributor = attributor
+        self.host = host
+        self.port = port
+        self.linktype = linktype
+        self.datagrams_received = 0
+        self.bytes_received = 0
+        self._decoder = PcapStreamDecoder(linktype=linktype)
+        self._decode_executor: ThreadPoolExecutor | None = None
+        self._transport: asyncio.DatagramTransport | None = None
+        self._file = None
+
+    async def start(self) -> int:
+        """Bind the UDP socket and open the output file.
+
+        Returns:
+            The bound UDP port
+        """
+        loop = asyncio.get_running_loop()
+        self._file = open(self.output_path, "wb")
+        self._decode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pcap-decode")
+        try:
+            self._transport, _ = await loop.create_datagram_endpoint(
+                lambda: _CollectorProtocol(self), local_addr=(self.host, self.port)
+            )
+        except OSError:
+            self._decode_executor.shutdown()
+            self._decode_executor = None
+            self._file.close()
+            self._file = None
+            raise
+        self.port = self._transport.get_extra_info("sockname")[1]
+        logger.info(f"Traffic collector listening on {self.host}:{self.port} -> {self.output_path}")
+        return self.port
+
+    def handle_datagram(self, data: bytes) -> None:
+        """Persist one exporter datagram and queue it for decoding."""
+        if self._file is None:
+            return
+        self.datagrams_received += 1
+        self.bytes_received += len(data)
+
+        records = data
+        if is_pcap_file_header(data):
+            records = data[24:]
+            if self._file.tell() == 0:
+                self._file.write(data[:24])
+        elif self._file.tell() == 0:
+            self._file.write(struct.pack("<IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 262144, self.linktype))
+
+        if self._decode_executor is not None:
+            self._decode_executor.submit(self._decode, data, self.attributor.current_step)
+        self._file.write(records)
+
+    def _decode(self, data: bytes, step_number: int) -> None:
+        try:
+            self.attributor.add_requests(self._decoder.feed_record(data), step_number)
+        except Exception as e:
+            logger.debug(f"Failed to decode exporter datagram: {e}")
+
+    async def close(self) -> str | None:
+        """Stop receiving, flush pending state and close the PCAP file.
+
+        Returns:
+            Path of the written PCAP, or None if no packet was received
+        """
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+            # Let the transport release the socket
+            await asyncio.sleep(0)
+        if self._decode_executor is not None:
+            executor, self._decode_executor = self._decode_executor, None
+            await asyncio.to_thread(executor.shutdown, True)
+        if self._file is None:
+            return None
+        self.attributor.add_requests(await asyncio.to_thread(self._decoder.close))
+        has_packets = self._file.tell() > 24
+        self._file.close()
+        self._file = None
+        return self.output_path if has_packets else None
@@ -0,0 +1,184 @@
+"""Opt-in sampling profiler keyed by step phase.
+
+A daemon thread samples the crawl thread's Python stack at a fixed
+interval and files each sample under the step phase and step number that
+were current at that moment. Phase changes come from a
+:class:`StepPhaseStateMachine` listener, which also accounts wall and CPU
+time per phase on the crawl thread itself.
+
+Output is one collapsed-stack file per phase (``<phase>.folded``, the
+``frame;frame;frame count`` format read by flamegraph.pl, speedscope and
+inferno), ``by_step.folded`` whose root frames are ``step_<n>;<phase>`` for
+drilling into one slow step, and ``summary.json`` with per-phase wall/CPU
+milliseconds and per-step sample counts.
+"""
+
+import json
+import logging
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any
+
+from mobile_crawler.domain.step_phase import StepPhase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 0.01
+MAX_STACK_DEPTH = 128
+
+
+def _frame_label(frame) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_name}"
+
+
+def collapse_stack(frame, max_depth: int = MAX_STACK_DEPTH) -> str:
+    """Render a frame and its callers root-first as ``a;b;c``."""
+    labels = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class PhaseProfiler:
+    """Samples one thread's stack and tags every sample with phase and step.
+
+    Call :meth:`start` from the thread to profile (the crawl thread), call
+    :meth:`set_phase` on every step phase transition, and call :meth:`stop`
+    then :meth:`write` when the crawl ends.
+    """
+
+    def __init__(self, interval_seconds: float = DEFAULT_INTERVAL_SECONDS):
+        """Initialize the profiler.
+
+        Args:
+            interval_seconds: Time between stack samples
+        """
+        self.interval_seconds = interval_seconds
+        self._target_thread_id: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        # (phase, step) is replaced as one tuple so the sampler never sees a torn pair
+        self._current: tuple[str, int] = (StepPhase.CAPTURE.value, 0)
+        self._samples: Counter[tuple[str, int, str]] = Counter()
+        self._wall_ms: defaultdict[str, float] = defaultdict(float)
+        self._cpu_ms: defaultdict[str, float] = defaultdict(float)
+        self._phase_started_wall = 0.0
+        self._phase_started_cpu = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self._samples.values())
+
+    def start(self, phase: str = StepPhase.CAPTURE.value, step_number: int = 0) -> None:
+        """Begin sampling the calling thread."""
+        if self.running:
+            return
+        self._target_thread_id = threading.get_ident()
+        self._current = (phase, step_number)
+        self._phase_started_wall = time.perf_counter()
+        self._phase_started_cpu = time.thread_time()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="phase-profiler", daemon=True)
+        self._thread.start()
+
+    def set_phase(self, phase: str, step_number: int) -> None:
+        """Switch the tag for subsequent samples; call on the profiled thread."""
+        self._account_current_phase()
+        self._current = (phase, step_number)
+
+    def stop(self) -> None:
+        """Stop sampling and close out the current phase's timings."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        if threading.get_ident() == self._target_thread_id:
+            self._account_current_phase()
+
+    def _account_current_phase(self) -> None:
+        now_wall = time.perf_counter()
+        now_cpu = time.thread_time()
+        phase = self._current[0]
+        self._wall_ms[phase] += (now_wall - self._phase_started_wall) * 1000
+        self._cpu_ms[phase] += (now_cpu - self._phase_started_cpu) * 1000
+        self._phase_started_wall = now_wall
+        self._phase_started_cpu = now_cpu
+
+    def _sample_loop(self) -> None:
+        target = self._target_thread_id
+        samples = self._samples
+        while not self._stop_event.wait(self.interval_seconds):
+            frame = sys._current_frames().get(target)
+            if frame is None:
+                continue
+            phase, step = self._current
+            samples[(phase, step, collapse_stack(frame))] += 1
+            del frame
+
+    def collapsed_stacks(self) -> dict[str, dict[str, int]]:
+        """Samples per phase as {phase: {collapsed_stack: count}}, summed over steps."""
+        by_phase: dict[str, Counter[str]] = defaultdict(Counter)
+        for (phase, _step, stack), count in list(self._samples.items()):
+            by_phase[phase][stack] += count
+        return {phase: dict(stacks) for phase, stacks in by_phase.items()}
+
+    def collapsed_stacks_by_step(self) -> dict[str, int]:
+        """Every sample as {"step_<n>;<phase>;<stack>": count}."""
+        return {
+            f"step_{step};{phase};{stack}": count
+            for (phase, step, stack), count in list(self._samples.items())
+        }
+
+    def summary(self) -> dict[str, Any]:
+        """Per-phase wall/CPU time and sample counts, plus samples per step."""
+        phase_samples: Counter[str] = Counter()
+        step_samples: dict[int, Counter[str]] = defaultdict(Counter)
+        for (phase, step, _stack), count in list(self._samples.items()):
+            phase_samples[phase] += count
+            step_samples[step][phase] += count
+        phases = sorted(set(phase_samples) | set(self._wall_ms))
+        return {
+            "interval_ms": self.interval_seconds * 1000,
+            "phases": {
+                phase: {
+                    "samples": phase_samples[phase],
+                    "wall_ms": round(self._wall_ms.get(phase, 0.0), 3),
+                    "cpu_ms": round(self._cpu_ms.get(phase, 0.0), 3),
+                }
+                for phase in phases
+            },
+            "steps": {str(step): dict(counts) for step, counts in sorted(step_samples.items())},
+        }
+
+    def write(self, output_dir: str | Path) -> list[Path]:
+        """Write ``<phase>.folded`` files and ``summary.json``.
+
+        Returns:
+            Paths of the files written
+        """
+        directory = Path(output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        files = {f"{phase}.folded": stacks for phase, stacks in self.collapsed_stacks().items()}
+        files["by_step.folded"] = self.collapsed_stacks_by_step()
+        for name, stacks in files.items():
+            path = directory / name
+            lines = [f"{stack} {count}" for stack, count in sorted(stacks.items())]
+            path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+            written.append(path)
+        summary_path = directory / "summary.json"
+        summary_path.write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        written.append(summary_path)
+        logger.info(f"Wrote phase profile ({self.sample_count} samples) to {directory}")
+        return written
@@ -15,7 +15,8 @@ class PromptBuilder:
         self,
         config_manager: ConfigManager,
         step_log_repository: StepLogRepository,
-        screen_repository: ScreenRepository | None = None
+        screen_repository: ScreenRepository | None = None,
+        traffic_attributor=None
     ):
         """Initialize prompt builder.
 
@@ -23,10 +24,12 @@ class PromptBuilder:
             config_manager: Configuration manager for settings
             step_log_repository: Repository for step logs
             screen_repository: Optional repository for screen info (enables novelty signals)
+            traffic_attributor: Optional LiveTrafficAttributor (enables network activity context)
         """
         self.config_manager = config_manager
         self.step_log_repository = step_log_repository
         self.screen_repository = screen_repository
+        self.traffic_attributor = traffic_attributor
 
     def build_system_prompt(self) -> str:
         """Build the system prompt with test credentials.
@@ -124,6 +127,9 @@ class PromptBuilder:
             "available_actions": available_actions
         }
 
+        if self.traffic_attributor is not None:
+            prompt_data["network_activity"] = self.traffic_attributor.prompt_summary()
+
         return json.dumps(prompt_data, indent=2)
 
     def _build_exploration_progress(
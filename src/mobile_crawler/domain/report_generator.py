@@ -7,6 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from mobile_crawler.domain.video_recording_manager import find_step_clip
 from mobile_crawler.infrastructure.ai_interaction_repository import AIInteractionRepository
 from mobile_crawler.infrastructure.database import DatabaseManager
 from mobile_crawler.infrastructure.run_repository import RunRepository
@@ -14,7 +15,7 @@ from mobile_crawler.infrastructure.step_log_repository import StepLogRepository
 from mobile_crawler.reporting.correlator import RunCorrelator
 from mobile_crawler.reporting.generator import JinjaReportGenerator
 from mobile_crawler.reporting.parsers.mobsf_parser import JsonMobSFParser
-from mobile_crawler.reporting.parsers.pcap_parser import DpktPcapParser
+from mobile_crawler.reporting.parsers.pcap_parser import StreamingPcapParser
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,7 @@ class ReportGenerator:
         self.ai_interaction_repository = AIInteractionRepository(db_manager)
 
         # Initialize reporting components
-        self.pcap_parser = DpktPcapParser()
+        self.pcap_parser = StreamingPcapParser()
         self.mobsf_parser = JsonMobSFParser()
         self.correlator = RunCorrelator(self.pcap_parser, self.mobsf_parser)
         self.jinja_generator = JinjaReportGenerator()
@@ -69,6 +70,8 @@ class ReportGenerator:
             if os.path.exists(mobsf_candidate):
                 mobsf_path = mobsf_candidate
 
+        video_manifest = self._load_video_manifest(run.session_path)
+
         # 2.2. Fetch AI interactions to get screenshot paths (which are missing in step_logs)
         interactions = self.ai_interaction_repository.get_ai_interactions_by_run(run_id)
         # Map step_number -> screenshot_path
@@ -97,7 +100,8 @@ class ReportGenerator:
                 'timestamp': log.timestamp,
                 'action': log.action_type,
                 'details': self._safe_json_load(log.target_bbox_json),
-                'screenshot': ss_path
+                'screenshot': ss_path,
+                'video': self._video_clip_url(video_manifest, log.step_number, run.session_path),
             })
 
         # 4. Correlate
@@ -124,6 +128,27 @@ class ReportGenerator:
         logger.info(f"Generated enhanced report: {output_path}")
         return output_path
 
+    def _load_video_manifest(self, session_path: str | None) -> dict[str, Any]:
+        """Read the session's video manifest, or return an empty one."""
+        if not session_path:
+            return {}
+        manifest_path = os.path.join(session_path, "videos", "manifest.json")
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _video_clip_url(self, manifest: dict[str, Any], step_number: int, session_path: str | None) -> str:
+        """Build a media-fragment URL that opens the step's segment at its start offset."""
+        clip = find_step_clip(manifest, step_number) if manifest else None
+        if not clip:
+            return ""
+        video_path, offset = clip
+        if session_path and os.path.isabs(video_path) and video_path.startswith(session_path):
+            video_path = os.path.relpath(video_path, os.path.join(session_path, "reports"))
+        return f"{Path(video_path).as_posix()}#t={offset:.1f}"
+
     def _safe_json_load(self, data: str | None) -> dict[str, Any]:
         """Safely load JSON data, with fallback to ast.literal_eval for older format."""
         if not data:
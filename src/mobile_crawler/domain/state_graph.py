@@ -1,27 +1,75 @@
-"""State transition graph and layout hashing for AI crawler navigation."""
+"""State transition graph and layout hashing for AI crawler navigation.
+
+The graph is persisted incrementally: each :meth:`StateGraphTracker.save`
+appends one JSON line holding only what changed since the previous save
+(upserted states, new transitions, new history entries) to
+``state_graph.journal.jsonl``. Every ``compact_every`` saves the whole graph
+is written once to ``state_graph.json`` and the journal is truncated, so
+per-step cost no longer grows with graph size. :meth:`StateGraphTracker.load`
+reads the snapshot and replays the journal on top of it.
+"""
 
 import hashlib
+import heapq
 import json
 import logging
+import math
+import os
 import re
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger("crawler_agent")
 
+SNAPSHOT_FILENAME = "state_graph.json"
+JOURNAL_FILENAME = "state_graph.journal.jsonl"
+DEFAULT_COMPACT_EVERY = 200
+DEFAULT_MAX_LOOP_PERIOD = 8
+
+# Executor actions that depend only on the screen they start from, so a
+# recorded transition can be replayed without asking the LLM again
+REPLAYABLE_ACTIONS = frozenset({"click", "long_press", "click_at", "click_area", "swipe", "system_button"})
+
+# Actions aimed at one UI element; only these use up a screen's clickable elements
+ELEMENT_ACTIONS = frozenset({"click", "long_press"})
+
+# Cost assumed for a hop whose tool duration was never observed
+DEFAULT_HOP_COST_MS = 1000.0
+
+_COMPACT_SEPARATORS = (",", ":")
+
+# Layout hash of a screen with no UI elements (e.g. nothing parsed)
+EMPTY_LAYOUT_HASH = hashlib.sha256(b"empty_state").hexdigest()
+
+
+def count_clickable(elements: list[dict[str, Any]]) -> int:
+    """Count elements the agent could act on (missing ``clickable`` counts as clickable)."""
+    return sum(1 for el in elements if el.get("clickable", True))
+
 
 class StateGraphTracker:
     """Tracks unique UI states using layout XML hashes and maintains a transition graph (FSM)."""
 
-    def __init__(self, run_id: int, logs_dir: str | Path | None = None):
+    def __init__(
+        self,
+        run_id: int,
+        logs_dir: str | Path | None = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        max_loop_period: int = DEFAULT_MAX_LOOP_PERIOD,
+    ):
         """Initialize the state graph tracker.
 
         Args:
             run_id: The ID of the crawler run.
-            logs_dir: Optional directory to persist the state graph JSON.
+            logs_dir: Optional directory to persist the state graph snapshot and journal.
+            compact_every: Number of journal records after which save() writes a
+                full snapshot and truncates the journal.
+            max_loop_period: Longest cycle (in screens) that detect_loop() looks for.
         """
         self.run_id = run_id
         self.logs_dir = Path(logs_dir) if logs_dir else None
+        self.compact_every = max(1, compact_every)
+        self.max_loop_period = max(1, max_loop_period)
 
         # Maps state_hash -> dict with state details (e.g., first_seen_step, package, activity)
         self.states: dict[str, dict[str, Any]] = {}
@@ -32,11 +80,28 @@ class StateGraphTracker:
         # Path of hashes visited in the current run, in order
         self.history: list[str] = []
 
+        # _period_runs[p]: how many trailing history entries equal the entry p steps earlier
+        self._period_runs: list[int] = [0] * (self.max_loop_period + 1)
+
+        # Adjacency index: from_state -> {action: latest transition} of distinct outgoing actions
+        self._outgoing: dict[str, dict[str, dict[str, Any]]] = {}
+
+        # from_state -> keys of the distinct elements clicked or long-pressed there
+        self._tried_elements: dict[str, set[str]] = {}
+
         # Set up dynamic content regex patterns to filter out
         self.time_pattern = re.compile(r"^\d{1,2}:\d{2}\s*(?:AM|PM)?$", re.IGNORECASE)
         self.battery_pattern = re.compile(r"^\d{1,3}%\s*$", re.IGNORECASE)
         self.date_pattern = re.compile(r"^\d{1,2}/\d{1,2}/\d{2,4}$")
 
+        # Persistence bookkeeping: what the next save() still has to write
+        self._dirty_states: set[str] = set()
+        self._saved_transitions = 0
+        self._saved_history = 0
+        self._journal_seq = 0
+        self._journal_records = 0
+        self._needs_snapshot = True
+
     def filter_dynamic_element(self, element: dict[str, Any]) -> bool:
         """Determine if an element represents dynamic system UI or temporary state.
 
@@ -81,7 +146,7 @@ class StateGraphTracker:
             SHA-256 hex string hash of the screen state.
         """
         if not elements:
-            return hashlib.sha256(b"empty_state").hexdigest()
+            return EMPTY_LAYOUT_HASH
 
         stable_elements = []
         for el in elements:
@@ -106,7 +171,14 @@ class StateGraphTracker:
         canonical_str = json.dumps(stable_elements, sort_keys=True, ensure_ascii=True)
         return hashlib.sha256(canonical_str.encode("utf-8")).hexdigest()
 
-    def record_state(self, state_hash: str, step_number: int, package: str, activity: str) -> bool:
+    def record_state(
+        self,
+        state_hash: str,
+        step_number: int,
+        package: str,
+        activity: str,
+        clickable_count: int | None = None,
+    ) -> bool:
         """Record a visited state.
 
         Args:
@@ -114,11 +186,15 @@ class StateGraphTracker:
             step_number: Current crawl step number.
             package: Android app package name.
             activity: Current Android activity name.
+            clickable_count: Number of clickable elements on the screen, used to
+                tell screens with untried elements (the frontier) from exhausted ones.
 
         Returns:
             True if this is a newly discovered state, False if revisited.
         """
         self.history.append(state_hash)
+        self._dirty_states.add(state_hash)
+        self._update_period_runs()
 
         if state_hash not in self.states:
             self.states[state_hash] = {
@@ -128,18 +204,29 @@ class StateGraphTracker:
                 "activity": activity,
                 "last_seen_step": step_number
             }
+            if clickable_count is not None:
+                self.states[state_hash]["clickable_count"] = clickable_count
             logger.debug(f"StateGraph: Discovered new screen state: {state_hash[:8]} (Step {step_number})")
             return True
         else:
             self.states[state_hash]["visit_count"] += 1
             self.states[state_hash]["last_seen_step"] = step_number
+            if clickable_count is not None:
+                self.states[state_hash]["clickable_count"] = clickable_count
             logger.debug(
                 f"StateGraph: Revisited screen state: {state_hash[:8]} "
                 f"(Visits: {self.states[state_hash]['visit_count']})"
             )
             return False
 
-    def record_transition(self, from_hash: str, to_hash: str, action: dict[str, Any] | str, step_number: int) -> None:
+    def record_transition(
+        self,
+        from_hash: str,
+        to_hash: str,
+        action: dict[str, Any] | str,
+        step_number: int,
+        duration_ms: float | None = None,
+    ) -> None:
         """Record a navigation transition between two states.
 
         Args:
@@ -147,47 +234,198 @@ class StateGraphTracker:
             to_hash: The destination state's layout hash.
             action: Description or dictionary representation of the action taken.
             step_number: Current crawl step number.
+            duration_ms: Observed execution time of the action, used to weight
+                replay paths.
         """
         # Simplify action representation if it is a dictionary
         action_desc = action
+        command = None
         if isinstance(action, dict):
             action_type = action.get("action", "unknown")
-            target = action.get("label_id") or action.get("target_bounding_box") or ""
+            target = action.get("label_id") or action.get("target_bounding_box") or ",".join(
+                str(v) for k, v in action.items() if k != "action"
+            )
             action_desc = f"{action_type}({target})"
+            if action_type in REPLAYABLE_ACTIONS:
+                command = dict(action)
 
-        self.transitions.append({
+        transition = {
             "from_state": from_hash,
             "to_state": to_hash,
             "action": str(action_desc),
             "step": step_number
-        })
+        }
+        if command is not None:
+            transition["command"] = command
+        if duration_ms is not None:
+            transition["duration_ms"] = round(duration_ms, 3)
+        self.transitions.append(transition)
+        self._index_transition(transition)
         logger.debug(f"StateGraph: Recorded transition {from_hash[:8]} --[{action_desc}]--> {to_hash[:8]}")
 
-    def detect_loop(self, window_size: int = 4) -> bool:
-        """Detect if the crawler is stuck in a navigation loop.
+    def _update_period_runs(self) -> None:
+        """Extend or reset the per-period match runs for the newest history entry."""
+        history = self.history
+        latest = history[-1]
+        size = len(history)
+        runs = self._period_runs
+        for period in range(1, self.max_loop_period + 1):
+            if size > period and history[size - 1 - period] == latest:
+                runs[period] += 1
+            else:
+                runs[period] = 0
+
+    def _rebuild_indexes(self) -> None:
+        """Recompute loop runs and the adjacency index after a bulk restore."""
+        self._period_runs = [0] * (self.max_loop_period + 1)
+        history = self.history
+        self.history = []
+        for state_hash in history:
+            self.history.append(state_hash)
+            self._update_period_runs()
+        self._outgoing = {}
+        self._tried_elements = {}
+        for transition in self.transitions:
+            self._index_transition(transition)
+
+    def _index_transition(self, transition: dict[str, Any]) -> None:
+        self._outgoing.setdefault(transition["from_state"], {})[transition["action"]] = transition
+        element = self._element_key(transition.get("command"))
+        if element is not None:
+            self._tried_elements.setdefault(transition["from_state"], set()).add(element)
+
+    @staticmethod
+    def _element_key(command: dict[str, Any] | None) -> str | None:
+        """Identify the element a click or long press targeted, or None for other actions.
+
+        ``index`` and ``label_id`` both name the element's position in the
+        parsed UI, so the same element reached either way shares one key.
+        """
+        if not command or command.get("action") not in ELEMENT_ACTIONS:
+            return None
+        for field in ("index", "label_id", "target_bounding_box"):
+            value = command.get(field)
+            if value is not None and value != "":
+                return str(value)
+        return None
+
+    def loop_period(self, window_size: int = 4) -> int | None:
+        """Return the shortest period of a loop at the end of the history, if any.
+
+        A period ``p`` (up to ``max_loop_period``) counts as a loop when the
+        trailing history repeats with period ``p`` for at least two full
+        cycles and for at least the last ``2 * window_size`` screens. For
+        periods dividing ``window_size`` this is exactly the old "last window
+        equals the window before it" check; other periods (tab bar rotations
+        of 3 or 5 screens) are now caught too. Cost is O(max_loop_period).
 
         Args:
-            window_size: Number of steps back to check for repetition.
+            window_size: Half the minimum number of trailing screens that must repeat.
 
         Returns:
-            True if a loop is detected.
+            The loop period, or None when no loop is detected.
+        """
+        runs = self._period_runs
+        for period in range(1, self.max_loop_period + 1):
+            if runs[period] >= max(period, 2 * window_size - period):
+                return period
+        return None
+
+    def loop_states(self, window_size: int = 4) -> list[str]:
+        """Return the states of the current loop in visit order (empty if none)."""
+        period = self.loop_period(window_size)
+        return self.history[-period:] if period else []
+
+    def outgoing_actions(self, state_hash: str) -> dict[str, str]:
+        """Distinct actions tried from a state, mapped to where they last led."""
+        return {action: t["to_state"] for action, t in self._outgoing.get(state_hash, {}).items()}
+
+    def is_frontier(self, state_hash: str) -> bool:
+        """Whether a state still has clickable elements no recorded action came from.
+
+        Distinct elements clicked or long-pressed there are compared with the
+        screen's clickable element count, so this is an estimate; swipes,
+        system buttons and text input do not count. States recorded without
+        a count are never treated as frontier.
         """
-        if len(self.history) < window_size * 2:
+        clickable = self.states.get(state_hash, {}).get("clickable_count")
+        if clickable is None:
             return False
+        return len(self._tried_elements.get(state_hash, ())) < clickable
 
-        # Look for repeating sub-sequences in the history
-        recent_states = self.history[-window_size:]
-        previous_states = self.history[-window_size*2:-window_size]
+    def path_to_frontier(self, from_hash: str, max_hops: int | None = None) -> list[dict[str, Any]] | None:
+        """Cheapest known replayable path from a state to the nearest other frontier state.
 
-        if recent_states == previous_states:
-            logger.warning(f"StateGraph: Loop detected in recent history: {[s[:8] for s in recent_states]}")
-            return True
+        Dijkstra over the adjacency index; each hop costs its observed
+        ``duration_ms`` (or DEFAULT_HOP_COST_MS). Only transitions with a
+        replayable ``command`` that actually changed the screen are used, and
+        each action's most recent outcome is trusted.
 
-        return False
+        Args:
+            from_hash: State to start from.
+            max_hops: Longest path to consider.
+
+        Returns:
+            The transitions to replay in order, or None if no frontier is reachable.
+        """
+        best: dict[str, float] = {from_hash: 0.0}
+        came_from: dict[str, dict[str, Any]] = {}
+        hops: dict[str, int] = {from_hash: 0}
+        queue: list[tuple[float, int, str]] = [(0.0, 0, from_hash)]
+        tie = 0
+        while queue:
+            cost, _, state = heapq.heappop(queue)
+            if cost > best.get(state, math.inf):
+                continue
+            if state != from_hash and self.is_frontier(state):
+                path = []
+                while state != from_hash:
+                    transition = came_from[state]
+                    path.append(transition)
+                    state = transition["from_state"]
+                path.reverse()
+                return path
+            if max_hops is not None and hops[state] >= max_hops:
+                continue
+            for transition in self._outgoing.get(state, {}).values():
+                to_state = transition["to_state"]
+                if "command" not in transition or to_state == state:
+                    continue
+                new_cost = cost + (transition.get("duration_ms") or DEFAULT_HOP_COST_MS)
+                if new_cost < best.get(to_state, math.inf):
+                    best[to_state] = new_cost
+                    came_from[to_state] = transition
+                    hops[to_state] = hops[state] + 1
+                    tie += 1
+                    heapq.heappush(queue, (new_cost, tie, to_state))
+        return None
+
+    def detect_loop(self, window_size: int = 4) -> bool:
+        """Detect if the crawler is stuck in a navigation loop.
+
+        Args:
+            window_size: Half the minimum number of trailing screens that must repeat;
+                see :meth:`loop_period`.
+
+        Returns:
+            True if a loop is detected.
+        """
+        period = self.loop_period(window_size)
+        if period is None:
+            return False
+        logger.warning(
+            f"StateGraph: Loop of period {period} detected in recent history: "
+            f"{[s[:8] for s in self.history[-period:]]}"
+        )
+        return True
 
     def get_loop_recovery_hint(self, current_hash: str, available_elements: list[dict[str, Any]]) -> str | None:
         """Provide a hint/action suggestion to escape a detected loop.
 
+        Only the outgoing actions of the current state (and of the other
+        states in the loop) are consulted, so the cost is bounded by their
+        out-degree rather than by the total number of recorded transitions.
+
         Args:
             current_hash: Current screen hash.
             available_elements: Currently clickable elements.
@@ -195,10 +433,7 @@ class StateGraphTracker:
         Returns:
             Advice string or None.
         """
-        # Find all transitions originating from the current state
-        attempted_actions = [
-            t["action"] for t in self.transitions if t["from_state"] == current_hash
-        ]
+        attempted_actions = list(self.outgoing_actions(current_hash))
 
         # Check if there are clickable elements we haven't interacted with in this state yet
         unexplored_buttons = []
@@ -228,28 +463,162 @@ class StateGraphTracker:
             label = first_unexplored.get("index") or first_unexplored.get("text") or first_unexplored.get("resourceId")
             return f"Loop warning! You are stuck in a loop. Try interacting with a new, unexplored element: element [{label}]."
 
+        # Every element here was tried; point at an action that previously left the loop
+        loop = {current_hash, *self.loop_states()}
+        for state_hash in dict.fromkeys([current_hash, *self.loop_states()]):
+            for action, to_state in self.outgoing_actions(state_hash).items():
+                if to_state not in loop:
+                    where = "here" if state_hash == current_hash else f"on screen {state_hash[:8]}"
+                    return (
+                        f"Loop warning! You are stuck in a loop. Action '{action}' {where} "
+                        f"previously led out of it; otherwise try the 'back' button or scrolling."
+                    )
+
         return "Loop warning! You are stuck in a loop. Try using the 'back' button or scrolling to escape the loop."
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the graph as a JSON-serializable dictionary."""
+        return {
+            "run_id": self.run_id,
+            "unique_states_count": len(self.states),
+            "total_transitions": len(self.transitions),
+            "states": self.states,
+            "transitions": self.transitions,
+            "history": self.history
+        }
+
+    def restore(self, graph_data: dict[str, Any]) -> None:
+        """Replace the tracked graph with previously saved data.
+
+        Args:
+            graph_data: Dictionary produced by :meth:`to_dict`.
+        """
+        self.states = {k: dict(v) for k, v in (graph_data.get("states") or {}).items()}
+        self.transitions = [dict(t) for t in graph_data.get("transitions") or []]
+        self.history = list(graph_data.get("history") or [])
+        self._rebuild_indexes()
+        self._needs_snapshot = True
+        logger.info(
+            f"StateGraph restored: {len(self.states)} states, {len(self.transitions)} transitions"
+        )
+
+    @property
+    def journal_seq(self) -> int:
+        """Sequence number of the newest journal record written or loaded (0 if none)."""
+        return self._journal_seq
+
     def save(self) -> None:
-        """Save the transition graph and states as a JSON file in the logs directory."""
+        """Persist changes since the last save to the logs directory.
+
+        Appends one journal record with the delta, or writes a full snapshot
+        when none exists yet, after :meth:`restore`, or once the journal holds
+        ``compact_every`` records. Failures are logged, not raised.
+        """
         if not self.logs_dir:
             return
 
         try:
             self.logs_dir.mkdir(parents=True, exist_ok=True)
-            output_path = self.logs_dir / "state_graph.json"
-
-            graph_data = {
-                "run_id": self.run_id,
-                "unique_states_count": len(self.states),
-                "total_transitions": len(self.transitions),
-                "states": self.states,
-                "transitions": self.transitions,
-                "history": self.history
-            }
-
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(graph_data, f, indent=2, ensure_ascii=True)
-            logger.info(f"StateGraph saved successfully to {output_path}")
+            if self._needs_snapshot or self._journal_records >= self.compact_every:
+                self._write_snapshot()
+            else:
+                self._append_journal()
         except Exception as e:
             logger.warning(f"Failed to save StateGraph: {e}")
+
+    def load(self) -> bool:
+        """Restore the graph from the snapshot plus any journal records after it.
+
+        A torn final journal line (from a crash mid-write) is ignored.
+
+        Returns:
+            True if anything was loaded from the logs directory.
+        """
+        if not self.logs_dir:
+            return False
+        snapshot_path = self.logs_dir / SNAPSHOT_FILENAME
+        journal_path = self.logs_dir / JOURNAL_FILENAME
+        if not snapshot_path.exists() and not journal_path.exists():
+            return False
+
+        graph_data: dict[str, Any] = {}
+        if snapshot_path.exists():
+            with open(snapshot_path, encoding="utf-8") as f:
+                graph_data = json.load(f)
+        snapshot_seq = graph_data.get("journal_seq", 0)
+        self.restore(graph_data)
+
+        last_seq = snapshot_seq
+        replayed = 0
+        if journal_path.exists():
+            with open(journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"StateGraph: ignoring torn journal record in {journal_path}")
+                        break
+                    # Records already folded into the snapshot survive a crash between
+                    # snapshot replace and journal truncation; skip them
+                    if record.get("seq", 0) <= snapshot_seq:
+                        continue
+                    self._apply_journal_record(record)
+                    last_seq = record["seq"]
+                    replayed += 1
+
+        if replayed:
+            self._rebuild_indexes()
+        self._journal_seq = last_seq
+        self._mark_saved()
+        # Rewrite the snapshot on the next save so the journal starts clean
+        self._needs_snapshot = True
+        logger.info(f"StateGraph loaded from {self.logs_dir} ({replayed} journal records replayed)")
+        return True
+
+    def _apply_journal_record(self, record: dict[str, Any]) -> None:
+        for state_hash, state in (record.get("states") or {}).items():
+            self.states[state_hash] = state
+        self.transitions.extend(record.get("transitions") or [])
+        self.history.extend(record.get("history") or [])
+
+    def _mark_saved(self) -> None:
+        self._dirty_states.clear()
+        self._saved_transitions = len(self.transitions)
+        self._saved_history = len(self.history)
+
+    def _append_journal(self) -> None:
+        new_transitions = self.transitions[self._saved_transitions:]
+        new_history = self.history[self._saved_history:]
+        if not (self._dirty_states or new_transitions or new_history):
+            return
+        self._journal_seq += 1
+        record = {
+            "seq": self._journal_seq,
+            "states": {h: self.states[h] for h in self._dirty_states if h in self.states},
+            "transitions": new_transitions,
+            "history": new_history,
+        }
+        line = json.dumps(record, ensure_ascii=True, separators=_COMPACT_SEPARATORS)
+        with open(self.logs_dir / JOURNAL_FILENAME, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        self._journal_records += 1
+        self._mark_saved()
+
+    def _write_snapshot(self) -> None:
+        snapshot_path = self.logs_dir / SNAPSHOT_FILENAME
+        tmp_path = snapshot_path.with_suffix(".json.tmp")
+        graph_data = self.to_dict()
+        graph_data["journal_seq"] = self._journal_seq
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(graph_data, f, ensure_ascii=True, separators=_COMPACT_SEPARATORS)
+        os.replace(tmp_path, snapshot_path)
+        # Truncate only after the snapshot is in place; see the seq check in load()
+        with open(self.logs_dir / JOURNAL_FILENAME, "w", encoding="utf-8"):
+            pass
+        self._journal_records = 0
+        self._needs_snapshot = False
+        self._mark_saved()
+        logger.debug(
+            f"StateGraph snapshot written to {snapshot_path} "
+            f"({len(self.states)} states, {len(self.transitions)} transitions)"
+        )
@@ -5,6 +5,8 @@ from __future__ import annotations
 import threading
 from dataclasses import dataclass, field
 
+from mobile_crawler.domain.latency_sketch import LatencySketch, LatencySummary
+
 try:
     from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
     OTEL_AVAILABLE = True
@@ -15,16 +17,20 @@ except ImportError:
 
 @dataclass
 class SpanStats:
-    """Accumulated token and latency stats collected from OTel LLM spans."""
+    """Accumulated token and latency stats collected from OTel LLM spans.
+
+    Latencies go into a fixed-size quantile sketch rather than a list, so a
+    long crawl does not grow memory and readers never re-sum every call.
+    """
     total_input_tokens: int = 0
     total_output_tokens: int = 0
-    llm_latencies_ms: list = field(default_factory=list)
+    llm_latency: LatencySketch = field(default_factory=LatencySketch)
 
     def record_llm_span(self, input_tokens: int, output_tokens: int, duration_ms: float) -> None:
         self.total_input_tokens += input_tokens
         self.total_output_tokens += output_tokens
         if duration_ms > 0:
-            self.llm_latencies_ms.append(duration_ms)
+            self.llm_latency.add(duration_ms)
 
     @property
     def total_tokens(self) -> int:
@@ -32,14 +38,17 @@ class SpanStats:
 
     @property
     def avg_latency_ms(self) -> float:
-        if not self.llm_latencies_ms:
-            return 0.0
-        return sum(self.llm_latencies_ms) / len(self.llm_latencies_ms)
+        return self.llm_latency.mean
+
+    @property
+    def latency_summary(self) -> LatencySummary:
+        """LLM call count, mean and p50/p95/p99 in milliseconds."""
+        return self.llm_latency.summary()
 
     def reset(self) -> None:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
-        self.llm_latencies_ms.clear()
+        self.llm_latency.clear()
 
 
 class StatsCollectorSpanProcessor(SpanProcessor):
@@ -93,7 +102,7 @@ class StatsCollectorSpanProcessor(SpanProcessor):
             snapshot = SpanStats(
                 total_input_tokens=self._stats.total_input_tokens,
                 total_output_tokens=self._stats.total_output_tokens,
-                llm_latencies_ms=list(self._stats.llm_latencies_ms),
+                llm_latency=self._stats.llm_latency.copy(),
             )
         return snapshot
 
@@ -10,11 +10,28 @@ from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from mobile_crawler.config.config_manager import ConfigManager
+    from mobile_crawler.domain.live_traffic import LiveTrafficAttributor, PcapUdpCollector
     from mobile_crawler.infrastructure.adb_client import ADBClient
     from mobile_crawler.infrastructure.session_folder_manager import SessionFolderManager
 
 logger = logging.getLogger(__name__)
 
+PCAPDROID_PACKAGE = "com.emanuelef.remote_capture"
+
+# Single device-side script answering "is the capture VPN up?" in one adb
+# round-trip: tun interface flags from sysfs plus the relevant lines of the
+# connectivity and PCAPdroid service dumps, separated by section markers.
+_PROBE_MARKER = "##mc:"
+_READINESS_PROBE_SCRIPT = (
+    f"echo '{_PROBE_MARKER}tun'; "
+    'for i in /sys/class/net/tun*; do [ -e "$i" ] && echo "${i##*/} $(cat "$i/flags")"; done; '
+    f"echo '{_PROBE_MARKER}connectivity'; "
+    f"dumpsys connectivity | grep -i -E 'vpn|{PCAPDROID_PACKAGE}'; "
+    f"echo '{_PROBE_MARKER}services'; "
+    f"dumpsys activity services {PCAPDROID_PACKAGE} | grep -i -E 'ServiceRecord|vpn|capture|pcap'"
+)
+_IFF_UP = 0x1
+
 
 class TrafficCaptureManager:
     """Manages traffic capture using PCAPdroid.
@@ -57,6 +74,11 @@ class TrafficCaptureManager:
         self._last_capture_readiness_diagnostics: dict[str, Any] = {}
         self._last_capture_startup_diagnostics: dict[str, Any] = {}
 
+        # Live per-step attribution via PCAPdroid's UDP exporter
+        self.live_traffic_enabled: bool = bool(config_manager.get("pcapdroid_live_traffic", False))
+        self.traffic_attributor: LiveTrafficAttributor | None = None
+        self._collector: PcapUdpCollector | None = None
+
         # Package: com.emanuelef.remote_capture
         # Activity: com.emanuelef.remote_capture/.activities.CaptureCtrl
 
@@ -237,16 +259,32 @@ class TrafficCaptureManager:
             "action",
             "start",
             "-e",
-            "pcap_dump_mode",
-            "pcap_file",
-            "-e",
             "app_filter",
             target_app_package,
-            "-e",
-            "pcap_name",
-            pcap_filename_only,
         ]
 
+        if self.live_traffic_enabled:
+            try:
+                collector_port = await self._start_collector_async()
+            except OSError as e:
+                logger.warning(f"Live traffic collector unavailable, falling back to PCAP file capture: {e}")
+                collector_port = None
+        else:
+            collector_port = None
+
+        if collector_port is not None:
+            collector_host = str(self.config_manager.get("pcapdroid_collector_host", "10.0.2.2"))
+            start_command_args.extend([
+                "-e", "pcap_dump_mode", "udp_exporter",
+                "-e", "collector_ip_address", collector_host,
+                "-e", "collector_port", str(collector_port),
+            ])
+        else:
+            start_command_args.extend([
+                "-e", "pcap_dump_mode", "pcap_file",
+                "-e", "pcap_name", pcap_filename_only,
+            ])
+
         if self.config_manager.get("pcapdroid_tls_decryption", False):
             start_command_args.extend(["-e", "tls_decryption", "true"])
 
@@ -264,6 +302,7 @@ class TrafficCaptureManager:
         start_ok, start_error = await self._send_start_intent_async(start_command_args)
         if not start_ok:
             logger.error(start_error)
+            await self._close_collector_async()
             self.pcap_filename_on_device = None
             self.local_pcap_file_path = None
             self._is_currently_capturing = False
@@ -288,10 +327,14 @@ class TrafficCaptureManager:
             self._last_consent_labels_tapped
         )
 
-        # Wait for PCAPdroid to initialize (configurable)
+        # Wait for PCAPdroid to initialize (configurable), returning early once
+        # the capture VPN is up
         init_wait = float(self.config_manager.get("pcapdroid_init_wait", 3.0))
         if init_wait > 0:
-            await asyncio.sleep(init_wait)
+            await self._wait_for_capture_probe_async(
+                init_wait,
+                float(self.config_manager.get("pcapdroid_startup_poll_interval_seconds", 1.0)),
+            )
 
         # Verify capture actually started by checking status
         logger.debug("[DEBUG] Sending PCAPdroid capture status query...")
@@ -346,6 +389,7 @@ class TrafficCaptureManager:
                 "Capture consent may still be pending or the VPN did not become active."
             )
             logger.error(f"{error_msg} Diagnostics: {readiness}")
+            await self._close_collector_async()
             self._clear_capture_state()
             return False, error_msg
 
@@ -405,6 +449,16 @@ class TrafficCaptureManager:
         else:
             logger.debug("[DEBUG] PCAPdroid stop command sent successfully")
 
+        if self._collector is not None:
+            # Packets were streamed to the local PCAP during the crawl, so there
+            # is no device file to finalize or pull.
+            pcap_path = await self._close_collector_async()
+            if pcap_path:
+                logger.info(f"PCAP file saved: {pcap_path}")
+                return os.path.abspath(pcap_path)
+            logger.error("Live traffic collector received no packets.")
+            return None
+
         # Wait for file finalization (configurable)
         finalize_wait = float(self.config_manager.get("pcapdroid_finalize_wait", 2.0))
         if finalize_wait > 0:
@@ -519,6 +573,34 @@ class TrafficCaptureManager:
                 f"ADB retcode: {retcode_rm}. Output: {stdout_rm}"
             )
 
+    async def _start_collector_async(self) -> int:
+        """Start the UDP collector writing to the local PCAP path.
+
+        Returns:
+            The UDP port PCAPdroid should export to
+        """
+        from mobile_crawler.domain.live_traffic import LiveTrafficAttributor, PcapUdpCollector
+
+        self.traffic_attributor = LiveTrafficAttributor(
+            history_size=int(self.config_manager.get("pcapdroid_live_traffic_history_steps", 50))
+        )
+        collector = PcapUdpCollector(
+            self.local_pcap_file_path,
+            self.traffic_attributor,
+            host=str(self.config_manager.get("pcapdroid_collector_bind_address", "0.0.0.0")),
+            port=int(self.config_manager.get("pcapdroid_collector_port", 5123)),
+        )
+        port = await collector.start()
+        self._collector = collector
+        return port
+
+    async def _close_collector_async(self) -> str | None:
+        """Close the UDP collector if running; returns the written PCAP path."""
+        collector, self._collector = self._collector, None
+        if collector is None:
+            return None
+        return await collector.close()
+
     def _clear_capture_state(self) -> None:
         """Clear local capture state after a failed startup."""
         self._is_currently_capturing = False
@@ -543,6 +625,10 @@ class TrafficCaptureManager:
         inspected = False
         accepted_any = False
         while time.monotonic() < deadline:
+            if self._probe_confirms_capture(await self._probe_capture_state_async()):
+                logger.debug("[DEBUG] PCAPdroid VPN is up; no consent dialog left to accept")
+                return accepted_any
+
             stdout = await self._dump_current_ui_async(
                 purpose="PCAPdroid consent inspection"
             )
@@ -599,41 +685,105 @@ class TrafficCaptureManager:
             return None
         return stdout
 
-    async def _check_capture_readiness_async(self, api_status_running: bool | None = None) -> dict[str, Any]:
-        ui_dump = await self._dump_current_ui_async(purpose="PCAPdroid readiness check")
-        unresolved = bool(ui_dump and self._find_pcapdroid_consent_button(ui_dump))
-        pcapdroid_foreground = self._ui_dump_has_package(ui_dump or "")
-        ui_running_hint = self._ui_dump_has_running_capture_hint(ui_dump or "")
+    async def _probe_capture_state_async(self) -> dict[str, Any]:
+        """Check tun interface and PCAPdroid VPN state with one adb shell call.
 
-        connectivity_output, connectivity_retcode = await self._run_adb_command_async(
-            ["shell", "dumpsys", "connectivity"],
-            suppress_stderr=True,
-        )
-        services_output, services_retcode = await self._run_adb_command_async(
-            ["shell", "dumpsys", "activity", "services", "com.emanuelef.remote_capture"],
+        Returns:
+            Dict with ``tun_up`` (a tun interface has IFF_UP set), ``vpn_hint``
+            (connectivity or service dumps attribute a VPN to PCAPdroid) and
+            diagnostic snippets.
+        """
+        output, retcode = await self._run_adb_command_async(
+            ["shell", _READINESS_PROBE_SCRIPT],
             suppress_stderr=True,
         )
-        connectivity_lower = connectivity_output.lower()
-        services_lower = services_output.lower()
-        package_name = "com.emanuelef.remote_capture"
+        sections = self._parse_probe_sections(output) if retcode == 0 else {}
+
+        tun_interfaces: list[str] = []
+        for line in sections.get("tun", "").splitlines():
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            try:
+                flags = int(parts[1], 16)
+            except ValueError:
+                continue
+            if flags & _IFF_UP:
+                tun_interfaces.append(parts[0])
+
+        connectivity_lower = sections.get("connectivity", "").lower()
+        services_lower = sections.get("services", "").lower()
         vpn_hint = (
-            (
-                connectivity_retcode == 0
-                and "vpn" in connectivity_lower
-                and package_name in connectivity_lower
-            )
+            ("vpn" in connectivity_lower and PCAPDROID_PACKAGE in connectivity_lower)
             or (
-                services_retcode == 0
-                and package_name in services_lower
+                PCAPDROID_PACKAGE in services_lower
                 and any(term in services_lower for term in ("vpn", "capture", "pcap"))
             )
         )
+        return {
+            "tun_up": bool(tun_interfaces),
+            "tun_interfaces": tun_interfaces,
+            "vpn_hint": vpn_hint,
+            "probe_retcode": retcode,
+            "connectivity_snippet": self._diagnostic_snippet(sections.get("connectivity", "")),
+            "services_snippet": self._diagnostic_snippet(sections.get("services", "")),
+        }
+
+    @staticmethod
+    def _parse_probe_sections(output: str) -> dict[str, str]:
+        sections: dict[str, list[str]] = {}
+        current: list[str] | None = None
+        for line in str(output).splitlines():
+            if line.startswith(_PROBE_MARKER):
+                current = sections.setdefault(line[len(_PROBE_MARKER):].strip(), [])
+            elif current is not None:
+                current.append(line)
+        return {name: "\n".join(lines) for name, lines in sections.items()}
+
+    @staticmethod
+    def _probe_confirms_capture(probe: dict[str, Any]) -> bool:
+        """A tun interface that is up and owned by PCAPdroid means capture is live."""
+        return bool(probe.get("tun_up") and probe.get("vpn_hint"))
+
+    async def _wait_for_capture_probe_async(self, timeout: float, poll_interval: float) -> dict[str, Any]:
+        """Poll the cheap probe until the capture VPN is up or ``timeout`` passes."""
+        deadline = time.monotonic() + max(timeout, 0.0)
+        probe = await self._probe_capture_state_async()
+        while not self._probe_confirms_capture(probe) and time.monotonic() < deadline:
+            await asyncio.sleep(min(max(poll_interval, 0.05), max(deadline - time.monotonic(), 0.0)))
+            probe = await self._probe_capture_state_async()
+        return probe
+
+    async def _check_capture_readiness_async(
+        self,
+        api_status_running: bool | None = None,
+        probe: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        if probe is None:
+            probe = await self._probe_capture_state_async()
+        if self._probe_confirms_capture(probe):
+            # The VPN only comes up after consent, so no UI dump is needed.
+            return {
+                "ready": True,
+                "readiness_source": "tun_interface",
+                "unresolved_consent": False,
+                "pcapdroid_foreground": None,
+                "api_status_running": api_status_running,
+                "ui_running_hint": None,
+                **probe,
+            }
+
+        ui_dump = await self._dump_current_ui_async(purpose="PCAPdroid readiness check")
+        unresolved = bool(ui_dump and self._find_pcapdroid_consent_button(ui_dump))
+        pcapdroid_foreground = self._ui_dump_has_package(ui_dump or "")
+        ui_running_hint = self._ui_dump_has_running_capture_hint(ui_dump or "")
+
         readiness_source = None
         if not unresolved and api_status_running is True:
             readiness_source = "api_status_running"
         elif not unresolved and ui_running_hint:
             readiness_source = "ui_status_running"
-        elif not unresolved and vpn_hint:
+        elif not unresolved and probe["vpn_hint"]:
             readiness_source = "vpn_or_service"
         ready = readiness_source is not None
         return {
@@ -643,11 +793,7 @@ class TrafficCaptureManager:
             "pcapdroid_foreground": pcapdroid_foreground,
             "api_status_running": api_status_running,
             "ui_running_hint": ui_running_hint,
-            "vpn_hint": vpn_hint,
-            "connectivity_retcode": connectivity_retcode,
-            "services_retcode": services_retcode,
-            "connectivity_snippet": self._diagnostic_snippet(connectivity_output),
-            "services_snippet": self._diagnostic_snippet(services_output),
+            **probe,
             "ui_snippet": self._diagnostic_snippet(ui_dump or ""),
         }
 
@@ -667,10 +813,16 @@ class TrafficCaptureManager:
         ) or bool(self._last_consent_labels_tapped)
 
         while True:
-            api_status = await self.get_capture_status_async()
+            probe = await self._probe_capture_state_async()
+            if self._probe_confirms_capture(probe):
+                # Skip the get_status intent round-trip once the VPN is visibly up.
+                api_status: dict[str, Any] = {"status": "not_queried", "running": None}
+            else:
+                api_status = await self.get_capture_status_async()
             api_running = api_status.get("running") if isinstance(api_status, dict) else None
             readiness = await self._check_capture_readiness_async(
-                api_status_running=api_running if isinstance(api_running, bool) else None
+                api_status_running=api_running if isinstance(api_running, bool) else None,
+                probe=probe,
             )
             readiness["startup_phase"] = "api_status_polling"
             readiness["api_start_sent"] = bool(
@@ -1,14 +1,22 @@
-"""ADB-backed segmented video recording for crawl sessions."""
+"""ADB-backed segmented video recording for crawl sessions.
+
+Segments are recorded back to back: when ``screenrecord`` hits its time
+limit the next segment starts immediately and the finished one is pulled
+in the background. Crawl steps are stamped on the monotonic clock as they
+begin and resolved to (segment, offset) pairs in ``manifest.json``, so a
+report can seek straight to a step's clip.
+"""
 
 import asyncio
+import bisect
 import json
 import logging
 import os
 import re
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from mobile_crawler.config.config_manager import ConfigManager
@@ -28,11 +36,51 @@ class VideoSegment:
     stopped_at: str | None = None
     size_bytes: int = 0
     error: str | None = None
+    # time.monotonic() when screenrecord was spawned / exited; offsets are
+    # relative to the start. Not serialized: they mean nothing across processes.
+    started_monotonic: float = field(default=0.0, repr=False)
+    stopped_monotonic: float | None = field(default=None, repr=False)
+
+
+@dataclass
+class StepVideoMarker:
+    """Where a crawl step begins in the recorded video."""
+
+    step_number: int
+    part: int
+    local_path: str | None
+    offset_seconds: float
+
+
+def find_step_clip(manifest: dict[str, Any], step_number: int) -> tuple[str, float] | None:
+    """Look up a step's video file and start offset in a recording manifest.
+
+    Args:
+        manifest: Parsed ``videos/manifest.json``
+        step_number: Crawl step to locate
+
+    Returns:
+        (local_path, offset_seconds), or None if the step was not recorded
+    """
+    for marker in manifest.get("steps", []):
+        if marker.get("step_number") == step_number and marker.get("local_path"):
+            return marker["local_path"], float(marker.get("offset_seconds", 0.0))
+    return None
+
+
+def _segment_dict(segment: VideoSegment) -> dict[str, Any]:
+    payload = asdict(segment)
+    payload.pop("started_monotonic")
+    payload.pop("stopped_monotonic")
+    return payload
 
 
 class VideoRecordingManager:
     """Records Android screen videos using segmented ADB screenrecord."""
 
+    # A segment ending sooner than this was not cut by --time-limit
+    MIN_SEGMENT_SECONDS = 1.0
+
     def __init__(
         self,
         config_manager: "ConfigManager",
@@ -72,11 +120,59 @@ class VideoRecordingManager:
         self._current_segment: VideoSegment | None = None
         self._segments: list[VideoSegment] = []
         self._recording = False
+        self._pull_tasks: set[asyncio.Task] = set()
+        self._manifest_lock = asyncio.Lock()
+        self._step_marks: list[tuple[int, float]] = []
 
     def is_recording(self) -> bool:
         """Return whether this manager currently owns an active recording."""
         return self._recording
 
+    def mark_step(self, step_number: int) -> None:
+        """Record that ``step_number`` starts now.
+
+        Cheap enough to call from the crawl's hot path: only a monotonic
+        timestamp is stored; mapping it to a segment happens when the
+        manifest is written.
+        """
+        if self._recording:
+            self._step_marks.append((step_number, time.monotonic()))
+
+    def step_index(self) -> list[StepVideoMarker]:
+        """Resolve recorded step marks to (segment, offset) pairs.
+
+        A step that started between two segments (while screenrecord was
+        restarting) maps to the beginning of the next segment.
+        """
+        segments = sorted(self._segments, key=lambda seg: seg.part)
+        if self._current_segment:
+            segments.append(self._current_segment)
+        segments = [seg for seg in segments if seg.started_monotonic]
+        starts = [seg.started_monotonic for seg in segments]
+
+        markers = []
+        for step_number, mark in self._step_marks:
+            index = bisect.bisect_right(starts, mark) - 1
+            if index < 0:
+                if not segments:
+                    continue
+                index = 0
+            segment = segments[index]
+            if segment.stopped_monotonic is not None and mark >= segment.stopped_monotonic:
+                if index + 1 >= len(segments):
+                    continue
+                segment = segments[index + 1]
+            offset = max(0.0, mark - segment.started_monotonic)
+            markers.append(StepVideoMarker(step_number, segment.part, segment.local_path, round(offset, 3)))
+        return markers
+
+    def locate_step(self, step_number: int) -> tuple[str, float] | None:
+        """Return (video file, offset seconds) where ``step_number`` starts, if recorded."""
+        for marker in self.step_index():
+            if marker.step_number == step_number and marker.local_path:
+                return marker.local_path, marker.offset_seconds
+        return None
+
     async def start_recording_async(
         self, run_id: int, session_path: str, app_package: str
     ) -> tuple[bool, str]:
@@ -93,7 +189,10 @@ class VideoRecordingManager:
         self.video_dir.mkdir(parents=True, exist_ok=True)
         self.manifest_path = self.video_dir / "manifest.json"
         self._stop_requested = asyncio.Event()
+        self._manifest_lock = asyncio.Lock()
         self._segments = []
+        self._step_marks = []
+        self._pull_tasks = set()
         self._part = 0
 
         output, retcode = await self._run_adb_command_async(
@@ -115,9 +214,9 @@ class VideoRecordingManager:
             return False, message
 
         self._recording = True
-        self._segment_task = asyncio.create_task(self._segment_loop())
         logger.info("Video recording started")
         await self._write_manifest_async()
+        self._segment_task = asyncio.create_task(self._segment_loop())
         return True, "Video recording started"
 
     async def stop_recording_and_save_async(self) -> str | None:
@@ -138,7 +237,10 @@ class VideoRecordingManager:
                 self._segment_task = None
 
         if self._current_segment:
-            await self._pull_current_segment()
+            await self._pull_segment(self._finish_current_segment())
+
+        if self._pull_tasks:
+            await asyncio.gather(*list(self._pull_tasks), return_exceptions=True)
 
         self._recording = False
         await self._write_manifest_async()
@@ -160,17 +262,34 @@ class VideoRecordingManager:
                 return
 
             await process.wait()
-            if self._current_segment:
-                await self._pull_current_segment()
-
-            if not self._stop_requested.is_set():
-                try:
-                    await self._start_next_segment()
-                except Exception as exc:
-                    logger.warning("Failed to roll video recording segment: %s", exc)
-                    self._recording = False
-                    await self._write_manifest_async()
-                    return
+            if self._stop_requested.is_set():
+                # stop_recording_and_save_async pulls the final segment
+                return
+
+            finished = self._finish_current_segment()
+            if finished and finished.stopped_monotonic - finished.started_monotonic < self.MIN_SEGMENT_SECONDS:
+                # screenrecord failing on startup would otherwise respawn in a tight loop
+                logger.warning("screenrecord exited immediately; not starting another segment")
+                self._recording = False
+                await self._pull_segment(finished)
+                return
+
+            try:
+                await self._start_next_segment()
+            except Exception as exc:
+                logger.warning("Failed to roll video recording segment: %s", exc)
+                self._recording = False
+                if finished:
+                    await self._pull_segment(finished)
+                await self._write_manifest_async()
+                return
+
+            # Pull the finished segment while the next one is already recording
+            if finished:
+                task = asyncio.create_task(self._pull_segment(finished))
+                self._pull_tasks.add(task)
+                task.add_done_callback(self._pull_tasks.discard)
+            await self._write_manifest_async()
 
     async def _start_next_segment(self) -> None:
         self._part += 1
@@ -194,6 +313,7 @@ class VideoRecordingManager:
             device_path=device_path,
             local_path=str(self.video_dir / filename) if self.video_dir else None,
             started_at=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            started_monotonic=time.monotonic(),
         )
         self._process = await asyncio.create_subprocess_exec(
             *args,
@@ -223,20 +343,24 @@ class VideoRecordingManager:
                 process.kill()
                 await process.wait()
 
-    async def _pull_current_segment(self) -> None:
+    def _finish_current_segment(self) -> VideoSegment | None:
+        """Close out the active segment and hand it over for pulling."""
         segment = self._current_segment
-        if not segment:
-            return
-
+        if segment is None:
+            return None
         segment.stopped_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        segment.stopped_monotonic = time.monotonic()
+        self._segments.append(segment)
+        self._current_segment = None
+        return segment
+
+    async def _pull_segment(self, segment: VideoSegment) -> None:
         if self.finalize_wait > 0:
             await asyncio.sleep(self.finalize_wait)
 
         local_path = segment.local_path
         if not local_path:
             segment.error = "Local segment path not set"
-            self._segments.append(segment)
-            self._current_segment = None
             await self._write_manifest_async()
             return
 
@@ -247,8 +371,6 @@ class VideoRecordingManager:
         if retcode != 0:
             segment.error = f"Device video file not found: {output}".strip()
             logger.warning(segment.error)
-            self._segments.append(segment)
-            self._current_segment = None
             await self._write_manifest_async()
             return
 
@@ -258,8 +380,6 @@ class VideoRecordingManager:
         if retcode != 0:
             segment.error = f"Failed to pull video segment: {output}".strip()
             logger.warning(segment.error)
-            self._segments.append(segment)
-            self._current_segment = None
             await self._write_manifest_async()
             return
 
@@ -275,8 +395,6 @@ class VideoRecordingManager:
             segment.error = f"ADB pull succeeded but local file is missing: {local_path}"
             logger.warning(segment.error)
 
-        self._segments.append(segment)
-        self._current_segment = None
         await self._write_manifest_async()
 
     async def _write_manifest_async(self) -> None:
@@ -288,16 +406,19 @@ class VideoRecordingManager:
             "package": self.app_package,
             "device_id": self.device_id,
             "segment_seconds": self.segment_seconds,
-            "segments": [asdict(segment) for segment in self._segments],
+            "segments": [_segment_dict(segment) for segment in sorted(self._segments, key=lambda seg: seg.part)],
+            "steps": [asdict(marker) for marker in self.step_index()],
         }
         if self._current_segment:
-            payload["active_segment"] = asdict(self._current_segment)
-
-        await asyncio.to_thread(
-            self.manifest_path.write_text,
-            json.dumps(payload, indent=2),
-            "utf-8",
-        )
+            payload["active_segment"] = _segment_dict(self._current_segment)
+
+        # Background pulls finish independently; serialize writes to the file
+        async with self._manifest_lock:
+            await asyncio.to_thread(
+                self.manifest_path.write_text,
+                json.dumps(payload, indent=2),
+                "utf-8",
+            )
 
     async def _run_adb_command_async(
         self,
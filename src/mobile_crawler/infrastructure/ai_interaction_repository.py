@@ -102,23 +102,51 @@ class AIInteractionRepository:
             ORDER BY step_number
         """, (run_id,))
 
-        interactions = []
-        for row in cursor.fetchall():
-            interactions.append(AIInteraction(
-                id=row[0],
-                run_id=row[1],
-                step_number=row[2],
-                timestamp=datetime.fromisoformat(row[3]),
-                request_json=row[4],
-                screenshot_path=row[5],
-                response_raw=row[6],
-                response_parsed_json=row[7],
-                tokens_input=row[8],
-                tokens_output=row[9],
-                latency_ms=row[10],
-                success=bool(row[11]),
-                error_message=row[12],
-                retry_count=row[13]
-            ))
-
-        return interactions
+        return [self._row_to_interaction(row) for row in cursor.fetchall()]
+
+    def get_ai_interaction(self, run_id: int, step_number: int) -> AIInteraction | None:
+        """Get the last recorded AI interaction for a step.
+
+        A step has one row per attempt; the latest attempt is the one whose
+        response (or final error) the crawler acted on.
+
+        Args:
+            run_id: The run ID
+            step_number: The step number within the run
+
+        Returns:
+            The most recent AIInteraction for the step, or None
+        """
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT id, run_id, step_number, timestamp, request_json, screenshot_path,
+                   response_raw, response_parsed_json, tokens_input, tokens_output,
+                   latency_ms, success, error_message, retry_count
+            FROM ai_interactions
+            WHERE run_id = ? AND step_number = ?
+            ORDER BY id DESC
+            LIMIT 1
+        """, (run_id, step_number))
+
+        row = cursor.fetchone()
+        return self._row_to_interaction(row) if row else None
+
+    def _row_to_interaction(self, row) -> AIInteraction:
+        return AIInteraction(
+            id=row[0],
+            run_id=row[1],
+            step_number=row[2],
+            timestamp=datetime.fromisoformat(row[3]),
+            request_json=row[4],
+            screenshot_path=row[5],
+            response_raw=row[6],
+            response_parsed_json=row[7],
+            tokens_input=row[8],
+            tokens_output=row[9],
+            latency_ms=row[10],
+            success=bool(row[11]),
+            error_message=row[12],
+            retry_count=row[13]
+        )
@@ -1,6 +1,7 @@
 """AI interaction service for coordinating AI model calls."""
 
 import json
+import logging
 import time
 from datetime import datetime
 from typing import Protocol
@@ -10,6 +11,9 @@ from mobile_crawler.domain.model_adapters import ModelAdapter
 from mobile_crawler.domain.models import AIAction, AIResponse, BoundingBox
 from mobile_crawler.domain.prompt_builder import PromptBuilder
 from mobile_crawler.infrastructure.ai_interaction_repository import AIInteraction, AIInteractionRepository
+from mobile_crawler.infrastructure.blob_store import BlobStore, make_blob_ref
+
+logger = logging.getLogger(__name__)
 
 
 class AIEventListener(Protocol):
@@ -33,7 +37,8 @@ class AIInteractionService:
         prompt_builder: PromptBuilder,
         ai_interaction_repository: AIInteractionRepository,
         config_manager: ConfigManager,
-        event_listener: AIEventListener | None = None
+        event_listener: AIEventListener | None = None,
+        blob_store: BlobStore | None = None
     ):
         """Initialize AI interaction service.
 
@@ -43,25 +48,39 @@ class AIInteractionService:
             ai_interaction_repository: Repository for logging interactions
             config_manager: Configuration manager
             event_listener: Optional event listener for AI events
+            blob_store: Optional blob store; when set, the screenshot is stored
+                once by digest and request_json keeps only a blob reference
         """
         self.model_adapter = model_adapter
         self.prompt_builder = prompt_builder
         self.ai_interaction_repository = ai_interaction_repository
         self.config_manager = config_manager
         self.event_listener = event_listener
+        self.blob_store = blob_store
 
     @classmethod
-    def from_config(cls, config_manager: ConfigManager, event_listener: AIEventListener | None = None) -> 'AIInteractionService':
+    def from_config(
+        cls,
+        config_manager: ConfigManager,
+        event_listener: AIEventListener | None = None,
+        blob_dir: str | None = None,
+        traffic_attributor=None
+    ) -> 'AIInteractionService':
         """Create AI interaction service from configuration.
 
         Args:
             config_manager: Configuration manager
             event_listener: Optional event listener for AI events
+            blob_dir: Blob store directory for request screenshots (usually the
+                session's ``blobs`` folder); defaults to ``<app data>/blobs``
+            traffic_attributor: LiveTrafficAttributor of the live capture, if any,
+                so prompts include the network activity block
 
         Returns:
             Configured AI interaction service
         """
         # Import here to avoid circular imports
+        from mobile_crawler.config import get_app_data_dir
         from mobile_crawler.domain.prompt_builder import PromptBuilder
         from mobile_crawler.infrastructure.ai_interaction_repository import AIInteractionRepository
         from mobile_crawler.infrastructure.database import DatabaseManager
@@ -76,10 +95,14 @@ class AIInteractionService:
         # Create other dependencies
         db = DatabaseManager()
         step_log_repo = StepLogRepository(db)
-        prompt_builder = PromptBuilder(config_manager, step_log_repo)
+        prompt_builder = PromptBuilder(config_manager, step_log_repo, traffic_attributor=traffic_attributor)
         ai_repo = AIInteractionRepository(db)
+        blob_store = BlobStore(
+            blob_dir or str(get_app_data_dir() / "blobs"),
+            image_format=config_manager.get("blob_image_format", "") or None,
+        )
 
-        return cls(model_adapter, prompt_builder, ai_repo, config_manager, event_listener)
+        return cls(model_adapter, prompt_builder, ai_repo, config_manager, event_listener, blob_store)
 
     @staticmethod
     def _create_model_adapter(provider: str, model_name: str, config_manager: ConfigManager) -> ModelAdapter:
@@ -178,7 +201,7 @@ class AIInteractionService:
             "system_prompt": system_prompt,
             "user_prompt": user_prompt
         }
-        request_json = json.dumps(request_data)
+        request_json = self._build_stored_request_json(request_data, screenshot_b64)
 
         # Emit request sent event
         if self.event_listener:
@@ -303,6 +326,40 @@ class AIInteractionService:
         # All retries failed
         raise last_exception or Exception("AI interaction failed after all retries")
 
+    def _build_stored_request_json(self, request_data: dict, screenshot_b64: str) -> str:
+        """Serialize request data for the ai_interactions table.
+
+        With a blob store configured, the base64 screenshot inside the user
+        prompt is replaced by a ``blob:sha256:<digest>`` reference so the row
+        does not carry the image bytes.
+
+        Args:
+            request_data: Request dict with system_prompt and user_prompt
+            screenshot_b64: Base64 screenshot that was embedded in the prompt
+
+        Returns:
+            JSON string to persist
+        """
+        if self.blob_store is None or not screenshot_b64:
+            return json.dumps(request_data)
+
+        user_prompt = request_data.get("user_prompt")
+        try:
+            user_prompt_data = json.loads(user_prompt) if isinstance(user_prompt, str) else None
+        except json.JSONDecodeError:
+            user_prompt_data = None
+        if not isinstance(user_prompt_data, dict) or "screenshot" not in user_prompt_data:
+            return json.dumps(request_data)
+
+        try:
+            digest = self.blob_store.put_base64(user_prompt_data["screenshot"], "png")
+        except Exception as e:
+            logger.warning(f"Failed to store screenshot blob, keeping it inline: {e}")
+            return json.dumps(request_data)
+
+        user_prompt_data["screenshot"] = make_blob_ref(digest)
+        return json.dumps({**request_data, "user_prompt": json.dumps(user_prompt_data)})
+
     def _parse_ai_response(self, response_text: str) -> AIResponse:
         """Parse and validate AI response.
 
@@ -0,0 +1,194 @@
+"""Content-addressed blob store for screenshots and other large payloads."""
+
+import base64
+import glob
+import hashlib
+import io
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+BLOB_REF_PREFIX = "blob:sha256:"
+
+# Image re-encodings the store can apply before writing. Keys are the
+# accepted ``image_format`` values, values are (Pillow format, extension).
+_IMAGE_FORMATS: dict[str, tuple[str, str]] = {
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+    "jpg": ("JPEG", "jpg"),
+}
+
+
+def compute_digest(data: bytes) -> str:
+    """Return the hex SHA-256 digest used as a blob key."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def make_blob_ref(digest: str) -> str:
+    """Build the string stored in DB rows / JSON in place of inline bytes."""
+    return f"{BLOB_REF_PREFIX}{digest}"
+
+
+def is_blob_ref(value: object) -> bool:
+    """Check whether a value is a blob reference produced by :func:`make_blob_ref`."""
+    return isinstance(value, str) and value.startswith(BLOB_REF_PREFIX)
+
+
+def parse_blob_ref(value: str) -> str | None:
+    """Extract the digest from a blob reference, or None if it is not one."""
+    if not is_blob_ref(value):
+        return None
+    digest = value[len(BLOB_REF_PREFIX):]
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        return None
+    return digest
+
+
+class BlobStore:
+    """Stores payloads once per unique content under ``<root>/<aa>/<digest>.<ext>``.
+
+    Blobs are keyed by the SHA-256 of the bytes handed to :meth:`put`, so an
+    unchanged screen captured on consecutive steps is written to disk only
+    once. Image payloads can optionally be re-encoded to WebP or JPEG; the
+    key stays the digest of the original bytes so dedup still works before
+    any encoding cost is paid.
+    """
+
+    def __init__(self, root_dir: str, image_format: str | None = None, image_quality: int = 80):
+        """Initialize the blob store.
+
+        Args:
+            root_dir: Directory holding the blobs (usually ``<session>/blobs``)
+            image_format: Optional re-encoding for images: "webp" or "jpeg"
+            image_quality: Encoder quality for lossy image formats (1-100)
+        """
+        fmt = (image_format or "").strip().lower() or None
+        if fmt is not None and fmt not in _IMAGE_FORMATS:
+            raise ValueError(f"Unsupported blob image format: {image_format}")
+
+        self.root_dir = root_dir
+        self.image_format = fmt
+        self.image_quality = max(1, min(100, int(image_quality)))
+        self.bytes_written = 0
+        self.dedup_hits = 0
+        self._paths: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def put(self, data: bytes, extension: str = "bin", digest: str | None = None) -> str:
+        """Store a payload if it is not already present.
+
+        Args:
+            data: Raw bytes to store
+            extension: File extension for the stored blob (e.g. "png", "json")
+            digest: Precomputed digest of ``data``, if the caller already has it
+
+        Returns:
+            Hex SHA-256 digest of ``data``
+        """
+        digest = digest or compute_digest(data)
+        if self.path(digest) is not None:
+            with self._lock:
+                self.dedup_hits += 1
+            return digest
+
+        payload, extension = self._encode(data, extension)
+        target = self._target_path(digest, extension)
+        tmp_path = f"{target}.{threading.get_ident()}.tmp"
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, target)
+
+        with self._lock:
+            self._paths[digest] = target
+            self.bytes_written += len(payload)
+        return digest
+
+    def put_file(self, source_path: str, digest: str, extension: str = "bin") -> str:
+        """Move an already-written file into the store without reading it again.
+
+        Meant for large payloads streamed to disk while being hashed. The
+        file should live on the same filesystem as the store (e.g. a
+        temporary file under ``root_dir``) so the move is a rename. If the
+        digest is already stored, ``source_path`` is deleted instead.
+
+        Args:
+            source_path: File to adopt; it no longer exists afterwards
+            digest: Hex SHA-256 of the file's contents
+            extension: File extension for the stored blob
+
+        Returns:
+            Path of the stored blob
+        """
+        existing = self.path(digest)
+        if existing is not None:
+            os.remove(source_path)
+            with self._lock:
+                self.dedup_hits += 1
+            return existing
+
+        target = self._target_path(digest, extension)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        size = os.path.getsize(source_path)
+        os.replace(source_path, target)
+
+        with self._lock:
+            self._paths[digest] = target
+            self.bytes_written += size
+        return target
+
+    def put_base64(self, data_b64: str, extension: str = "png") -> str:
+        """Decode a base64 payload (optionally a ``data:`` URI) and store it."""
+        if data_b64.startswith("data:") and "," in data_b64:
+            data_b64 = data_b64.split(",", 1)[1]
+        return self.put(base64.b64decode(data_b64), extension)
+
+    def path(self, digest: str) -> str | None:
+        """Return the on-disk path of a blob, or None if it is not stored."""
+        cached = self._paths.get(digest)
+        if cached is not None:
+            return cached
+
+        matches = glob.glob(os.path.join(self.root_dir, digest[:2], f"{digest}.*"))
+        matches = [m for m in matches if not m.endswith(".tmp")]
+        if not matches:
+            return None
+        with self._lock:
+            self._paths[digest] = matches[0]
+        return matches[0]
+
+    def get(self, digest: str) -> bytes | None:
+        """Read a blob's stored bytes, or None if it is not stored."""
+        blob_path = self.path(digest)
+        if blob_path is None:
+            return None
+        with open(blob_path, "rb") as f:
+            return f.read()
+
+    def resolve(self, value: str) -> bytes | None:
+        """Read the blob behind a reference string produced by :func:`make_blob_ref`."""
+        digest = parse_blob_ref(value)
+        return self.get(digest) if digest else None
+
+    def _target_path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.root_dir, digest[:2], f"{digest}.{extension.lstrip('.')}")
+
+    def _encode(self, data: bytes, extension: str) -> tuple[bytes, str]:
+        if self.image_format is None or extension.lower() not in ("png", "jpg", "jpeg", "webp"):
+            return data, extension
+
+        pil_format, new_extension = _IMAGE_FORMATS[self.image_format]
+        try:
+            from PIL import Image
+
+            with Image.open(io.BytesIO(data)) as img:
+                if pil_format == "JPEG" and img.mode != "RGB":
+                    img = img.convert("RGB")
+                output = io.BytesIO()
+                img.save(output, format=pil_format, quality=self.image_quality)
+            return output.getvalue(), new_extension
+        except Exception as e:
+            logger.warning(f"Blob image re-encoding failed, storing original bytes: {e}")
+            return data, extension
@@ -2,12 +2,55 @@
 
 import logging
 import sqlite3
+import threading
+import time
 from pathlib import Path
 
 from mobile_crawler.config import get_app_data_dir
+from mobile_crawler.domain.latency_sketch import LatencySketch, LatencySummary
 
 logger = logging.getLogger(__name__)
 
+# The run history's "provider/model" label, blank unless both are set.
+# Shared by the index below and the run history sort so SQLite can use one for the other.
+RUN_MODEL_LABEL_SQL = (
+    "(CASE WHEN ai_provider <> '' AND ai_model <> '' THEN ai_provider || '/' || ai_model ELSE '' END)"
+)
+
+# Process-wide commit timings for every crawler.db connection; reset per run
+_commit_latency = LatencySketch()
+_commit_latency_lock = threading.Lock()
+
+
+class _TimedConnection(sqlite3.Connection):
+    """sqlite3 connection that records how long each commit takes.
+
+    Commits are where WAL writes hit the disk, so their latency is the
+    SQLite write latency the crawl actually waits on.
+    """
+
+    def commit(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().commit()
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with _commit_latency_lock:
+                _commit_latency.add(elapsed_ms)
+
+
+def commit_latency_summary() -> LatencySummary:
+    """Count and p50/p95/p99 of crawler.db commit latency (ms) in this process."""
+    with _commit_latency_lock:
+        return _commit_latency.summary()
+
+
+def reset_commit_latency() -> None:
+    """Discard recorded commit timings, e.g. when a new run starts."""
+    global _commit_latency
+    with _commit_latency_lock:
+        _commit_latency = LatencySketch()
+
 
 class DatabaseManager:
     """Manages SQLite database connections and schema for crawler.db."""
@@ -30,7 +73,7 @@ class DatabaseManager:
         # Ensure the app data directory exists before opening the database.
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         # Add timeout to handle busy database (especially on Windows)
-        conn = sqlite3.connect(str(self.db_path), timeout=60.0)
+        conn = sqlite3.connect(str(self.db_path), timeout=60.0, factory=_TimedConnection)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
@@ -275,6 +318,7 @@ class DatabaseManager:
                 metadata_json TEXT,
                 current_package TEXT DEFAULT NULL,
                 current_activity TEXT DEFAULT NULL,
+                network_json TEXT DEFAULT NULL,  -- traffic attributed to the step
                 FOREIGN KEY (run_id) REFERENCES runs(id)
             )
         """)
@@ -288,6 +332,11 @@ class DatabaseManager:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_omni_cache_screen ON omni_parser_cache(screen_key)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_phase_transitions_run ON step_phase_transitions(run_id, step_number)")
+        # Run history paging: sort by start time, optionally filtered by status/package
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_start_time ON runs(start_time, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, start_time, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_app_package ON runs(app_package, start_time, id)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_runs_model_label ON runs({RUN_MODEL_LABEL_SQL}, id)")
 
         conn.commit()
 
@@ -336,6 +385,8 @@ class DatabaseManager:
                 conn.execute("ALTER TABLE step_phase_transitions ADD COLUMN current_package TEXT DEFAULT NULL")
             if "current_activity" not in columns:
                 conn.execute("ALTER TABLE step_phase_transitions ADD COLUMN current_activity TEXT DEFAULT NULL")
+            if "network_json" not in columns:
+                conn.execute("ALTER TABLE step_phase_transitions ADD COLUMN network_json TEXT DEFAULT NULL")
 
             conn.commit()
         except sqlite3.OperationalError as e:
@@ -0,0 +1,7 @@
+-- Migration: 012_add_run_history_indexes.sql
+-- Description: Index runs for keyset-paginated, filtered run history queries
+-- Created: 2026-10-18
+
+CREATE INDEX IF NOT EXISTS idx_runs_start_time ON runs(start_time, id);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, start_time, id);
+CREATE INDEX IF NOT EXISTS idx_runs_app_package ON runs(app_package, start_time, id);
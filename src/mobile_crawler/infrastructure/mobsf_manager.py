@@ -4,19 +4,27 @@ Manages integration with Mobile Security Framework (MobSF) for
 static analysis of Android applications.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
+import shlex
+import shutil
 import subprocess
-import time
+import tempfile
 import zipfile
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 import requests
 
+from mobile_crawler.infrastructure.blob_store import BlobStore
+
 if TYPE_CHECKING:
     from mobile_crawler.config.config_manager import ConfigManager
     from mobile_crawler.infrastructure.adb_client import ADBClient
@@ -33,6 +41,123 @@ MOBSF_KEY_DISCOVERY_ERROR = (
 )
 MOBSF_INVALID_KEY_ERROR = "MobSF API key is invalid; refreshed Docker key did not authenticate."
 
+_HASH_CHUNK_SIZE = 1024 * 1024
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def file_sha256(path: str) -> str:
+    """Return the hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    """Place ``source`` at ``target`` as a hard link, copying across filesystems."""
+    if os.path.exists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+class MobSFReportCache:
+    """On-disk MobSF results keyed by the SHA-256 of the analysed APK.
+
+    Each entry lives in ``<root>/<sha256>/`` and holds the JSON and PDF
+    reports, the scorecard and a ``manifest.json`` written last, so an entry
+    without a manifest is treated as absent.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+
+    def _entry_dir(self, apk_sha256: str) -> str:
+        return os.path.join(self.root_dir, apk_sha256)
+
+    def lookup(self, apk_sha256: str) -> dict[str, Any] | None:
+        """Return the cached manifest for an APK, or None on a miss."""
+        manifest_path = os.path.join(self._entry_dir(apk_sha256), self.MANIFEST)
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or not manifest.get("file_hash"):
+            return None
+        return manifest
+
+    def restore(self, apk_sha256: str, reports_dir: str) -> dict[str, Any] | None:
+        """Copy a cached entry's reports into ``reports_dir``.
+
+        Returns:
+            The manifest with ``pdf_report``/``json_report`` pointing at the
+            copies, or None if the entry is missing or incomplete
+        """
+        manifest = self.lookup(apk_sha256)
+        if manifest is None:
+            return None
+        entry_dir = self._entry_dir(apk_sha256)
+        file_hash = manifest["file_hash"]
+        restored = dict(manifest)
+        for key, name, suffix in (("json_report", "report.json", "json"), ("pdf_report", "report.pdf", "pdf")):
+            source = os.path.join(entry_dir, name)
+            if not os.path.exists(source):
+                restored[key] = None
+                continue
+            target = os.path.join(reports_dir, f"{file_hash}_report.{suffix}")
+            try:
+                shutil.copyfile(source, target)
+            except OSError as e:
+                logger.warning("Failed to restore cached MobSF report %s: %s", source, e)
+                return None
+            restored[key] = target
+        if not restored["json_report"] and not restored["pdf_report"]:
+            return None
+        return restored
+
+    def store(
+        self,
+        apk_sha256: str,
+        file_hash: str,
+        package_name: str,
+        pdf_path: str | None,
+        json_path: str | None,
+        scorecard: dict[str, Any] | None,
+    ) -> bool:
+        """Save a finished scan's reports under the APK digest.
+
+        Returns:
+            True if the entry was written
+        """
+        entry_dir = self._entry_dir(apk_sha256)
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            if json_path:
+                shutil.copyfile(json_path, os.path.join(entry_dir, "report.json"))
+            if pdf_path:
+                shutil.copyfile(pdf_path, os.path.join(entry_dir, "report.pdf"))
+            manifest = {
+                "apk_sha256": apk_sha256,
+                "file_hash": file_hash,
+                "package_name": package_name,
+                "security_score": scorecard,
+                "created_at": datetime.now().isoformat(),
+            }
+            tmp_path = os.path.join(entry_dir, f"{self.MANIFEST}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, os.path.join(entry_dir, self.MANIFEST))
+            return True
+        except OSError as e:
+            logger.warning("Failed to cache MobSF reports for %s: %s", apk_sha256, e)
+            return False
+
 
 class MobSFAnalysisResult:
     """Result of MobSF analysis."""
@@ -356,8 +481,16 @@ class MobSFManager:
     ) -> str | None:
         """Extract the APK file from a connected Android device using ADB.
 
+        APKs are hashed on the device first; splits whose digest is already in
+        the local APK store are not transferred again. The remaining splits are
+        streamed concurrently into the store with ``adb exec-out cat``. Split
+        installs are then packed into a ``.apks`` archive built straight from
+        the store.
+
         Args:
             package_name: The package name of the app to extract
+            output_dir: Directory for the extracted APK or split archive
+            device_id: Optional device serial for ADB operations
 
         Returns:
             Path to the extracted APK file, or None if extraction failed
@@ -400,37 +533,49 @@ class MobSFManager:
 
             os.makedirs(selected_output_dir, exist_ok=True)
 
-            pulled_files = []
-            for index, remote_apk in enumerate(apk_paths):
-                remote_name = os.path.basename(remote_apk) or f"split_{index}.apk"
-                safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", remote_name)
-                if len(apk_paths) == 1:
-                    local_apk = os.path.join(selected_output_dir, f"{package_name}.apk")
-                else:
-                    local_apk = os.path.join(selected_output_dir, f"{index:02d}_{safe_name}")
-
-                pull_cmd = ["pull", remote_apk, local_apk]
-                pull_result = subprocess.run(
-                    adb_prefix + pull_cmd,
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                )
-
-                if pull_result.returncode != 0:
-                    logger.error(f"Failed to pull APK {remote_apk}: {pull_result.stderr}")
-                    return None
-                pulled_files.append(local_apk)
-
-            if len(pulled_files) == 1:
-                logger.info(f"APK extracted to: {pulled_files[0]}")
-                return pulled_files[0]
-
+            store = self._apk_store()
+            device_digests = self._device_sha256(adb_prefix, apk_paths)
+            stored: dict[str, str] = {}
+            for remote_apk in apk_paths:
+                digest = device_digests.get(remote_apk)
+                stored_path = store.path(digest) if digest else None
+                if stored_path:
+                    stored[remote_apk] = stored_path
+
+            missing = [remote_apk for remote_apk in apk_paths if remote_apk not in stored]
+            if stored:
+                logger.info(f"Reusing {len(stored)} of {len(apk_paths)} APK(s) from local store")
+            if missing:
+                workers = max(1, min(len(missing), int(self.config_manager.get("mobsf_apk_pull_workers", 4))))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apk-pull") as pool:
+                    pulled = pool.map(
+                        lambda remote: self._pull_apk_to_store(
+                            adb_prefix, remote, store, device_digests.get(remote)
+                        ),
+                        missing,
+                    )
+                    for remote_apk, stored_path in zip(missing, pulled, strict=True):
+                        if not stored_path:
+                            return None
+                        stored[remote_apk] = stored_path
+
+            if len(apk_paths) == 1:
+                local_apk = os.path.join(selected_output_dir, f"{package_name}.apk")
+                _link_or_copy(stored[apk_paths[0]], local_apk)
+                logger.info(f"APK extracted to: {local_apk}")
+                return local_apk
+
+            # APKs are already compressed, so entries are stored as-is. Fixed
+            # entry timestamps keep the archive byte-identical for identical
+            # splits, so its SHA-256 can key the report cache.
             archive_path = os.path.join(selected_output_dir, f"{package_name}.apks")
-            with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-                for pulled_file in pulled_files:
-                    archive.write(pulled_file, arcname=os.path.basename(pulled_file))
+            with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED) as archive:
+                for index, remote_apk in enumerate(apk_paths):
+                    remote_name = os.path.basename(remote_apk) or f"split_{index}.apk"
+                    safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", remote_name)
+                    entry = zipfile.ZipInfo(f"{index:02d}_{safe_name}", date_time=_ZIP_EPOCH)
+                    with open(stored[remote_apk], "rb") as source, archive.open(entry, "w") as target:
+                        shutil.copyfileobj(source, target, _HASH_CHUNK_SIZE)
 
             logger.info(f"Split APK archive extracted to: {archive_path}")
             return archive_path
@@ -439,6 +584,79 @@ class MobSFManager:
             logger.error(f"Error extracting APK: {str(e)}")
             return None
 
+    def _apk_store(self) -> BlobStore:
+        """Return the content-addressed store holding pulled APKs across runs."""
+        store_dir = self.config_manager.get("mobsf_apk_store_dir") or os.path.join(
+            "output_data", "apk_store"
+        )
+        return BlobStore(store_dir)
+
+    def _device_sha256(self, adb_prefix: list[str], apk_paths: list[str]) -> dict[str, str]:
+        """Hash APKs on the device with one ``sha256sum`` call.
+
+        Returns:
+            Mapping of device path to hex digest; empty if the device has no
+            ``sha256sum`` (older toybox builds), in which case every APK is pulled
+        """
+        result = subprocess.run(
+            adb_prefix + ["shell", "sha256sum", *(shlex.quote(path) for path in apk_paths)],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        digests = {}
+        for line in (result.stdout or "").splitlines():
+            match = re.match(r"([0-9a-f]{64})\s+(.+)$", line.strip())
+            if match:
+                digests[match.group(2)] = match.group(1)
+        if len(digests) < len(apk_paths):
+            logger.debug(f"On-device sha256sum covered {len(digests)} of {len(apk_paths)} APK(s)")
+        return digests
+
+    def _pull_apk_to_store(
+        self,
+        adb_prefix: list[str],
+        remote_apk: str,
+        store: BlobStore,
+        expected_digest: str | None,
+    ) -> str | None:
+        """Stream one APK from the device into the store, hashing it on the way.
+
+        Returns:
+            Path of the stored APK, or None if the transfer failed or the
+            bytes do not match the on-device digest
+        """
+        os.makedirs(store.root_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix="pull-", suffix=".tmp", dir=store.root_dir)
+        digest = hashlib.sha256()
+        try:
+            with os.fdopen(fd, "wb") as out, subprocess.Popen(
+                adb_prefix + ["exec-out", "cat", remote_apk],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            ) as proc:
+                while chunk := proc.stdout.read(_HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+                    out.write(chunk)
+                stderr = proc.stderr.read().decode("utf-8", errors="replace")
+                returncode = proc.wait()
+
+            actual = digest.hexdigest()
+            if returncode != 0 or os.path.getsize(tmp_path) == 0:
+                logger.error(f"Failed to pull APK {remote_apk}: {stderr.strip()}")
+                return None
+            if expected_digest and actual != expected_digest:
+                logger.error(
+                    f"Pulled APK {remote_apk} does not match its on-device digest "
+                    f"({actual} != {expected_digest})"
+                )
+                return None
+            return store.put_file(tmp_path, actual, "apk")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def upload_apk(self, apk_path: str) -> tuple[bool, dict[str, Any]]:
         """Upload an APK file to MobSF for analysis.
 
@@ -587,6 +805,19 @@ class MobSFManager:
         data = {"hash": file_hash}
         return self._make_api_request("scorecard", "POST", data=data)
 
+    def _report_cache(self) -> MobSFReportCache | None:
+        """Return the configured report cache, or None when caching is disabled."""
+        if not self.config_manager.get("mobsf_report_cache_enabled", True):
+            return None
+        cache_dir = self.config_manager.get("mobsf_report_cache_dir") or os.path.join(
+            "output_data", "mobsf_cache"
+        )
+        return MobSFReportCache(cache_dir)
+
+    async def _api_call_async(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking API helper in a worker thread so the event loop stays free."""
+        return await asyncio.to_thread(method, *args, **kwargs)
+
     def perform_complete_scan(
         self,
         package_name: str,
@@ -595,17 +826,57 @@ class MobSFManager:
         device_id: str | None = None,
         log_callback: Callable[[str, str | None], None] | None = None,
     ) -> tuple[bool, dict[str, Any]]:
-        """Perform a complete scan workflow.
+        """Perform a complete scan workflow, blocking until it finishes.
+
+        Synchronous wrapper around :meth:`perform_complete_scan_async` for
+        callers without an event loop (CLI, UI worker threads).
+
+        Args:
+            package_name: The package name to scan
+            run_id: Optional run ID for organizing results
+            session_path: Optional session directory path
+            device_id: Optional device serial for ADB operations
+            log_callback: Optional callback function to display logs.
+                         Should accept (message: str, color: Optional[str] = None)
+
+        Returns:
+            Tuple of (success, scan_summary)
+        """
+        return asyncio.run(
+            self.perform_complete_scan_async(
+                package_name,
+                run_id=run_id,
+                session_path=session_path,
+                device_id=device_id,
+                log_callback=log_callback,
+            )
+        )
+
+    async def perform_complete_scan_async(
+        self,
+        package_name: str,
+        run_id: int | None = None,
+        session_path: str | None = None,
+        device_id: str | None = None,
+        log_callback: Callable[[str, str | None], None] | None = None,
+    ) -> tuple[bool, dict[str, Any]]:
+        """Perform a complete scan workflow without blocking the event loop.
 
         1. Extract APK from device
-        2. Upload to MobSF
-        3. Scan the APK
-        4. Get and save reports
+        2. Return cached reports if this exact APK was scanned before
+        3. Upload to MobSF
+        4. Scan the APK
+        5. Get and save reports, then cache them by APK digest
+
+        HTTP calls run in worker threads and report polling backs off
+        exponentially, so the pipeline can run alongside a crawl. Cancelling
+        the awaiting task stops the pipeline at the next await.
 
         Args:
             package_name: The package name to scan
             run_id: Optional run ID for organizing results
             session_path: Optional session directory path
+            device_id: Optional device serial for ADB operations
             log_callback: Optional callback function to display logs.
                          Should accept (message: str, color: Optional[str] = None)
 
@@ -626,7 +897,7 @@ class MobSFManager:
             return False, {"error": "MobSF analysis is disabled"}
 
         try:
-            preflight_ok, preflight_error = self.preflight()
+            preflight_ok, preflight_error = await self._api_call_async(self.preflight)
         except ValueError as e:
             _log(f"ERROR: {e}", "red")
             return False, {"error": str(e)}
@@ -668,7 +939,9 @@ class MobSFManager:
         # Extract APK from device
         _log("Extracting APK from device...", "blue")
         logger.debug(f"Extracting APK for package: {package_name}")
-        apk_path = self.extract_apk_from_device(package_name, output_dir=apks_dir, device_id=device_id)
+        apk_path = await asyncio.to_thread(
+            self.extract_apk_from_device, package_name, output_dir=apks_dir, device_id=device_id
+        )
         if not apk_path:
             error_msg = "Failed to extract APK from device"
             logger.error(f"MobSF analysis failed: {error_msg}")
@@ -677,10 +950,30 @@ class MobSFManager:
         _log(f"APK extracted to: {apk_path}", "green")
         logger.debug(f"APK extracted successfully: {apk_path}")
 
+        # Identical APKs produce identical reports; reuse them when available
+        cache = self._report_cache()
+        apk_sha256 = None
+        if cache is not None:
+            apk_sha256 = await asyncio.to_thread(file_sha256, apk_path)
+            cached = await asyncio.to_thread(cache.restore, apk_sha256, reports_dir)
+            if cached is not None:
+                _log(f"Reusing cached MobSF reports for APK sha256 {apk_sha256[:12]}", "green")
+                return True, {
+                    "package_name": package_name,
+                    "file_hash": cached["file_hash"],
+                    "apk_path": apk_path,
+                    "apk_sha256": apk_sha256,
+                    "pdf_report": cached["pdf_report"],
+                    "json_report": cached["json_report"],
+                    "security_score": cached.get("security_score") or "Unknown",
+                    "scan_complete": True,
+                    "cached": True,
+                }
+
         # Upload APK to MobSF
         _log("Uploading APK to MobSF...", "blue")
         logger.debug(f"Uploading APK to MobSF server: {self.api_url}")
-        upload_success, upload_result = self.upload_apk(apk_path)
+        upload_success, upload_result = await self._api_call_async(self.upload_apk, apk_path)
         if not upload_success:
             error_msg = f"Failed to upload APK: {upload_result}"
             logger.error(f"MobSF analysis failed: {error_msg}")
@@ -699,7 +992,7 @@ class MobSFManager:
         # Scan the APK
         _log("Starting MobSF static analysis...", "blue")
         logger.debug(f"Initiating MobSF scan for hash: {file_hash}")
-        scan_success, scan_result = self.scan_apk(file_hash)
+        scan_success, scan_result = await self._api_call_async(self.scan_apk, file_hash)
         if not scan_success:
             error_msg = f"Failed to scan APK: {scan_result}"
             logger.error(f"MobSF analysis failed: {error_msg}")
@@ -708,78 +1001,8 @@ class MobSFManager:
         logger.debug("MobSF scan initiated successfully")
         _log("MobSF scan started successfully", "green")
 
-        # Wait for scan to complete and display logs
-        scan_timeout = int(self.config_manager.get("mobsf_scan_timeout", 900))
-        poll_interval = float(self.config_manager.get("mobsf_poll_interval", 2))
-        max_retries = int(scan_timeout / poll_interval)
-        last_log_count = 0
-        seen_logs = set()
-        scan_complete = False
-
-        _log(f"Waiting for scan to complete (timeout: {scan_timeout}s, polling every {poll_interval}s)...", "blue")
-
-        for attempt in range(max_retries):
-            # Try to get scan logs for progress updates
-            logs_success, logs = self.get_scan_logs(file_hash)
-            if logs_success and "logs" in logs:
-                log_entries = logs.get("logs", [])
-
-                # Display new log entries
-                if log_entries:
-                    for log_entry in log_entries[last_log_count:]:
-                        log_id = (
-                            f"{log_entry.get('timestamp', '')}-"
-                            f"{log_entry.get('status', '')}-{log_entry.get('message', '')}"
-                        )
-                        if log_id not in seen_logs:
-                            seen_logs.add(log_id)
-                            status = log_entry.get("status", "")
-                            message = log_entry.get("message", "")
-                            timestamp = log_entry.get("timestamp", "")
-
-                            if message:
-                                log_message = f"[MobSF] {message}"
-                                if timestamp:
-                                    log_message = f"[{timestamp}] {log_message}"
-
-                                # Determine color based on status
-                                if "Error" in status or "Failed" in status:
-                                    color = "red"
-                                elif "Completed" in status or "Success" in status:
-                                    color = "green"
-                                elif "Warning" in status:
-                                    color = "orange"
-                                else:
-                                    color = "blue"
-
-                                _log(log_message, color)
-
-                            if status and status not in message:
-                                _log(f"[MobSF] Status: {status}", "blue")
-
-                    last_log_count = len(log_entries)
-
-            # Treat report availability as the completion signal across MobSF versions.
-            json_success, json_result = self.get_report_json(file_hash, timeout=10)
-            if json_success and isinstance(json_result, dict) and json_result:
-                _log("Scan completed - JSON report is available", "green")
-                scan_complete = True
-                break
-            pdf_success, pdf_result = self.get_pdf_report(file_hash, timeout=10)
-            if pdf_success and isinstance(pdf_result, bytes) and len(pdf_result) > 0:
-                _log("Scan completed - PDF report is available", "green")
-                scan_complete = True
-                break
-
-            if not scan_complete:
-                if attempt == 0:
-                    _log("Waiting for scan to start...", "blue")
-                elif attempt % 15 == 0:  # Log progress every 30 seconds
-                    elapsed = attempt * poll_interval
-                    _log(f"Scan in progress... ({elapsed:.0f}s / {scan_timeout}s)", "blue")
-                    logger.info(f"MobSF scan for {file_hash} still in progress: {elapsed:.0f}s elapsed")
-
-            time.sleep(poll_interval)
+        scan_timeout = float(self.config_manager.get("mobsf_scan_timeout", 900))
+        scan_complete = await self._wait_for_scan_async(file_hash, scan_timeout, _log)
 
         # Save reports only if scan is complete
         pdf_path = None
@@ -792,8 +1015,10 @@ class MobSFManager:
             json_path = os.path.join(reports_dir, f"{file_hash}_report.json")
 
             req_timeout = int(self.config_manager.get("mobsf_request_timeout", 300))
-            pdf_path = self.save_pdf_report(file_hash, pdf_path, timeout=req_timeout)
-            json_path = self.save_json_report(file_hash, json_path, timeout=req_timeout)
+            pdf_path, json_path = await asyncio.gather(
+                self._api_call_async(self.save_pdf_report, file_hash, pdf_path, timeout=req_timeout),
+                self._api_call_async(self.save_json_report, file_hash, json_path, timeout=req_timeout),
+            )
 
             if pdf_path:
                 _log(f"PDF report saved: {pdf_path}", "green")
@@ -802,12 +1027,19 @@ class MobSFManager:
 
             # Get security score
             _log("Retrieving security score...", "blue")
-            score_success, scorecard = self.get_security_score(file_hash)
+            score_success, scorecard = await self._api_call_async(self.get_security_score, file_hash)
             if score_success and isinstance(scorecard, dict):
                 score_value = scorecard.get("score", "N/A")
                 _log(f"Security Score: {score_value}", "green")
+            else:
+                scorecard = None
+
+            if cache is not None and apk_sha256 and (pdf_path or json_path):
+                await asyncio.to_thread(
+                    cache.store, apk_sha256, file_hash, package_name, pdf_path, json_path, scorecard
+                )
         else:
-            _log(f"Warning: Scan timeout reached ({scan_timeout}s). Reports may not be available yet.", "orange")
+            _log(f"Warning: Scan timeout reached ({scan_timeout:g}s). Reports may not be available yet.", "orange")
             _log("You can manually retrieve reports later using the file hash.", "orange")
             _log(f"File hash: {file_hash}", "blue")
 
@@ -816,10 +1048,12 @@ class MobSFManager:
             "package_name": package_name,
             "file_hash": file_hash,
             "apk_path": apk_path,
+            "apk_sha256": apk_sha256,
             "pdf_report": pdf_path,
             "json_report": json_path,
             "security_score": scorecard if scorecard else "Unknown",
             "scan_complete": scan_complete,
+            "cached": False,
         }
 
         if scan_complete:
@@ -829,6 +1063,114 @@ class MobSFManager:
             _log("MobSF analysis timed out - scan may still be in progress", "orange")
             return False, summary
 
+    async def _wait_for_scan_async(
+        self,
+        file_hash: str,
+        scan_timeout: float,
+        log: Callable[[str, str | None], None],
+    ) -> bool:
+        """Poll until a report is available, backing off exponentially.
+
+        The delay starts at ``mobsf_poll_interval`` and doubles after each
+        poll without progress, up to ``mobsf_poll_max_interval``. New scan log
+        entries reset it, so an actively progressing scan is followed closely.
+
+        Args:
+            file_hash: MobSF hash of the uploaded file
+            scan_timeout: Seconds to wait before giving up
+            log: Progress logger taking (message, color)
+
+        Returns:
+            True if a JSON or PDF report became available before the timeout
+        """
+        initial_interval = max(0.01, float(self.config_manager.get("mobsf_poll_interval", 2)))
+        max_interval = max(
+            initial_interval, float(self.config_manager.get("mobsf_poll_max_interval", 30))
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + scan_timeout
+        delay = initial_interval
+        last_log_count = 0
+        seen_logs = set()
+        next_progress_log = 30.0
+
+        log(
+            f"Waiting for scan to complete (timeout: {scan_timeout:g}s, polling every "
+            f"{initial_interval:g}s backing off to {max_interval:g}s)...",
+            "blue",
+        )
+        log("Waiting for scan to start...", "blue")
+
+        while True:
+            # Try to get scan logs for progress updates
+            progressed = False
+            logs_success, logs = await self._api_call_async(self.get_scan_logs, file_hash)
+            if logs_success and isinstance(logs, dict) and "logs" in logs:
+                log_entries = logs.get("logs", [])
+
+                # Display new log entries
+                for log_entry in log_entries[last_log_count:]:
+                    log_id = (
+                        f"{log_entry.get('timestamp', '')}-"
+                        f"{log_entry.get('status', '')}-{log_entry.get('message', '')}"
+                    )
+                    if log_id in seen_logs:
+                        continue
+                    seen_logs.add(log_id)
+                    progressed = True
+                    status = log_entry.get("status", "")
+                    message = log_entry.get("message", "")
+                    timestamp = log_entry.get("timestamp", "")
+
+                    if message:
+                        log_message = f"[MobSF] {message}"
+                        if timestamp:
+                            log_message = f"[{timestamp}] {log_message}"
+
+                        # Determine color based on status
+                        if "Error" in status or "Failed" in status:
+                            color = "red"
+                        elif "Completed" in status or "Success" in status:
+                            color = "green"
+                        elif "Warning" in status:
+                            color = "orange"
+                        else:
+                            color = "blue"
+
+                        log(log_message, color)
+
+                    if status and status not in message:
+                        log(f"[MobSF] Status: {status}", "blue")
+
+                last_log_count = max(last_log_count, len(log_entries))
+
+            # Treat report availability as the completion signal across MobSF versions.
+            json_success, json_result = await self._api_call_async(
+                self.get_report_json, file_hash, timeout=10
+            )
+            if json_success and isinstance(json_result, dict) and json_result:
+                log("Scan completed - JSON report is available", "green")
+                return True
+            pdf_success, pdf_result = await self._api_call_async(
+                self.get_pdf_report, file_hash, timeout=10
+            )
+            if pdf_success and isinstance(pdf_result, bytes) and len(pdf_result) > 0:
+                log("Scan completed - PDF report is available", "green")
+                return True
+
+            now = loop.time()
+            if now >= deadline:
+                return False
+            elapsed = now - started
+            if elapsed >= next_progress_log:
+                log(f"Scan in progress... ({elapsed:.0f}s / {scan_timeout:g}s)", "blue")
+                logger.info(f"MobSF scan for {file_hash} still in progress: {elapsed:.0f}s elapsed")
+                next_progress_log += 30.0
+
+            delay = initial_interval if progressed else min(delay * 2, max_interval)
+            await asyncio.sleep(min(delay, deadline - now))
+
     def analyze_run(
         self, run: "Run", device_id: str
     ) -> MobSFAnalysisResult:
@@ -850,22 +1192,57 @@ class MobSFManager:
                 error="MobSF analysis is disabled in configuration"
             )
 
-        # Get session path from run
-        session_path = None
-        if hasattr(run, "session_path") and run.session_path:
-            session_path = run.session_path
-        elif self.session_folder_manager:
-            session_path = self.session_folder_manager.get_session_path(run)
-
-        # Perform complete scan
         success, summary = self.perform_complete_scan(
             package_name=run.app_package,
             run_id=run.id,
-            session_path=session_path,
+            session_path=self._run_session_path(run),
             device_id=device_id,
             log_callback=None,  # UI will handle logging separately
         )
+        return self._analysis_result(success, summary)
+
+    async def analyze_run_async(
+        self,
+        run: "Run",
+        device_id: str,
+        log_callback: Callable[[str, str | None], None] | None = None,
+    ) -> MobSFAnalysisResult:
+        """Async variant of :meth:`analyze_run` for use inside a running event loop.
+
+        Args:
+            run: Run object for organizing results
+            device_id: Device ID for ADB operations
+            log_callback: Optional progress callback taking (message, color)
+
+        Returns:
+            MobSFAnalysisResult with report paths or error
+        """
+        if not self.config_manager.get("enable_mobsf_analysis", False):
+            return MobSFAnalysisResult(
+                success=False,
+                error="MobSF analysis is disabled in configuration"
+            )
+
+        success, summary = await self.perform_complete_scan_async(
+            package_name=run.app_package,
+            run_id=run.id,
+            session_path=self._run_session_path(run),
+            device_id=device_id,
+            log_callback=log_callback,
+        )
+        return self._analysis_result(success, summary)
+
+    def _run_session_path(self, run: "Run") -> str | None:
+        """Resolve the session folder of a run, if known."""
+        if hasattr(run, "session_path") and run.session_path:
+            return run.session_path
+        if self.session_folder_manager:
+            return self.session_folder_manager.get_session_path(run)
+        return None
 
+    @staticmethod
+    def _analysis_result(success: bool, summary: dict[str, Any]) -> MobSFAnalysisResult:
+        """Convert a scan summary into a MobSFAnalysisResult."""
         if success:
             return MobSFAnalysisResult(
                 success=True,
@@ -874,8 +1251,7 @@ class MobSFManager:
                 scan_id=summary.get("file_hash"),
                 security_score=summary.get("security_score"),
             )
-        else:
-            return MobSFAnalysisResult(
-                success=False,
-                error=summary.get("error", "Unknown error"),
-            )
+        return MobSFAnalysisResult(
+            success=False,
+            error=summary.get("error", "Unknown error"),
+        )
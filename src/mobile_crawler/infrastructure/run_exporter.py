@@ -9,6 +9,7 @@ from typing import Any
 
 from mobile_crawler.config import get_app_data_dir
 from mobile_crawler.infrastructure.ai_interaction_repository import AIInteractionRepository
+from mobile_crawler.infrastructure.blob_store import is_blob_ref
 from mobile_crawler.infrastructure.database import DatabaseManager
 from mobile_crawler.infrastructure.run_repository import RunRepository
 from mobile_crawler.infrastructure.screen_repository import ScreenRepository
@@ -206,6 +207,7 @@ class RunExporter:
 
         Returns:
             Cleaned request data with screenshot replaced by placeholder
+            (blob references are kept as-is)
         """
         if not request_json:
             return None
@@ -220,7 +222,8 @@ class RunExporter:
                     try:
                         # Parse the user prompt JSON
                         user_prompt_data = json.loads(user_prompt)
-                        if 'screenshot' in user_prompt_data:
+                        screenshot = user_prompt_data.get('screenshot')
+                        if 'screenshot' in user_prompt_data and not is_blob_ref(screenshot):
                             # Replace base64 with placeholder
                             user_prompt_data['screenshot'] = "[BASE64_SCREENSHOT_REMOVED]"
                             request_data['user_prompt'] = json.dumps(user_prompt_data)
@@ -7,10 +7,29 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from mobile_crawler.domain.errors import ErrorContext, RecorderError
-from mobile_crawler.infrastructure.database import DatabaseManager
+from mobile_crawler.infrastructure.database import RUN_MODEL_LABEL_SQL, DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# Columns the run history can be sorted by server-side, mapped to the SQL
+# expression used for ORDER BY and keyset comparisons. Nullable columns are
+# coalesced so the (value, id) cursor always compares cleanly.
+RUN_SORT_COLUMNS: dict[str, str] = {
+    "id": "id",
+    "device_id": "device_id",
+    "app_package": "app_package",
+    "start_time": "start_time",
+    "end_time": "COALESCE(end_time, '')",
+    "status": "status",
+    "total_steps": "COALESCE(total_steps, 0)",
+    "unique_screens": "COALESCE(unique_screens, 0)",
+    "ai_model": RUN_MODEL_LABEL_SQL,
+}
+
+# Upper bound appended to a prefix so "col >= prefix AND col < prefix + max"
+# can be answered from the column index (LIKE is case-insensitive and can't).
+_PREFIX_UPPER_BOUND = "\U0010ffff"
+
 
 @dataclass
 class Run:
@@ -28,6 +47,13 @@ class Run:
     unique_screens: int = 0
     session_path: str | None = None
 
+    @property
+    def model_label(self) -> str:
+        """``provider/model`` as shown in the run history, or "" if either is unset."""
+        if self.ai_provider and self.ai_model:
+            return f"{self.ai_provider}/{self.ai_model}"
+        return ""
+
 
 class RunRepository:
     """Repository for CRUD operations on runs table with cascading deletes."""
@@ -109,6 +135,95 @@ class RunRepository:
 
             return [self._row_to_run(row) for row in rows]
 
+    def get_runs_page(
+        self,
+        limit: int = 100,
+        after: tuple | None = None,
+        status: str | None = None,
+        app_package: str | None = None,
+        sort_by: str = "start_time",
+        descending: bool = True,
+    ) -> list[Run]:
+        """Get one page of runs using keyset pagination.
+
+        Pages are addressed by the ``(sort value, id)`` of the last row of
+        the previous page instead of an OFFSET, so every page costs the same
+        index seek no matter how deep into the history it is.
+
+        Args:
+            limit: Maximum number of runs to return
+            after: Cursor from :meth:`page_cursor` for the last run already
+                loaded, or None for the first page
+            status: Only return runs with this status
+            app_package: Only return runs whose package starts with this prefix
+            sort_by: Key of ``RUN_SORT_COLUMNS`` to order by
+            descending: Sort direction
+
+        Returns:
+            List of at most ``limit`` runs
+        """
+        if sort_by not in RUN_SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort_by}")
+        sort_expr = RUN_SORT_COLUMNS[sort_by]
+        op = "<" if descending else ">"
+        direction = "DESC" if descending else "ASC"
+
+        clauses = []
+        params: list = []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if app_package:
+            clauses.append("app_package >= ? AND app_package < ?")
+            params.extend([app_package, app_package + _PREFIX_UPPER_BOUND])
+        if after is not None:
+            value, run_id = after
+            if sort_by == "id":
+                clauses.append(f"id {op} ?")
+                params.append(run_id)
+            else:
+                clauses.append(f"({sort_expr} {op} ? OR ({sort_expr} = ? AND id {op} ?))")
+                params.extend([value, value, run_id])
+
+        query = "SELECT * FROM runs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        if sort_by == "id":
+            query += f" ORDER BY id {direction} LIMIT ?"
+        else:
+            query += f" ORDER BY {sort_expr} {direction}, id {direction} LIMIT ?"
+        params.append(limit)
+
+        with closing(self.db_manager.get_connection()) as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+
+            return [self._row_to_run(row) for row in rows]
+
+    @staticmethod
+    def page_cursor(run: Run, sort_by: str = "start_time") -> tuple:
+        """Build the ``after`` cursor for :meth:`get_runs_page` from a loaded run.
+
+        Args:
+            run: Last run of the current page
+            sort_by: Sort key the page was requested with
+
+        Returns:
+            Tuple of (sort value as stored in the database, run id)
+        """
+        if sort_by in ("start_time", "end_time"):
+            value = getattr(run, sort_by)
+            value = value.isoformat() if value else ""
+        elif sort_by in ("total_steps", "unique_screens"):
+            value = getattr(run, sort_by) or 0
+        elif sort_by == "ai_model":
+            value = run.model_label
+        else:
+            value = getattr(run, sort_by)
+        return (value, run.id)
+
     def get_runs_by_package(self, app_package: str) -> list[Run]:
         """Get all runs for a specific app package.
 
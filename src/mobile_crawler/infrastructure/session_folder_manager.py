@@ -45,8 +45,9 @@ class SessionFolderManager:
         os.makedirs(session_path, exist_ok=True)
 
         # Create standard subdirectories
-        # Separate folders for different artifact types: pcap, videos, logs, apks
-        subdirs = ["screenshots", "reports", "pcap", "videos", "logs", "data", "apks"]
+        # Separate folders for different artifact types: pcap, videos, logs, apks,
+        # and content-addressed blobs (deduplicated screenshots / large payloads)
+        subdirs = ["screenshots", "reports", "pcap", "videos", "logs", "data", "apks", "blobs"]
         for subdir in subdirs:
             os.makedirs(os.path.join(session_path, subdir), exist_ok=True)
 
@@ -345,3 +345,38 @@ class StepPhaseRepository:
                 context=ErrorContext(run_id=run_id),
                 cause=e,
             ) from e
+
+    def record_step_network(self, run_id: int, step_number: int, network_json: str) -> None:
+        """Update the latest transition for a step with its attributed network traffic.
+
+        Args:
+            run_id: The run ID.
+            step_number: The step number.
+            network_json: JSON summary of the requests attributed to the step.
+
+        Raises:
+            RecorderError: If the database operation fails.
+        """
+        try:
+            with closing(self.db_manager.get_connection()) as conn:
+                conn.execute(
+                    """
+                    UPDATE step_phase_transitions
+                    SET network_json = ?
+                    WHERE run_id = ? AND step_number = ?
+                    AND id = (
+                        SELECT id FROM step_phase_transitions
+                        WHERE run_id = ? AND step_number = ?
+                        ORDER BY timestamp DESC
+                        LIMIT 1
+                    )
+                """,
+                    (network_json, run_id, step_number, run_id, step_number),
+                )
+                conn.commit()
+        except sqlite3.OperationalError as e:
+            raise RecorderError(
+                f"Failed to record step network traffic: {e}",
+                context=ErrorContext(run_id=run_id),
+                cause=e,
+            ) from e
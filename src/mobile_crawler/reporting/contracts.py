@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -12,6 +12,10 @@ class NetworkRequest:
     host: str
     protocol: str
     status_code: int | None = None
+    dst_ip: str | None = None
+    dst_port: int | None = None
+    answers: list[str] = field(default_factory=list)
+    size_bytes: int = 0
 
 @dataclass
 class Vulnerability:
@@ -36,6 +40,18 @@ class EnrichedStep:
     action_details: dict[str, Any]
     screenshot_path: str
     network_requests: list[NetworkRequest]
+    request_count: int = 0
+    total_bytes: int = 0
+    new_hosts: list[str] = field(default_factory=list)
+    video_clip: str = ""
+
+@dataclass
+class HostAggregate:
+    host: str
+    request_count: int = 0
+    total_bytes: int = 0
+    first_seen: datetime | None = None
+    first_seen_step: int | None = None
 
 @dataclass
 class RunSummary:
@@ -54,6 +70,7 @@ class RunReportData:
     timeline: list[EnrichedStep]
     security_analysis: MobSFAnalysis | None
     network_summary: dict[str, Any]
+    host_summary: list[HostAggregate] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -1,7 +1,16 @@
+from bisect import bisect_left
 from datetime import datetime
 from typing import Any
 
-from .contracts import EnrichedStep, MobSFParser, PcapParser, RunReportData, RunSummary
+from .contracts import (
+    EnrichedStep,
+    HostAggregate,
+    MobSFParser,
+    NetworkRequest,
+    PcapParser,
+    RunReportData,
+    RunSummary,
+)
 
 
 class RunCorrelator:
@@ -35,11 +44,14 @@ class RunCorrelator:
         )
 
         # 3. Build Timeline with Correlation (US2)
-        timeline = []
-
-        # Sort network requests by time for efficient matching (even though PcapParser usually returns them sorted)
+        # Requests are sorted once; each step's window [step_ts, next_ts) is then
+        # located with two bisections instead of scanning every request.
         sorted_requests = sorted(network_requests, key=lambda x: x.timestamp)
+        request_times = [r.timestamp for r in sorted_requests]
+        hosts = self._aggregate_hosts(sorted_requests)
 
+        timeline = []
+        attributed = 0
         for i, raw_step in enumerate(raw_steps):
             step_ts = raw_step.get('timestamp', datetime.now())
 
@@ -51,20 +63,34 @@ class RunCorrelator:
                 next_ts = end_time  # For the last step, the window ends at the run's end time
 
             # Match requests in this window [step_ts, next_ts)
-            step_requests = [
-                req for req in sorted_requests
-                if step_ts <= req.timestamp < (next_ts if next_ts else datetime.max)
-            ]
+            lo = bisect_left(request_times, step_ts)
+            hi = bisect_left(request_times, next_ts if next_ts else datetime.max, lo)
+            step_requests = sorted_requests[lo:hi]
+            attributed += len(step_requests)
+
+            step_number = i + 1
+            new_hosts = []
+            for req in step_requests:
+                host = hosts[req.host]
+                if host.first_seen_step is None:
+                    host.first_seen_step = step_number
+                    new_hosts.append(req.host)
 
             timeline.append(EnrichedStep(
-                step_number=i + 1,
+                step_number=step_number,
                 timestamp=step_ts,
                 action_type=raw_step.get('action', 'N/A'),
                 action_details=raw_step.get('details', {}),
                 screenshot_path=raw_step.get('screenshot', ''),
-                network_requests=step_requests
+                network_requests=step_requests,
+                request_count=len(step_requests),
+                total_bytes=sum(r.size_bytes for r in step_requests),
+                new_hosts=new_hosts,
+                video_clip=raw_step.get('video', ''),
             ))
 
+        host_summary = sorted(hosts.values(), key=lambda h: (-h.request_count, h.host))
+
         return RunReportData(
             run_id=run_id,
             summary=summary,
@@ -72,6 +98,21 @@ class RunCorrelator:
             security_analysis=security_analysis,
             network_summary={
                 "total_requests": len(network_requests),
-                "distinct_hosts": len({r.host for r in network_requests}) if network_requests else 0
-            }
+                "distinct_hosts": len(hosts),
+                "total_bytes": sum(h.total_bytes for h in host_summary),
+                "unattributed_requests": max(0, len(network_requests) - attributed),
+            },
+            host_summary=host_summary,
         )
+
+    @staticmethod
+    def _aggregate_hosts(sorted_requests: list[NetworkRequest]) -> dict[str, HostAggregate]:
+        """Build per-host totals in one pass over time-sorted requests."""
+        hosts: dict[str, HostAggregate] = {}
+        for req in sorted_requests:
+            host = hosts.get(req.host)
+            if host is None:
+                host = hosts[req.host] = HostAggregate(host=req.host, first_seen=req.timestamp)
+            host.request_count += 1
+            host.total_bytes += req.size_bytes
+        return hosts
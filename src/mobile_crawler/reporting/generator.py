@@ -25,7 +25,8 @@ class JinjaReportGenerator(ReportGenerator):
             summary=data.summary,
             security_analysis=data.security_analysis,
             timeline=data.timeline,
-            network_summary=data.network_summary
+            network_summary=data.network_summary,
+            host_summary=data.host_summary
         )
 
         with open(output_path_html, 'w', encoding='utf-8') as f:
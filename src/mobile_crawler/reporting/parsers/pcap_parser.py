@@ -1,9 +1,61 @@
+import mmap
+import socket
+import struct
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import datetime
 
 import dpkt
 
 from ..contracts import NetworkRequest, PcapParser
 
+# Link-layer header types (https://www.tcpdump.org/linktypes.html)
+LINKTYPE_NULL = 0
+LINKTYPE_ETHERNET = 1
+LINKTYPE_RAW_BSD = 12
+LINKTYPE_RAW_OPENBSD = 14
+LINKTYPE_RAW = 101
+LINKTYPE_LOOP = 108
+LINKTYPE_LINUX_SLL = 113
+LINKTYPE_IPV4 = 228
+LINKTYPE_IPV6 = 229
+LINKTYPE_LINUX_SLL2 = 276
+
+_RAW_IP_LINKTYPES = frozenset({
+    LINKTYPE_RAW_BSD, LINKTYPE_RAW_OPENBSD, LINKTYPE_RAW, LINKTYPE_IPV4, LINKTYPE_IPV6,
+})
+
+# Classic pcap magic -> (struct byte order, timestamp fraction scale)
+_PCAP_MAGICS = {
+    b"\xd4\xc3\xb2\xa1": ("<", 1e-6),
+    b"\xa1\xb2\xc3\xd4": (">", 1e-6),
+    b"\x4d\x3c\xb2\xa1": ("<", 1e-9),
+    b"\xa1\xb2\x3c\x4d": (">", 1e-9),
+}
+_PCAPNG_SHB = b"\x0a\x0d\x0d\x0a"
+
+_ETHERTYPE_IPV4 = 0x0800
+_ETHERTYPE_IPV6 = 0x86DD
+_ETHERTYPE_VLAN = (0x8100, 0x88A8)
+
+_IPPROTO_TCP = 6
+_IPPROTO_UDP = 17
+_IPV6_EXTENSION_HEADERS = (0, 43, 60)
+_IPV6_FRAGMENT_HEADER = 44
+
+_HTTP_METHODS = (
+    b"GET ", b"POST ", b"PUT ", b"HEAD ", b"DELETE ", b"PATCH ", b"OPTIONS ", b"CONNECT ",
+)
+_HTTP_FIRST_BYTES = frozenset(method[0] for method in _HTTP_METHODS)
+_HTTP_HEADER_LIMIT = 8192
+
+_TLS_HANDSHAKE = 0x16
+_TLS_CLIENT_HELLO = 0x01
+
+# Already-parsed pages of the mapping are dropped from the resident set in
+# chunks of this size, so RSS does not grow to the size of the capture.
+_RELEASE_CHUNK = 64 * 1024 * 1024
+
 
 class DpktPcapParser(PcapParser):
     MAX_REQUESTS = 1000
@@ -55,3 +107,534 @@ class DpktPcapParser(PcapParser):
             return []
 
         return requests
+
+
+class StreamingPcapParser(PcapParser):
+    """Streaming parser for pcap and pcapng captures.
+
+    The capture is memory-mapped and walked record by record. Only payloads
+    that can hold an HTTP request line, a TLS ClientHello or DNS are copied
+    out of the mapping, and all cross-packet state (ClientHellos split over
+    segments, DNS queries awaiting answers, IP -> hostname) is LRU-bounded,
+    so memory stays flat regardless of capture size and there is no cap on
+    the number of requests.
+
+    Supported link types: Ethernet (incl. VLAN tags), Linux cooked v1/v2,
+    raw IPv4/IPv6 and BSD loopback, i.e. everything PCAPdroid writes.
+    """
+
+    MAX_PENDING_HELLOS = 1024
+    MAX_HELLO_BYTES = 16 * 1024
+    MAX_PENDING_DNS = 4096
+    MAX_DNS_CACHE = 65536
+
+    def parse(self, pcap_path: str) -> list[NetworkRequest]:
+        return list(self.iter_requests(pcap_path))
+
+    def iter_requests(self, pcap_path: str) -> Iterator[NetworkRequest]:
+        """Yield requests in capture order (DNS lookups once answered).
+
+        Truncated trailing records, as left by a capture that is still being
+        written, end the iteration instead of raising.
+        """
+        try:
+            f = open(pcap_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file
+                return
+            with buf:
+                yield from _TrafficExtractor(self).run(buf)
+
+
+def is_pcap_file_header(data: bytes) -> bool:
+    """Check whether ``data`` starts with a classic pcap file header."""
+    return len(data) >= 24 and bytes(data[:4]) in _PCAP_MAGICS
+
+
+class PcapStreamDecoder:
+    """Incremental decoder for classic pcap data that arrives in pieces.
+
+    :meth:`feed` accepts arbitrary chunks of a pcap file (e.g. the tail of a
+    capture that is still being written); :meth:`feed_record` accepts whole
+    records without a file header, as sent one or more per datagram by
+    PCAPdroid's UDP exporter. Requests are returned as soon as they can be
+    decoded; DNS lookups once their answer has arrived.
+    """
+
+    def __init__(self, parser: StreamingPcapParser | None = None, linktype: int = LINKTYPE_RAW):
+        """Initialize the decoder.
+
+        Args:
+            parser: Parser whose LRU limits apply (defaults to a new StreamingPcapParser)
+            linktype: Link type of header-less records until a file header is seen
+        """
+        self.linktype = linktype
+        self._extractor = _TrafficExtractor(parser or StreamingPcapParser())
+        self._buffer = bytearray()
+        self._header_seen = False
+        self._record = struct.Struct("<IIII")
+        self._scale = 1e-6
+
+    def feed(self, chunk: bytes) -> list[NetworkRequest]:
+        """Append a chunk of a pcap file and decode every complete record in it.
+
+        Raises:
+            ValueError: If the stream does not start with a pcap file header.
+        """
+        self._buffer.extend(chunk)
+        if not self._header_seen:
+            if len(self._buffer) < 24:
+                return []
+            if not self._read_header(bytes(self._buffer[:24])):
+                raise ValueError("Stream does not start with a pcap file header")
+            del self._buffer[:24]
+        consumed, requests = self._decode_records(self._buffer)
+        del self._buffer[:consumed]
+        return requests
+
+    def feed_record(self, data: bytes) -> list[NetworkRequest]:
+        """Decode one datagram holding pcap records, optionally led by a file header."""
+        if is_pcap_file_header(data):
+            self._read_header(data[:24])
+            data = data[24:]
+        return self._decode_records(data)[1]
+
+    def close(self) -> list[NetworkRequest]:
+        """Flush state kept across packets (unanswered DNS, partial ClientHellos)."""
+        return list(self._extractor.flush())
+
+    def _read_header(self, header: bytes) -> bool:
+        params = _PCAP_MAGICS.get(header[:4])
+        if params is None:
+            return False
+        endian, self._scale = params
+        self._record = struct.Struct(endian + "IIII")
+        self.linktype = struct.unpack_from(endian + "I", header, 20)[0] & 0x0FFFFFFF
+        self._header_seen = True
+        return True
+
+    def _decode_records(self, data) -> tuple[int, list[NetworkRequest]]:
+        requests: list[NetworkRequest] = []
+        offset = 0
+        while offset + 16 <= len(data):
+            seconds, fraction, captured, _ = self._record.unpack_from(data, offset)
+            end = offset + 16 + captured
+            if end > len(data):
+                break
+            frame = bytes(data[offset + 16:end])
+            requests.extend(
+                self._extractor.feed(frame, seconds + fraction * self._scale, self.linktype, 0, len(frame))
+            )
+            offset = end
+        return offset, requests
+
+
+def iter_packets(buf) -> Iterator[tuple[float, int, int, int]]:
+    """Yield ``(timestamp, linktype, start, end)`` for each packet in a pcap/pcapng buffer."""
+    magic = bytes(buf[:4])
+    if magic in _PCAP_MAGICS:
+        yield from _iter_pcap(buf, *_PCAP_MAGICS[magic])
+    elif magic == _PCAPNG_SHB:
+        yield from _iter_pcapng(buf)
+
+
+def _iter_pcap(buf, endian: str, scale: float) -> Iterator[tuple[float, int, int, int]]:
+    if len(buf) < 24:
+        return
+    # Upper bits of the linktype field carry FCS metadata
+    linktype = struct.unpack_from(endian + "I", buf, 20)[0] & 0x0FFFFFFF
+    record = struct.Struct(endian + "IIII")
+    offset = 24
+    size = len(buf)
+    while offset + 16 <= size:
+        seconds, fraction, captured, _ = record.unpack_from(buf, offset)
+        offset += 16
+        end = offset + captured
+        if end > size:
+            return
+        yield seconds + fraction * scale, linktype, offset, end
+        offset = end
+
+
+def _iter_pcapng(buf) -> Iterator[tuple[float, int, int, int]]:
+    size = len(buf)
+    offset = 0
+    endian = "<"
+    interfaces: list[tuple[int, float]] = []
+    last_ts = 0.0
+    while offset + 12 <= size:
+        if buf[offset:offset + 4] == _PCAPNG_SHB:
+            endian = "<" if buf[offset + 8:offset + 12] == b"\x4d\x3c\x2b\x1a" else ">"
+            interfaces = []
+        block_type, block_len = struct.unpack_from(endian + "II", buf, offset)
+        if block_len < 12 or offset + block_len > size:
+            return
+        body = offset + 8
+        body_end = offset + block_len - 4
+
+        if block_type == 1:
+            # Interface Description Block
+            linktype = struct.unpack_from(endian + "H", buf, body)[0]
+            interfaces.append((linktype, _pcapng_ts_scale(buf, body + 8, body_end, endian)))
+        elif block_type == 6 and body + 20 <= body_end:
+            # Enhanced Packet Block
+            iface, ts_high, ts_low, captured, _ = struct.unpack_from(endian + "IIIII", buf, body)
+            if iface < len(interfaces):
+                linktype, scale = interfaces[iface]
+                last_ts = ((ts_high << 32) | ts_low) * scale
+                data = body + 20
+                yield last_ts, linktype, data, min(data + captured, body_end)
+        elif block_type == 3 and interfaces and body + 4 <= body_end:
+            # Simple Packet Block (no timestamp; reuse the previous one)
+            original = struct.unpack_from(endian + "I", buf, body)[0]
+            data = body + 4
+            yield last_ts, interfaces[0][0], data, min(data + original, body_end)
+        elif block_type == 2 and body + 20 <= body_end:
+            # Obsolete Packet Block
+            iface, _, ts_high, ts_low, captured, _ = struct.unpack_from(endian + "HHIIII", buf, body)
+            if iface < len(interfaces):
+                linktype, scale = interfaces[iface]
+                last_ts = ((ts_high << 32) | ts_low) * scale
+                data = body + 20
+                yield last_ts, linktype, data, min(data + captured, body_end)
+
+        offset += block_len
+
+
+def _pcapng_ts_scale(buf, offset: int, end: int, endian: str) -> float:
+    """Read if_tsresol from IDB options (default microseconds)."""
+    while offset + 4 <= end:
+        code, length = struct.unpack_from(endian + "HH", buf, offset)
+        if code == 0:
+            break
+        if code == 9 and length >= 1:
+            resolution = buf[offset + 4]
+            if resolution & 0x80:
+                return 2.0 ** -(resolution & 0x7F)
+            return 10.0 ** -resolution
+        offset += 4 + ((length + 3) & ~3)
+    return 1e-6
+
+
+def _ip_offset(buf, linktype: int, start: int, end: int) -> int | None:
+    """Return the offset of the IP header inside a link-layer frame."""
+    if linktype in _RAW_IP_LINKTYPES:
+        return start
+    if linktype == LINKTYPE_ETHERNET:
+        if end - start < 14:
+            return None
+        ethertype = struct.unpack_from(">H", buf, start + 12)[0]
+        offset = start + 14
+        while ethertype in _ETHERTYPE_VLAN and offset + 4 <= end:
+            ethertype = struct.unpack_from(">H", buf, offset + 2)[0]
+            offset += 4
+        return offset if ethertype in (_ETHERTYPE_IPV4, _ETHERTYPE_IPV6) else None
+    if linktype == LINKTYPE_LINUX_SLL:
+        if end - start < 16:
+            return None
+        protocol = struct.unpack_from(">H", buf, start + 14)[0]
+        return start + 16 if protocol in (_ETHERTYPE_IPV4, _ETHERTYPE_IPV6) else None
+    if linktype == LINKTYPE_LINUX_SLL2:
+        if end - start < 20:
+            return None
+        protocol = struct.unpack_from(">H", buf, start)[0]
+        return start + 20 if protocol in (_ETHERTYPE_IPV4, _ETHERTYPE_IPV6) else None
+    if linktype in (LINKTYPE_NULL, LINKTYPE_LOOP):
+        return start + 4 if end - start > 4 else None
+    return None
+
+
+def _client_hello_sni(data: bytes) -> tuple[bool, str | None]:
+    """Extract the SNI from bytes starting at a TLS handshake record.
+
+    Returns:
+        ``(complete, sni)``. ``complete`` is False when the ClientHello is cut
+        off before the server_name extension could be read, i.e. more TCP
+        payload is needed.
+    """
+    if len(data) < 9:
+        return False, None
+    if data[0] != _TLS_HANDSHAKE or data[5] != _TLS_CLIENT_HELLO:
+        return True, None
+    hello_len = int.from_bytes(data[6:9], "big")
+    body = data[9:9 + hello_len]
+    truncated = len(body) < hello_len
+
+    # client_version(2) + random(32), then session_id, cipher_suites, compression_methods
+    pos = 34
+    if len(body) < pos + 1:
+        return not truncated, None
+    pos += 1 + body[pos]
+    if len(body) < pos + 2:
+        return not truncated, None
+    pos += 2 + int.from_bytes(body[pos:pos + 2], "big")
+    if len(body) < pos + 1:
+        return not truncated, None
+    pos += 1 + body[pos]
+    if len(body) < pos + 2:
+        return not truncated, None
+    extensions_end = pos + 2 + int.from_bytes(body[pos:pos + 2], "big")
+    pos += 2
+
+    while pos + 4 <= min(extensions_end, len(body)):
+        ext_type, ext_len = struct.unpack_from(">HH", body, pos)
+        pos += 4
+        if ext_type == 0:
+            if pos + ext_len > len(body):
+                return False, None
+            entry = pos + 2
+            while entry + 3 <= pos + ext_len:
+                name_type = body[entry]
+                name_len = int.from_bytes(body[entry + 1:entry + 3], "big")
+                if name_type == 0:
+                    name = body[entry + 3:entry + 3 + name_len]
+                    return True, name.decode("ascii", "replace").lower()
+                entry += 3 + name_len
+            return True, None
+        pos += ext_len
+    return not truncated, None
+
+
+def _parse_http_request(payload: bytes) -> tuple[str, str, str, str] | None:
+    """Parse ``(method, target, version, host)`` from the start of an HTTP/1.x request."""
+    line_end = payload.find(b"\r\n")
+    if line_end == -1:
+        return None
+    parts = payload[:line_end].split(b" ")
+    if len(parts) != 3 or not parts[2].startswith(b"HTTP/"):
+        return None
+    host = ""
+    headers_end = payload.find(b"\r\n\r\n", line_end)
+    for line in payload[line_end + 2:headers_end if headers_end != -1 else None].split(b"\r\n"):
+        name, sep, value = line.partition(b":")
+        if sep and name.strip().lower() == b"host":
+            host = value.strip().decode("ascii", "replace")
+            break
+    return (
+        parts[0].decode("ascii", "replace"),
+        parts[1].decode("ascii", "replace"),
+        parts[2][5:].decode("ascii", "replace"),
+        host,
+    )
+
+
+def _format_address(raw: bytes) -> str:
+    return socket.inet_ntop(socket.AF_INET if len(raw) == 4 else socket.AF_INET6, raw)
+
+
+class _TrafficExtractor:
+    """Per-capture state for :class:`StreamingPcapParser`."""
+
+    def __init__(self, parser: StreamingPcapParser):
+        self._parser = parser
+        # flow -> (first segment timestamp, dst address, dst port, buffered bytes)
+        self._pending_hellos: OrderedDict[tuple, tuple[float, bytes, int, bytearray]] = OrderedDict()
+        # (dns id, client address, client port) -> (timestamp, qname, resolver address, query size)
+        self._pending_dns: OrderedDict[tuple, tuple[float, str, bytes, int]] = OrderedDict()
+        # resolved address -> hostname the app asked for
+        self._dns_names: OrderedDict[bytes, str] = OrderedDict()
+
+    def run(self, buf) -> Iterator[NetworkRequest]:
+        release = getattr(buf, "madvise", None) if hasattr(mmap, "MADV_DONTNEED") else None
+        released = 0
+        for ts, linktype, start, end in iter_packets(buf):
+            if release is not None and end - released >= _RELEASE_CHUNK:
+                upto = start - start % mmap.PAGESIZE
+                release(mmap.MADV_DONTNEED, released, upto - released)
+                released = upto
+            yield from self.feed(buf, ts, linktype, start, end)
+        yield from self.flush()
+
+    def feed(self, buf, ts: float, linktype: int, start: int, end: int) -> Iterator[NetworkRequest]:
+        """Decode one link-layer frame ``buf[start:end]``."""
+        ip_offset = _ip_offset(buf, linktype, start, end)
+        if ip_offset is None or ip_offset >= end:
+            return
+        yield from self._handle_ip(buf, ts, ip_offset, end)
+
+    def flush(self) -> Iterator[NetworkRequest]:
+        """Emit unanswered DNS queries and incomplete ClientHellos."""
+        for ts, qname, resolver, size in self._pending_dns.values():
+            yield self._dns_request(ts, qname, resolver, [], size)
+        for ts, dst, dport, data in self._pending_hellos.values():
+            yield self._tls_request(ts, dst, dport, _client_hello_sni(bytes(data))[1], len(data))
+        self._pending_dns.clear()
+        self._pending_hellos.clear()
+
+    def _handle_ip(self, buf, ts: float, offset: int, end: int) -> Iterator[NetworkRequest]:
+        version = buf[offset] >> 4
+        if version == 4:
+            if offset + 20 > end:
+                return
+            header_len = (buf[offset] & 0x0F) * 4
+            total_len, frag = struct.unpack_from(">H2xH", buf, offset + 2)
+            if frag & 0x1FFF:
+                # Non-first fragment: no transport header
+                return
+            protocol = buf[offset + 9]
+            src = buf[offset + 12:offset + 16]
+            dst = buf[offset + 16:offset + 20]
+            l4 = offset + header_len
+            if total_len:
+                end = min(end, offset + total_len)
+        elif version == 6:
+            if offset + 40 > end:
+                return
+            payload_len = struct.unpack_from(">H", buf, offset + 4)[0]
+            protocol = buf[offset + 6]
+            src = buf[offset + 8:offset + 24]
+            dst = buf[offset + 24:offset + 40]
+            l4 = offset + 40
+            if payload_len:
+                end = min(end, l4 + payload_len)
+            while protocol in _IPV6_EXTENSION_HEADERS or protocol == _IPV6_FRAGMENT_HEADER:
+                if l4 + 8 > end:
+                    return
+                if protocol == _IPV6_FRAGMENT_HEADER:
+                    if struct.unpack_from(">H", buf, l4 + 2)[0] & 0xFFF8:
+                        return
+                    protocol = buf[l4]
+                    l4 += 8
+                else:
+                    protocol = buf[l4]
+                    l4 += (buf[l4 + 1] + 1) * 8
+        else:
+            return
+
+        if protocol == _IPPROTO_TCP:
+            yield from self._handle_tcp(buf, ts, src, dst, l4, end)
+        elif protocol == _IPPROTO_UDP:
+            yield from self._handle_udp(buf, ts, src, dst, l4, end)
+
+    def _handle_tcp(self, buf, ts, src, dst, offset, end) -> Iterator[NetworkRequest]:
+        if offset + 20 > end:
+            return
+        sport, dport = struct.unpack_from(">HH", buf, offset)
+        payload = offset + (buf[offset + 12] >> 4) * 4
+        if payload >= end:
+            return
+
+        flow = (src, sport, dst, dport)
+        pending = self._pending_hellos.get(flow)
+        if pending is not None:
+            pending[3].extend(buf[payload:end])
+            self._pending_hellos.move_to_end(flow)
+            complete, sni = _client_hello_sni(bytes(pending[3]))
+            if complete or len(pending[3]) >= self._parser.MAX_HELLO_BYTES:
+                del self._pending_hellos[flow]
+                yield self._tls_request(pending[0], dst, dport, sni, len(pending[3]))
+            return
+
+        first = buf[payload]
+        if first == _TLS_HANDSHAKE:
+            if payload + 6 > end or buf[payload + 5] != _TLS_CLIENT_HELLO:
+                return
+            data = buf[payload:min(end, payload + self._parser.MAX_HELLO_BYTES)]
+            complete, sni = _client_hello_sni(data)
+            if complete:
+                yield self._tls_request(ts, dst, dport, sni, len(data))
+                return
+            self._pending_hellos[flow] = (ts, dst, dport, bytearray(data))
+            if len(self._pending_hellos) > self._parser.MAX_PENDING_HELLOS:
+                _, (old_ts, old_dst, old_dport, old_data) = self._pending_hellos.popitem(last=False)
+                yield self._tls_request(
+                    old_ts, old_dst, old_dport, _client_hello_sni(bytes(old_data))[1], len(old_data)
+                )
+        elif first in _HTTP_FIRST_BYTES:
+            data = buf[payload:min(end, payload + _HTTP_HEADER_LIMIT)]
+            if not data.startswith(_HTTP_METHODS):
+                return
+            parsed = _parse_http_request(data)
+            if parsed is None:
+                return
+            method, target, version, host = parsed
+            host = host or self._host_for(dst)
+            url = target if "://" in target else f"http://{host}{target}"
+            yield NetworkRequest(
+                timestamp=datetime.fromtimestamp(ts),
+                method=method,
+                url=url,
+                host=host,
+                protocol=f"HTTP/{version}",
+                dst_ip=_format_address(dst),
+                dst_port=dport,
+                size_bytes=end - payload,
+            )
+
+    def _handle_udp(self, buf, ts, src, dst, offset, end) -> Iterator[NetworkRequest]:
+        if offset + 8 > end:
+            return
+        sport, dport = struct.unpack_from(">HH", buf, offset)
+        if sport != 53 and dport != 53:
+            return
+        try:
+            dns = dpkt.dns.DNS(buf[offset + 8:end])
+            size = end - offset - 8
+        except (dpkt.dpkt.Error, IndexError, ValueError, struct.error):
+            return
+        if not dns.qd:
+            return
+        qname = dns.qd[0].name.lower()
+
+        if dns.qr == dpkt.dns.DNS_Q:
+            self._pending_dns[(dns.id, src, sport)] = (ts, qname, dst, size)
+            if len(self._pending_dns) > self._parser.MAX_PENDING_DNS:
+                _, (old_ts, old_qname, old_resolver, old_size) = self._pending_dns.popitem(last=False)
+                yield self._dns_request(old_ts, old_qname, old_resolver, [], old_size)
+            return
+
+        answers = []
+        for rr in dns.an:
+            if rr.type in (dpkt.dns.DNS_A, dpkt.dns.DNS_AAAA) and len(rr.rdata) in (4, 16):
+                answers.append(_format_address(rr.rdata))
+                self._remember_name(bytes(rr.rdata), qname)
+            elif rr.type == dpkt.dns.DNS_CNAME:
+                answers.append(rr.cname)
+        query = self._pending_dns.pop((dns.id, dst, dport), None)
+        if query is not None:
+            yield self._dns_request(query[0], qname, src, answers, query[3] + size)
+        else:
+            yield self._dns_request(ts, qname, src, answers, size)
+
+    def _remember_name(self, address: bytes, name: str) -> None:
+        self._dns_names[address] = name
+        self._dns_names.move_to_end(address)
+        if len(self._dns_names) > self._parser.MAX_DNS_CACHE:
+            self._dns_names.popitem(last=False)
+
+    def _host_for(self, address: bytes) -> str:
+        return self._dns_names.get(bytes(address)) or _format_address(address)
+
+    def _tls_request(self, ts: float, dst: bytes, dport: int, sni: str | None, size: int) -> NetworkRequest:
+        host = sni or self._host_for(dst)
+        return NetworkRequest(
+            timestamp=datetime.fromtimestamp(ts),
+            method="CONNECT",
+            url=f"https://{host}",
+            host=host,
+            protocol="TLS",
+            dst_ip=_format_address(dst),
+            dst_port=dport,
+            size_bytes=size,
+        )
+
+    @staticmethod
+    def _dns_request(
+        ts: float, qname: str, resolver: bytes, answers: list[str], size: int
+    ) -> NetworkRequest:
+        return NetworkRequest(
+            timestamp=datetime.fromtimestamp(ts),
+            method="DNS",
+            url=f"dns://{qname}",
+            host=qname,
+            protocol="DNS",
+            dst_ip=_format_address(resolver),
+            dst_port=53,
+            answers=answers,
+            size_bytes=size,
+        )
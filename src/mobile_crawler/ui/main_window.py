@@ -1,12 +1,14 @@
 """Main window for the mobile-crawler GUI application."""
 
+import importlib
 import logging
 import re
 import sys
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QIcon
@@ -24,9 +26,9 @@ from PySide6.QtWidgets import (
 from mobile_crawler.config.config_manager import ConfigManager
 from mobile_crawler.core.crawl_controller import CrawlController
 from mobile_crawler.core.crawl_state_machine import CrawlState
-from mobile_crawler.core.crawler_loop import CrawlerLoop
 from mobile_crawler.core.log_sinks import LogLevel, QLogHandler
 from mobile_crawler.core.stale_run_cleaner import StaleRunCleaner
+from mobile_crawler.domain.latency_sketch import EMPTY_SUMMARY, LatencySketch, LatencySummary
 from mobile_crawler.domain.models import ActionResult
 from mobile_crawler.domain.providers.registry import ProviderRegistry
 from mobile_crawler.domain.providers.vision_detector import VisionDetector
@@ -58,6 +60,9 @@ from mobile_crawler.ui.widgets.run_history_view import RunHistoryView
 from mobile_crawler.ui.widgets.settings_panel import SettingsPanel
 from mobile_crawler.ui.widgets.stats_dashboard import StatsDashboard
 
+if TYPE_CHECKING:
+    from mobile_crawler.core.crawler_loop import CrawlerLoop
+
 
 def _get_gui_icon_path() -> str:
     """Return the absolute path to the GUI/taskbar icon."""
@@ -98,7 +103,7 @@ class CrawlStatistics:
     unique_screen_hashes: set[str] = field(default_factory=set)
     total_screen_visits: int = 0
     ai_call_count: int = 0
-    ai_response_times_ms: list[float] = field(default_factory=list)
+    ai_response_times: LatencySketch = field(default_factory=LatencySketch)
     last_step_number: int = 0  # Track last seen step to avoid double counting
 
     # OCR timing
@@ -120,7 +125,10 @@ class CrawlStatistics:
     # OTel-sourced token counts (populated from StatsCollectorSpanProcessor)
     total_input_tokens: int = 0
     total_output_tokens: int = 0
-    otel_latencies_ms: list[float] = field(default_factory=list)  # per-call real latencies
+    otel_latency: LatencySummary = EMPTY_SUMMARY  # per-call real latencies
+
+    # Bounded latency sketches keyed by timing name ("action", "screenshot", "ocr", "phase.decide", ...)
+    latencies: dict[str, LatencySketch] = field(default_factory=dict)
 
     # CrawlerAgent-derived metrics
     tool_call_count: int = 0  # total tool calls observed
@@ -129,9 +137,21 @@ class CrawlStatistics:
 
     def avg_ai_response_time(self) -> float:
         """Calculate average AI response time in milliseconds."""
-        if not self.ai_response_times_ms:
-            return 0.0
-        return sum(self.ai_response_times_ms) / len(self.ai_response_times_ms)
+        return self.ai_response_times.mean
+
+    def record_latency(self, name: str, duration_ms: float) -> None:
+        """Add a timing sample to the named latency sketch."""
+        sketch = self.latencies.get(name)
+        if sketch is None:
+            sketch = self.latencies[name] = LatencySketch()
+        sketch.add(duration_ms)
+
+    def latency_summaries(self) -> dict[str, LatencySummary]:
+        """Percentile summaries for the LLM and every recorded timing."""
+        summaries = {name: sketch.summary() for name, sketch in self.latencies.items()}
+        # Prefer OTel real per-call latencies; fall back to recorded response times
+        summaries["llm"] = self.otel_latency if self.otel_latency.count else self.ai_response_times.summary()
+        return summaries
 
     def elapsed_seconds(self) -> float:
         """Calculate elapsed time since start in seconds."""
@@ -648,7 +668,7 @@ class MainWindow(QMainWindow):
             unique_screens=0,
         )
 
-    def _create_crawler_loop(self, config_manager: ConfigManager, run: Any) -> CrawlerLoop:
+    def _create_crawler_loop(self, config_manager: ConfigManager, run: Any) -> "CrawlerLoop":
         """Create crawler loop with all dependencies.
 
         Args:
@@ -660,6 +680,7 @@ class MainWindow(QMainWindow):
         """
         event_listeners = [self.signal_adapter]
 
+        from mobile_crawler.core.crawler_loop import CrawlerLoop
         from mobile_crawler.infrastructure.ai_interaction_repository import AIInteractionRepository
 
         ai_repo = AIInteractionRepository(self._services["database_manager"])
@@ -910,6 +931,7 @@ class MainWindow(QMainWindow):
         if self._current_stats and result.execution_time_ms > 0:
             self._current_stats.action_count += 1
             self._current_stats.action_total_time_ms += result.execution_time_ms
+            self._current_stats.record_latency("action", result.execution_time_ms)
             self._update_dashboard_stats()
 
     def _on_ocr_completed(self, run_id: int, step_number: int, duration_ms: float, element_count: int) -> None:
@@ -925,6 +947,7 @@ class MainWindow(QMainWindow):
         if self._current_stats:
             self._current_stats.ocr_operation_count += 1
             self._current_stats.ocr_total_time_ms += duration_ms
+            self._current_stats.record_latency("ocr", duration_ms)
             self._update_dashboard_stats()
 
     def _on_screenshot_timing(self, run_id: int, step_number: int, duration_ms: float) -> None:
@@ -939,12 +962,15 @@ class MainWindow(QMainWindow):
         if self._current_stats:
             self._current_stats.screenshot_count += 1
             self._current_stats.screenshot_total_time_ms += duration_ms
+            self._current_stats.record_latency("screenshot", duration_ms)
             self._update_dashboard_stats()
 
     def _on_step_phase_transition(self, run_id: int, step_number: int, from_phase: str, to_phase: str, duration_ms: float) -> None:
         """Handle step phase transition event — count transitions for stats."""
         if self._current_stats and self._current_stats.run_id == run_id:
             self._current_stats.phase_transition_count += 1
+            if duration_ms > 0:
+                self._current_stats.record_latency(f"phase.{from_phase}", duration_ms)
 
     def _on_step_completed(self, run_id: int, step_number: int, actions_count: int, duration_ms: float) -> None:
         """Handle step completed event.
@@ -1081,6 +1107,11 @@ class MainWindow(QMainWindow):
         self.ai_monitor_panel.set_timing_provider(
             self._services["step_phase_repository"].get_transitions_for_step
         )
+        from mobile_crawler.infrastructure.ai_interaction_repository import AIInteractionRepository
+
+        self.ai_monitor_panel.set_interaction_loader(
+            AIInteractionRepository(self._services["database_manager"]).get_ai_interaction
+        )
         self.ai_monitor_panel.show_step_details.connect(self._show_ai_step_details)
 
         tabs.addTab(self.log_viewer, "Logs")
@@ -1441,7 +1472,8 @@ class MainWindow(QMainWindow):
 
         # Track AI calls
         self._current_stats.ai_call_count += 1
-        self._current_stats.ai_response_times_ms.append(response_time)
+        if response_time > 0:
+            self._current_stats.ai_response_times.add(response_time)
 
         # Update dashboard
         self._update_dashboard_stats()
@@ -1456,12 +1488,8 @@ class MainWindow(QMainWindow):
             return
 
         stats = self._current_stats
-
-        # Prefer OTel real per-call latencies; fall back to recorded response times only
-        if stats.otel_latencies_ms:
-            avg_ai_ms = sum(stats.otel_latencies_ms) / len(stats.otel_latencies_ms)
-        else:
-            avg_ai_ms = stats.avg_ai_response_time()
+        latency_summaries = stats.latency_summaries()
+        avg_ai_ms = latency_summaries["llm"].mean
 
         self.stats_dashboard.update_stats(
             total_steps=stats.total_steps,
@@ -1488,6 +1516,7 @@ class MainWindow(QMainWindow):
             ),
             tool_error_count=stats.tool_error_count,
             phase_transition_count=stats.phase_transition_count,
+            latency_summaries=latency_summaries,
         )
 
     def _update_elapsed_time(self) -> None:
@@ -1506,7 +1535,7 @@ class MainWindow(QMainWindow):
             if span_stats is not None:
                 self._current_stats.total_input_tokens = span_stats.total_input_tokens
                 self._current_stats.total_output_tokens = span_stats.total_output_tokens
-                self._current_stats.otel_latencies_ms = span_stats.llm_latencies_ms
+                self._current_stats.otel_latency = span_stats.latency_summary
 
         self._update_dashboard_stats()
 
@@ -1613,6 +1642,23 @@ class MainWindow(QMainWindow):
         event.accept()
 
 
+# Modules needed only once a crawl starts; imported lazily by MainWindow
+CRAWL_ONLY_MODULES = ("mobile_crawler.core.crawler_loop",)
+
+
+def _preload_crawl_modules() -> None:
+    """Import crawl-only modules on a daemon thread without blocking the UI."""
+
+    def _load():
+        for module_name in CRAWL_ONLY_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                logging.getLogger(__name__).debug(f"Background import of {module_name} failed: {e}")
+
+    threading.Thread(target=_load, name="crawl-module-preload", daemon=True).start()
+
+
 def run():
     """Entry point for the GUI application."""
     _set_windows_app_user_model_id()
@@ -1629,6 +1675,10 @@ def run():
     window = MainWindow()
     window.showMaximized()
 
+    # Crawl-only modules (agent stack, LLM clients, tracing) load in the
+    # background once the window is up, so the first crawl starts quickly
+    QTimer.singleShot(0, _preload_crawl_modules)
+
     sys.exit(app.exec())
 
 
@@ -1,24 +1,29 @@
 """AI Monitor Panel widget for displaying AI interactions in real-time."""
 
 import base64
+import bisect
 import json
 import os
+import re
+from dataclasses import dataclass
 from datetime import datetime
 
-from PySide6.QtCore import Qt, QTimer, Signal, Slot
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPixmap
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QButtonGroup,
     QComboBox,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QRadioButton,
     QScrollArea,
+    QStyle,
+    QStyledItemDelegate,
     QTableWidget,
     QTableWidgetItem,
     QTextEdit,
@@ -28,131 +33,289 @@ from PySide6.QtWidgets import (
 
 from .json_tree_widget import JsonTreeWidget
 
+# Role returning the TimelineRow behind an index
+TimelineRowRole = Qt.ItemDataRole.UserRole + 1
+
+# Tokens longer than this are base64/digest noise rather than searchable words
+_MAX_TOKEN_LENGTH = 40
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class TimelineRow:
+    """Everything a collapsed timeline row paints; full bodies are not kept here."""
+    step_number: int
+    timestamp: datetime
+    status: str  # "pending", "success" or "failed"
+    metrics: str
+    prompt_preview: str
+    response_preview: str
+    error_message: str | None = None
+
+
+def _tokenize(text: str) -> set[str]:
+    return {token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) <= _MAX_TOKEN_LENGTH}
+
+
+class InteractionSearchIndex:
+    """In-memory inverted index from word tokens to step numbers.
+
+    Each query word matches steps containing a token that starts with it;
+    all words must match. Prefix lookups bisect a sorted vocabulary, so a
+    search costs O(log vocabulary + matches) instead of a scan over every
+    interaction's text.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, set[int]] = {}
+        self._vocabulary: list[str] = []
+        self._step_tokens: dict[int, set[str]] = {}
+
+    def add_text(self, step_number: int, text: str) -> None:
+        """Index additional text for a step."""
+        tokens = self._step_tokens.setdefault(step_number, set())
+        for token in _tokenize(text) - tokens:
+            tokens.add(token)
+            steps = self._postings.get(token)
+            if steps is None:
+                steps = self._postings[token] = set()
+                bisect.insort(self._vocabulary, token)
+            steps.add(step_number)
+
+    def search(self, query: str) -> set[int]:
+        """Return the steps matching every word of ``query``."""
+        words = sorted(_tokenize(query), key=len, reverse=True)
+        if not words:
+            return set(self._step_tokens)
+        result: set[int] | None = None
+        for word in words:
+            steps = self._prefix_matches(word)
+            result = steps if result is None else result & steps
+            if not result:
+                return set()
+        return result
+
+    def matches(self, step_number: int, query: str) -> bool:
+        """Check a single step against ``query`` without touching the postings."""
+        tokens = self._step_tokens.get(step_number, ())
+        return all(any(token.startswith(word) for token in tokens) for word in _tokenize(query))
+
+    def clear(self) -> None:
+        """Drop all indexed text."""
+        self._postings.clear()
+        self._vocabulary.clear()
+        self._step_tokens.clear()
+
+    def _prefix_matches(self, prefix: str) -> set[int]:
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\U0010ffff", lo=start)
+        if end - start == 1:
+            return set(self._postings[self._vocabulary[start]])
+        steps: set[int] = set()
+        for token in self._vocabulary[start:end]:
+            steps |= self._postings[token]
+        return steps
+
+
+class AIInteractionListModel(QAbstractListModel):
+    """Timeline rows in arrival order with status and search filtering.
+
+    Rows are updated in place when a pending request completes. The model
+    keeps the positions of rows passing the filter, so a search only walks
+    the matching steps handed to :meth:`set_filter`.
+    """
 
-class AIInteractionItem(QWidget):
-    """Custom widget for displaying a single AI interaction in the list."""
-
-    show_details_requested = Signal(int)  # Emits step_number
-
-    def __init__(self, step_number: int, timestamp: datetime, success: bool,
-                 latency_ms: float | None, tokens_in: int | None,
-                 tokens_out: int | None, error_message: str | None,
-                 prompt_preview: str, response_preview: str,
-                 full_prompt: str, full_response: str,
-                 parsed_actions: list[dict], pending: bool = False,
-                 timing_summary: dict | None = None, parent=None):
-        """Initialize AI interaction item.
+    def __init__(self, parent=None):
+        """Initialize the model.
 
         Args:
-            step_number: Step number in crawl
-            timestamp: When interaction occurred
-            success: Whether interaction succeeded
-            latency_ms: Response time in milliseconds
-            tokens_in: Input token count
-            tokens_out: Output token count
-            error_message: Error message if failed
-            prompt_preview: Truncated prompt preview
-            response_preview: Truncated response preview
-            full_prompt: Complete prompt text
-            full_response: Complete response text
-            parsed_actions: Parsed action details
-            pending: Whether interaction is still pending
-            parent: Parent widget
+            parent: Parent QObject
         """
         super().__init__(parent)
-        self.step_number = step_number
-        self.timestamp = timestamp
-        self.success = success
-        self.latency_ms = latency_ms
-        self.tokens_in = tokens_in
-        self.tokens_out = tokens_out
-        self.error_message = error_message
-        self.prompt_preview = prompt_preview
-        self.response_preview = response_preview
-        self.full_prompt = full_prompt
-        self.full_response = full_response
-        self.parsed_actions = parsed_actions
-        self.pending = pending
-        self.timing_summary = timing_summary or {}
-
-        self.expanded = False
-        self.list_item = None  # Will be set after creation
-        self._setup_ui()
+        self._rows: list[TimelineRow] = []
+        self._position: dict[int, int] = {}  # step_number -> index in _rows
+        self._visible: list[int] = []  # indexes into _rows, ascending
+        self._status = "all"
+        self._steps: set[int] | None = None
 
-    def _setup_ui(self):
-        """Set up the user interface."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
+    # --- Qt model interface -------------------------------------------------
 
-        # Header row with status, step, metrics, timestamp
-        header_layout = QHBoxLayout()
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._visible)
 
-        # Status indicator
-        status_label = QLabel()
-        if self.pending:
-            status_label.setText("○")
-            status_label.setStyleSheet("color: gray; font-weight: bold;")
-        elif self.success:
-            status_label.setText("✓")
-            status_label.setStyleSheet("color: green; font-weight: bold;")
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._visible):
+            return None
+        row = self._rows[self._visible[index.row()]]
+        if role == TimelineRowRole:
+            return row
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"Step {row.step_number}"
+        if role == Qt.ItemDataRole.UserRole:
+            return row.step_number
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return "Double-click to show details"
+        return None
+
+    # --- Updates ------------------------------------------------------------
+
+    def upsert(self, row: TimelineRow) -> QModelIndex | None:
+        """Add a row, or replace the row for the same step.
+
+        Returns:
+            The row's index if it is visible under the current filter
+        """
+        position = self._position.get(row.step_number)
+        if position is None:
+            position = len(self._rows)
+            self._position[row.step_number] = position
+            self._rows.append(row)
         else:
-            status_label.setText("✗")
-            status_label.setStyleSheet("color: red; font-weight: bold;")
-        header_layout.addWidget(status_label)
-
-        # Step number
-        step_label = QLabel(f"Step {self.step_number}")
-        step_label.setStyleSheet("font-weight: bold;")
-        header_layout.addWidget(step_label)
-
-        # Metrics
-        metrics_parts = []
-        step_duration_ms = self.timing_summary.get("total_step_duration_ms")
-        if step_duration_ms is not None:
-            metrics_parts.append(f"step {step_duration_ms / 1000:.1f}s")
-        if self.latency_ms is not None:
-            metrics_parts.append(f"AI {self.latency_ms/1000:.1f}s")
-        if self.tokens_in is not None and self.tokens_out is not None:
-            metrics_parts.append(f"{self.tokens_in}→{self.tokens_out}")
-        elif self.tokens_in is not None:
-            metrics_parts.append(f"{self.tokens_in}→?")
-        elif self.tokens_out is not None:
-            metrics_parts.append(f"?→{self.tokens_out}")
-
-        metrics_text = " | ".join(metrics_parts) if metrics_parts else ""
-        metrics_label = QLabel(metrics_text)
-        metrics_label.setStyleSheet("color: #666;")
-        header_layout.addWidget(metrics_label)
-
-        header_layout.addStretch()
+            self._rows[position] = row
+
+        visible_row = bisect.bisect_left(self._visible, position)
+        was_visible = visible_row < len(self._visible) and self._visible[visible_row] == position
+        accepted = self._accepts(row)
+        if accepted and was_visible:
+            index = self.index(visible_row)
+            self.dataChanged.emit(index, index)
+        elif accepted:
+            self.beginInsertRows(QModelIndex(), visible_row, visible_row)
+            self._visible.insert(visible_row, position)
+            self.endInsertRows()
+        elif was_visible:
+            self.beginRemoveRows(QModelIndex(), visible_row, visible_row)
+            del self._visible[visible_row]
+            self.endRemoveRows()
+        return self.index(visible_row) if accepted else None
+
+    def set_filter(self, status: str, steps: set[int] | None) -> None:
+        """Show rows with the given status whose step is in ``steps``.
 
-        # Timestamp
-        time_str = self.timestamp.strftime("%H:%M:%S")
-        time_label = QLabel(time_str)
-        time_label.setStyleSheet("color: #666;")
-        header_layout.addWidget(time_label)
+        Args:
+            status: "all", "success" or "failed"
+            steps: Steps matching the search, or None when not searching
+        """
+        self.beginResetModel()
+        self._status = status
+        self._steps = steps
+        if steps is None:
+            candidates = range(len(self._rows))
+        else:
+            candidates = sorted(self._position[s] for s in steps if s in self._position)
+        self._visible = [position for position in candidates if self._accepts(self._rows[position])]
+        self.endResetModel()
+
+    def add_search_match(self, step_number: int) -> None:
+        """Record that a step matches the active search (for rows added later)."""
+        if self._steps is not None:
+            self._steps.add(step_number)
+
+    def clear(self) -> None:
+        """Remove all rows and reset the filter."""
+        self.beginResetModel()
+        self._rows = []
+        self._position = {}
+        self._visible = []
+        self._status = "all"
+        self._steps = None
+        self.endResetModel()
+
+    def total_rows(self) -> int:
+        """Number of rows regardless of the filter."""
+        return len(self._rows)
+
+    def has_step(self, step_number: int) -> bool:
+        """Whether a row exists for the step, visible or not."""
+        return step_number in self._position
+
+    def _accepts(self, row: TimelineRow) -> bool:
+        if self._steps is not None and row.step_number not in self._steps:
+            return False
+        if self._status == "success":
+            return row.status == "success"
+        if self._status == "failed":
+            return row.status != "success"
+        return True
 
-        layout.addLayout(header_layout)
 
-        # Content preview (collapsed state)
-        preview_text = f"Prompt: {self.prompt_preview}\nResponse: {self.response_preview}"
-        self.preview_label = QLabel(preview_text)
-        self.preview_label.setWordWrap(True)
-        self.preview_label.setStyleSheet("margin-left: 20px;")
-        layout.addWidget(self.preview_label)
+class AIInteractionDelegate(QStyledItemDelegate):
+    """Paints a collapsed timeline row: status, step, metrics, time, previews.
 
-        # Show Details button
-        self.expand_button = QPushButton("Show Details")
-        self.expand_button.clicked.connect(lambda: self.show_details_requested.emit(self.step_number))
-        layout.addWidget(self.expand_button)
+    Every row has the same height so the view can use uniform item sizes.
+    """
 
-        # Error message (if any)
-        if self.error_message:
-            error_label = QLabel(f"Error: {self.error_message}")
-            error_label.setStyleSheet("color: red; font-style: italic;")
-            error_label.setWordWrap(True)
-            layout.addWidget(error_label)
+    _PADDING = 6
+    _STATUS_STYLE = {
+        "pending": ("○", QColor("gray")),
+        "success": ("✓", QColor("green")),
+        "failed": ("✗", QColor("red")),
+    }
 
+    # Header, prompt, response and an error line (left blank without an error)
+    _LINES = 4
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self._LINES * QFontMetrics(option.font).height() + 2 * self._PADDING)
+
+    def paint(self, painter, option, index) -> None:
+        row = index.data(TimelineRowRole)
+        if row is None:
+            return super().paint(painter, option, index)
+
+        style = option.widget.style() if option.widget else None
+        if style is not None:
+            style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+
+        painter.save()
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        text_color = option.palette.highlightedText().color() if selected else option.palette.text().color()
+        muted = text_color if selected else QColor("#666")
+        metrics = QFontMetrics(option.font)
+        line_height = metrics.height()
+        rect = option.rect.adjusted(self._PADDING, self._PADDING, -self._PADDING, -self._PADDING)
+        x, y = rect.left(), rect.top()
+
+        # Header: status glyph, step, metrics ... timestamp
+        glyph, glyph_color = self._STATUS_STYLE.get(row.status, self._STATUS_STYLE["failed"])
+        bold = QFont(option.font)
+        bold.setBold(True)
+        painter.setFont(bold)
+        painter.setPen(glyph_color)
+        painter.drawText(QRect(x, y, line_height, line_height), Qt.AlignmentFlag.AlignLeft, glyph)
+        x += line_height + 4
+        painter.setPen(text_color)
+        step_text = f"Step {row.step_number}"
+        painter.drawText(QRect(x, y, rect.width(), line_height), Qt.AlignmentFlag.AlignLeft, step_text)
+        x += QFontMetrics(bold).horizontalAdvance(step_text) + 8
+
+        painter.setFont(option.font)
+        painter.setPen(muted)
+        time_text = row.timestamp.strftime("%H:%M:%S")
+        time_width = metrics.horizontalAdvance(time_text)
+        painter.drawText(QRect(rect.right() - time_width, y, time_width, line_height),
+                         Qt.AlignmentFlag.AlignRight, time_text)
+        metrics_width = max(0, rect.right() - time_width - 8 - x)
+        painter.drawText(QRect(x, y, metrics_width, line_height), Qt.AlignmentFlag.AlignLeft,
+                         metrics.elidedText(row.metrics, Qt.TextElideMode.ElideRight, metrics_width))
+
+        # Previews, indented under the header
+        indent = rect.left() + 20
+        width = rect.right() - indent
+        painter.setPen(text_color)
+        for line_number, text in enumerate((f"Prompt: {row.prompt_preview}", f"Response: {row.response_preview}"), 1):
+            painter.drawText(QRect(indent, y + line_number * line_height, width, line_height),
+                             Qt.AlignmentFlag.AlignLeft,
+                             metrics.elidedText(text.replace("\n", " "), Qt.TextElideMode.ElideRight, width))
+
+        if row.error_message:
+            italic = QFont(option.font)
+            italic.setItalic(True)
+            painter.setFont(italic)
+            painter.setPen(QColor("red"))
+            painter.drawText(QRect(indent, y + 3 * line_height, width, line_height), Qt.AlignmentFlag.AlignLeft,
+                             metrics.elidedText(f"Error: {row.error_message}", Qt.TextElideMode.ElideRight, width))
+        painter.restore()
 
 
 class StepDetailWidget(QWidget):
@@ -478,7 +641,14 @@ class StepDetailWidget(QWidget):
 
 
 class AIMonitorPanel(QWidget):
-    """Widget for monitoring AI interactions in real-time."""
+    """Widget for monitoring AI interactions in real-time.
+
+    The timeline is a ``QListView`` over :class:`AIInteractionListModel`
+    painted by :class:`AIInteractionDelegate`, so long runs cost one small
+    row record per step rather than a widget tree. With an interaction
+    loader set, prompt and response bodies are dropped once a step
+    completes and re-read from ``ai_interactions`` when its details open.
+    """
 
     show_step_details = Signal(int, datetime, bool, str, str, list, object, str, object)  # step_number, timestamp, success, prompt, response, actions, error_msg, screenshot_path, timing_data
 
@@ -492,12 +662,23 @@ class AIMonitorPanel(QWidget):
         self._interactions = {}  # step_number -> interaction data
         self._filter_state = {"status": "all", "search": ""}
         self._timing_provider = None
+        self._interaction_loader = None
+        self._search_index = InteractionSearchIndex()
+        self._model = AIInteractionListModel(self)
         self._setup_ui()
 
     def set_timing_provider(self, provider) -> None:
         """Set a callback returning phase transitions for (run_id, step_number)."""
         self._timing_provider = provider
 
+    def set_interaction_loader(self, loader) -> None:
+        """Set a callback returning the stored AIInteraction for (run_id, step_number).
+
+        When set, completed steps keep only their timeline row and search
+        tokens in memory; bodies are loaded through it on demand.
+        """
+        self._interaction_loader = loader
+
     @Slot(int, int, str)
     def add_screenshot_path(self, run_id: int, step_number: int, screenshot_path: str):
         """Store screenshot path for a step.
@@ -555,9 +736,16 @@ class AIMonitorPanel(QWidget):
         controls_layout.addStretch()
         monitor_layout.addLayout(controls_layout)
 
-        # Interactions list
-        self.interactions_list = QListWidget()
+        # Interactions timeline (double-click or Enter opens details)
+        self.interactions_list = QListView()
+        self.interactions_list.setModel(self._model)
+        self.interactions_list.setItemDelegate(AIInteractionDelegate(self.interactions_list))
+        self.interactions_list.setUniformItemSizes(True)
+        self.interactions_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.interactions_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.interactions_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.interactions_list.setMinimumHeight(400)
+        self.interactions_list.activated.connect(self._on_row_activated)
         monitor_layout.addWidget(self.interactions_list)
 
         layout.addWidget(monitor_group)
@@ -597,8 +785,10 @@ class AIMonitorPanel(QWidget):
         if "timestamp" not in interaction:
             interaction["timestamp"] = datetime.now()
 
-        # Create pending list item
-        self._add_list_item(step_number, pending=True)
+        self._search_index.add_text(step_number, _searchable_prompt(_prompt_text(request_data)))
+
+        # Show as pending
+        self._upsert_row(step_number, pending=True)
 
     @Slot(int, int, dict)
     def add_response(self, run_id: int, step_number: int, response_data: dict):
@@ -623,15 +813,27 @@ class AIMonitorPanel(QWidget):
         interaction["response_data"] = response_data
         interaction["success"] = self._determine_success(response_data)
         interaction["error_message"] = response_data.get("error_message")
+        interaction["latency_ms"] = response_data.get("latency_ms")
+        interaction["tokens_input"] = response_data.get("tokens_input")
+        interaction["tokens_output"] = response_data.get("tokens_output")
 
         if is_full:
             interaction["_response_updated"] = True
 
-        # Update or replace list item
-        self._update_list_item(step_number)
+        self._search_index.add_text(step_number, _response_text(response_data))
 
-    def _add_list_item(self, step_number: int, pending: bool = False):
-        """Add or update list item for step.
+        # Update the row in place
+        self._upsert_row(step_number, pending=False)
+
+        # The service persists the interaction before emitting the response,
+        # so the bodies can be re-read from the database from now on.
+        if self._interaction_loader is not None:
+            interaction["request_data"] = None
+            interaction["response_data"] = None
+            interaction["_bodies_released"] = True
+
+    def _upsert_row(self, step_number: int, pending: bool = False):
+        """Build the timeline row for a step and add or update it in the model.
 
         Args:
             step_number: Step number
@@ -641,71 +843,12 @@ class AIMonitorPanel(QWidget):
         if not interaction:
             return
 
-        # Create item data
-        timestamp = interaction["timestamp"]
-        success = interaction.get("success", False) if not pending else False
-        latency_ms = interaction.get("latency_ms")
-        tokens_in = interaction.get("tokens_input")
-        tokens_out = interaction.get("tokens_output")
-        error_message = interaction.get("error_message")
-        timing_data = self._get_timing_data(
-            interaction.get("run_id"),
-            step_number,
-        )
-
-        # Extract prompt and response previews
         request_data = interaction.get("request_data") or {}
         response_data = interaction.get("response_data") or {}
-
-        prompt_text = ""
-        if "user_prompt" in request_data:
-            prompt_text = request_data["user_prompt"]
-        elif "prompt" in request_data:
-            prompt_text = request_data["prompt"]
-
-        # Filter base64 from prompt preview
-        prompt_preview_text = prompt_text
-        try:
-            prompt_data = json.loads(prompt_text)
-            if isinstance(prompt_data, dict) and 'screenshot' in prompt_data:
-                # Create preview without base64
-                preview_parts = []
-                for key, value in prompt_data.items():
-                    if key == 'screenshot':
-                        preview_parts.append(f"{key}: [Image]")
-                    elif isinstance(value, (list, dict)):
-                        preview_parts.append(f"{key}: {json.dumps(value)[:50]}...")
-                    else:
-                        preview_parts.append(f"{key}: {str(value)[:50]}")
-                prompt_preview_text = " | ".join(preview_parts)
-        except (json.JSONDecodeError, TypeError):
-            pass
-
-        # Parse actions if available
-        parsed_actions = []
-        if "actions" in response_data:
-            parsed_actions = response_data["actions"]
-        elif "parsed_response" in response_data:
-            try:
-                parsed = json.loads(response_data["parsed_response"])
-                if isinstance(parsed, dict) and "actions" in parsed:
-                    parsed_actions = parsed["actions"]
-                elif isinstance(parsed, list):
-                    parsed_actions = parsed
-            except (json.JSONDecodeError, KeyError):
-                pass
-
-        # Extract full response text
-        full_response = ""
-        if "response" in response_data:
-            full_response = response_data["response"]
-        elif "raw_response" in response_data:
-            full_response = response_data["raw_response"]
-        elif "parsed_response" in response_data:
-            full_response = response_data["parsed_response"]
+        parsed_actions = _parsed_actions(response_data)
 
         # Create response preview
-        response_preview_text = full_response
+        response_preview_text = _response_text(response_data)
         if parsed_actions:
             # Use first action for preview
             action = parsed_actions[0]
@@ -713,48 +856,46 @@ class AIMonitorPanel(QWidget):
             reasoning = action.get('reasoning', '')
             response_preview_text = f"{action_name}: {reasoning}"
 
-        # Create previews
-        prompt_preview = prompt_preview_text[:100] + "..." if len(prompt_preview_text) > 100 else prompt_preview_text
-        response_preview = response_preview_text[:100] + "..." if len(response_preview_text) > 100 else response_preview_text
-
-        # Create custom widget
-        item_widget = AIInteractionItem(
+        success = bool(interaction.get("success")) if not pending else False
+        row = TimelineRow(
             step_number=step_number,
-            timestamp=timestamp,
-            success=success,
-            latency_ms=latency_ms,
-            tokens_in=tokens_in,
-            tokens_out=tokens_out,
-            error_message=error_message,
-            prompt_preview=prompt_preview,
-            response_preview=response_preview,
-            full_prompt=prompt_text,
-            full_response=full_response,
-            parsed_actions=parsed_actions,
-            pending=pending,
-            timing_summary=timing_data,
+            timestamp=interaction["timestamp"],
+            status="pending" if pending else ("success" if success else "failed"),
+            metrics=self._metrics_text(interaction),
+            prompt_preview=_truncate(_prompt_preview(_prompt_text(request_data))),
+            response_preview=_truncate(response_preview_text),
+            error_message=interaction.get("error_message"),
         )
 
-        # Create list item
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(item_widget.sizeHint())
-
-        # Link widget to list item for size updates
-        item_widget.list_item = list_item
-
-        # Connect show details signal
-        item_widget.show_details_requested.connect(lambda sn: self._on_show_details(sn))
-
-        # Add to list
-        self.interactions_list.addItem(list_item)
-        self.interactions_list.setItemWidget(list_item, item_widget)
+        if self._filter_state["search"] and self._search_index.matches(step_number, self._filter_state["search"]):
+            self._model.add_search_match(step_number)
+        is_new = not self._model.has_step(step_number)
+        index = self._model.upsert(row)
 
         # Auto-scroll to latest entry
-        self.interactions_list.scrollToItem(list_item)
+        if index is not None and is_new:
+            self.interactions_list.scrollTo(index)
 
-        # Store reference for updates
-        interaction["_list_item"] = list_item
-        interaction["_item_widget"] = item_widget
+    def _metrics_text(self, interaction: dict) -> str:
+        """Format step duration, AI latency and token counts for the row header."""
+        timing_data = self._get_timing_data(interaction.get("run_id"), interaction["step_number"])
+        latency_ms = interaction.get("latency_ms")
+        tokens_in = interaction.get("tokens_input")
+        tokens_out = interaction.get("tokens_output")
+
+        metrics_parts = []
+        step_duration_ms = timing_data.get("total_step_duration_ms")
+        if step_duration_ms is not None:
+            metrics_parts.append(f"step {step_duration_ms / 1000:.1f}s")
+        if latency_ms is not None:
+            metrics_parts.append(f"AI {latency_ms/1000:.1f}s")
+        if tokens_in is not None and tokens_out is not None:
+            metrics_parts.append(f"{tokens_in}→{tokens_out}")
+        elif tokens_in is not None:
+            metrics_parts.append(f"{tokens_in}→?")
+        elif tokens_out is not None:
+            metrics_parts.append(f"?→{tokens_out}")
+        return " | ".join(metrics_parts)
 
     def _is_full_response(self, response_data: dict) -> bool:
         """Check if response_data contains full AI response (not just summary)."""
@@ -789,35 +930,6 @@ class AIMonitorPanel(QWidget):
         # Default to False
         return False
 
-    def _update_list_item(self, step_number: int):
-        """Update existing list item with response data.
-
-        Args:
-            step_number: Step number
-        """
-        interaction = self._interactions.get(step_number)
-        if not interaction:
-            return
-
-        # Remove old list item if it exists
-        old_list_item = interaction.get("_list_item")
-        old_widget = interaction.get("_item_widget")
-
-        if old_list_item:
-            row = self.interactions_list.row(old_list_item)
-            if row >= 0:
-                # Remove widget first, then item
-                self.interactions_list.removeItemWidget(old_list_item)
-                self.interactions_list.takeItem(row)
-            # Clear references
-            interaction["_list_item"] = None
-            interaction["_item_widget"] = None
-            if old_widget:
-                old_widget.deleteLater()
-
-        # Add updated item (not pending anymore)
-        self._add_list_item(step_number, pending=False)
-
     def _on_status_filter_changed(self, status_text: str):
         """Handle status filter change.
 
@@ -847,53 +959,42 @@ class AIMonitorPanel(QWidget):
         self._apply_filters()
 
     def _apply_filters(self):
-        """Apply current filters to visible items."""
-        status_filter = self._filter_state["status"]
-        search_text = self._filter_state["search"].lower()
+        """Apply current filters to the model.
 
-        for _step_number, interaction in self._interactions.items():
-            if "_list_item" not in interaction:
-                continue
-
-            list_item = interaction["_list_item"]
-            visible = True
-
-            # Status filter
-            if status_filter != "all":
-                success = interaction.get("success", False)
-                if status_filter == "success" and not success:
-                    visible = False
-                elif status_filter == "failed" and success:
-                    visible = False
-
-            # Search filter
-            if visible and search_text:
-                request_data = interaction.get("request_data", {})
-                response_data = interaction.get("response_data", {})
-
-                search_content = ""
-                if "user_prompt" in request_data:
-                    search_content += request_data["user_prompt"]
-                if "response" in response_data:
-                    search_content += response_data["response"]
-
-                if search_text not in search_content.lower():
-                    visible = False
+        The search is answered by the in-memory index, so only matching
+        steps are visited.
+        """
+        search_text = self._filter_state["search"].strip()
+        steps = self._search_index.search(search_text) if search_text else None
+        self._model.set_filter(self._filter_state["status"], steps)
 
-            list_item.setHidden(not visible)
+    def visible_steps(self) -> list[int]:
+        """Step numbers of the rows currently shown, in display order."""
+        return [
+            self._model.index(row).data(Qt.ItemDataRole.UserRole)
+            for row in range(self._model.rowCount())
+        ]
 
     def _on_clear_clicked(self):
         """Handle clear button click."""
         self._interactions.clear()
-        self.interactions_list.clear()
+        self._search_index.clear()
+        self._model.clear()
         self._filter_state = {"status": "all", "search": ""}
         self.status_filter.setCurrentText("All")
         self.search_input.clear()
+        self._search_timer.stop()
 
     def clear(self):
         """Clear all interactions."""
         self._on_clear_clicked()
 
+    def _on_row_activated(self, index: QModelIndex):
+        """Open the details of the activated timeline row."""
+        step_number = index.data(Qt.ItemDataRole.UserRole)
+        if step_number is not None:
+            self._on_show_details(step_number)
+
     def _on_show_details(self, step_number: int):
         """Handle show details request for a step.
 
@@ -904,47 +1005,13 @@ class AIMonitorPanel(QWidget):
         if not interaction:
             return
 
-        # Extract all data needed for detail view
-        timestamp = interaction["timestamp"]
-        success = interaction.get("success", False)
-        error_message = interaction.get("error_message")
-
-        request_data = interaction.get("request_data") or {}
-        response_data = interaction.get("response_data") or {}
-
-        prompt_text = ""
-        if "user_prompt" in request_data:
-            prompt_text = request_data["user_prompt"]
-        elif "prompt" in request_data:
-            prompt_text = request_data["prompt"]
-
-        response_text = ""
-        if "response" in response_data:
-            response_text = response_data["response"]
-        elif "raw_response" in response_data:
-            response_text = response_data["raw_response"]
-        elif "parsed_response" in response_data:
-            response_text = response_data["parsed_response"]
-
-        # Parse actions if available
-        parsed_actions = []
-        if "actions" in response_data:
-            parsed_actions = response_data["actions"]
-        elif "parsed_response" in response_data:
-            try:
-                parsed = json.loads(response_data["parsed_response"])
-                if isinstance(parsed, dict) and "actions" in parsed:
-                    parsed_actions = parsed["actions"]
-                elif isinstance(parsed, list):
-                    parsed_actions = parsed
-            except (json.JSONDecodeError, KeyError):
-                pass
+        prompt_text, response_text, parsed_actions, error_message = self._load_bodies(interaction)
 
         # Emit signal with all data
         self.show_step_details.emit(
             step_number,
-            timestamp,
-            success,
+            interaction["timestamp"],
+            interaction.get("success", False),
             prompt_text,
             response_text,
             parsed_actions,
@@ -953,6 +1020,39 @@ class AIMonitorPanel(QWidget):
             self._get_timing_data(interaction.get("run_id"), step_number),
         )
 
+    def _load_bodies(self, interaction: dict) -> tuple[str, str, list[dict], str | None]:
+        """Return (prompt, response, parsed actions, error) for a step.
+
+        Uses the in-memory request/response while they are held, and the
+        stored ai_interactions row once they have been released.
+        """
+        error_message = interaction.get("error_message")
+        if not interaction.get("_bodies_released"):
+            request_data = interaction.get("request_data") or {}
+            response_data = interaction.get("response_data") or {}
+            return (_prompt_text(request_data), _response_text(response_data),
+                    _parsed_actions(response_data), error_message)
+
+        try:
+            record = self._interaction_loader(interaction.get("run_id"), interaction["step_number"])
+        except Exception:
+            record = None
+        if record is None:
+            return "", "", [], error_message
+
+        try:
+            request_data = json.loads(record.request_json) if record.request_json else {}
+        except (json.JSONDecodeError, TypeError):
+            request_data = {"user_prompt": record.request_json}
+        response_data = {}
+        if record.response_raw is not None:
+            response_data["response"] = record.response_raw
+        if record.response_parsed_json:
+            response_data["parsed_response"] = record.response_parsed_json
+        return (_prompt_text(request_data if isinstance(request_data, dict) else {}),
+                _response_text(response_data), _parsed_actions(response_data),
+                record.error_message or error_message)
+
     def _get_timing_data(self, run_id: int | None, step_number: int) -> dict:
         if not run_id or not self._timing_provider:
             return {}
@@ -963,6 +1063,78 @@ class AIMonitorPanel(QWidget):
         return _build_timing_breakdown(transitions)
 
 
+def _prompt_text(request_data: dict) -> str:
+    """Extract the user prompt from request data."""
+    if "user_prompt" in request_data:
+        return request_data["user_prompt"]
+    if "prompt" in request_data:
+        return request_data["prompt"]
+    return ""
+
+
+def _response_text(response_data: dict) -> str:
+    """Extract the full response text from response data."""
+    if "response" in response_data:
+        return response_data["response"] or ""
+    if "raw_response" in response_data:
+        return response_data["raw_response"] or ""
+    if "parsed_response" in response_data:
+        return response_data["parsed_response"] or ""
+    return ""
+
+
+def _parsed_actions(response_data: dict) -> list[dict]:
+    """Extract parsed actions from response data, if any."""
+    if "actions" in response_data:
+        return response_data["actions"]
+    if "parsed_response" in response_data:
+        try:
+            parsed = json.loads(response_data["parsed_response"])
+            if isinstance(parsed, dict) and "actions" in parsed:
+                return parsed["actions"]
+            if isinstance(parsed, list):
+                return parsed
+        except (json.JSONDecodeError, KeyError, TypeError):
+            pass
+    return []
+
+
+def _prompt_preview(prompt_text: str) -> str:
+    """Summarize a JSON user prompt without its base64 screenshot."""
+    try:
+        prompt_data = json.loads(prompt_text)
+    except (json.JSONDecodeError, TypeError):
+        return prompt_text
+    if not isinstance(prompt_data, dict) or 'screenshot' not in prompt_data:
+        return prompt_text
+
+    preview_parts = []
+    for key, value in prompt_data.items():
+        if key == 'screenshot':
+            preview_parts.append(f"{key}: [Image]")
+        elif isinstance(value, (list, dict)):
+            preview_parts.append(f"{key}: {json.dumps(value)[:50]}...")
+        else:
+            preview_parts.append(f"{key}: {str(value)[:50]}")
+    return " | ".join(preview_parts)
+
+
+def _searchable_prompt(prompt_text: str) -> str:
+    """Return the prompt text to index, minus any embedded screenshot."""
+    try:
+        prompt_data = json.loads(prompt_text)
+    except (json.JSONDecodeError, TypeError):
+        return prompt_text
+    if isinstance(prompt_data, dict) and 'screenshot' in prompt_data:
+        prompt_data = {key: value for key, value in prompt_data.items() if key != 'screenshot'}
+        return json.dumps(prompt_data)
+    return prompt_text
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    return text[:limit] + "..." if len(text) > limit else text
+
+
 def _build_timing_breakdown(transitions) -> dict:
     """Build UI timing rows from StepPhaseTransition-like objects."""
     rows = []
@@ -1,28 +1,201 @@
 """Log viewer widget for mobile-crawler GUI."""
 
+import bisect
 import re
+from collections import deque
 from datetime import datetime
-from html import escape
 
-from PySide6.QtCore import Signal
-from PySide6.QtGui import QColor, QFont, QTextCursor
-from PySide6.QtWidgets import QComboBox, QGroupBox, QHBoxLayout, QLabel, QPushButton, QTextEdit, QVBoxLayout, QWidget
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QKeySequence, QShortcut
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QComboBox,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QListView,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
 
 from mobile_crawler.core.logging_service import LogLevel
 
+# One display line: (level order, rendered text, foreground color hex)
+LogRow = tuple[int, str, str]
+
+
+class LogRingBuffer:
+    """Fixed-capacity FIFO of display rows addressed by sequence number.
+
+    Row ``n`` is the ``n``-th row ever appended; once more than ``capacity``
+    rows have been appended the oldest are overwritten. Lookups by sequence
+    number are O(1), which keeps the list model cheap to query however
+    much history has scrolled through.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of rows retained
+        """
+        self.capacity = max(1, int(capacity))
+        self._items: list[LogRow | None] = [None] * self.capacity
+        self.first_seq = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def end_seq(self) -> int:
+        """Sequence number the next appended row will get."""
+        return self.first_seq + self._count
+
+    def append(self, row: LogRow) -> None:
+        """Append a row, overwriting the oldest one when full."""
+        self._items[self.end_seq % self.capacity] = row
+        if self._count == self.capacity:
+            self.first_seq += 1
+        else:
+            self._count += 1
+
+    def get(self, seq: int) -> LogRow:
+        """Return the row with the given sequence number (must still be retained)."""
+        return self._items[seq % self.capacity]
+
+    def clear(self) -> None:
+        """Drop all rows; sequence numbers keep increasing."""
+        self.first_seq = self.end_seq
+        self._count = 0
+        self._items = [None] * self.capacity
+
+
+class LogListModel(QAbstractListModel):
+    """List model over a :class:`LogRingBuffer` with a minimum-level filter.
+
+    The model keeps the sequence numbers of rows passing the filter, so
+    changing the filter is a scan over stored level numbers rather than a
+    re-render, and trimming old rows is a single row-removal at the top.
+    """
+
+    def __init__(self, capacity: int, parent=None):
+        """Initialize the model.
+
+        Args:
+            capacity: Maximum number of rows retained
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._buffer = LogRingBuffer(capacity)
+        self._min_order = 0
+        # Sequence numbers of visible rows; entries before _offset are trimmed
+        self._visible: list[int] = []
+        self._offset = 0
+        self._colors: dict[str, QColor] = {}
+
+    # --- Qt model interface -------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._visible) - self._offset
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self.rowCount():
+            return None
+        _, text, color = self._buffer.get(self._visible[self._offset + index.row()])
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == Qt.ItemDataRole.ForegroundRole:
+            qcolor = self._colors.get(color)
+            if qcolor is None:
+                qcolor = self._colors[color] = QColor(color)
+            return qcolor
+        return None
+
+    # --- Updates ------------------------------------------------------------
+
+    def append_rows(self, rows: list[LogRow]) -> None:
+        """Append rows, trimming the oldest beyond capacity.
+
+        Emits at most one removal (for trimmed rows) and one insertion.
+        """
+        if not rows:
+            return
+        rows = rows[-self._buffer.capacity:]
+        overflow = len(self._buffer) + len(rows) - self._buffer.capacity
+        if overflow > 0:
+            self._drop_visible_before(self._buffer.first_seq + overflow)
+
+        first_seq = self._buffer.end_seq
+        new_visible = []
+        for offset, row in enumerate(rows):
+            self._buffer.append(row)
+            if row[0] >= self._min_order:
+                new_visible.append(first_seq + offset)
+        if not new_visible:
+            return
+
+        first_row = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_visible) - 1)
+        self._visible.extend(new_visible)
+        self.endInsertRows()
+
+    def set_min_order(self, min_order: int) -> None:
+        """Show only rows whose level order is at least ``min_order``."""
+        self.beginResetModel()
+        self._min_order = min_order
+        buffer = self._buffer
+        self._visible = [
+            seq for seq in range(buffer.first_seq, buffer.end_seq) if buffer.get(seq)[0] >= min_order
+        ]
+        self._offset = 0
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.beginResetModel()
+        self._buffer.clear()
+        self._visible = []
+        self._offset = 0
+        self.endResetModel()
+
+    def row_text(self, row: int) -> str:
+        """Return the rendered text of a visible row."""
+        return self._buffer.get(self._visible[self._offset + row])[1]
+
+    def _drop_visible_before(self, first_kept_seq: int) -> None:
+        end = bisect.bisect_left(self._visible, first_kept_seq, lo=self._offset)
+        dropped = end - self._offset
+        if dropped > 0:
+            self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+            self._offset = end
+            self.endRemoveRows()
+        # Compact occasionally instead of slicing the list on every trim
+        if self._offset > len(self._visible) // 2:
+            self._visible = self._visible[self._offset:]
+            self._offset = 0
+
 
 class LogViewer(QWidget):
     """Widget for displaying real-time logs.
 
     Provides scrolling log display with level filtering, terminal-like
-    rich text formatting, color-coded levels, and clear functionality.
+    formatting, color-coded levels, and clear functionality.
 
-    Log entries are stored in memory so that changing the level
-    filter re-renders the visible set without losing history.
+    Log lines are kept in a fixed-capacity ring buffer behind a
+    ``QListView`` with uniform row heights, so only the visible rows are
+    ever painted. Appends are queued and classified in batches once per
+    event-loop tick, and changing the level filter re-filters the model
+    without re-rendering anything.
     """
 
-    # Maximum entries kept in memory to avoid unbounded growth
-    _MAX_ENTRIES = 5000
+    # Maximum display lines kept in memory to avoid unbounded growth
+    _CAPACITY = 50_000
+
+    # Maximum queued entries rendered per event-loop tick
+    _MAX_BATCH = 2_000
 
     # Signal emitted when logs are cleared
     logs_cleared = Signal()  # type: ignore
@@ -42,8 +215,8 @@ class LogViewer(QWidget):
             LogLevel.ERROR: 3,
             LogLevel.ACTION: 1,  # Same as INFO
         }
-        # Stored log entries: list of (LogLevel, timestamp_str, message)
-        self._entries: list[tuple[LogLevel, str, str]] = []
+        # Entries waiting for the next flush: (LogLevel, timestamp_str, message)
+        self._pending: deque[tuple[LogLevel, str, str]] = deque(maxlen=self._CAPACITY)
         self._theme = {
             "bg": "#0b0f14",
             "border": "#263241",
@@ -55,11 +228,12 @@ class LogViewer(QWidget):
             "action": "#5cc8ff",
             "warning": "#f4bd50",
             "error": "#ff6b6b",
-            "badge_bg": "#151d27",
-            "stdout": "#73808e",
-            "stderr": "#d68a58",
-            "source": "#aab7c4",
         }
+        self._model = LogListModel(self._CAPACITY, self)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -92,15 +266,22 @@ class LogViewer(QWidget):
         controls_layout.addStretch()
         log_layout.addLayout(controls_layout)
 
-        # Log text area
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setMinimumHeight(300)
-        self.log_text.setAcceptRichText(True)
-        self.log_text.setFont(QFont("Consolas", 9))
-        self.log_text.setStyleSheet(
+        # Log list (one row per display line)
+        self.log_list = QListView()
+        self.log_list.setModel(self._model)
+        self.log_list.setUniformItemSizes(True)
+        # Lay rows out incrementally; a full static relayout per insert is O(rows)
+        self.log_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.log_list.setBatchSize(1000)
+        self.log_list.setWordWrap(False)
+        self.log_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.log_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.log_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.log_list.setMinimumHeight(300)
+        self.log_list.setFont(QFont("Consolas", 9))
+        self.log_list.setStyleSheet(
             f"""
-            QTextEdit {{
+            QListView {{
                 background-color: {self._theme["bg"]};
                 color: {self._theme["text"]};
                 border: 1px solid {self._theme["border"]};
@@ -111,7 +292,9 @@ class LogViewer(QWidget):
             }}
             """
         )
-        log_layout.addWidget(self.log_text)
+        copy_shortcut = QShortcut(QKeySequence.StandardKey.Copy, self.log_list)
+        copy_shortcut.activated.connect(self.copy_selection)
+        log_layout.addWidget(self.log_list)
 
         log_group.setLayout(log_layout)
         layout.addWidget(log_group)
@@ -140,8 +323,8 @@ class LogViewer(QWidget):
     def _on_level_filter_changed(self, level_text: str):
         """Handle level filter dropdown change.
 
-        Updates the minimum level and re-renders all stored entries
-        so that the user immediately sees the effect of the filter.
+        Updates the minimum level and re-filters the stored lines so that
+        the user immediately sees the effect of the filter.
 
         Args:
             level_text: Selected level text
@@ -154,201 +337,133 @@ class LogViewer(QWidget):
             "ACTION": LogLevel.ACTION,
         }
         self._min_level = level_map.get(level_text, LogLevel.DEBUG)
-        self._rebuild_display()
+        self.flush()
+        self._model.set_min_order(self._level_order.get(self._min_level, 0))
+        self.log_list.scrollToBottom()
 
     def _on_clear_clicked(self):
         """Handle clear button click."""
-        self._entries.clear()
-        self.log_text.clear()
+        self.clear_logs()
         self.logs_cleared.emit()
 
     def append_log(self, level: LogLevel, message: str):
         """Append a log message to the viewer.
 
-        Stores the entry for re-filtering and appends to the display
-        if it passes the current level filter.
+        The entry is queued and rendered with any others that arrive
+        before control returns to the event loop.
 
         Args:
             level: Log level
             message: Log message
         """
         timestamp = datetime.now().strftime("%H:%M:%S")
+        self._pending.append((level, timestamp, message))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-        # Store the entry
-        self._entries.append((level, timestamp, message))
-
-        # Trim oldest entries if we exceed the maximum
-        if len(self._entries) > self._MAX_ENTRIES:
-            self._entries = self._entries[-self._MAX_ENTRIES:]
-            # Rebuild needed because we dropped entries
-            self._rebuild_display()
-            return
-
-        # Append to display only if it passes the filter
-        self._append_to_display(level, timestamp, message)
+    def flush(self):
+        """Render queued entries into the list.
 
-    def _append_to_display(self, level: LogLevel, timestamp: str, message: str):
-        """Append a single formatted entry to the text widget.
-
-        Args:
-            level: Log level
-            timestamp: Pre-formatted timestamp string
-            message: Log message text
+        At most ``_MAX_BATCH`` entries are rendered per call; the rest are
+        left for the next event-loop tick. The view follows new lines only
+        while it is scrolled to the bottom.
         """
-        level_order = self._level_order.get(level, 0)
-        min_order = self._level_order.get(self._min_level, 0)
-
-        if level_order < min_order:
+        if not self._pending:
             return
-
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-
-        cursor.insertHtml(self._format_entry_html(level, timestamp, message))
-        cursor.insertBlock()
-
-        # Auto-scroll to bottom
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
-
-    def _rebuild_display(self):
-        """Re-render all stored entries based on the current level filter.
-
-        Called when the filter level changes or when old entries are trimmed.
-        """
-        self.log_text.clear()
-
-        cursor = self.log_text.textCursor()
-        min_order = self._level_order.get(self._min_level, 0)
-
-        for level, timestamp, message in self._entries:
-            level_order = self._level_order.get(level, 0)
-            if level_order < min_order:
-                continue
-
-            cursor.insertHtml(self._format_entry_html(level, timestamp, message))
-            cursor.insertBlock()
-
-        # Scroll to bottom after rebuild
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
-
-    def _format_entry_html(self, level: LogLevel, timestamp: str, message: str) -> str:
-        """Build the rich HTML representation for one stored log entry."""
+        rows: list[LogRow] = []
+        for _ in range(min(len(self._pending), self._MAX_BATCH)):
+            rows.extend(self._format_entry_rows(*self._pending.popleft()))
+
+        scrollbar = self.log_list.verticalScrollBar()
+        follow = scrollbar.value() >= scrollbar.maximum()
+        self._model.append_rows(rows)
+        if follow:
+            self.log_list.scrollToBottom()
+
+        if self._pending:
+            self._flush_timer.start()
+
+    def visible_text(self) -> str:
+        """Return the lines that pass the current filter, newline-separated."""
+        self.flush()
+        return "\n".join(self._model.row_text(row) for row in range(self._model.rowCount()))
+
+    def copy_selection(self):
+        """Copy the selected lines to the clipboard."""
+        rows = sorted(index.row() for index in self.log_list.selectionModel().selectedRows())
+        if rows:
+            QApplication.clipboard().setText("\n".join(self._model.row_text(row) for row in rows))
+
+    def _format_entry_rows(self, level: LogLevel, timestamp: str, message: str) -> list[LogRow]:
+        """Build the display lines for one log entry."""
         display_message = re.sub(r"^\s*\[(stdout|stderr)\]\s*", "", message, flags=re.IGNORECASE)
         classification = self._classify_message(level, message)
         lines = display_message.splitlines() or [""]
-        first_line = lines[0]
-        continuation_lines = lines[1:]
+        order = self._level_order.get(level, 0)
 
-        level_name = level.name
-        level_color = classification["level_color"]
-        text_color = classification["text_color"]
-        badge_bg = classification["badge_bg"]
         source = classification["source"]
+        source_badge = f" [{source}]" if source else ""
+        rows = [(order, f"[{timestamp}] [{level.name}]{source_badge} {lines[0]}", classification["text_color"])]
 
-        timestamp_html = self._span(f"[{timestamp}]", self._theme["muted"])
-        level_html = self._badge(level_name, level_color, badge_bg)
-        source_html = f" {self._badge(source, classification['source_color'], badge_bg)}" if source else ""
-        first_line_html = self._preserve_spaces(escape(first_line))
-
-        blocks = [
-            (
-                "<div style=\"font-family: Consolas, 'Courier New', monospace; "
-                "font-size: 9pt; line-height: 130%; margin: 0 0 2px 0; "
-                f"color: {text_color}; white-space: pre-wrap;\">"
-                f"{timestamp_html} {level_html}{source_html} "
-                f"<span style=\"color: {text_color};\">{first_line_html}</span>"
-                "</div>"
-            )
-        ]
-
-        for line in continuation_lines:
-            line_html = self._preserve_spaces(escape(line))
-            blocks.append(
-                "<div style=\"font-family: Consolas, 'Courier New', monospace; "
-                "font-size: 9pt; line-height: 130%; margin: 0; white-space: pre-wrap; "
-                f"color: {classification['continuation_color']};\">"
-                f"<span style=\"color: {self._theme['muted']};\">          | </span>{line_html}"
-                "</div>"
-            )
-
-        return "".join(blocks)
+        continuation_color = classification["continuation_color"]
+        for line in lines[1:]:
+            rows.append((order, f"          | {line}".expandtabs(4), continuation_color))
+        return rows
 
     def _classify_message(self, level: LogLevel, message: str) -> dict:
         """Classify a log entry for display styling only."""
         lower = message.lower()
         stripped = message.strip()
         source = ""
-        source_color = self._theme["source"]
         text_color = self._theme["info"]
-        level_color = self._qcolor_to_hex(self._get_level_color(level.name))
-        badge_bg = self._theme["badge_bg"]
         continuation_color = "#a5b0bd"
 
         if stripped.startswith("[stdout]"):
             source = "STDOUT"
-            source_color = self._theme["stdout"]
             text_color = self._theme["debug"]
             continuation_color = self._theme["muted"]
         elif stripped.startswith("[stderr]"):
             source = "STDERR"
-            source_color = self._theme["stderr"]
             text_color = "#c79a80"
             continuation_color = "#aa8370"
 
         role_match = re.search(r"\b(Manager|Executor|AppOpener) response:", message)
         if role_match:
             source = role_match.group(1).upper()
-            source_color = self._theme["action"]
 
         if re.match(r"^\s*(step\s+\d+|\[\w+\]\s*step\s+\d+)", lower):
             source = source or "STEP"
-            source_color = self._theme["action"]
 
         if self._looks_like_action(message):
             source = source or "ACTION"
             text_color = self._theme["action"]
-            level_color = self._theme["action"]
 
         if level == LogLevel.DEBUG:
             text_color = text_color if source else self._theme["debug"]
             continuation_color = self._theme["muted"]
         elif level == LogLevel.ACTION:
             text_color = self._theme["action"]
-            level_color = self._theme["action"]
             source = source or "ACTION"
-            source_color = self._theme["action"]
         elif level == LogLevel.WARNING:
             text_color = self._theme["warning"]
-            level_color = self._theme["warning"]
             source = source or "WARN"
-            source_color = self._theme["warning"]
         elif level == LogLevel.ERROR:
             text_color = self._theme["error"]
-            level_color = self._theme["error"]
             source = source or "ERROR"
-            source_color = self._theme["error"]
 
         if self._has_error_words(lower):
             text_color = self._theme["error"]
             source = source or "ERROR"
-            source_color = self._theme["error"]
         elif self._has_warning_words(lower):
             text_color = self._theme["warning"]
             source = source or "WARN"
-            source_color = self._theme["warning"]
         elif self._has_success_words(lower):
             text_color = self._theme["ok"]
             source = source or "OK"
-            source_color = self._theme["ok"]
 
         return {
             "source": source,
-            "source_color": source_color,
             "text_color": text_color,
-            "level_color": level_color,
-            "badge_bg": badge_bg,
             "continuation_color": continuation_color,
         }
 
@@ -370,21 +485,6 @@ class LogViewer(QWidget):
         normalized = re.sub(r"\bfailed=\d+\b", "", lower_message)
         return any(word in normalized for word in ("error", "failed", "failure", "exception", "traceback", "crash"))
 
-    def _badge(self, text: str, color: str, background: str) -> str:
-        return (
-            f"<span style=\"color: {color}; background-color: {background}; "
-            f"font-weight: 700;\">[{escape(text)}]</span>"
-        )
-
-    def _span(self, text: str, color: str) -> str:
-        return f"<span style=\"color: {color};\">{escape(text)}</span>"
-
-    def _preserve_spaces(self, text: str) -> str:
-        return text.replace(" ", "&nbsp;").replace("\t", "&nbsp;&nbsp;&nbsp;&nbsp;")
-
-    def _qcolor_to_hex(self, color: QColor) -> str:
-        return f"#{color.red():02x}{color.green():02x}{color.blue():02x}"
-
     def set_level_filter(self, level: LogLevel):
         """Set the minimum log level filter.
 
@@ -400,7 +500,7 @@ class LogViewer(QWidget):
         }
         self.level_filter.setCurrentText(level_map.get(level, "DEBUG"))
         # Note: setCurrentText triggers currentTextChanged which calls
-        # _on_level_filter_changed which calls _rebuild_display
+        # _on_level_filter_changed which re-filters the model
 
     def get_level_filter(self) -> LogLevel:
         """Get the current minimum log level filter.
@@ -412,5 +512,5 @@ class LogViewer(QWidget):
 
     def clear_logs(self):
         """Clear all logs from the viewer."""
-        self._entries.clear()
-        self.log_text.clear()
+        self._pending.clear()
+        self._model.clear()
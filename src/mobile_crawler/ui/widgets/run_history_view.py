@@ -2,24 +2,61 @@
 
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
     QHBoxLayout,
     QHeaderView,
     QLabel,
+    QLineEdit,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from mobile_crawler.ui.async_utils import AsyncOperation
+
 if TYPE_CHECKING:
     from mobile_crawler.domain.report_generator import ReportGenerator
     from mobile_crawler.infrastructure.mobsf_manager import MobSFManager
-    from mobile_crawler.infrastructure.run_repository import RunRepository
+    from mobile_crawler.infrastructure.run_repository import Run, RunRepository
+
+# (header, server-side sort key) per column; None means not sortable.
+RUN_HISTORY_COLUMNS: list[tuple[str, str | None]] = [
+    ("ID", "id"),
+    ("Device", "device_id"),
+    ("Package", "app_package"),
+    ("Start Time", "start_time"),
+    ("End Time", "end_time"),
+    ("Status", "status"),
+    ("Steps", "total_steps"),
+    ("Screens", "unique_screens"),
+    ("Model", "ai_model"),
+    ("Actions", None),
+]
+ACTIONS_COLUMN = 9
+STATUS_COLUMN = 5
+DEFAULT_SORT_COLUMN = 3
+
+RUN_STATUSES = ["RUNNING", "STOPPED", "COMPLETED", "ERROR", "INTERRUPTED"]
+
+STATUS_COLORS = {
+    "RUNNING": "#0066CC",  # Blue
+    "STOPPED": "#009900",  # Green
+    "COMPLETED": "#009900",  # Green
+    "ERROR": "#CC0000",  # Red
+    "INTERRUPTED": "#DAA520",  # Goldenrod/Orange
+}
+
+# Item data role carrying the resolved session folder path (or None).
+SessionPathRole = Qt.ItemDataRole.UserRole + 1
+
+# Sentinel for runs whose session folder has not been looked up yet.
+_PATH_PENDING = object()
 
 
 class MobSFAnalysisWorker(QThread):
@@ -41,6 +78,247 @@ class MobSFAnalysisWorker(QThread):
             self.analysis_failed.emit(self._run.id, str(e))
 
 
+def resolve_session_paths(runs: list["Run"]) -> dict[int, str | None]:
+    """Resolve session folders for a batch of runs (runs off the UI thread).
+
+    Args:
+        runs: Runs to look up
+
+    Returns:
+        Mapping of run ID to absolute session folder path, or None if missing
+    """
+    from mobile_crawler.infrastructure.session_folder_manager import SessionFolderManager
+
+    session_manager = SessionFolderManager()
+    return {run.id: session_manager.get_session_path(run) for run in runs}
+
+
+class RunHistoryModel(QAbstractTableModel):
+    """Table model over the runs table, loaded one keyset page at a time.
+
+    Only the pages the view has scrolled to are held in memory. Sorting and
+    filtering are pushed down to ``RunRepository.get_runs_page``; repositories
+    without it fall back to paging ``get_all_runs`` in memory.
+    """
+
+    # Emitted with newly loaded runs whose session folder still needs resolving
+    session_paths_requested = Signal(list)
+
+    def __init__(self, run_repository: "RunRepository", page_size: int = 200, parent=None):
+        """Initialize the model.
+
+        Args:
+            run_repository: Repository the runs are read from
+            page_size: Number of runs fetched per page
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._run_repository = run_repository
+        self._page_size = page_size
+        self._runs: list[Run] = []
+        self._has_more = False
+        self._session_paths: dict[int, str | None] = {}
+        self._status: str | None = None
+        self._app_package: str | None = None
+        self._sort_by = RUN_HISTORY_COLUMNS[DEFAULT_SORT_COLUMN][1]
+        self._descending = True
+
+    # --- Qt model interface -------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._runs)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(RUN_HISTORY_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(RUN_HISTORY_COLUMNS)
+        ):
+            return RUN_HISTORY_COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._runs):
+            return None
+        run = self._runs[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(run, column)
+        if role == Qt.ItemDataRole.UserRole:
+            return run.id
+        if role == SessionPathRole:
+            path = self._session_paths.get(run.id, _PATH_PENDING)
+            return None if path is _PATH_PENDING else path
+        if role == Qt.ItemDataRole.ForegroundRole and column == STATUS_COLUMN:
+            color = STATUS_COLORS.get(run.status)
+            return QColor(color) if color else None
+        if role == Qt.ItemDataRole.ToolTipRole and column == ACTIONS_COLUMN:
+            path = self._session_paths.get(run.id, _PATH_PENDING)
+            if path is _PATH_PENDING:
+                return "Looking for run folder..."
+            return "Open Run Folder" if path else "Folder not found"
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid() or not self._has_more:
+            return
+        runs = self._fetch_page(self._runs[-1] if self._runs else None)
+        if not runs:
+            return
+        first = len(self._runs)
+        self.beginInsertRows(QModelIndex(), first, first + len(runs) - 1)
+        self._runs.extend(runs)
+        self.endInsertRows()
+        self._request_session_paths(runs)
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder) -> None:
+        if not 0 <= column < len(RUN_HISTORY_COLUMNS):
+            return
+        sort_by = RUN_HISTORY_COLUMNS[column][1]
+        if sort_by is None:
+            return
+        descending = order == Qt.SortOrder.DescendingOrder
+        if sort_by == self._sort_by and descending == self._descending:
+            return
+        self._sort_by = sort_by
+        self._descending = descending
+        self.reload(clear_paths=False)
+
+    # --- Loading ------------------------------------------------------------
+
+    def reload(self, clear_paths: bool = True) -> None:
+        """Drop loaded rows and fetch the first page for the current query.
+
+        Args:
+            clear_paths: Forget resolved session folders (set on explicit
+                refresh; sort/filter changes keep them)
+        """
+        self.beginResetModel()
+        if clear_paths:
+            self._session_paths.clear()
+        self._has_more = True
+        self._runs = self._fetch_page(None)
+        self.endResetModel()
+        self._request_session_paths(self._runs)
+
+    def set_filters(self, status: str | None = None, app_package: str | None = None) -> None:
+        """Apply server-side filters and reload from the first page.
+
+        Args:
+            status: Only show runs with this status (None for all)
+            app_package: Only show runs whose package starts with this prefix
+        """
+        status = status or None
+        app_package = (app_package or "").strip() or None
+        if status == self._status and app_package == self._app_package:
+            return
+        self._status = status
+        self._app_package = app_package
+        self.reload(clear_paths=False)
+
+    def _fetch_page(self, last_run: "Run | None") -> list["Run"]:
+        if hasattr(self._run_repository, "get_runs_page"):
+            after = self._run_repository.page_cursor(last_run, self._sort_by) if last_run else None
+            runs = self._run_repository.get_runs_page(
+                limit=self._page_size,
+                after=after,
+                status=self._status,
+                app_package=self._app_package,
+                sort_by=self._sort_by,
+                descending=self._descending,
+            )
+        else:
+            runs = self._page_in_memory(len(self._runs) if last_run else 0)
+        runs = list(runs)
+        self._has_more = len(runs) >= self._page_size
+        return runs
+
+    def _page_in_memory(self, offset: int) -> list["Run"]:
+        runs = [
+            run for run in self._run_repository.get_all_runs()
+            if (self._status is None or run.status == self._status)
+            and (self._app_package is None or (run.app_package or "").startswith(self._app_package))
+        ]
+        sort_by = self._sort_by
+        runs.sort(
+            key=lambda run: (getattr(run, sort_by) is not None, getattr(run, sort_by) or 0, run.id or 0),
+            reverse=self._descending,
+        )
+        return runs[offset:offset + self._page_size]
+
+    def _request_session_paths(self, runs: list["Run"]) -> None:
+        pending = [run for run in runs if run.id not in self._session_paths]
+        if pending:
+            self.session_paths_requested.emit(pending)
+
+    # --- Row access ---------------------------------------------------------
+
+    def run_at(self, row: int) -> "Run | None":
+        """Return the run shown at ``row``, or None if out of range."""
+        if 0 <= row < len(self._runs):
+            return self._runs[row]
+        return None
+
+    def row_for_run_id(self, run_id: int) -> int | None:
+        """Return the loaded row showing ``run_id``, or None if not loaded."""
+        for row, run in enumerate(self._runs):
+            if run.id == run_id:
+                return row
+        return None
+
+    def remove_run(self, run_id: int) -> None:
+        """Drop a run from the loaded rows without reloading."""
+        row = self.row_for_run_id(run_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._runs[row]
+        self.endRemoveRows()
+        self._session_paths.pop(run_id, None)
+
+    def set_session_paths(self, paths: dict[int, str | None]) -> None:
+        """Store resolved session folders and refresh the Actions cells."""
+        self._session_paths.update(paths)
+        for run_id in paths:
+            row = self.row_for_run_id(run_id)
+            if row is not None:
+                index = self.index(row, ACTIONS_COLUMN)
+                self.dataChanged.emit(index, index)
+
+    def _display_text(self, run: "Run", column: int) -> str:
+        if column == 0:
+            return str(run.id)
+        if column == 1:
+            return run.device_id
+        if column == 2:
+            return run.app_package
+        if column == 3:
+            return run.start_time.strftime("%Y-%m-%d %H:%M:%S")
+        if column == 4:
+            return run.end_time.strftime("%Y-%m-%d %H:%M:%S") if run.end_time else "N/A"
+        if column == 5:
+            return run.status
+        if column == 6:
+            return str(run.total_steps)
+        if column == 7:
+            return str(run.unique_screens)
+        if column == 8:
+            return run.model_label
+        if column == ACTIONS_COLUMN:
+            path = self._session_paths.get(run.id, _PATH_PENDING)
+            if path is _PATH_PENDING:
+                return "..."
+            return "📂 Open" if path else "—"
+        return ""
+
+
 class RunHistoryView(QWidget):
     """Widget for viewing and managing past crawl runs.
 
@@ -73,6 +351,8 @@ class RunHistoryView(QWidget):
         self._report_generator = report_generator
         self._mobsf_manager = mobsf_manager
         self._mobsf_worker = None
+        self._path_thread: AsyncOperation | None = None
+        self._pending_path_runs: list = []
 
         self.setMinimumHeight(170)
 
@@ -83,36 +363,56 @@ class RunHistoryView(QWidget):
         """Set up user interface."""
         layout = QVBoxLayout()
 
-        # Title label
+        # Title row with server-side filters
+        header_layout = QHBoxLayout()
         title_label = QLabel("Run History")
         title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
-        layout.addWidget(title_label)
-
-        # Table for run metadata
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            "ID",
-            "Device",
-            "Package",
-            "Start Time",
-            "End Time",
-            "Status",
-            "Steps",
-            "Screens",
-            "Model",
-            "Actions"
-        ])
+        header_layout.addWidget(title_label)
+        header_layout.addStretch()
+
+        self.status_filter = QComboBox()
+        self.status_filter.addItem("All statuses", None)
+        for status in RUN_STATUSES:
+            self.status_filter.addItem(status, status)
+        self.status_filter.currentIndexChanged.connect(self._apply_filters)
+        header_layout.addWidget(self.status_filter)
+
+        self.package_filter = QLineEdit()
+        self.package_filter.setPlaceholderText("Filter by package...")
+        self.package_filter.setClearButtonEnabled(True)
+        header_layout.addWidget(self.package_filter)
+
+        # Debounce typing so each keystroke doesn't hit the database
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(250)
+        self._filter_timer.timeout.connect(self._apply_filters)
+        self.package_filter.textChanged.connect(self._filter_timer.start)
+
+        layout.addLayout(header_layout)
+
+        # Table for run metadata; rows are fetched page by page as it scrolls
+        self.model = RunHistoryModel(self._run_repository, parent=self)
+        self.model.session_paths_requested.connect(self._queue_session_paths)
+        self.model.modelReset.connect(self._on_model_reset)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Configure table
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.table.horizontalHeader().setSortIndicator(DEFAULT_SORT_COLUMN, Qt.SortOrder.DescendingOrder)
+        self.table.setSortingEnabled(True)
 
         # Make table read-only
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        self.table.clicked.connect(self._on_table_clicked)
 
         layout.addWidget(self.table)
 
@@ -149,100 +449,60 @@ class RunHistoryView(QWidget):
         self.setLayout(layout)
 
         # Connect table selection change
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
     def _load_runs(self):
-        """Load all runs from repository into table."""
-        # Save current selection if any
+        """Reload the first page of runs, keeping the selection if still loaded."""
         selected_id = self.get_selected_run_id()
 
-        runs = self._run_repository.get_all_runs()
-
-        self.table.setRowCount(len(runs))
-
-        # Need session manager to resolve paths
-        # We'll create it on fly since it's lightweight, or we could inject it
-        from mobile_crawler.infrastructure.session_folder_manager import SessionFolderManager
-        session_manager = SessionFolderManager()
-
-        for row, run in enumerate(runs):
-            # ID
-            id_item = QTableWidgetItem(str(run.id))
-            id_item.setData(Qt.ItemDataRole.UserRole, run.id)
-            self.table.setItem(row, 0, id_item)
-
-            # Device
-            device_item = QTableWidgetItem(run.device_id)
-            self.table.setItem(row, 1, device_item)
-
-            # Package
-            package_item = QTableWidgetItem(run.app_package)
-            self.table.setItem(row, 2, package_item)
-
-            # Start Time
-            start_time = run.start_time.strftime("%Y-%m-%d %H:%M:%S")
-            start_time_item = QTableWidgetItem(start_time)
-            self.table.setItem(row, 3, start_time_item)
-
-            # End Time
-            if run.end_time:
-                end_time = run.end_time.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                end_time = "N/A"
-            end_time_item = QTableWidgetItem(end_time)
-            self.table.setItem(row, 4, end_time_item)
-
-            # Status
-            status_item = QTableWidgetItem(run.status)
-            # Color code status
-            if run.status == "RUNNING":
-                status_item.setForeground(QColor("#0066CC"))  # Blue
-            elif run.status == "STOPPED":
-                status_item.setForeground(QColor("#009900"))  # Green
-            elif run.status == "COMPLETED":
-                status_item.setForeground(QColor("#009900"))  # Green
-            elif run.status == "ERROR":
-                status_item.setForeground(QColor("#CC0000"))  # Red
-            elif run.status == "INTERRUPTED":
-                status_item.setForeground(QColor("#DAA520"))  # Goldenrod/Orange
-            self.table.setItem(row, 5, status_item)
-
-            # Steps
-            steps_item = QTableWidgetItem(str(run.total_steps))
-            self.table.setItem(row, 6, steps_item)
-
-            # Screens
-            screens_item = QTableWidgetItem(str(run.unique_screens))
-            self.table.setItem(row, 7, screens_item)
-
-            # Model
-            model_text = ""
-            if run.ai_provider and run.ai_model:
-                model_text = f"{run.ai_provider}/{run.ai_model}"
-            model_item = QTableWidgetItem(model_text)
-            self.table.setItem(row, 8, model_item)
-
-            # Action Button (Open Folder)
-            # Only enable if folder exists
-            session_path = session_manager.get_session_path(run)
-
-            open_btn = QPushButton("📂 Open")
-            open_btn.setToolTip("Open Run Folder")
-            if session_path:
-                open_btn.clicked.connect(lambda checked=False, path=session_path: self._open_folder(path))
-            else:
-                open_btn.setEnabled(False)
-                open_btn.setToolTip("Folder not found")
-
-            self.table.setCellWidget(row, 9, open_btn)
-
-        # Restore selection
+        self.model.reload()
+
         if selected_id is not None:
-             for row in range(self.table.rowCount()):
-                item = self.table.item(row, 0)
-                if item and item.data(Qt.ItemDataRole.UserRole) == selected_id:
-                    self.table.selectRow(row)
-                    break
+            row = self.model.row_for_run_id(selected_id)
+            if row is not None:
+                self.table.selectRow(row)
+
+    def _apply_filters(self):
+        """Push the status/package filters down to the repository query."""
+        self._filter_timer.stop()
+        self.model.set_filters(
+            status=self.status_filter.currentData(),
+            app_package=self.package_filter.text(),
+        )
+
+    def _on_model_reset(self):
+        """Size columns to the first page once, instead of on every fetch."""
+        self._on_selection_changed()
+        if self.model.rowCount() > 0:
+            self.table.resizeColumnsToContents()
+
+    def _queue_session_paths(self, runs: list):
+        """Resolve session folders for newly loaded rows in the background."""
+        self._pending_path_runs.extend(runs)
+        self._start_session_path_worker()
+
+    def _start_session_path_worker(self):
+        if self._path_thread is not None or not self._pending_path_runs:
+            return
+        runs, self._pending_path_runs = self._pending_path_runs, []
+        self._path_thread = AsyncOperation(resolve_session_paths, args=(runs,))
+        self._path_thread.result_ready.connect(self.model.set_session_paths)
+        self._path_thread.finished.connect(self._on_session_path_worker_finished)
+        self._path_thread.start()
+
+    def _on_session_path_worker_finished(self):
+        thread, self._path_thread = self._path_thread, None
+        if thread is not None:
+            thread.deleteLater()
+        self._start_session_path_worker()
+
+    def _on_table_clicked(self, index: QModelIndex):
+        """Open the run folder when its Actions cell is clicked."""
+        if index.column() != ACTIONS_COLUMN:
+            return
+        path = index.data(SessionPathRole)
+        if path:
+            self._open_folder(path)
 
     def _open_folder(self, path: str):
         """Open folder in system file explorer."""
@@ -256,8 +516,7 @@ class RunHistoryView(QWidget):
 
     def _on_selection_changed(self):
         """Handle table selection change."""
-        selected_items = self.table.selectedItems()
-        has_selection = len(selected_items) > 0
+        has_selection = self.get_selected_run_id() is not None
 
         self.delete_button.setEnabled(has_selection)
         self.report_button.setEnabled(has_selection)
@@ -265,17 +524,10 @@ class RunHistoryView(QWidget):
 
     def _on_delete_clicked(self):
         """Handle delete button click."""
-        selected_rows = self.table.selectionModel().selectedRows()
-        if not selected_rows:
-            return
-
-        row = selected_rows[0].row()
-        run_id_item = self.table.item(row, 0)
-        if run_id_item is None:
+        run_id = self.get_selected_run_id()
+        if run_id is None:
             return
 
-        run_id = run_id_item.data(Qt.ItemDataRole.UserRole)
-
         # Show confirmation dialog
         reply = QMessageBox.question(
             self,
@@ -291,7 +543,7 @@ class RunHistoryView(QWidget):
                 deleted = self._run_repository.delete_run(run_id)
                 if deleted:
                     # Remove row from table
-                    self.table.removeRow(row)
+                    self.model.remove_run(run_id)
                     self.run_deleted.emit(run_id)
                     QMessageBox.information(
                         self,
@@ -313,17 +565,10 @@ class RunHistoryView(QWidget):
 
     def _on_generate_report_clicked(self):
         """Handle generate report button click."""
-        selected_rows = self.table.selectionModel().selectedRows()
-        if not selected_rows:
-            return
-
-        row = selected_rows[0].row()
-        run_id_item = self.table.item(row, 0)
-        if run_id_item is None:
+        run_id = self.get_selected_run_id()
+        if run_id is None:
             return
 
-        run_id = run_id_item.data(Qt.ItemDataRole.UserRole)
-
         # Show confirmation dialog
         reply = QMessageBox.question(
             self,
@@ -351,21 +596,12 @@ class RunHistoryView(QWidget):
 
     def _on_mobsf_clicked(self):
         """Handle MobSF button click."""
-        selected_rows = self.table.selectionModel().selectedRows()
-        if not selected_rows:
-            return
-
-        row = selected_rows[0].row()
-        run_id_item = self.table.item(row, 0)
-        if run_id_item is None:
-            return
-
-        run_id = run_id_item.data(Qt.ItemDataRole.UserRole)
-        package_item = self.table.item(row, 2)
-        if package_item is None:
+        run = self._get_selected_run()
+        if run is None:
             return
 
-        package = package_item.text()
+        run_id = run.id
+        package = run.app_package
 
         # Show confirmation dialog
         reply = QMessageBox.question(
@@ -464,13 +700,15 @@ class RunHistoryView(QWidget):
         Returns:
             Run ID if a run is selected, None otherwise
         """
-        selected_rows = self.table.selectionModel().selectedRows()
-        if not selected_rows:
-            return None
+        run = self._get_selected_run()
+        return run.id if run is not None else None
 
-        row = selected_rows[0].row()
-        run_id_item = self.table.item(row, 0)
-        if run_id_item is None:
+    def _get_selected_run(self) -> "Run | None":
+        """Get the currently selected run from the loaded rows."""
+        selection_model = self.table.selectionModel()
+        if selection_model is None:
             return None
-
-        return run_id_item.data(Qt.ItemDataRole.UserRole)
+        selected_rows = selection_model.selectedRows()
+        if not selected_rows:
+            return None
+        return self.model.run_at(selected_rows[0].row())
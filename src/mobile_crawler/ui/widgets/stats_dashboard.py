@@ -12,6 +12,17 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from mobile_crawler.domain.latency_sketch import LatencySummary
+
+# Timings shown in the Latency section: (summary key, label)
+_LATENCY_ROWS = (
+    ("llm", "LLM"),
+    ("action", "ADB Action"),
+    ("screenshot", "ADB Screenshot"),
+    ("ocr", "OmniParser/OCR"),
+)
+_PHASE_PREFIX = "phase."
+
 
 def _make_section_label(text: str) -> QLabel:
     lbl = QLabel(text)
@@ -20,6 +31,18 @@ def _make_section_label(text: str) -> QLabel:
     return lbl
 
 
+def _format_ms(value_ms: float) -> str:
+    if value_ms >= 1000:
+        return f"{value_ms / 1000:.1f}s"
+    return f"{value_ms:.0f}ms"
+
+
+def _format_percentiles(summary: LatencySummary | None) -> str:
+    if summary is None or summary.count == 0:
+        return "—"
+    return f"{_format_ms(summary.p50)} / {_format_ms(summary.p95)} / {_format_ms(summary.p99)}"
+
+
 def _make_separator() -> QFrame:
     sep = QFrame()
     sep.setFrameShape(QFrame.Shape.HLine)
@@ -131,6 +154,25 @@ class StatsDashboard(QWidget):
         grid.addWidget(_make_separator(), row, 0, 1, 2)
         row += 1
 
+        # ── Latency ──────────────────────────────────────────────
+        grid.addWidget(_make_section_label("Latency p50 / p95 / p99"), row, 0, 1, 2)
+        row += 1
+
+        self.latency_labels: dict[str, QLabel] = {}
+        for key, title in _LATENCY_ROWS:
+            grid.addWidget(QLabel(f"{title}:"), row, 0)
+            self.latency_labels[key] = QLabel("—")
+            grid.addWidget(self.latency_labels[key], row, 1)
+            row += 1
+
+        self.phase_latency_label = QLabel("Phases p95: —")
+        self.phase_latency_label.setWordWrap(True)
+        grid.addWidget(self.phase_latency_label, row, 0, 1, 2)
+        row += 1
+
+        grid.addWidget(_make_separator(), row, 0, 1, 2)
+        row += 1
+
         # ── Tool Metrics ─────────────────────────────────────────
         grid.addWidget(_make_section_label("Tool Metrics"), row, 0, 1, 2)
         row += 1
@@ -211,8 +253,14 @@ class StatsDashboard(QWidget):
         tool_calls_per_step: float = 0.0,
         tool_error_count: int = 0,
         phase_transition_count: int = 0,
+        latency_summaries: dict[str, LatencySummary] | None = None,
     ):
-        """Update all statistics labels and progress bar."""
+        """Update all statistics labels and progress bar.
+
+        ``latency_summaries`` maps timing names ("llm", "action", "screenshot",
+        "ocr", "phase.<name>") to precomputed sketch summaries, so rendering
+        them costs the same however long the crawl has run.
+        """
         if total_steps > 0 or duration_seconds > 0:
             self.placeholder_label.setVisible(False)
             self.stats_content.setVisible(True)
@@ -263,6 +311,17 @@ class StatsDashboard(QWidget):
             self.tokens_in_label.setText("Tokens In: —")
             self.tokens_out_label.setText("Tokens Out: —")
 
+        # ── Latency ──────────────────────────────────────────
+        latency_summaries = latency_summaries or {}
+        for key, label in self.latency_labels.items():
+            label.setText(_format_percentiles(latency_summaries.get(key)))
+        phases = [
+            f"{name[len(_PHASE_PREFIX):]} {_format_ms(summary.p95)}"
+            for name, summary in sorted(latency_summaries.items())
+            if name.startswith(_PHASE_PREFIX) and summary.count
+        ]
+        self.phase_latency_label.setText(f"Phases p95: {' · '.join(phases) if phases else '—'}")
+
         # ── Duration ─────────────────────────────────────────
         self.duration_label.setText(f"Elapsed: {duration_seconds:.0f}s")
 
@@ -22,7 +22,7 @@ class TestCrawlCommand:
 
     @patch('mobile_crawler.cli.commands.crawl.DatabaseManager')
     @patch('mobile_crawler.cli.commands.crawl.ConfigManager')
-    @patch('mobile_crawler.cli.commands.crawl.CrawlerLoop')
+    @patch('mobile_crawler.core.crawler_loop.CrawlerLoop')
     def test_crawl_command_basic(self, mock_crawler_loop_cls, mock_config_manager_cls, mock_db_manager_cls):
         """Test basic crawl command execution."""
         # Setup mocks
@@ -69,7 +69,7 @@ class TestCrawlCommand:
         mock_db_manager_cls.return_value = mock_db_manager
 
         with patch('mobile_crawler.cli.commands.crawl.RunRepository') as mock_run_repo_cls, \
-             patch('mobile_crawler.cli.commands.crawl.CrawlerLoop') as mock_crawler_loop_cls, \
+             patch('mobile_crawler.core.crawler_loop.CrawlerLoop') as mock_crawler_loop_cls, \
              patch('mobile_crawler.cli.commands.crawl.get_app_data_dir') as mock_get_app_data_dir:
 
             mock_run_repo = Mock()
@@ -111,7 +111,7 @@ class TestCrawlCommand:
         mock_db_manager_cls.return_value = mock_db_manager
 
         with patch('mobile_crawler.cli.commands.crawl.RunRepository') as mock_run_repo_cls, \
-             patch('mobile_crawler.cli.commands.crawl.CrawlerLoop') as mock_crawler_loop_cls, \
+             patch('mobile_crawler.core.crawler_loop.CrawlerLoop') as mock_crawler_loop_cls, \
              patch('mobile_crawler.cli.commands.crawl.get_app_data_dir') as mock_get_app_data_dir:
 
             mock_run_repo = Mock()
@@ -132,3 +132,48 @@ class TestCrawlCommand:
             assert result.exit_code == 0
             mock_config_manager.set.assert_any_call('enable_traffic_capture', True)
             mock_config_manager.set.assert_any_call('pcapdroid_tls_decryption', True)
+
+    def test_crawl_command_requires_target_without_resume(self):
+        """--device/--package/--model are required unless resuming."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ['crawl', '--device', 'emulator-5554'])
+
+        assert result.exit_code != 0
+        assert '--package' in result.output
+        assert '--model' in result.output
+
+    @patch('mobile_crawler.cli.commands.crawl.DatabaseManager')
+    @patch('mobile_crawler.cli.commands.crawl.ConfigManager')
+    def test_crawl_command_resume_reuses_run(self, mock_config_manager_cls, mock_db_manager_cls):
+        """--resume reuses the stored run and asks CrawlerLoop to restore its checkpoint."""
+        mock_config_manager = Mock()
+        mock_config_manager.user_config_store = Mock()
+        mock_config_manager_cls.return_value = mock_config_manager
+        mock_db_manager_cls.return_value = Mock()
+
+        with patch('mobile_crawler.cli.commands.crawl.RunRepository') as mock_run_repo_cls, \
+             patch('mobile_crawler.core.crawler_loop.CrawlerLoop') as mock_crawler_loop_cls, \
+             patch('mobile_crawler.cli.commands.crawl.get_app_data_dir') as mock_get_app_data_dir:
+
+            stored_run = Mock()
+            stored_run.device_id = 'emulator-5554'
+            stored_run.app_package = 'com.example.app'
+            stored_run.ai_model = 'gemini-pro'
+            stored_run.ai_provider = 'gemini'
+            mock_run_repo = Mock()
+            mock_run_repo.get_run_by_id.return_value = stored_run
+            mock_run_repo_cls.return_value = mock_run_repo
+
+            mock_crawler_loop = Mock()
+            mock_crawler_loop_cls.return_value = mock_crawler_loop
+            mock_get_app_data_dir.return_value = Mock()
+
+            runner = CliRunner()
+            result = runner.invoke(cli, ['crawl', '--resume', '42'])
+
+            assert result.exit_code == 0
+            mock_run_repo.create_run.assert_not_called()
+            mock_run_repo.update_run.assert_called_once_with(stored_run)
+            assert stored_run.status == 'RUNNING'
+            mock_config_manager.set.assert_any_call('app_package', 'com.example.app')
+            mock_crawler_loop.run.assert_called_once_with(42, resume=True)
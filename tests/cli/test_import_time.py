@@ -0,0 +1,89 @@
+"""Import-time regression checks for the CLI and GUI entry points.
+
+Each entry point is imported in a fresh interpreter under ``python -X importtime``.
+The cumulative import time must stay within its budget and crawl-only
+dependencies must not be loaded until a crawl actually starts.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Entry point module -> cumulative import budget in milliseconds. Budgets are
+# generous on purpose; they catch an eager agent-stack import (seconds), not
+# small drifts.
+IMPORT_BUDGETS_MS = {
+    "mobile_crawler.cli.main": 300,
+    "mobile_crawler.cli.commands.list": 500,
+    "mobile_crawler.cli.commands.config": 500,
+    "mobile_crawler.cli.commands.crawl": 1000,
+    "mobile_crawler.ui.main_window": 4000,
+}
+
+# Modules that only a running crawl needs
+CRAWL_ONLY_MODULES = (
+    "mobile_crawler.core.crawler_loop",
+    "mobile_crawler.domain.crawler_agent_service",
+    "llama_index.core",
+    "opentelemetry",
+)
+
+
+def _import_profile(module: str) -> tuple[dict[str, int], str]:
+    """Import ``module`` under -X importtime; return cumulative µs per module and stderr."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "QT_QPA_PLATFORM": "offscreen"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            cumulative[parts[2].strip()] = int(parts[1])
+        except ValueError:
+            continue  # header line
+    return cumulative, result.stderr
+
+
+@pytest.mark.cli
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+def test_entry_point_skips_crawl_only_modules(module):
+    if module == "mobile_crawler.ui.main_window":
+        pytest.importorskip("PySide6")
+    cumulative, _ = _import_profile(module)
+
+    loaded = [name for name in CRAWL_ONLY_MODULES if name in cumulative]
+    assert loaded == [], f"{module} eagerly imports {loaded}"
+
+
+@pytest.mark.cli
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+def test_entry_point_import_budget(module):
+    if module == "mobile_crawler.ui.main_window":
+        pytest.importorskip("PySide6")
+    cumulative, _ = _import_profile(module)
+
+    elapsed_ms = cumulative[module] / 1000
+    assert elapsed_ms <= IMPORT_BUDGETS_MS[module], (
+        f"{module} took {elapsed_ms:.0f} ms to import (budget {IMPORT_BUDGETS_MS[module]} ms)"
+    )
+
+
+@pytest.mark.cli
+def test_config_import_does_not_open_user_config_db():
+    cumulative, _ = _import_profile("mobile_crawler.config")
+
+    assert "mobile_crawler.infrastructure.user_config_store" not in cumulative
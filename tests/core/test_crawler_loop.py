@@ -1,5 +1,6 @@
 """Tests for CrawlerLoop lifecycle, event emission, and error handling."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -111,6 +112,105 @@ class TestCrawlerLoopLifecycle:
         # Verify on_crawl_started was called
         mock_listener.on_crawl_started.assert_called_once_with(1, "com.example.app")
 
+    @patch('mobile_crawler.core.crawler_loop.CrawlerAgentService')
+    def test_run_writes_phase_profile_when_enabled(
+        self,
+        mock_crawler_service_class,
+        crawler_loop,
+        mock_config_manager,
+        mock_run_repository,
+        mock_session_folder_manager,
+        tmp_path,
+    ):
+        """Profiler flag should hand a profiler to the service and write it to logs/profile."""
+        mock_config_manager.get.side_effect = lambda key, default=None: {
+            "phase_profiler_enabled": True,
+            "phase_profiler_interval_ms": 5,
+            "limit_type": "steps",
+            "max_crawl_steps": 1,
+        }.get(key, default)
+
+        mock_run = Mock()
+        mock_run.app_package = "com.example.app"
+        mock_run.device_id = "device123"
+        mock_run_repository.get_run_by_id.return_value = mock_run
+        mock_session_folder_manager.create_session_folder.return_value = "/tmp/session"
+        mock_session_folder_manager.get_subfolder.return_value = str(tmp_path)
+
+        mock_service = Mock()
+        mock_crawler_service_class.return_value = mock_service
+
+        async def mock_explore(*args, **kwargs):
+            mock_result = Mock()
+            mock_result.success = True
+            mock_result.steps_completed = 1
+            mock_result.error_message = None
+            mock_result.final_state = {}
+            return mock_result
+
+        mock_service.execute_exploration_task = mock_explore
+        mock_service.cleanup = AsyncMock()
+
+        crawler_loop.run(1)
+
+        profiler = mock_service.configure_phase_profiler.call_args.args[0]
+        assert profiler.interval_seconds == 0.005
+        assert not profiler.running
+        assert (tmp_path / "profile" / "summary.json").exists()
+
+    @patch('mobile_crawler.core.crawler_loop.CrawlerAgentService')
+    def test_run_serves_metrics_endpoint_when_enabled(
+        self,
+        mock_crawler_service_class,
+        crawler_loop,
+        mock_config_manager,
+        mock_run_repository,
+        mock_session_folder_manager,
+    ):
+        """Metrics flag should serve /metrics during the run and release it afterwards."""
+        import urllib.request
+
+        mock_config_manager.get.side_effect = lambda key, default=None: {
+            "metrics_endpoint_enabled": True,
+            "metrics_endpoint_port": 0,
+            "limit_type": "steps",
+            "max_crawl_steps": 1,
+        }.get(key, default)
+
+        mock_run = Mock()
+        mock_run.app_package = "com.example.app"
+        mock_run.device_id = "device123"
+        mock_run_repository.get_run_by_id.return_value = mock_run
+        mock_session_folder_manager.create_session_folder.return_value = "/tmp/session"
+
+        mock_service = Mock()
+        mock_service.writer_queue_depth.return_value = 2
+        mock_service._stats_processor.get_stats.return_value = None
+        mock_crawler_service_class.return_value = mock_service
+        scraped = {}
+
+        async def mock_explore(*args, **kwargs):
+            crawler_loop._emit_event("on_step_phase_transition", 1, 1, "record", "checkpoint", 4.0)
+            with urllib.request.urlopen(crawler_loop._metrics_endpoint.url, timeout=5) as response:
+                scraped["body"] = response.read().decode()
+            mock_result = Mock()
+            mock_result.success = True
+            mock_result.steps_completed = 1
+            mock_result.error_message = None
+            mock_result.final_state = {}
+            return mock_result
+
+        mock_service.execute_exploration_task = mock_explore
+        mock_service.cleanup = AsyncMock()
+
+        crawler_loop.run(1)
+
+        assert "crawler_steps_total 1\n" in scraped["body"]
+        assert "crawler_trajectory_writer_queue_depth 2\n" in scraped["body"]
+        mock_service.configure_timing_sink.assert_called_once()
+        assert crawler_loop._metrics_endpoint is None
+        assert all(type(listener).__name__ != "CrawlMetrics" for listener in crawler_loop.event_listeners)
+
     @patch('mobile_crawler.core.crawler_loop.VideoRecordingManager')
     @patch('mobile_crawler.core.crawler_loop.CrawlerAgentService')
     def test_run_starts_and_stops_video_recording_when_enabled(
@@ -166,6 +266,7 @@ class TestCrawlerLoopLifecycle:
         mock_video_manager.stop_recording_and_save_async.assert_awaited_once()
         mock_run_repository.update_run_stats.assert_called_once()
         assert mock_run_repository.update_run_stats.call_args.kwargs["status"] == "COMPLETED"
+        mock_service.clear_checkpoint.assert_called_once()
 
     @patch('mobile_crawler.core.crawler_loop.TrafficCaptureManager')
     @patch('mobile_crawler.core.crawler_loop.CrawlerAgentService')
@@ -466,17 +567,77 @@ class TestCrawlerLoopLifecycle:
         mock_service.execute_exploration_task = mock_explore
         mock_service.cleanup = Mock()
         mock_mobsf = Mock()
-        mock_mobsf.analyze_run.return_value = Mock(
+        mock_mobsf.analyze_run_async = AsyncMock(return_value=Mock(
             success=True,
             scan_id="hash123",
             json_path="/tmp/session/reports/hash123_report.json",
             report_path="/tmp/session/reports/hash123_report.pdf",
-        )
+        ))
         mock_mobsf_class.return_value = mock_mobsf
 
         crawler_loop.run(1)
 
-        mock_mobsf.analyze_run.assert_called_once_with(mock_run, "device123")
+        mock_mobsf.analyze_run_async.assert_awaited_once_with(mock_run, "device123")
+
+    @patch('mobile_crawler.core.crawler_loop.MobSFManager')
+    @patch('mobile_crawler.core.crawler_loop.CrawlerAgentService')
+    def test_run_overlaps_mobsf_with_crawl_and_cancels_on_failure(
+        self,
+        mock_crawler_service_class,
+        mock_mobsf_class,
+        crawler_loop,
+        mock_config_manager,
+        mock_run_repository,
+        mock_session_folder_manager,
+        mock_listener,
+    ):
+        """MobSF starts with the crawl and is cancelled when the crawl fails."""
+        mock_config_manager.get.side_effect = lambda key, default=None: {
+            "enable_mobsf_analysis": True,
+            "enable_video_recording": False,
+            "limit_type": "steps",
+        }.get(key, default)
+        mock_run = Mock()
+        mock_run.app_package = "com.example.app"
+        mock_run.device_id = "device123"
+        mock_run_repository.get_run_by_id.return_value = mock_run
+        mock_session_folder_manager.create_session_folder.return_value = "/tmp/session"
+
+        scan_started = asyncio.Event()
+        scan_cancelled = []
+
+        async def slow_scan(*args, **kwargs):
+            scan_started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                scan_cancelled.append(True)
+                raise
+
+        mock_mobsf_class.return_value.analyze_run_async = slow_scan
+
+        async def mock_explore(*args, **kwargs):
+            await asyncio.wait_for(scan_started.wait(), timeout=5)
+            mock_result = Mock()
+            mock_result.success = False
+            mock_result.steps_completed = 0
+            mock_result.error_message = "agent failed"
+            mock_result.final_state = {}
+            return mock_result
+
+        mock_service = Mock()
+        mock_service.execute_exploration_task = mock_explore
+        mock_service.cleanup = Mock()
+        mock_crawler_service_class.return_value = mock_service
+
+        crawler_loop.run(1)
+
+        assert scan_cancelled == [True]
+        assert mock_run_repository.update_run_stats.call_args.kwargs["status"] == "ERROR"
+        assert any(
+            "MobSF analysis cancelled" in call.args[2]
+            for call in mock_listener.on_debug_log.call_args_list
+        )
 
     @patch('mobile_crawler.core.crawler_loop.MobSFManager')
     @patch('mobile_crawler.core.crawler_loop.CrawlerAgentService')
@@ -556,10 +717,10 @@ class TestCrawlerLoopLifecycle:
 
         mock_service.execute_exploration_task = mock_explore
         mock_service.cleanup = Mock()
-        mock_mobsf_class.return_value.analyze_run.return_value = Mock(
+        mock_mobsf_class.return_value.analyze_run_async = AsyncMock(return_value=Mock(
             success=False,
             error="MobSF unavailable",
-        )
+        ))
 
         crawler_loop.run(1)
 
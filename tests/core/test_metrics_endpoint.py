@@ -0,0 +1,117 @@
+"""Tests for the local OpenMetrics endpoint."""
+
+import urllib.error
+import urllib.request
+from unittest.mock import Mock
+
+import pytest
+
+from mobile_crawler.core.metrics_endpoint import CONTENT_TYPE, CrawlMetrics, MetricsEndpoint
+from mobile_crawler.domain.latency_sketch import LatencySummary
+from mobile_crawler.domain.stats_collector_span_processor import SpanStats
+
+
+def _metrics(**kwargs):
+    metrics = CrawlMetrics(run_id=7, **kwargs)
+    metrics.on_crawl_started(7, "com.example.app")
+    return metrics
+
+
+class TestCrawlMetrics:
+    """Tests for CrawlMetrics event accumulation and rendering."""
+
+    def test_phase_transitions_count_steps_and_phase_latency(self):
+        """Test steps are counted at CHECKPOINT and phase durations are summarised."""
+        metrics = _metrics()
+        for step in (1, 2):
+            metrics.on_step_phase_transition(7, step, "capture", "decide", 300.0)
+            metrics.on_step_phase_transition(7, step, "decide", "execute", 2000.0)
+            metrics.on_step_phase_transition(7, step, "execute", "record", 0.0)
+            metrics.on_step_phase_transition(7, step, "record", "checkpoint", 5.0)
+            metrics.on_step_phase_transition(7, step, "checkpoint", "capture", 1.0)
+        metrics.record_latency("tool_execution", 120.0)
+        metrics.on_error(7, None, RuntimeError("boom"))
+
+        text = metrics.render()
+
+        assert "crawler_steps_total 2\n" in text
+        assert "crawler_errors_total 1\n" in text
+        assert 'crawler_latency_milliseconds_count{timing="phase.decide"} 2\n' in text
+        assert 'crawler_latency_milliseconds_count{timing="tool_execution"} 1\n' in text
+        assert 'timing="phase.execute"' not in text
+        assert text.endswith("# EOF\n")
+
+    def test_render_includes_tokens_writer_queue_and_sqlite(self):
+        """Test span stats, writer queue depth and commit latency are rendered."""
+        span_stats = SpanStats()
+        span_stats.record_llm_span(1000, 200, 1500.0)
+        metrics = _metrics(
+            span_stats=lambda: span_stats,
+            writer_queue_depth=lambda: 3,
+            commit_latency=lambda: LatencySummary(count=4, mean=2.0, p50=1.5, p95=4.0, p99=4.0, max=4.0),
+        )
+
+        text = metrics.render()
+
+        assert 'crawler_llm_tokens_total{direction="input"} 1000\n' in text
+        assert 'crawler_llm_tokens_total{direction="output"} 200\n' in text
+        assert "crawler_llm_tokens_per_second " in text
+        assert 'crawler_latency_milliseconds_count{timing="llm"} 1\n' in text
+        assert "crawler_trajectory_writer_queue_depth 3\n" in text
+        assert 'crawler_sqlite_commit_latency_milliseconds{quantile="0.95"} 4.0\n' in text
+        assert "crawler_sqlite_commit_latency_milliseconds_sum 8.0\n" in text
+
+    def test_optional_sources_omitted_when_unavailable(self):
+        """Test missing span stats or writer produce no series rather than errors."""
+        metrics = _metrics(span_stats=lambda: None, writer_queue_depth=lambda: None)
+
+        text = metrics.render()
+
+        assert "crawler_llm_tokens" not in text
+        assert "crawler_trajectory_writer_queue_depth" not in text
+        assert "crawler_steps_total 0\n" in text
+
+
+class TestMetricsEndpoint:
+    """Tests for the HTTP endpoint."""
+
+    def test_serves_metrics_and_404s_other_paths(self):
+        """Test GET /metrics returns the rendered text with the OpenMetrics content type."""
+        render = Mock(return_value="crawler_steps_total 1\n# EOF\n")
+        endpoint = MetricsEndpoint(render, port=0)
+        endpoint.start()
+        try:
+            with urllib.request.urlopen(endpoint.url, timeout=5) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(endpoint.url.replace("/metrics", "/other"), timeout=5)
+        finally:
+            endpoint.stop()
+
+        assert body == "crawler_steps_total 1\n# EOF\n"
+        assert content_type == CONTENT_TYPE
+        assert excinfo.value.code == 404
+        render.assert_called_once_with()
+
+    def test_render_failure_returns_500(self):
+        """Test a failing render does not kill the server."""
+        endpoint = MetricsEndpoint(Mock(side_effect=RuntimeError("bad")), port=0)
+        endpoint.start()
+        try:
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(endpoint.url, timeout=5)
+        finally:
+            endpoint.stop()
+        assert excinfo.value.code == 500
+
+    def test_stop_releases_port(self):
+        """Test the port can be rebound after stop()."""
+        first = MetricsEndpoint(Mock(return_value="# EOF\n"), port=0)
+        first.start()
+        port = first.port
+        first.stop()
+
+        second = MetricsEndpoint(Mock(return_value="# EOF\n"), port=port)
+        second.start()
+        second.stop()
@@ -3,6 +3,8 @@
 from datetime import datetime
 from unittest.mock import Mock
 
+import pytest
+
 from mobile_crawler.core.runtime_stats_collector import (
     RuntimeStats,
     RuntimeStatsCollector,
@@ -498,6 +500,25 @@ class TestRuntimeStatsCollector:
         assert summary["crawl_duration_seconds"] >= 0
         assert "screens_per_minute" in summary
 
+    def test_latency_percentiles(self):
+        """Test named latency sketches and phase durations."""
+        collector = RuntimeStatsCollector(run_id=100)
+
+        for ms in range(1, 101):
+            collector.record_ai_call(response_time_ms=float(ms * 10), success=True)
+            collector.record_latency("adb", float(ms))
+        collector.record_ai_call(response_time_ms=60000.0, success=False, timeout=True)
+        collector.record_phase_duration("decide", 2500.0)
+
+        llm = collector.latency_summary("llm")
+        assert llm.count == 100
+        assert llm.p50 == pytest.approx(500.0, rel=0.02)
+        assert llm.p99 == pytest.approx(990.0, rel=0.02)
+        assert collector.latency_summary("adb").p95 == pytest.approx(95.0, rel=0.02)
+        assert collector.latency_summary("phase.decide").count == 1
+        assert collector.latency_summary("omniparser").count == 0
+        assert set(collector.get_summary()["latency_percentiles_ms"]) == {"llm", "adb", "phase.decide"}
+
     def test_stats_property(self):
         """Test stats property accessor."""
         collector = RuntimeStatsCollector(run_id=100)
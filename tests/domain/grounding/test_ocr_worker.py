@@ -0,0 +1,168 @@
+import io
+import os
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+from mobile_crawler.domain.grounding.manager import GroundingManager
+from mobile_crawler.domain.grounding.ocr_engine import create_reader
+from mobile_crawler.domain.grounding.ocr_worker import OCRWorker, OCRWorkerError, WorkerOCREngine
+
+
+class _FakeReader:
+    """Stands in for easyocr.Reader inside the worker process."""
+
+    def __init__(self, on_gpu):
+        self.on_gpu = on_gpu
+
+    def readtext(self, image, batch_size=1):
+        height, width = image.shape[:2]
+        box = [[0, 0], [width, 0], [width, height], [0, height]]
+        return [(box, f"pid={os.getpid()} batch={batch_size}", 0.9)]
+
+    def recognize(self, grey, horizontal_list=None, free_list=None, batch_size=1):
+        return [
+            ([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], f"crop{i} batch={batch_size}", 0.8)
+            for i, (x0, x1, y0, y1) in enumerate(horizontal_list)
+        ]
+
+
+def _fake_reader_factory(languages, gpu):
+    return _FakeReader(bool(gpu)), bool(gpu)
+
+
+def _cpu_only_reader_factory(languages, gpu):
+    if gpu:
+        raise RuntimeError("CUDA driver not found")
+    return _FakeReader(False), False
+
+
+def _failing_reader_factory(languages, gpu):
+    raise FileNotFoundError("model files missing")
+
+
+def _png(width=120, height=80):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color="white").save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def worker():
+    # One worker for the module: spawning imports torch, which takes seconds
+    worker = OCRWorker(reader_factory=_fake_reader_factory, batch_size=8, startup_timeout=60)
+    yield worker
+    worker.close()
+
+
+def test_worker_loads_once_and_serves_image_bytes(worker):
+    first = worker.detect([_png(120, 80)])
+    second = worker.detect([_png(50, 40), _png(30, 20)])
+
+    assert first[0][0].box == (0, 0, 120, 80)
+    assert [r[0].box for r in second] == [(0, 0, 50, 40), (0, 0, 30, 20)]
+    # Every request is answered by the same long-lived process
+    texts = {results[0].text for results in first + second}
+    assert texts == {f"pid={worker._process.pid} batch=8"}
+    assert worker._process.pid != os.getpid()
+
+
+def test_recognize_sends_all_crops_in_one_batch(worker):
+    boxes = [(0, 0, 10, 10), (20, 0, 40, 10), (0, 20, 60, 30)]
+
+    results = worker.recognize(_png(), boxes)
+
+    assert [r.box for r in results] == boxes
+    assert all(r.text.endswith("batch=8") for r in results)
+    assert worker.recognize(_png(), [(0, 0, 1, 1)] * 12)[0].text.endswith("batch=12")
+
+
+def test_worker_restarts_after_crash(worker):
+    worker.start()
+    old_pid = worker._process.pid
+    worker._process.kill()
+    worker._process.join()
+
+    results = worker.detect([_png()])
+
+    assert worker._process.pid != old_pid
+    assert results[0][0].text.startswith(f"pid={worker._process.pid}")
+
+
+def test_worker_falls_back_to_cpu_when_gpu_start_fails():
+    worker = OCRWorker(gpu=True, reader_factory=_cpu_only_reader_factory, startup_timeout=60)
+    try:
+        worker.start()
+        assert worker.running
+        assert worker.on_gpu is False
+    finally:
+        worker.close()
+    assert not worker.running
+
+
+def test_worker_reports_load_failure_on_cpu():
+    worker = OCRWorker(gpu=False, reader_factory=_failing_reader_factory, startup_timeout=60)
+    with pytest.raises(OCRWorkerError, match="model files missing"):
+        worker.start()
+    assert not worker.running
+
+
+def test_create_reader_falls_back_to_cpu():
+    reader = Mock()
+    reader_cls = Mock(side_effect=[RuntimeError("CUDA out of memory"), reader])
+    with patch.dict(sys.modules, {"easyocr": Mock(Reader=reader_cls)}):
+        result = create_reader(["en"], gpu=True)
+
+    assert result == (reader, False)
+    assert [c.kwargs["gpu"] for c in reader_cls.call_args_list] == [True, False]
+
+
+def test_importing_grounding_does_not_load_easyocr():
+    code = (
+        "import sys, mobile_crawler.domain.grounding.ocr_worker; "
+        "print('easyocr' in sys.modules, 'torch' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout
+
+    assert output.split() == ["False", "False"]
+
+
+def test_engine_returns_empty_on_worker_error():
+    worker = Mock()
+    worker.detect.side_effect = OCRWorkerError("gone")
+
+    assert WorkerOCREngine(worker=worker).detect_text_bytes(b"png") == []
+
+
+def test_manager_grounds_in_memory_bytes(tmp_path, worker):
+    manager = GroundingManager(ocr_engine=WorkerOCREngine(worker=worker))
+    output_path = str(tmp_path / "marked.png")
+
+    overlay = manager.process_image_bytes(_png(100, 60), output_path)
+
+    assert overlay.original_dimensions == (100, 60)
+    assert overlay.label_map == {1: (50, 30)}
+    assert overlay.ocr_elements[0]["bounds"] == (0, 0, 100, 60)
+    with Image.open(output_path) as img:
+        assert img.size == (100, 60)
+
+
+def test_process_screenshot_reads_file_once(tmp_path):
+    screenshot = tmp_path / "screen.png"
+    screenshot.write_bytes(_png(40, 30))
+    engine = Mock()
+    engine.detect_text_bytes.return_value = []
+    manager = GroundingManager(ocr_engine=engine)
+
+    overlay = manager.process_screenshot(str(screenshot))
+
+    engine.detect_text_bytes.assert_called_once_with(screenshot.read_bytes())
+    engine.detect_text.assert_not_called()
+    assert overlay.marked_image_path == str(tmp_path / "screen_grounded.png")
+    assert overlay.original_dimensions == (40, 30)
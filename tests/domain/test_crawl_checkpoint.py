@@ -0,0 +1,209 @@
+"""Tests for crash-resumable crawl checkpoints."""
+
+import json
+import types
+from unittest.mock import Mock
+
+import pytest
+
+from mobile_crawler.domain.crawl_checkpoint import (
+    CHECKPOINT_FILENAME,
+    CrawlCheckpoint,
+    CrawlCheckpointStore,
+    restore_agent_state,
+    snapshot_agent_state,
+)
+from mobile_crawler.domain.crawler_agent_service import CrawlerAgentService
+from mobile_crawler.domain.errors import CheckpointError
+from mobile_crawler.domain.state_graph import StateGraphTracker
+
+
+def _agent_state(**overrides):
+    state = types.SimpleNamespace(
+        step_number=4,
+        visited_packages={"com.example.app"},
+        visited_activities={"MainActivity", "SettingsActivity"},
+        plan="1. Open settings",
+        manager_memory="Login requires email",
+        action_history=[{"action": "click", "index": 3}],
+        action_outcomes=[True],
+        fast_memory=["remember me"],
+        a11y_tree=[{"index": 1}],
+    )
+    for key, value in overrides.items():
+        setattr(state, key, value)
+    return state
+
+
+def _tracker_with_graph():
+    tracker = StateGraphTracker(run_id=7)
+    tracker.record_state("hashA", 1, "com.example.app", "MainActivity")
+    tracker.record_state("hashB", 2, "com.example.app", "SettingsActivity")
+    tracker.record_transition("hashA", "hashB", {"action": "click", "label_id": 3}, 2)
+    return tracker
+
+
+def test_snapshot_excludes_device_state_and_serializes_sets():
+    snapshot = snapshot_agent_state(_agent_state())
+
+    assert snapshot["visited_activities"] == ["MainActivity", "SettingsActivity"]
+    assert snapshot["step_number"] == 4
+    assert "a11y_tree" not in snapshot
+    json.dumps(snapshot)
+
+
+def test_restore_agent_state_updates_in_place():
+    snapshot = snapshot_agent_state(_agent_state())
+    fresh = _agent_state(
+        step_number=0, visited_activities=set(), plan="", manager_memory="", action_history=[]
+    )
+    original = fresh
+
+    restore_agent_state(fresh, snapshot)
+
+    assert fresh is original
+    assert fresh.step_number == 4
+    assert fresh.visited_activities == {"MainActivity", "SettingsActivity"}
+    assert fresh.manager_memory == "Login requires email"
+    assert fresh.action_history == [{"action": "click", "index": 3}]
+
+
+def test_state_graph_round_trip():
+    tracker = _tracker_with_graph()
+
+    restored = StateGraphTracker(run_id=7)
+    restored.restore(json.loads(json.dumps(tracker.to_dict())))
+
+    assert restored.states == tracker.states
+    assert restored.transitions == tracker.transitions
+    assert restored.history == ["hashA", "hashB"]
+    assert restored.record_state("hashA", 3, "com.example.app", "MainActivity") is False
+
+
+def test_store_save_and_load(tmp_path):
+    store = CrawlCheckpointStore(str(tmp_path / "data"))
+    checkpoint = CrawlCheckpoint(
+        run_id=7,
+        step_number=12,
+        agent_state=snapshot_agent_state(_agent_state()),
+        state_graph=_tracker_with_graph().to_dict(),
+    )
+
+    store.save(checkpoint)
+    loaded = store.load()
+
+    assert (tmp_path / "data" / CHECKPOINT_FILENAME).exists()
+    assert not (tmp_path / "data" / f"{CHECKPOINT_FILENAME}.tmp").exists()
+    assert loaded.run_id == 7
+    assert loaded.step_number == 12
+    assert loaded.state_graph["history"] == ["hashA", "hashB"]
+
+
+def test_store_load_missing_or_corrupt(tmp_path):
+    store = CrawlCheckpointStore(str(tmp_path))
+    assert store.load() is None
+
+    (tmp_path / CHECKPOINT_FILENAME).write_text("{not json", encoding="utf-8")
+    assert store.load() is None
+
+
+def test_store_save_failure_raises_checkpoint_error(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("x", encoding="utf-8")
+    store = CrawlCheckpointStore(str(blocker / "data"))
+
+    with pytest.raises(CheckpointError):
+        store.save(CrawlCheckpoint(run_id=1))
+
+
+class TestCrawlerAgentServiceCheckpointing:
+    """Checkpoint capture/restore through CrawlerAgentService."""
+
+    @pytest.fixture
+    def service(self):
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: {"crawl_checkpoint_interval_steps": 2}.get(key, default)
+        config.user_config_store = Mock()
+        svc = CrawlerAgentService(config_manager=config, ai_interaction_repository=None, device_id="dev")
+        svc._current_run_id = 7
+        return svc
+
+    def test_checkpoint_saved_on_interval(self, service, tmp_path):
+        service.configure_checkpointing(str(tmp_path))
+        service._crawler_agent = types.SimpleNamespace(
+            shared_state=_agent_state(), state_graph_tracker=_tracker_with_graph()
+        )
+
+        service._current_step_number = 1
+        service._maybe_checkpoint()
+        assert not (tmp_path / CHECKPOINT_FILENAME).exists()
+
+        service._current_step_number = 2
+        service._maybe_checkpoint()
+        assert CrawlCheckpointStore(str(tmp_path)).load().step_number == 2
+
+    def test_resume_restores_into_new_agent(self, service, tmp_path):
+        service.configure_checkpointing(str(tmp_path))
+        service._crawler_agent = types.SimpleNamespace(
+            shared_state=_agent_state(), state_graph_tracker=_tracker_with_graph()
+        )
+        service._current_step_number = 9
+        service._save_checkpoint()
+
+        service._current_step_number = 0
+        checkpoint = service.configure_checkpointing(str(tmp_path), resume=True)
+        assert checkpoint is not None
+
+        new_state = _agent_state(step_number=0, visited_activities=set(), manager_memory="")
+        new_tracker = StateGraphTracker(run_id=0)
+        service._crawler_agent = types.SimpleNamespace(shared_state=new_state, state_graph_tracker=new_tracker)
+        service._restore_pending_checkpoint()
+
+        assert service._current_step_number == 9
+        assert new_state.step_number == 4
+        assert new_state.manager_memory == "Login requires email"
+        assert set(new_tracker.states) == {"hashA", "hashB"}
+        assert service._pending_checkpoint is None
+
+    def test_journaled_graph_is_referenced_not_copied(self, service, tmp_path):
+        service.configure_checkpointing(str(tmp_path))
+        service._crawler_agent = types.SimpleNamespace(
+            shared_state=_agent_state(), state_graph_tracker=_tracker_with_graph()
+        )
+        service._attach_state_graph_journal()
+        service._current_step_number = 2
+        service._save_checkpoint()
+
+        tracker = service._crawler_agent.state_graph_tracker
+        tracker.record_state("hashC", 3, "com.example.app", "AboutActivity")
+        service._current_step_number = 4
+        service._save_checkpoint()
+
+        data = json.loads((tmp_path / CHECKPOINT_FILENAME).read_text(encoding="utf-8"))
+        assert "state_graph" not in data
+        assert data["state_graph_seq"] == tracker.journal_seq == 1
+
+        service.configure_checkpointing(str(tmp_path), resume=True)
+        new_tracker = StateGraphTracker(run_id=0)
+        service._crawler_agent = types.SimpleNamespace(
+            shared_state=_agent_state(step_number=0), state_graph_tracker=new_tracker
+        )
+        service._attach_state_graph_journal()
+        service._restore_pending_checkpoint()
+
+        assert set(new_tracker.states) == {"hashA", "hashB", "hashC"}
+        assert new_tracker.history == ["hashA", "hashB", "hashC"]
+        assert service._current_step_number == 4
+
+    def test_clear_checkpoint_removes_file(self, service, tmp_path):
+        service.configure_checkpointing(str(tmp_path))
+        service._crawler_agent = types.SimpleNamespace(
+            shared_state=_agent_state(), state_graph_tracker=_tracker_with_graph()
+        )
+        service._current_step_number = 2
+        service._save_checkpoint()
+
+        service.clear_checkpoint()
+
+        assert not (tmp_path / CHECKPOINT_FILENAME).exists()
+        assert service.configure_checkpointing(str(tmp_path), resume=True) is None
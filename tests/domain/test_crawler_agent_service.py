@@ -296,6 +296,38 @@ class TestCrawlerAgentServicePhaseTransition:
         assert metadata["validation_retries"][0]["reason"] == "Missing plan tag"
         assert crawler_agent_service._pending_step_timing == {}
 
+    def test_sub_phase_timings_forwarded_to_timing_sink(self, crawler_agent_service):
+        """Test configure_timing_sink receives every sub-phase timing."""
+        sink = Mock()
+        crawler_agent_service.configure_timing_sink(sink)
+
+        crawler_agent_service._add_sub_phase_timing("tool_execution_ms", 87.25, parent_phase=StepPhase.EXECUTE)
+        crawler_agent_service._add_sub_phase_timing("verification_ms", None)
+
+        sink.assert_called_once_with("tool_execution", 87.25)
+
+    def test_phase_profiler_follows_phase_machine(self, crawler_agent_service):
+        """Test configure_phase_profiler starts sampling and retags on transitions."""
+        crawler_agent_service.begin_step_tracking(run_id=1)
+        profiler = Mock()
+
+        crawler_agent_service.configure_phase_profiler(profiler)
+        crawler_agent_service._current_step_number = 4
+        crawler_agent_service._step_phase_machine.transition_to(StepPhase.DECIDE)
+
+        profiler.start.assert_called_once_with("capture", 0)
+        profiler.set_phase.assert_called_once_with("decide", 4)
+
+    def test_writer_queue_depth(self, crawler_agent_service):
+        """Test writer_queue_depth reads the agent's trajectory writer queue."""
+        assert crawler_agent_service.writer_queue_depth() is None
+
+        agent = Mock()
+        agent.trajectory_writer.worker.queue.qsize.return_value = 5
+        crawler_agent_service._crawler_agent = agent
+
+        assert crawler_agent_service.writer_queue_depth() == 5
+
 
 class TestCrawlerAgentServiceWireObservers:
     """Tests for wiring observers to agent."""
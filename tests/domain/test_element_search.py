@@ -0,0 +1,137 @@
+"""Tests for element search filters and the spatial index."""
+
+from mobile_crawler.domain.crawler_agent.tools.helpers import element_search
+from mobile_crawler.domain.crawler_agent.tools.helpers.element_search import (
+    Filters,
+    SpatialIndex,
+    flatten_tree,
+    spatial_index_for,
+)
+
+
+def node(text, left, top, right, bottom, children=None, **extra):
+    return {
+        "text": text,
+        "boundsInScreen": {"left": left, "top": top, "right": right, "bottom": bottom},
+        "children": children or [],
+        **extra,
+    }
+
+
+def screen():
+    """Header, a two-row list with a button in each row, and a footer."""
+    row1 = node("", 0, 200, 1000, 300, [
+        node("Alpha", 0, 200, 400, 300),
+        node("Edit", 800, 200, 1000, 300, isClickable=True),
+    ])
+    row2 = node("", 0, 400, 1000, 500, [
+        node("Beta", 0, 400, 400, 500),
+        node("Edit", 800, 400, 1000, 500, isClickable=True),
+    ])
+    root = node("", 0, 0, 1000, 1000, [
+        node("Header", 0, 0, 1000, 100),
+        node("", 0, 200, 1000, 500, [row1, row2]),
+        node("Footer", 0, 900, 1000, 1000),
+    ])
+    return root
+
+
+def texts(nodes):
+    return [n["text"] for n in nodes]
+
+
+class TestFlattenTree:
+    def test_pre_order(self):
+        root = screen()
+
+        assert texts(flatten_tree(root)) == [
+            "", "Header", "", "", "Alpha", "Edit", "", "Beta", "Edit", "Footer"
+        ]
+
+
+class TestSpatialIndex:
+    def test_subtree_ranges_and_parents(self):
+        root = screen()
+        index = SpatialIndex([root])
+        row1 = root["children"][1]["children"][0]
+
+        (start, end), = index.ranges([row1])
+        assert index.nodes[start] is row1
+        assert texts(index.nodes[start:end]) == ["", "Alpha", "Edit"]
+        assert index.nodes[index.parents[start]] is root["children"][1]
+
+    def test_ranges_reject_foreign_nodes(self):
+        index = SpatialIndex([screen()])
+
+        assert index.ranges([node("x", 0, 0, 1, 1)]) is None
+
+    def test_index_is_reused_for_subsets_of_a_tree(self):
+        root = screen()
+        index = spatial_index_for([root])
+
+        assert spatial_index_for(root["children"]) is index
+        assert spatial_index_for([]) is None
+
+    def test_cache_is_bounded(self):
+        for _ in range(element_search._MAX_CACHED_INDEXES + 3):
+            spatial_index_for([screen()])
+
+        assert len(element_search._index_cache) == element_search._MAX_CACHED_INDEXES
+
+
+class TestRelationalFilters:
+    def test_below_orders_by_distance(self):
+        result = Filters.below(Filters.text_matches("Alpha"))([screen()])
+
+        # Beta's row is nearer than its Edit button, and the footer is farthest
+        assert texts(result)[:2] == ["Beta", ""]
+        assert texts(result)[-1] == "Footer"
+        assert "Header" not in texts(result)
+
+    def test_above_left_right(self):
+        root = screen()
+
+        assert texts(Filters.above(Filters.text_matches("Alpha"))([root])) == ["Header"]
+        assert texts(Filters.right_of(Filters.text_matches("Beta"))([root])) == ["Edit", "Edit"]
+        edit = Filters.left_of(Filters.text_matches("Edit"))([root])
+        assert texts(edit) == ["Alpha", "Beta"]
+
+    def test_overlapping_input_repeats_nodes_like_a_scan(self):
+        root = screen()
+        row2 = root["children"][1]["children"][1]
+        # A row and its own button: flattening visits the button twice
+        nodes = [row2, row2["children"][1]]
+
+        result = Filters.right_of(Filters.text_matches("Beta"))(nodes)
+
+        assert len(result) == 2
+        assert result[0] is result[1] is row2["children"][1]
+
+    def test_missing_anchor_returns_nothing(self):
+        assert Filters.below(Filters.text_matches("Nope"))([screen()]) == []
+
+
+class TestHierarchyFilters:
+    def test_contains_child_with_node_filter_uses_descendants(self):
+        root = screen()
+
+        result = Filters.contains_child(Filters.text_matches("Beta"))([root])
+
+        # Node filters flatten each child's subtree, so every ancestor matches
+        assert result == [root, root["children"][1], root["children"][1]["children"][1]]
+
+    def test_contains_child_with_relational_filter(self):
+        root = screen()
+
+        result = Filters.contains_child(Filters.below(Filters.text_matches("Header")))([root])
+
+        assert result[0] is root
+
+    def test_child_of(self):
+        root = screen()
+
+        result = Filters.child_of(Filters.text_matches("Header"))([root])
+
+        assert result == []
+        rows = Filters.child_of(Filters.contains_child(Filters.text_matches("Alpha")))([root])
+        assert root["children"][1] in rows
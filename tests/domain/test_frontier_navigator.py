@@ -0,0 +1,143 @@
+"""Tests for LLM-free frontier navigation over the state graph."""
+
+import asyncio
+from types import SimpleNamespace
+
+from mobile_crawler.domain.frontier_navigator import FrontierNavigator
+from mobile_crawler.domain.state_graph import StateGraphTracker
+
+
+def _click(index):
+    return {"action": "click", "index": index}
+
+
+def _graph():
+    """home -(1)-> list -(2)-> detail; list has one untried element, detail has two."""
+    tracker = StateGraphTracker(run_id=1)
+    tracker.record_state("home", 1, "com.app", "Main", clickable_count=1)
+    tracker.record_transition("home", "list", _click(1), 1, duration_ms=300)
+    tracker.record_state("list", 2, "com.app", "List", clickable_count=2)
+    tracker.record_transition("list", "detail", _click(2), 2, duration_ms=300)
+    tracker.record_state("detail", 3, "com.app", "Detail", clickable_count=2)
+    tracker.record_transition("detail", "home", {"action": "system_button", "button": "home"}, 3)
+    tracker.record_state("home", 4, "com.app", "Main", clickable_count=1)
+    return tracker
+
+
+class FakeDevice:
+    """Moves between screens according to a {(screen, action): screen} table."""
+
+    def __init__(self, screen, edges):
+        self.screen = screen
+        self.edges = edges
+        self.executed = []
+        self.contexts = []
+
+    async def execute(self, command, workflow_ctx=None):
+        self.executed.append(command)
+        self.contexts.append(workflow_ctx)
+        key = (self.screen, command["action"], command.get("index"))
+        if key not in self.edges:
+            return False
+        self.screen = self.edges[key]
+        return True
+
+    async def capture(self):
+        return SimpleNamespace(layout_hash=self.screen, phone_state={}, elements=None)
+
+
+def test_path_to_frontier_prefers_cheapest_recorded_path():
+    tracker = _graph()
+
+    path = tracker.path_to_frontier("home")
+
+    assert [t["to_state"] for t in path] == ["list"]
+    assert path[0]["command"] == _click(1)
+
+
+def test_path_to_frontier_respects_max_hops_and_replayable_actions():
+    tracker = _graph()
+    tracker.record_transition("home", "settings", {"action": "type", "text": "x", "index": 3}, 5)
+    tracker.record_state("settings", 5, "com.app", "Settings", clickable_count=9)
+
+    # "type" is not replayable, so settings is only reachable through the LLM
+    assert [t["to_state"] for t in tracker.path_to_frontier("home")] == ["list"]
+    assert tracker.path_to_frontier("detail", max_hops=1) is None
+    assert [t["to_state"] for t in tracker.path_to_frontier("detail", max_hops=2)] == ["home", "list"]
+
+
+def test_should_navigate_only_from_exhausted_screens():
+    tracker = _graph()
+    navigator = FrontierNavigator(tracker, execute=None, capture=None)
+
+    assert navigator.should_navigate("home") is True
+    assert navigator.should_navigate("list") is False
+    assert navigator.should_navigate("unknown") is False
+
+
+def test_swipe_and_back_do_not_exhaust_a_screen():
+    tracker = StateGraphTracker(run_id=1)
+    tracker.record_state("form", 1, "com.app", "Form", clickable_count=2)
+    tracker.record_transition("form", "form", {"action": "swipe", "direction": "up"}, 1)
+    tracker.record_transition("form", "home", {"action": "system_button", "button": "back"}, 2)
+    tracker.record_transition("form", "form", {"action": "input_text", "text": "x", "index": 1}, 3)
+    navigator = FrontierNavigator(tracker, execute=None, capture=None)
+
+    assert tracker.is_frontier("form") is True
+    assert navigator.should_navigate("form") is False
+
+
+def test_same_element_by_label_and_index_counts_once():
+    tracker = StateGraphTracker(run_id=1)
+    tracker.record_state("form", 1, "com.app", "Form", clickable_count=2)
+    tracker.record_transition("form", "detail", {"action": "click", "label_id": 1}, 1)
+    tracker.record_transition("form", "detail", _click(1), 2)
+    assert tracker.is_frontier("form") is True
+
+    tracker.record_transition("form", "menu", {"action": "long_press", "index": 2}, 3)
+    assert tracker.is_frontier("form") is False
+
+
+def test_navigate_replays_path_and_records_hops():
+    tracker = _graph()
+    device = FakeDevice("detail", {("detail", "system_button", None): "home", ("home", "click", 1): "list"})
+    navigator = FrontierNavigator(tracker, device.execute, device.capture)
+
+    ctx = object()
+
+    result = asyncio.run(navigator.navigate("detail", step_number=5, workflow_ctx=ctx))
+
+    assert result.reached is True
+    assert result.hops_completed == 2
+    assert result.llm_steps_saved == 2
+    assert result.final_state.layout_hash == "list"
+    assert tracker.history[-2:] == ["home", "list"]
+    assert navigator.total_hops == 2
+    assert device.contexts == [ctx, ctx]
+
+
+def test_navigate_stops_and_hands_back_on_divergence():
+    tracker = _graph()
+    device = FakeDevice("detail", {("detail", "system_button", None): "dialog"})
+    navigator = FrontierNavigator(tracker, device.execute, device.capture)
+
+    result = asyncio.run(navigator.navigate("detail", step_number=5))
+
+    assert result.reached is False
+    assert result.diverged is True
+    assert result.hops_completed == 0
+    assert result.final_state.layout_hash == "dialog"
+    assert len(device.executed) == 1
+    # The observed outcome replaces the stale edge
+    assert tracker.outgoing_actions("detail")["system_button(home)"] == "dialog"
+
+
+def test_navigate_without_path_does_nothing():
+    tracker = StateGraphTracker(run_id=1)
+    tracker.record_state("lonely", 1, "com.app", "Main", clickable_count=0)
+    device = FakeDevice("lonely", {})
+
+    result = asyncio.run(FrontierNavigator(tracker, device.execute, device.capture).navigate("lonely", 1))
+
+    assert result.final_state is None
+    assert device.executed == []
@@ -0,0 +1,129 @@
+"""Tests for the bounded latency quantile sketch."""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from mobile_crawler.domain.latency_sketch import EMPTY_SUMMARY, LatencySketch
+from mobile_crawler.domain.stats_collector_span_processor import StatsCollectorSpanProcessor
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestLatencySketch:
+    """Test LatencySketch accuracy, bounds and merging."""
+
+    def test_empty_sketch(self):
+        """Test an empty sketch reports zeros."""
+        sketch = LatencySketch()
+        assert sketch.count == 0
+        assert sketch.quantile(0.99) == 0.0
+        assert sketch.summary() == EMPTY_SUMMARY
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test p50/p95/p99 stay within the configured relative error."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(7, 1) for _ in range(20_000)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        summary = sketch.summary()
+        for q, estimate in [(0.5, summary.p50), (0.95, summary.p95), (0.99, summary.p99)]:
+            assert estimate == pytest.approx(_exact_quantile(values, q), rel=0.011)
+        assert summary.count == len(values)
+        assert summary.mean == pytest.approx(sum(values) / len(values))
+        assert summary.max == max(values)
+
+    def test_bucket_count_is_bounded(self):
+        """Test collapsing keeps memory fixed and preserves the tail."""
+        sketch = LatencySketch(max_buckets=64)
+        values = [10 ** (i / 1000) for i in range(6000)]  # 1ms .. ~1e6ms
+        for value in values:
+            sketch.add(value)
+
+        assert sketch.bucket_count == 64
+        assert sketch.count == len(values)
+        assert sketch.quantile(0.99) == pytest.approx(_exact_quantile(values, 0.99), rel=0.011)
+
+    def test_merge_matches_single_sketch(self):
+        """Test merging two sketches equals recording into one."""
+        rng = random.Random(3)
+        left, right, combined = LatencySketch(), LatencySketch(), LatencySketch()
+        for i in range(5000):
+            value = rng.uniform(1, 5000)
+            (left if i % 2 else right).add(value)
+            combined.add(value)
+
+        left.merge(right)
+
+        merged, expected = left.summary(), combined.summary()
+        assert (merged.count, merged.p50, merged.p95, merged.p99, merged.max) == (
+            expected.count, expected.p50, expected.p95, expected.p99, expected.max
+        )
+        assert merged.mean == pytest.approx(expected.mean)
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test merging incompatible sketches raises."""
+        other = LatencySketch(relative_accuracy=0.05)
+        other.add(1.0)
+        with pytest.raises(ValueError):
+            LatencySketch(relative_accuracy=0.01).merge(other)
+
+    def test_summary_cached_until_next_sample(self):
+        """Test repeated reads reuse the summary until new data arrives."""
+        sketch = LatencySketch()
+        sketch.add(100.0)
+        first = sketch.summary()
+        assert sketch.summary() is first
+
+        sketch.add(300.0)
+        assert sketch.summary() is not first
+        assert sketch.summary().count == 2
+
+    def test_zero_and_negative_samples(self):
+        """Test zero lands in the zero bucket and negatives are ignored."""
+        sketch = LatencySketch()
+        sketch.add(0.0)
+        sketch.add(-5.0)
+        sketch.add(50.0)
+        assert sketch.count == 2
+        assert sketch.quantile(0.0) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(50.0, rel=0.01)
+
+    def test_copy_is_independent(self):
+        """Test copies do not share bucket state."""
+        sketch = LatencySketch()
+        sketch.add(10.0)
+        clone = sketch.copy()
+        sketch.add(20.0)
+        assert clone.count == 1
+        assert sketch.count == 2
+
+
+class TestStatsCollectorSpanProcessor:
+    """Test span processor latency tracking."""
+
+    def test_llm_latency_recorded_in_sketch(self):
+        """Test LLM span durations feed the sketch and snapshots are independent."""
+        processor = StatsCollectorSpanProcessor()
+        for duration_ms in (1000, 2000, 3000):
+            span = Mock(
+                attributes={"llm.token_count.prompt": 10, "llm.token_count.completion": 5},
+                start_time=1_000,
+                end_time=1_000 + duration_ms * 1_000_000,
+            )
+            processor.on_end(span)
+
+        stats = processor.get_stats()
+        processor.reset()
+
+        assert stats.total_tokens == 45
+        assert stats.avg_latency_ms == pytest.approx(2000.0)
+        assert stats.latency_summary.count == 3
+        assert stats.latency_summary.p50 == pytest.approx(2000.0, rel=0.01)
+        assert processor.get_stats().latency_summary.count == 0
@@ -0,0 +1,243 @@
+"""Tests for live per-step traffic attribution over PCAPdroid's UDP exporter."""
+
+import asyncio
+import json
+import socket
+import struct
+import time
+import types
+from datetime import datetime
+from unittest.mock import Mock
+
+import dpkt
+
+from mobile_crawler.domain.crawler_agent_service import CrawlerAgentService
+from mobile_crawler.domain.live_traffic import LiveTrafficAttributor, PcapUdpCollector
+from mobile_crawler.domain.prompt_builder import PromptBuilder
+from mobile_crawler.domain.traffic_capture_manager import TrafficCaptureManager
+from mobile_crawler.reporting.contracts import NetworkRequest
+from mobile_crawler.reporting.parsers.pcap_parser import LINKTYPE_RAW, StreamingPcapParser
+
+CLIENT = "10.0.0.2"
+RESOLVER = "10.0.0.1"
+
+
+def _ipv4(src, dst, proto, payload):
+    header = struct.pack(
+        ">BBHHHBBH4s4s", 0x45, 0, 20 + len(payload), 0, 0, 64, proto, 0,
+        socket.inet_aton(src), socket.inet_aton(dst),
+    )
+    return header + payload
+
+
+def _tcp(sport, dport, payload):
+    return struct.pack(">HHIIBBHHH", sport, dport, 1, 0, 5 << 4, 0x18, 65535, 0, 0) + payload
+
+
+def _udp(sport, dport, payload):
+    return struct.pack(">HHHH", sport, dport, 8 + len(payload), 0) + payload
+
+
+def _client_hello(sni):
+    name = sni.encode()
+    server_name = struct.pack(">BH", 0, len(name)) + name
+    extension = struct.pack(">HHH", 0, len(server_name) + 2, len(server_name)) + server_name
+    body = (
+        b"\x03\x03" + b"\x22" * 32 + b"\x00" + b"\x00\x02\x13\x01" + b"\x01\x00"
+        + struct.pack(">H", len(extension)) + extension
+    )
+    handshake = b"\x01" + len(body).to_bytes(3, "big") + body
+    return b"\x16\x03\x01" + struct.pack(">H", len(handshake)) + handshake
+
+
+def _dns(name, txid, answer=None):
+    message = dpkt.dns.DNS(id=txid, qd=[dpkt.dns.DNS.Q(name=name)])
+    if answer:
+        message.qr = dpkt.dns.DNS_R
+        message.an = [dpkt.dns.DNS.RR(name=name, type=dpkt.dns.DNS_A, rdata=socket.inet_aton(answer))]
+    return bytes(message)
+
+
+def _record(ts, packet):
+    seconds = int(ts)
+    return struct.pack("<IIII", seconds, int((ts - seconds) * 1e6), len(packet), len(packet)) + packet
+
+
+def _recorded_capture():
+    """Records of a short session, grouped by the crawl step that caused them."""
+    return {
+        1: [
+            _record(1.0, _ipv4(CLIENT, RESOLVER, 17, _udp(5000, 53, _dns("api.example.com", 1)))),
+            _record(1.1, _ipv4(RESOLVER, CLIENT, 17, _udp(53, 5000, _dns("api.example.com", 1, "93.184.216.34")))),
+            _record(1.2, _ipv4(CLIENT, "93.184.216.34", 6, _tcp(40000, 443, _client_hello("api.example.com")))),
+        ],
+        2: [
+            _record(2.0, _ipv4(CLIENT, "93.184.216.34", 6, _tcp(40001, 443, _client_hello("api.example.com")))),
+        ],
+        3: [
+            _record(3.0, _ipv4(CLIENT, "151.101.1.1", 6, _tcp(40002, 443, _client_hello("ads.tracker.net")))),
+            _record(3.1, _ipv4(CLIENT, "151.101.1.2", 6, _tcp(40003, 80, (
+                b"GET /pixel HTTP/1.1\r\nHost: cdn.tracker.net\r\n\r\n"
+            )))),
+        ],
+    }
+
+
+async def _replay(port, records, collector):
+    """Send records to the collector over UDP and wait until they are processed."""
+    expected = collector.datagrams_received + len(records)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for record in records:
+            sock.sendto(record, ("127.0.0.1", port))
+    deadline = time.monotonic() + 5.0
+    while collector.datagrams_received < expected and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+def _request(host, size=100):
+    return NetworkRequest(datetime.now(), "CONNECT", f"https://{host}", host, "TLS", size_bytes=size)
+
+
+class TestLiveTrafficAttributor:
+
+    def test_requests_go_to_current_step_and_new_hosts_are_tracked(self):
+        attributor = LiveTrafficAttributor()
+        attributor.begin_step(1)
+        attributor.add_request(_request("a.example"))
+        attributor.add_request(_request("a.example"))
+        attributor.begin_step(2)
+        attributor.add_request(_request("a.example"))
+        attributor.add_request(_request("b.example", size=50))
+
+        step1 = attributor.step_summary(1)
+        step2 = attributor.step_summary(2)
+        assert (step1.request_count, step1.total_bytes, step1.new_hosts) == (2, 200, ["a.example"])
+        assert step2.hosts == ["a.example", "b.example"]
+        assert step2.new_hosts == ["b.example"]
+
+    def test_prompt_summary_reports_last_completed_step(self):
+        attributor = LiveTrafficAttributor(history_size=3)
+        for step in range(1, 6):
+            attributor.begin_step(step)
+            attributor.add_request(_request(f"host{step}.example"))
+
+        summary = attributor.prompt_summary(recent_steps=2)
+
+        assert summary["new_hosts_last_step"] == ["host4.example"]
+        assert [s["step"] for s in summary["recent_steps"]] == [4, 5]
+        assert summary["distinct_hosts"] == 5
+        assert attributor.step_summary(1) is None
+
+    def test_prompt_builder_includes_network_activity(self):
+        attributor = LiveTrafficAttributor()
+        attributor.begin_step(1)
+        attributor.add_request(_request("api.example.com"))
+        attributor.begin_step(2)
+        step_logs = Mock()
+        step_logs.get_exploration_journal.return_value = []
+        step_logs.get_step_statistics.return_value = {}
+        builder = PromptBuilder(Mock(get=Mock(return_value="")), step_logs, traffic_attributor=attributor)
+
+        prompt = builder.build_user_prompt("b64", run_id=1)
+
+        assert '"new_hosts_last_step": [\n      "api.example.com"' in prompt
+
+    def test_service_publishes_activity_and_persists_finished_step(self):
+        attributor = LiveTrafficAttributor()
+        service = CrawlerAgentService(config_manager=Mock(), ai_interaction_repository=None, device_id="dev")
+        service._current_run_id = 7
+        service._step_phase_machine = Mock()
+        service._step_phase_repository = Mock()
+        service._crawler_agent = types.SimpleNamespace(shared_state=types.SimpleNamespace(network_activity=""))
+        service.configure_traffic_attribution(attributor)
+        attributor.add_request(_request("api.example.com"))
+
+        asyncio.run(service._handle_tool_execution_event(Mock(tool_name="tap", success=True, duration_ms=None)))
+
+        run_id, step, network_json = service._step_phase_repository.record_step_network.call_args[0]
+        assert (run_id, step) == (7, 0)
+        assert json.loads(network_json)["hosts"] == ["api.example.com"]
+        activity = json.loads(service._crawler_agent.shared_state.network_activity)
+        assert activity["new_hosts_last_step"] == ["api.example.com"]
+
+
+def test_udp_replay_attributes_flows_to_steps(tmp_path):
+    capture = _recorded_capture()
+    output = tmp_path / "live.pcap"
+    attributor = LiveTrafficAttributor()
+
+    async def scenario():
+        collector = PcapUdpCollector(str(output), attributor, host="127.0.0.1", port=0)
+        port = await collector.start()
+        for step, records in capture.items():
+            attributor.begin_step(step)
+            await _replay(port, records, collector)
+        return await collector.close()
+
+    pcap_path = asyncio.run(scenario())
+
+    step1, step2, step3 = (attributor.step_summary(n) for n in (1, 2, 3))
+    assert step1.hosts == ["api.example.com"]
+    assert step1.request_count == 2  # DNS lookup + TLS connection
+    assert step2.new_hosts == []
+    assert step3.new_hosts == ["ads.tracker.net", "cdn.tracker.net"]
+
+    # The collected file is a regular capture of the same traffic
+    assert pcap_path == str(output)
+    requests = StreamingPcapParser().parse(pcap_path)
+    assert [r.host for r in requests] == [
+        "api.example.com", "api.example.com", "api.example.com", "ads.tracker.net", "cdn.tracker.net",
+    ]
+
+
+def test_capture_manager_streams_to_collector_and_stops_without_pull(tmp_path):
+    config = Mock()
+    config.get.side_effect = lambda key, default=None: {
+        "enable_traffic_capture": True,
+        "app_package": "com.test.app",
+        "pcapdroid_api_key": "key",
+        "pcapdroid_init_wait": 0.0,
+        "pcapdroid_finalize_wait": 30.0,
+        "pcapdroid_consent_timeout_seconds": 0.0,
+        "pcapdroid_live_traffic": True,
+        "pcapdroid_collector_bind_address": "127.0.0.1",
+        "pcapdroid_collector_port": 0,
+    }.get(key, default)
+    commands = []
+
+    async def adb(cmd, suppress_stderr=False):
+        joined = " ".join(cmd)
+        commands.append(joined)
+        if "pm list packages" in joined:
+            return ("package:com.emanuelef.remote_capture\n", 0)
+        if "##mc:" in joined:
+            return ("##mc:tun\ntun0 0x1091\n##mc:connectivity\nVPN CONNECTED com.emanuelef.remote_capture\n"
+                    "##mc:services\n", 0)
+        return ("", 0)
+
+    manager = TrafficCaptureManager(config_manager=config, adb_client=Mock())
+    manager._run_adb_command_async = adb
+    manager._stop_any_existing_capture_async = Mock(side_effect=lambda: asyncio.sleep(0))
+
+    async def scenario():
+        started, _ = await manager.start_capture_async(run_id=1, step_num=0, session_path=str(tmp_path))
+        assert started
+        collector = manager._collector
+        manager.traffic_attributor.begin_step(1)
+        await _replay(collector.port, _recorded_capture()[3], collector)
+        stop_started = time.monotonic()
+        path = await manager.stop_capture_and_pull_async(run_id=1, step_num=0)
+        return path, time.monotonic() - stop_started
+
+    pcap_path, stop_seconds = asyncio.run(scenario())
+
+    start_command = next(c for c in commands if "pcap_dump_mode" in c)
+    assert "udp_exporter" in start_command
+    assert "collector_port" in start_command
+    assert not any(c.startswith("pull") for c in commands)
+    assert stop_seconds < 5.0
+    assert pcap_path.endswith(".pcap")
+    assert manager.traffic_attributor.step_summary(1).new_hosts == ["ads.tracker.net", "cdn.tracker.net"]
+    assert len(StreamingPcapParser().parse(pcap_path)) == 2
+    with open(pcap_path, "rb") as f:
+        assert struct.unpack_from("<I", f.read(24), 20)[0] == LINKTYPE_RAW
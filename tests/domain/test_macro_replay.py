@@ -0,0 +1,210 @@
+"""Tests for settle-aware macro replay."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mobile_crawler.domain.crawler_agent.macro.replay import MacroPlayer
+from mobile_crawler.domain.crawler_agent.tools.driver.recording import RecordingDriver
+from mobile_crawler.domain.crawler_agent.tools.filters import ConciseFilter, DetailedFilter
+from mobile_crawler.domain.crawler_agent.tools.formatters import IndexedFormatter
+from mobile_crawler.domain.crawler_agent.tools.ui.provider import AndroidStateProvider
+from mobile_crawler.domain.state_graph import EMPTY_LAYOUT_HASH
+
+
+def _player(**kwargs):
+    player = MacroPlayer(device_serial="emulator-5554", **kwargs)
+    player.driver = AsyncMock()
+    player.settle_poll_interval = 0
+    return player
+
+
+def _states(*hashes):
+    provider = AsyncMock()
+    provider.get_state.side_effect = [SimpleNamespace(layout_hash=h) for h in hashes]
+    return provider
+
+
+class TestWaitUntilSettled:
+    @pytest.mark.asyncio
+    async def test_settles_once_screenshot_stops_changing(self):
+        player = _player(settle_timeout=3.0)
+        player.driver.screenshot.side_effect = [b"anim-1", b"anim-2", b"done", b"done"]
+
+        settled, fingerprint = await player.wait_until_settled()
+
+        assert settled is True
+        assert fingerprint is not None
+        assert player.driver.screenshot.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_gives_up_at_ceiling(self):
+        player = _player(settle_timeout=0.05)
+        player.settle_poll_interval = 0.01
+        frames = iter(range(10_000))
+        player.driver.screenshot.side_effect = lambda: str(next(frames)).encode()
+
+        settled, _ = await player.wait_until_settled()
+
+        assert settled is False
+
+    @pytest.mark.asyncio
+    async def test_uses_layout_hash_from_state_provider(self):
+        player = _player(settle_timeout=3.0, state_provider=_states("a", "b", "b"))
+
+        assert await player.wait_until_settled() == (True, "b")
+        player.driver.screenshot.assert_not_awaited()
+
+
+class TestReplayMacro:
+    @pytest.mark.asyncio
+    async def test_settle_mode_skips_fixed_sleeps(self):
+        player = _player(settle_timeout=3.0)
+        player.driver.screenshot.return_value = b"still"
+        macro = {"actions": [
+            {"action_type": "tap", "x": 1, "y": 2},
+            {"action_type": "swipe", "start_x": 0, "start_y": 0, "end_x": 0, "end_y": 9},
+        ]}
+
+        with patch("mobile_crawler.domain.crawler_agent.macro.replay.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await player.replay_macro(macro) is True
+
+        assert all(call.args[0] == 0 for call in sleep.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_fixed_delay_mode_sleeps_between_actions_only(self):
+        player = _player(delay_between_actions=1.0)
+        macro = {"actions": [{"action_type": "tap", "x": 1, "y": 2}, {"action_type": "back"}]}
+
+        with patch("mobile_crawler.domain.crawler_agent.macro.replay.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await player.replay_macro(macro) is True
+
+        assert [call.args[0] for call in sleep.await_args_list] == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_reports_drift_against_recorded_layout_hash(self):
+        player = _player(settle_timeout=3.0, state_provider=_states("home", "home", "popup", "popup"))
+        macro = {"actions": [
+            {"action_type": "tap", "x": 1, "y": 2, "expected_layout_hash": "home"},
+            {"action_type": "tap", "x": 3, "y": 4, "expected_layout_hash": "detail"},
+        ]}
+
+        assert await player.replay_macro(macro) is True
+        assert player.drifted_steps == [2]
+
+    @pytest.mark.asyncio
+    async def test_stop_on_drift_aborts_replay(self):
+        player = _player(settle_timeout=3.0, state_provider=_states("popup", "popup"), stop_on_drift=True)
+        macro = {"actions": [
+            {"action_type": "tap", "x": 1, "y": 2, "expected_layout_hash": "home"},
+            {"action_type": "tap", "x": 3, "y": 4},
+        ]}
+
+        assert await player.replay_macro(macro) is False
+        assert player.driver.tap.await_count == 1
+
+
+    @pytest.mark.asyncio
+    async def test_fixed_delay_mode_still_checks_drift(self):
+        player = _player(delay_between_actions=1.0, state_provider=_states("home", "popup"))
+        macro = {"actions": [
+            {"action_type": "tap", "x": 1, "y": 2, "expected_layout_hash": "home"},
+            {"action_type": "tap", "x": 3, "y": 4, "expected_layout_hash": "detail"},
+        ]}
+
+        with patch("mobile_crawler.domain.crawler_agent.macro.replay.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await player.replay_macro(macro) is True
+
+        assert [call.args[0] for call in sleep.await_args_list] == [1.0, 1.0]
+        assert player.drifted_steps == [2]
+
+
+def _android_driver():
+    """Stands in for AndroidDriver, whose get_ui_tree() never includes an a11y tree."""
+    driver = AsyncMock()
+    driver.screenshot.return_value = b"png"
+    driver.get_ui_tree.return_value = {
+        "a11y_tree": [],
+        "phone_state": {"currentApp": "com.example.app"},
+        "device_context": {"screen_bounds": {"width": 1080, "height": 2400}},
+    }
+    return driver
+
+
+_OMNI_ELEMENTS = [
+    {"bbox": [0.1, 0.1, 0.5, 0.2], "content": "Settings", "interactivity": True, "type": "text"},
+    {"bbox": [0.1, 0.3, 0.5, 0.4], "content": "Profile", "interactivity": True, "type": "text"},
+]
+
+
+class TestVerifyDrift:
+    @pytest.mark.asyncio
+    async def test_refuses_to_verify_when_parser_sees_no_elements(self):
+        driver = _android_driver()
+        accessibility = AndroidStateProvider(
+            driver, DetailedFilter(), IndexedFormatter(), ui_parser_mode="accessibility"
+        )
+        assert (await accessibility.get_state()).layout_hash == EMPTY_LAYOUT_HASH
+
+        player = _player(settle_timeout=3.0, verify_drift=True, stop_on_drift=True)
+        player.driver = driver
+        macro = {
+            "layout_hash": {"ui_parser_mode": "accessibility", "tree_filter": "detailed"},
+            "actions": [
+                {"action_type": "tap", "x": 1, "y": 2, "expected_layout_hash": "home"},
+                {"action_type": "tap", "x": 3, "y": 4, "expected_layout_hash": "detail"},
+            ],
+        }
+
+        assert await player.replay_macro(macro) is True
+        assert player.verify_drift is False
+        assert player.drift_provider is None
+        assert player.drifted_steps == []
+        assert driver.tap.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_recorded_provider_and_matches_hashes(self):
+        omni = AsyncMock(return_value=_OMNI_ELEMENTS)
+        with patch.object(AndroidStateProvider, "_get_omni_parser_elements", new=omni), \
+                patch("mobile_crawler.domain.crawler_agent.macro.replay.asyncio.sleep", new=AsyncMock()):
+            recorder = AndroidStateProvider(
+                _android_driver(), ConciseFilter(), IndexedFormatter(), ui_parser_mode="omniparser"
+            )
+            recorded = (await recorder.get_state()).layout_hash
+            player = _player(verify_drift=True, stop_on_drift=True)
+            player.driver = _android_driver()
+            macro = {
+                "layout_hash": recorder.layout_hash_settings(),
+                "actions": [
+                    {"action_type": "tap", "x": 1, "y": 2, "expected_layout_hash": recorded},
+                    {"action_type": "back", "expected_layout_hash": "elsewhere"},
+                ],
+            }
+
+            assert await player.replay_macro(macro) is False
+
+        assert recorded != EMPTY_LAYOUT_HASH
+        assert player.drift_provider.ui_parser_mode == "omniparser"
+        assert player.drift_provider.tree_filter.get_name() == "concise"
+        assert player.drifted_steps == [2]
+
+    @pytest.mark.asyncio
+    async def test_macro_without_hash_settings_is_not_verified(self):
+        player = _player(verify_drift=True)
+        macro = {"actions": [{"action_type": "tap", "x": 1, "y": 2, "expected_layout_hash": "home"}]}
+
+        assert await player.replay_macro(macro) is True
+        assert player.verify_drift is False
+        player.driver.get_ui_tree.assert_not_awaited()
+
+
+class TestRecordingDriverLayoutHash:
+    @pytest.mark.asyncio
+    async def test_last_capture_after_action_is_kept(self):
+        driver = RecordingDriver(AsyncMock())
+        driver.note_layout_hash("before-any-action")
+        await driver.tap(1, 2)
+        driver.note_layout_hash("settling")
+        driver.note_layout_hash("settled")
+
+        assert driver.log == [{"action_type": "tap", "x": 1, "y": 2, "expected_layout_hash": "settled"}]
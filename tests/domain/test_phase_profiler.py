@@ -0,0 +1,99 @@
+"""Tests for the per-phase sampling profiler."""
+
+import json
+import sys
+import time
+
+from mobile_crawler.domain.phase_profiler import PhaseProfiler, collapse_stack
+from mobile_crawler.domain.step_phase import StepPhase, StepPhaseStateMachine
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _hash_screen(seconds):
+    _busy(seconds)
+
+
+def _wait_for_llm(seconds):
+    time.sleep(seconds)
+
+
+class TestCollapseStack:
+    """Test collapsed stack rendering."""
+
+    def test_root_first_with_module_names(self):
+        """Test frames are rendered caller-first as module:function."""
+        stack = collapse_stack(sys._getframe())
+        assert stack.endswith(f"{__name__}:test_root_first_with_module_names")
+        assert ";" in stack
+
+    def test_depth_is_capped(self):
+        """Test max_depth keeps only the innermost frames."""
+        stack = collapse_stack(sys._getframe(), max_depth=2)
+        assert len(stack.split(";")) == 2
+
+
+class TestPhaseProfiler:
+    """Test sampling, phase tagging and output."""
+
+    def test_samples_are_tagged_with_phase_and_step(self, tmp_path):
+        """Test each phase's samples land in its own collapsed-stack file."""
+        profiler = PhaseProfiler(interval_seconds=0.002)
+        profiler.start(StepPhase.CAPTURE.value, 1)
+        _hash_screen(0.15)
+        profiler.set_phase(StepPhase.DECIDE.value, 1)
+        _wait_for_llm(0.15)
+        profiler.set_phase(StepPhase.CAPTURE.value, 2)
+        _hash_screen(0.05)
+        profiler.stop()
+
+        stacks = profiler.collapsed_stacks()
+        assert any(stack.endswith("_hash_screen;" + f"{__name__}:_busy") for stack in stacks["capture"])
+        assert any(f"{__name__}:_wait_for_llm" in stack for stack in stacks["decide"])
+        assert not any("_wait_for_llm" in stack for stack in stacks["capture"])
+
+        summary = profiler.summary()
+        assert set(summary["steps"]) == {"1", "2"}
+        assert set(summary["steps"]["1"]) == {"capture", "decide"}
+        # LLM waits are wall time without CPU; hashing burns CPU
+        decide = summary["phases"]["decide"]
+        capture = summary["phases"]["capture"]
+        assert decide["wall_ms"] >= 140
+        assert decide["cpu_ms"] < decide["wall_ms"] / 2
+        assert capture["cpu_ms"] > capture["wall_ms"] / 4
+
+        written = profiler.write(tmp_path)
+
+        assert {p.name for p in written} == {"capture.folded", "decide.folded", "by_step.folded", "summary.json"}
+        line = (tmp_path / "decide.folded").read_text().splitlines()[0]
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and ";" in stack
+        assert all(
+            line.startswith(("step_1;capture;", "step_1;decide;", "step_2;capture;"))
+            for line in (tmp_path / "by_step.folded").read_text().splitlines()
+        )
+        assert json.loads((tmp_path / "summary.json").read_text())["phases"]["decide"]["samples"] > 0
+
+    def test_stop_without_start_is_noop(self, tmp_path):
+        """Test an unstarted profiler stops and writes an empty summary."""
+        profiler = PhaseProfiler()
+        profiler.stop()
+        assert profiler.sample_count == 0
+        assert [p.name for p in profiler.write(tmp_path)] == ["by_step.folded", "summary.json"]
+
+    def test_follows_step_phase_machine(self):
+        """Test a state machine listener drives the profiler's phase tag."""
+        profiler = PhaseProfiler(interval_seconds=0.002)
+        machine = StepPhaseStateMachine()
+        machine.add_listener(lambda _old, new: profiler.set_phase(new.value, 3))
+        profiler.start()
+        machine.transition_to(StepPhase.DECIDE)
+        _busy(0.05)
+        profiler.stop()
+
+        assert "3" in profiler.summary()["steps"]
+        assert profiler.summary()["steps"]["3"].keys() == {"decide"}
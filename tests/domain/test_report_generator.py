@@ -1,5 +1,6 @@
 """Tests for ReportGenerator."""
 
+import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -165,3 +166,33 @@ class TestReportGenerator:
         # Completely invalid
         result = generator._safe_json_load("not json at all")
         assert result == {"raw": "not json at all"}
+
+    def test_steps_link_to_their_video_offset(self, tmp_path):
+        """Steps in the video manifest get a media-fragment link to their clip."""
+        videos = tmp_path / "videos"
+        videos.mkdir()
+        clip = videos / "app_run1_part002.mp4"
+        (videos / "manifest.json").write_text(json.dumps({
+            "steps": [{"step_number": 1, "part": 2, "local_path": str(clip), "offset_seconds": 12.345}],
+        }))
+        run = Mock(session_path=str(tmp_path), app_package="com.example.app", device_id="device123",
+                   start_time=datetime(2024, 1, 1, 10, 0, 0), end_time=datetime(2024, 1, 1, 10, 5, 0),
+                   status="COMPLETED")
+        step = Mock(step_number=1, timestamp=datetime(2024, 1, 1, 10, 0, 30), action_type="click",
+                    target_bbox_json=None)
+        unrecorded = Mock(step_number=2, timestamp=datetime(2024, 1, 1, 10, 1, 0), action_type="back",
+                          target_bbox_json=None)
+
+        with patch('mobile_crawler.domain.report_generator.RunRepository') as run_repo_cls, \
+             patch('mobile_crawler.domain.report_generator.StepLogRepository') as step_repo_cls, \
+             patch('mobile_crawler.domain.report_generator.AIInteractionRepository') as ai_repo_cls, \
+             patch('mobile_crawler.domain.report_generator.JinjaReportGenerator') as mock_jinja_cls:
+            run_repo_cls.return_value.get_run_by_id.return_value = run
+            step_repo_cls.return_value.get_step_logs_by_run.return_value = [step, unrecorded]
+            ai_repo_cls.return_value.get_ai_interactions_by_run.return_value = []
+
+            ReportGenerator(Mock()).generate(1, str(tmp_path / "report.html"))
+
+        report_data = mock_jinja_cls.return_value.generate.call_args.args[0]
+        assert report_data.timeline[0].video_clip == "../videos/app_run1_part002.mp4#t=12.3"
+        assert report_data.timeline[1].video_clip == ""
@@ -1,4 +1,6 @@
-from mobile_crawler.domain.state_graph import StateGraphTracker
+import json
+
+from mobile_crawler.domain.state_graph import JOURNAL_FILENAME, SNAPSHOT_FILENAME, StateGraphTracker
 
 
 def test_compute_layout_hash_stability():
@@ -88,3 +90,133 @@ def test_loop_recovery_hint():
     # Clicked index 1 previously, so it should suggest index 2
     hint = tracker.get_loop_recovery_hint(state_a, elements)
     assert "element [2]" in hint
+
+
+def _record_steps(tracker, steps, start=1):
+    for step in range(start, start + steps):
+        state = f"state{step % 3}"
+        tracker.record_state(state, step, "com.test", "Activity")
+        tracker.record_transition(f"state{(step - 1) % 3}", state, {"action": "click", "label_id": step}, step)
+        tracker.save()
+
+
+def test_save_appends_journal_between_snapshots(tmp_path):
+    tracker = StateGraphTracker(run_id=1, logs_dir=tmp_path, compact_every=3)
+
+    _record_steps(tracker, 3)
+
+    # First save snapshots; the next two only append deltas
+    snapshot = json.loads((tmp_path / SNAPSHOT_FILENAME).read_text())
+    assert snapshot["total_transitions"] == 1
+    journal = (tmp_path / JOURNAL_FILENAME).read_text().splitlines()
+    assert len(journal) == 2
+    record = json.loads(journal[-1])
+    assert record["seq"] == 2
+    assert list(record["states"]) == ["state0"]
+    assert record["transitions"] == [tracker.transitions[-1]]
+    assert record["history"] == ["state0"]
+
+
+def test_save_compacts_journal_into_snapshot(tmp_path):
+    tracker = StateGraphTracker(run_id=1, logs_dir=tmp_path, compact_every=3)
+
+    _record_steps(tracker, 6)
+
+    snapshot = json.loads((tmp_path / SNAPSHOT_FILENAME).read_text())
+    assert snapshot["total_transitions"] == 5
+    assert snapshot["journal_seq"] == 3
+    assert len((tmp_path / JOURNAL_FILENAME).read_text().splitlines()) == 1
+
+
+def test_load_replays_journal_after_snapshot(tmp_path):
+    tracker = StateGraphTracker(run_id=1, logs_dir=tmp_path, compact_every=4)
+    _record_steps(tracker, 11)
+
+    loaded = StateGraphTracker(run_id=1, logs_dir=tmp_path)
+    assert loaded.load() is True
+
+    assert loaded.states == tracker.states
+    assert loaded.transitions == tracker.transitions
+    assert loaded.history == tracker.history
+
+
+def test_load_skips_records_already_in_snapshot_and_torn_tail(tmp_path):
+    tracker = StateGraphTracker(run_id=1, logs_dir=tmp_path, compact_every=2)
+    _record_steps(tracker, 2)
+    stale_journal = (tmp_path / JOURNAL_FILENAME).read_text()
+    _record_steps(tracker, 2, start=3)
+    # Simulate a crash after the snapshot was replaced but before truncation,
+    # followed by a half-written record
+    (tmp_path / JOURNAL_FILENAME).write_text(stale_journal + '{"seq": 9, "transi')
+
+    loaded = StateGraphTracker(run_id=1, logs_dir=tmp_path)
+    loaded.load()
+
+    assert loaded.transitions == tracker.transitions
+    assert loaded.history == tracker.history
+
+
+def test_load_without_files_returns_false(tmp_path):
+    assert StateGraphTracker(run_id=1, logs_dir=tmp_path).load() is False
+    assert StateGraphTracker(run_id=1).load() is False
+
+
+def _visit(tracker, sequence):
+    for step, state in enumerate(sequence, start=len(tracker.history) + 1):
+        tracker.record_state(state, step, "com.test", "Activity")
+
+
+def test_loop_detection_finds_period_three_and_five():
+    tracker = StateGraphTracker(run_id=1)
+    _visit(tracker, ["home"] + ["a", "b", "c"] * 2 + ["a", "b"])
+    # 8 trailing screens with period 3: a b c a b c a b
+    assert tracker.loop_period() == 3
+    assert tracker.detect_loop() is True
+
+    tracker = StateGraphTracker(run_id=1)
+    _visit(tracker, list("abcde") * 2)
+    assert tracker.loop_period() == 5
+    assert tracker.loop_states() == list("abcde")
+
+
+def test_loop_detection_needs_two_full_cycles():
+    tracker = StateGraphTracker(run_id=1)
+    _visit(tracker, list("abcdefg") + list("abcdef"))
+    assert tracker.detect_loop() is False
+
+    tracker = StateGraphTracker(run_id=1, max_loop_period=4)
+    _visit(tracker, list("abcde") * 3)
+    assert tracker.detect_loop() is False
+
+
+def test_loop_detection_resets_when_path_diverges():
+    tracker = StateGraphTracker(run_id=1)
+    _visit(tracker, ["a", "b"] * 4)
+    assert tracker.detect_loop() is True
+
+    _visit(tracker, ["new"])
+    assert tracker.detect_loop() is False
+
+
+def test_loop_detection_survives_restore():
+    tracker = StateGraphTracker(run_id=1)
+    _visit(tracker, list("abc") * 3)
+
+    restored = StateGraphTracker(run_id=1)
+    restored.restore(tracker.to_dict())
+
+    assert restored.loop_period() == 3
+
+
+def test_loop_recovery_hint_points_at_action_leaving_loop():
+    tracker = StateGraphTracker(run_id=1)
+    for step, (src, dst) in enumerate([("a", "b"), ("b", "a"), ("b", "settings")], start=1):
+        tracker.record_transition(src, dst, f"click({step})", step_number=step)
+    _visit(tracker, ["a", "b"] * 4)
+
+    elements = [{"index": 1, "text": "Next", "clickable": True}]
+    hint = tracker.get_loop_recovery_hint("a", elements)
+
+    assert "click(3)" in hint
+    assert "previously led out" in hint
+    assert tracker.outgoing_actions("b") == {"click(2)": "a", "click(3)": "settings"}
@@ -0,0 +1,73 @@
+"""Tests for StealthDriver swipe scripting."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from mobile_crawler.domain.crawler_agent.tools.driver.stealth import (
+    StealthDriver,
+    build_motion_script,
+    motion_sleep_seconds,
+)
+
+PATH = [(100, 100), (120, 150), (140, 200), (160, 250), (180, 300)]
+
+
+class TestBuildMotionScript:
+    def test_script_presses_moves_and_releases(self):
+        commands = build_motion_script(PATH, duration_ms=1000).split("; ")
+        motions = [c for c in commands if c.startswith("input motionevent")]
+
+        assert motions[0] == "input motionevent DOWN 100 100"
+        assert motions[-1] == "input motionevent UP 180 300"
+        assert sum(c.startswith("input motionevent MOVE") for c in commands) == len(PATH) - 1
+        assert commands.count("sleep 0.200") == len(PATH) - 1
+
+    def test_short_delays_are_dropped(self):
+        script = build_motion_script(PATH, duration_ms=10)
+
+        assert "sleep" not in script
+
+    def test_overhead_is_subtracted_from_sleep(self):
+        assert motion_sleep_seconds(PATH, 1000, command_overhead_s=0.05) == 0.15
+        assert motion_sleep_seconds(PATH, 1000, command_overhead_s=0.5) == 0.0
+
+
+class TestStealthSwipe:
+    def _driver(self):
+        inner = Mock()
+        inner.ensure_connected = AsyncMock()
+        inner.device.shell = AsyncMock()
+        return StealthDriver(inner), inner
+
+    def test_swipe_is_a_single_shell_call(self):
+        driver, inner = self._driver()
+
+        with patch(
+            "mobile_crawler.domain.crawler_agent.tools.driver.stealth.generate_curved_path",
+            return_value=PATH,
+        ):
+            asyncio.run(driver.swipe(100, 100, 180, 300, duration_ms=1000))
+
+        inner.device.shell.assert_awaited_once()
+        script = inner.device.shell.await_args.args[0]
+        assert script.startswith("input motionevent DOWN 100 100")
+        assert script.endswith("input motionevent UP 180 300")
+
+    def test_overrun_shortens_later_sleeps(self):
+        driver, inner = self._driver()
+        # First swipe sleeps 0.8 s and spends 0.6 s more starting 6 input commands
+        clock = iter([0.0, 1.4, 10.0, 11.0])
+
+        with patch(
+            "mobile_crawler.domain.crawler_agent.tools.driver.stealth.generate_curved_path",
+            return_value=PATH,
+        ), patch(
+            "mobile_crawler.domain.crawler_agent.tools.driver.stealth.time.perf_counter",
+            side_effect=lambda: next(clock),
+        ):
+            asyncio.run(driver.swipe(100, 100, 180, 300, duration_ms=1000))
+            asyncio.run(driver.swipe(100, 100, 180, 300, duration_ms=1000))
+
+        first, second = (call.args[0] for call in inner.device.shell.await_args_list)
+        assert "sleep 0.200" in first
+        assert "sleep 0.100" in second
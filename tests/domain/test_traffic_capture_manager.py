@@ -3,6 +3,7 @@
 import asyncio
 import os
 import tempfile
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -10,6 +11,15 @@ import pytest
 from mobile_crawler.domain.traffic_capture_manager import TrafficCaptureManager
 
 
+def _probe_output(tun="", connectivity="", services=""):
+    """Format device output of the combined readiness probe script."""
+    return "\n".join([
+        "##mc:tun", tun,
+        "##mc:connectivity", connectivity,
+        "##mc:services", services,
+    ])
+
+
 class TestTrafficCaptureManager:
     """Tests for TrafficCaptureManager."""
 
@@ -115,7 +125,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             if "am start" in joined and "pcap_dump_mode" in joined:
                 events.append("start_intent")
                 return ("Starting: Intent { cmp=com.emanuelef.remote_capture/.activities.CaptureCtrl }\n", 0)
@@ -157,7 +167,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in " ".join(cmd):
                 return ("android.permission.INTERNET\n", 0)
             if "dumpsys connectivity" in " ".join(cmd):
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             if "am start" in " ".join(cmd):
                 return ("Starting: Intent { cmp=com.emanuelef.remote_capture/.activities.CaptureCtrl }\n", 0)
             if "test -d" in " ".join(cmd):
@@ -208,7 +218,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             if "am start" in joined:
                 return ("Starting: Intent { cmp=com.emanuelef.remote_capture/.activities.CaptureCtrl }\n", 0)
             if "test -d" in joined:
@@ -270,7 +280,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in " ".join(cmd):
                 return ("android.permission.INTERNET\n", 0)
             if "dumpsys connectivity" in " ".join(cmd):
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             if "am start" in " ".join(cmd) and "action stop" in " ".join(cmd):
                 return ("", 0)
             if "am start" in " ".join(cmd):
@@ -339,7 +349,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in " ".join(cmd):
                 return ("android.permission.INTERNET\n", 0)
             if "dumpsys connectivity" in " ".join(cmd):
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             if "am start" in " ".join(cmd) and "action stop" in " ".join(cmd):
                 return ("", 0)
             if "am start" in " ".join(cmd):
@@ -380,7 +390,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in " ".join(cmd):
                 return ("android.permission.INTERNET\n", 0)
             if "dumpsys connectivity" in " ".join(cmd):
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             if "am start" in " ".join(cmd) and "action stop" in " ".join(cmd):
                 return ("", 0)
             if "am start" in " ".join(cmd):
@@ -651,7 +661,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             if "am start" in joined:
                 return ("Starting: Intent { cmp=com.emanuelef.remote_capture/.activities.CaptureCtrl }\n", 0)
             if "test -d" in joined:
@@ -690,7 +700,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             if "am start" in joined:
                 return ("Starting: Intent { cmp=com.emanuelef.remote_capture/.activities.CaptureCtrl }\n", 0)
             if "test -d" in joined:
@@ -731,7 +741,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("NetworkProviders for: VpnNetworkProvider:0 Active default network: 113", 0)
+                return (_probe_output(connectivity="NetworkProviders for: VpnNetworkProvider:0 Active default network: 113"), 0)
             if "dumpsys activity services com.emanuelef.remote_capture" in joined:
                 return ("", 0)
             if "action get_status" in joined:
@@ -774,7 +784,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("NetworkProviders for: VpnNetworkProvider:0 Active default network: 113", 0)
+                return (_probe_output(connectivity="NetworkProviders for: VpnNetworkProvider:0 Active default network: 113"), 0)
             if "dumpsys activity services com.emanuelef.remote_capture" in joined:
                 return ("", 0)
             if "action get_status" in joined:
@@ -830,7 +840,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("NetworkProviders for: VpnNetworkProvider:0 Active default network: 113", 0)
+                return (_probe_output(connectivity="NetworkProviders for: VpnNetworkProvider:0 Active default network: 113"), 0)
             if "dumpsys activity services com.emanuelef.remote_capture" in joined:
                 return ("", 0)
             if "action get_status" in joined:
@@ -881,7 +891,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("NetworkProviders for: VpnNetworkProvider:0 Active default network: 113", 0)
+                return (_probe_output(connectivity="NetworkProviders for: VpnNetworkProvider:0 Active default network: 113"), 0)
             if "dumpsys activity services com.emanuelef.remote_capture" in joined:
                 return ("", 0)
             if "action get_status" in joined:
@@ -928,7 +938,7 @@ class TestTrafficCaptureManager:
             if "dumpsys package" in joined:
                 return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
             if "dumpsys connectivity" in joined:
-                return ("NetworkProviders for: VpnNetworkProvider:0 Active default network: 113", 0)
+                return (_probe_output(connectivity="NetworkProviders for: VpnNetworkProvider:0 Active default network: 113"), 0)
             if "dumpsys activity services com.emanuelef.remote_capture" in joined:
                 return ("", 0)
             if "action get_status" in joined:
@@ -970,7 +980,7 @@ class TestTrafficCaptureManager:
             if "cat /sdcard/ui_dump.xml" in joined:
                 return (ui_xml, 0)
             if "dumpsys connectivity" in joined:
-                return ("NetworkProviders for: VpnNetworkProvider:0 Active default network: 113", 0)
+                return (_probe_output(connectivity="NetworkProviders for: VpnNetworkProvider:0 Active default network: 113"), 0)
             if "dumpsys activity services com.emanuelef.remote_capture" in joined:
                 return ("", 0)
             return ("", 0)
@@ -1022,7 +1032,7 @@ class TestTrafficCaptureManager:
             if "cat /sdcard/ui_dump.xml" in joined:
                 return ("<hierarchy><node text=\"PCAPdroid\" /></hierarchy>", 0)
             if "dumpsys connectivity" in joined:
-                return ("VPN com.emanuelef.remote_capture NetworkAgentInfo", 0)
+                return (_probe_output(connectivity="VPN com.emanuelef.remote_capture NetworkAgentInfo"), 0)
             return ("", 0)
 
         mock_run_adb.side_effect = adb_side_effect
@@ -1056,6 +1066,124 @@ class TestTrafficCaptureManager:
         assert "Missing PCAP PCAPdroid service diagnostics" in caplog.text
 
 
+class FakeAdbDevice:
+    """Fake adb endpoint where PCAPdroid's VPN comes up some time after the start intent.
+
+    Every command costs ``command_latency`` seconds, like a real adb round-trip.
+    """
+
+    def __init__(self, vpn_up_after: float, command_latency: float = 0.02):
+        self.vpn_up_after = vpn_up_after
+        self.command_latency = command_latency
+        self.commands: list[str] = []
+        self.started_at: float | None = None
+        self.ui_dumps_after_vpn_up = 0
+
+    async def __call__(self, cmd, suppress_stderr=False):
+        await asyncio.sleep(self.command_latency)
+        joined = " ".join(cmd)
+        self.commands.append(joined)
+        if "pm list packages" in joined:
+            return ("package:com.emanuelef.remote_capture\n", 0)
+        if "dumpsys package" in joined:
+            return ("android.permission.INTERNET\nandroid.permission.ACCESS_NETWORK_STATE\n", 0)
+        if "##mc:" in joined:
+            return (_probe_output(**self._device_state()), 0)
+        if "uiautomator dump" in joined and self._vpn_up():
+            self.ui_dumps_after_vpn_up += 1
+        if "am start" in joined and "pcap_dump_mode" in joined:
+            self.started_at = time.monotonic()
+        if "am start" in joined:
+            return ("Starting: Intent { cmp=com.emanuelef.remote_capture/.activities.CaptureCtrl }\n", 0)
+        if "cat /sdcard/ui_dump.xml" in joined:
+            return ("<hierarchy></hierarchy>", 0)
+        return ("", 0)
+
+    def _vpn_up(self) -> bool:
+        return self.started_at is not None and time.monotonic() - self.started_at >= self.vpn_up_after
+
+    def _device_state(self) -> dict[str, str]:
+        if not self._vpn_up():
+            return {"tun": "tun0 0x1090"}
+        return {
+            "tun": "tun0 0x1091",
+            "connectivity": "VPN CONNECTED extra: com.emanuelef.remote_capture",
+            "services": "ServiceRecord{1 u0 com.emanuelef.remote_capture/.CaptureService}",
+        }
+
+    def count(self, fragment: str) -> int:
+        return sum(1 for command in self.commands if fragment in command)
+
+
+class TestCaptureReadinessProbe:
+    """Time-to-ready of capture startup against a fake adb device."""
+
+    @pytest.fixture
+    def config_manager(self):
+        """Production-like waits: fixed sleeps would dominate time-to-ready."""
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: {
+            "enable_traffic_capture": True,
+            "app_package": "com.test.app",
+            "pcapdroid_api_key": "test_api_key",
+            "pcapdroid_init_wait": 3.0,
+            "pcapdroid_consent_timeout_seconds": 15.0,
+            "pcapdroid_consent_poll_interval_seconds": 0.05,
+            "pcapdroid_startup_timeout_seconds": 15.0,
+            "pcapdroid_startup_poll_interval_seconds": 0.05,
+        }.get(key, default)
+        return config
+
+    @pytest.mark.parametrize("vpn_up_after", [0.0, 0.3])
+    def test_start_returns_as_soon_as_tun_is_up(self, config_manager, vpn_up_after):
+        device = FakeAdbDevice(vpn_up_after=vpn_up_after)
+        manager = TrafficCaptureManager(config_manager=config_manager, adb_client=Mock())
+        manager._run_adb_command_async = device
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            success, _ = asyncio.run(
+                manager.start_capture_async(run_id=1, step_num=1, session_path=temp_dir)
+            )
+        time_to_ready = time.monotonic() - device.started_at
+
+        assert success is True
+        assert manager._last_capture_readiness_diagnostics["readiness_source"] == "tun_interface"
+        assert time_to_ready < vpn_up_after + 0.5
+        assert device.ui_dumps_after_vpn_up == 0
+        assert device.count("dumpsys connectivity") == device.count("##mc:")
+
+    def test_vpn_already_up_needs_no_ui_dump_or_status_intent(self, config_manager):
+        device = FakeAdbDevice(vpn_up_after=0.0)
+        manager = TrafficCaptureManager(config_manager=config_manager, adb_client=Mock())
+        manager._run_adb_command_async = device
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asyncio.run(manager.start_capture_async(run_id=1, step_num=1, session_path=temp_dir))
+
+        assert device.count("uiautomator dump") == 0
+        assert device.count("action get_status") == 1  # the one-off status query after init
+
+    def test_probe_requires_tun_up_and_owned_by_pcapdroid(self, config_manager):
+        manager = TrafficCaptureManager(config_manager=config_manager, adb_client=Mock())
+
+        manager._run_adb_command_async = AsyncMock(return_value=(_probe_output(tun="tun0 0x1091"), 0))
+        other_vpn = asyncio.run(manager._probe_capture_state_async())
+        manager._run_adb_command_async = AsyncMock(return_value=(
+            _probe_output(tun="tun0 0x1090", services="ServiceRecord{1 u0 com.emanuelef.remote_capture/.CaptureService}"),
+            0,
+        ))
+        tun_down = asyncio.run(manager._probe_capture_state_async())
+        manager._run_adb_command_async = AsyncMock(return_value=("sh: dumpsys: not found", 1))
+        failed = asyncio.run(manager._probe_capture_state_async())
+
+        assert other_vpn["tun_up"] is True and other_vpn["vpn_hint"] is False
+        assert tun_down["tun_up"] is False and tun_down["vpn_hint"] is True
+        assert failed["tun_up"] is False and failed["probe_retcode"] == 1
+        assert not any(
+            TrafficCaptureManager._probe_confirms_capture(probe) for probe in (other_vpn, tun_down, failed)
+        )
+
+
 class TestTrafficCaptureManagerADBFallback:
     """Test ADB client fallback behavior."""
 
@@ -0,0 +1,149 @@
+"""Tests for trajectory screenshot persistence through the blob store."""
+
+import asyncio
+import io
+import json
+import types
+
+from PIL import Image
+
+from mobile_crawler.domain.crawler_agent.agent.trajectory.writer import TrajectoryWriter
+from mobile_crawler.infrastructure.blob_store import BlobStore, compute_digest
+
+
+def _png_bytes(color):
+    output = io.BytesIO()
+    Image.new("RGB", (8, 8), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_trajectory_writer_stores_screenshots_as_blobs(tmp_path):
+    red, blue = _png_bytes((255, 0, 0)), _png_bytes((0, 0, 255))
+    store = BlobStore(str(tmp_path / "blobs"))
+    trajectory = types.SimpleNamespace(
+        trajectory_folder=tmp_path / "traj",
+        events=[],
+        macro=[],
+        ui_states=[],
+        screenshot_queue=[red, red, blue],
+        screenshot_count=3,
+        screenshot_digests=[],
+        blob_store=store,
+        goal="goal",
+    )
+    trajectory.trajectory_folder.mkdir()
+
+    async def _write():
+        writer = TrajectoryWriter()
+        await writer.start()
+        writer.write_final(trajectory, True)
+        await writer.stop()
+
+    asyncio.run(_write())
+
+    index = (trajectory.trajectory_folder / "screenshots.txt").read_text().split()
+    assert index == [compute_digest(red), compute_digest(red), compute_digest(blue)]
+    assert store.bytes_written == len(red) + len(blue)
+    assert not list((trajectory.trajectory_folder / "screenshots").glob("*.png"))
+    assert (trajectory.trajectory_folder / "screenshots" / "trajectory.gif").exists()
+
+
+def test_screenshot_index_is_appended_per_write(tmp_path):
+    red, blue = _png_bytes((255, 0, 0)), _png_bytes((0, 0, 255))
+    trajectory = types.SimpleNamespace(
+        trajectory_folder=tmp_path / "traj",
+        events=[],
+        macro=[],
+        ui_states=[],
+        screenshot_queue=[red],
+        screenshot_count=1,
+        screenshot_digests=[],
+        blob_store=BlobStore(str(tmp_path / "blobs")),
+        goal="goal",
+    )
+    trajectory.trajectory_folder.mkdir()
+    index_path = trajectory.trajectory_folder / "screenshots.txt"
+
+    async def _write():
+        writer = TrajectoryWriter()
+        await writer.start()
+        writer.write(trajectory, "step_1")
+        await writer.worker.queue.join()
+        first = index_path.read_text()
+        trajectory.screenshot_queue.append(blue)
+        trajectory.screenshot_count = 2
+        writer.write(trajectory, "step_2")
+        await writer.stop()
+        return first
+
+    first = asyncio.run(_write())
+
+    assert first == f"{compute_digest(red)}\n"
+    assert index_path.read_text() == f"{compute_digest(red)}\n{compute_digest(blue)}\n"
+    assert trajectory.screenshot_digests == [compute_digest(red), compute_digest(blue)]
+
+
+def test_streaming_gif_is_viewable_after_each_frame(tmp_path):
+    from mobile_crawler.domain.crawler_agent.agent.trajectory.animation import StreamingGifEncoder
+
+    encoder = StreamingGifEncoder(tmp_path / "t.gif", duration=500, max_width=4)
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+    for count, color in enumerate(colors, start=1):
+        encoder.add_frame(_png_bytes(color))
+        with Image.open(tmp_path / "t.gif") as gif:
+            assert gif.n_frames == count
+            assert gif.size == (4, 4)
+            assert gif.info["duration"] == 500
+
+    with Image.open(tmp_path / "t.gif") as gif:
+        gif.seek(2)
+        assert gif.convert("RGB").getpixel((0, 0)) == (0, 0, 255)
+
+
+def test_trajectory_writer_streams_frames_during_crawl(tmp_path):
+    trajectory = types.SimpleNamespace(
+        trajectory_folder=tmp_path / "traj",
+        events=[],
+        macro=[],
+        ui_states=[],
+        screenshot_queue=[_png_bytes((255, 0, 0))],
+        screenshot_count=1,
+        goal="goal",
+    )
+    trajectory.trajectory_folder.mkdir()
+    gif_path = trajectory.trajectory_folder / "screenshots" / "trajectory.gif"
+
+    async def _write():
+        writer = TrajectoryWriter(stream_animation=True, animation_format="webp")
+        await writer.start()
+        writer.write(trajectory, stage="step_1")
+        await writer.worker.queue.join()
+        with Image.open(gif_path) as gif:
+            assert gif.n_frames == 1
+
+        trajectory.screenshot_queue.append(_png_bytes((0, 255, 0)))
+        trajectory.screenshot_count = 2
+        writer.write_final(trajectory, True)
+        await writer.stop()
+
+    asyncio.run(_write())
+
+    with Image.open(gif_path) as gif:
+        assert gif.n_frames == 2
+    with Image.open(gif_path.with_suffix(".webp")) as webp:
+        assert webp.n_frames == 2
+
+
+def test_macro_records_layout_hash_settings(tmp_path):
+    trajectory = types.SimpleNamespace(
+        trajectory_folder=tmp_path,
+        goal="goal",
+        layout_hash_settings={"ui_parser_mode": "omniparser", "tree_filter": "concise"},
+    )
+
+    job = TrajectoryWriter()._create_macro_job([{"action_type": "tap", "x": 1, "y": 2}], trajectory, "id", "final")
+
+    macro = json.loads(job.serialized_macro)
+    assert macro["layout_hash"] == {"ui_parser_mode": "omniparser", "tree_filter": "concise"}
+    assert macro["total_actions"] == 1
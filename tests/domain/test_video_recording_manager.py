@@ -5,7 +5,7 @@ import json
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
-from mobile_crawler.domain.video_recording_manager import VideoRecordingManager
+from mobile_crawler.domain.video_recording_manager import VideoRecordingManager, find_step_clip
 
 
 def _config(enabled=True):
@@ -123,3 +123,118 @@ def test_start_failure_is_graceful(mock_create_process, tmp_path):
     assert success is False
     assert "failed" in message.lower()
     assert manager.is_recording() is False
+
+
+def _recording_device(events, pull_seconds=0.2, segment_seconds=(0.05,)):
+    """Fake screenrecord processes and adb commands that log their timing.
+
+    Each listed segment ends on its own after the given duration; the next
+    one runs until ``pkill`` stops it.
+    """
+    stopped = asyncio.Event()
+    durations = list(segment_seconds)
+
+    def make_process(*args, **kwargs):
+        part = sum(1 for e in events if e[0] == "record") + 1
+        events.append(("record", part))
+        duration = durations.pop(0) if durations else None
+        process = Mock()
+        process.returncode = None
+
+        async def wait():
+            if duration is None:
+                await stopped.wait()
+            else:
+                await asyncio.sleep(duration)
+            process.returncode = 0
+            return 0
+
+        process.wait = wait
+        return process
+
+    async def adb(cmd, suppress_stderr=False, timeout=None):
+        device_cmd = cmd[2:] if cmd[:2] == ["-s", "dev1"] else cmd
+        if device_cmd[:2] == ["shell", "pkill"]:
+            stopped.set()
+        elif device_cmd[0] == "pull":
+            events.append(("pull-start", device_cmd[1]))
+            await asyncio.sleep(pull_seconds)
+            Path(device_cmd[2]).write_bytes(b"mp4")
+            events.append(("pull-end", device_cmd[1]))
+        return ("", 0)
+
+    return AsyncMock(side_effect=make_process), AsyncMock(side_effect=adb)
+
+
+def test_next_segment_records_while_previous_is_pulled(tmp_path):
+    events = []
+    create_process, adb = _recording_device(events)
+    manager = VideoRecordingManager(_config(), adb_client=Mock(execute_async=adb), device_id="dev1")
+    manager.MIN_SEGMENT_SECONDS = 0.01
+
+    async def run_lifecycle():
+        with patch("mobile_crawler.domain.video_recording_manager.asyncio.create_subprocess_exec", create_process):
+            await manager.start_recording_async(42, str(tmp_path), "com.test.app")
+            await asyncio.sleep(0.1)
+            return await manager.stop_recording_and_save_async()
+
+    asyncio.run(run_lifecycle())
+
+    kinds = [e[0] for e in events]
+    # Segment 2 starts before segment 1's pull has even begun
+    assert events[:3] == [("record", 1), ("record", 2), ("pull-start", events[2][1])]
+    assert "part001" in events[2][1]
+    assert kinds.count("pull-end") == 2
+    manifest = json.loads((tmp_path / "videos" / "manifest.json").read_text(encoding="utf-8"))
+    assert [s["part"] for s in manifest["segments"]] == [1, 2]
+    assert all(s["size_bytes"] == 3 for s in manifest["segments"])
+    assert "started_monotonic" not in manifest["segments"][0]
+
+
+def test_step_index_maps_steps_to_segment_offsets(tmp_path):
+    events = []
+    create_process, adb = _recording_device(events, pull_seconds=0.0, segment_seconds=(0.3,))
+    manager = VideoRecordingManager(_config(), adb_client=Mock(execute_async=adb), device_id="dev1")
+    manager.MIN_SEGMENT_SECONDS = 0.01
+
+    async def run_lifecycle():
+        with patch("mobile_crawler.domain.video_recording_manager.asyncio.create_subprocess_exec", create_process):
+            await manager.start_recording_async(42, str(tmp_path), "com.test.app")
+            manager.mark_step(1)
+            await asyncio.sleep(0.2)
+            manager.mark_step(2)
+            await asyncio.sleep(0.25)
+            manager.mark_step(3)
+            await manager.stop_recording_and_save_async()
+
+    asyncio.run(run_lifecycle())
+
+    markers = {m.step_number: m for m in manager.step_index()}
+    assert (markers[1].part, markers[2].part, markers[3].part) == (1, 1, 2)
+    assert markers[1].offset_seconds < 0.1
+    assert 0.15 < markers[2].offset_seconds < 0.3
+    assert 0.1 < markers[3].offset_seconds < 0.3
+
+    manifest = json.loads((tmp_path / "videos" / "manifest.json").read_text(encoding="utf-8"))
+    path, offset = find_step_clip(manifest, 3)
+    assert path.endswith("part002_" + path.rsplit("part002_", 1)[1])
+    assert offset == markers[3].offset_seconds
+    assert manager.locate_step(2) == (markers[2].local_path, markers[2].offset_seconds)
+    assert find_step_clip(manifest, 99) is None
+
+
+def test_immediate_screenrecord_exit_does_not_respawn(tmp_path):
+    events = []
+    create_process, adb = _recording_device(events, pull_seconds=0.0, segment_seconds=(0.0, 0.0, 0.0))
+    manager = VideoRecordingManager(_config(), adb_client=Mock(execute_async=adb), device_id="dev1")
+
+    async def run_lifecycle():
+        with patch("mobile_crawler.domain.video_recording_manager.asyncio.create_subprocess_exec", create_process):
+            await manager.start_recording_async(42, str(tmp_path), "com.test.app")
+            await asyncio.sleep(0.1)
+            recording = manager.is_recording()
+            await manager.stop_recording_and_save_async()
+            return recording
+
+    assert asyncio.run(run_lifecycle()) is False
+    assert [e for e in events if e[0] == "record"] == [("record", 1)]
@@ -211,6 +211,34 @@ class TestAIInteractionRepositoryRetrieve:
             assert len(interactions) == 1
             assert interactions[0].run_id == run_id
 
+    def test_get_interaction_returns_last_attempt_for_step(self, ai_repo, run_repo):
+        """Test get_ai_interaction returns the latest attempt of one step."""
+        run_id = _create_run(run_repo)
+        for step, retry_count, success in [(1, 0, True), (2, 0, False), (2, 1, True), (3, 0, True)]:
+            ai_repo.create_ai_interaction(AIInteraction(
+                id=None,
+                run_id=run_id,
+                step_number=step,
+                timestamp=datetime.now(),
+                request_json=f'{{"step": {step}, "attempt": {retry_count}}}',
+                screenshot_path=None,
+                response_raw=None,
+                response_parsed_json=None,
+                tokens_input=None,
+                tokens_output=None,
+                latency_ms=None,
+                success=success,
+                error_message=None if success else "timeout",
+                retry_count=retry_count,
+            ))
+
+        interaction = ai_repo.get_ai_interaction(run_id, 2)
+
+        assert interaction.retry_count == 1
+        assert interaction.success is True
+        assert interaction.request_json == '{"step": 2, "attempt": 1}'
+        assert ai_repo.get_ai_interaction(run_id, 9) is None
+
 
 class TestAIInteractionRepositoryDataIntegrity:
     """Tests for data integrity."""
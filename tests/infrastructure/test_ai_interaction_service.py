@@ -221,3 +221,18 @@ class TestAIInteractionService:
         response_text = '{"actions": [{"action": "click", "action_desc": "test", "target_bounding_box": {"top_left": [0,0], "bottom_right": [10,10]}, "input_text": "should not be here", "reasoning": "test"}], "signup_completed": false}'
         with pytest.raises(ValueError, match="cannot have input_text"):
             service._parse_ai_response(response_text)
+
+    def test_from_config_stores_request_screenshots_as_blobs(self, tmp_path):
+        """Test services built from config dedupe screenshots into the blob store."""
+        config_manager = Mock()
+        config_manager.get.side_effect = lambda key, default=None: {"ai_provider": "mock"}.get(key, default)
+
+        service = AIInteractionService.from_config(config_manager, blob_dir=str(tmp_path / "blobs"))
+
+        assert service.blob_store is not None
+        request_data = {"system_prompt": "s", "user_prompt": json.dumps({"screenshot": "iVBORw0KGgo="})}
+        first = service._build_stored_request_json(request_data, "iVBORw0KGgo=")
+        second = service._build_stored_request_json(request_data, "iVBORw0KGgo=")
+        assert first == second
+        assert "blob:sha256:" in first
+        assert service.blob_store.dedup_hits == 1
@@ -0,0 +1,118 @@
+"""Tests for the content-addressed blob store."""
+
+import base64
+import io
+import json
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from mobile_crawler.infrastructure.ai_interaction_service import AIInteractionService
+from mobile_crawler.infrastructure.blob_store import (
+    BlobStore,
+    compute_digest,
+    is_blob_ref,
+    make_blob_ref,
+    parse_blob_ref,
+)
+
+
+def _png_bytes(color=(255, 0, 0)):
+    output = io.BytesIO()
+    Image.new("RGB", (8, 8), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_put_is_content_addressed_and_deduplicated(tmp_path):
+    store = BlobStore(str(tmp_path))
+
+    digest = store.put(b"payload", "bin")
+    again = store.put(b"payload", "bin")
+
+    assert digest == again == compute_digest(b"payload")
+    assert (tmp_path / digest[:2] / f"{digest}.bin").exists()
+    assert store.get(digest) == b"payload"
+    assert store.bytes_written == len(b"payload")
+    assert store.dedup_hits == 1
+
+
+def test_path_found_by_fresh_store_instance(tmp_path):
+    digest = BlobStore(str(tmp_path)).put(b"payload", "json")
+
+    assert BlobStore(str(tmp_path)).get(digest) == b"payload"
+    assert BlobStore(str(tmp_path)).get("0" * 64) is None
+
+
+def test_put_file_adopts_streamed_file_and_dedups(tmp_path):
+    store = BlobStore(str(tmp_path))
+    digest = compute_digest(b"large payload")
+    first = tmp_path / "pull-1.tmp"
+    second = tmp_path / "pull-2.tmp"
+    first.write_bytes(b"large payload")
+    second.write_bytes(b"large payload")
+
+    stored = store.put_file(str(first), digest, "apk")
+    again = store.put_file(str(second), digest, "apk")
+
+    assert stored == again == str(tmp_path / digest[:2] / f"{digest}.apk")
+    assert not first.exists() and not second.exists()
+    assert store.get(digest) == b"large payload"
+    assert store.dedup_hits == 1
+
+
+def test_images_reencoded_but_keyed_by_original_bytes(tmp_path):
+    png = _png_bytes()
+    store = BlobStore(str(tmp_path), image_format="webp")
+
+    digest = store.put(png, "png")
+
+    assert digest == compute_digest(png)
+    assert store.path(digest).endswith(".webp")
+    with Image.open(io.BytesIO(store.get(digest))) as img:
+        assert img.format == "WEBP"
+
+
+def test_unsupported_image_format_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        BlobStore(str(tmp_path), image_format="tiff")
+
+
+def test_blob_refs_round_trip(tmp_path):
+    store = BlobStore(str(tmp_path))
+    digest = store.put_base64("data:image/png;base64," + base64.b64encode(b"img").decode(), "png")
+    ref = make_blob_ref(digest)
+
+    assert is_blob_ref(ref)
+    assert parse_blob_ref(ref) == digest
+    assert parse_blob_ref("blob:sha256:nothex") is None
+    assert store.resolve(ref) == b"img"
+
+
+def test_ai_interaction_request_json_references_blob(tmp_path):
+    screenshot_b64 = base64.b64encode(_png_bytes()).decode()
+    model_adapter = Mock()
+    model_adapter.generate_response.return_value = (
+        '{"actions": [{"action": "back", "action_desc": "Go back", "reasoning": "r"}], "signup_completed": false}',
+        {},
+    )
+    prompt_builder = Mock()
+    prompt_builder.build_system_prompt.return_value = "System prompt"
+    prompt_builder.build_user_prompt.return_value = json.dumps({"screenshot": screenshot_b64, "is_stuck": False})
+    ai_repo = Mock()
+    config_manager = Mock()
+    config_manager.get.return_value = 0
+    listener = Mock()
+    store = BlobStore(str(tmp_path))
+
+    service = AIInteractionService(
+        model_adapter, prompt_builder, ai_repo, config_manager, listener, blob_store=store
+    )
+    service.get_next_actions(1, 1, screenshot_b64, None)
+
+    stored = json.loads(ai_repo.create_ai_interaction.call_args[0][0].request_json)
+    ref = json.loads(stored["user_prompt"])["screenshot"]
+    assert store.resolve(ref) == base64.b64decode(screenshot_b64)
+    # Live listeners still receive the inline screenshot
+    sent = listener.on_ai_request_sent.call_args[0][2]
+    assert json.loads(sent["user_prompt"])["screenshot"] == screenshot_b64
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from mobile_crawler.infrastructure.database import DatabaseManager
+from mobile_crawler.infrastructure.database import DatabaseManager, commit_latency_summary, reset_commit_latency
 
 
 @pytest.fixture
@@ -48,6 +48,31 @@ class TestDatabaseManager:
         assert isinstance(conn, sqlite3.Connection)
         assert db_manager.db_path.exists()
 
+    def test_commits_are_timed(self, db_manager):
+        """Test commits on manager connections feed the commit latency summary."""
+        before = commit_latency_summary().count
+        conn = db_manager.get_connection()
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.commit()
+        conn.commit()
+        conn.close()
+
+        summary = commit_latency_summary()
+        assert summary.count == before + 2
+        assert summary.p99 >= 0
+
+    def test_reset_commit_latency(self, db_manager):
+        """Test resetting drops timings recorded before the reset."""
+        conn = db_manager.get_connection()
+        conn.commit()
+        reset_commit_latency()
+        assert commit_latency_summary().count == 0
+
+        conn.commit()
+        conn.close()
+        assert commit_latency_summary().count == 1
+
     def test_schema_creation(self, db_manager):
         """Test schema creation creates all required tables."""
         db_manager.create_schema()
@@ -1,8 +1,14 @@
 """Tests for MobSFManager."""
 
+import asyncio
+import hashlib
+import json
 import os
+import sys
 import tempfile
+import threading
 import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 
@@ -13,6 +19,7 @@ from mobile_crawler.infrastructure.mobsf_manager import (
     MOBSF_KEY_DISCOVERY_ERROR,
     MobSFAnalysisResult,
     MobSFManager,
+    file_sha256,
 )
 
 
@@ -26,6 +33,7 @@ def _make_config_manager(**overrides):
         "mobsf_scan_timeout": 900,
         "mobsf_poll_interval": 2,
         "adb_executable_path": "adb",
+        "mobsf_report_cache_enabled": False,
     }
     defaults.update(overrides)
     config = Mock()
@@ -33,6 +41,247 @@ def _make_config_manager(**overrides):
     return config
 
 
+class _FakeAdb:
+    """Executable stand-in for adb serving one package's APKs from a directory."""
+
+    def __init__(self, path, device_dir, log_path):
+        self.path = path
+        self.device_dir = device_dir
+        self.log_path = log_path
+
+    def commands(self):
+        return self.log_path.read_text().splitlines() if self.log_path.exists() else []
+
+
+_FAKE_ADB_SCRIPT = """#!{python}
+import hashlib, os, sys
+ROOT, LOG, SHA256SUM, CORRUPT = {root!r}, {log!r}, {sha256sum!r}, {corrupt!r}
+args = sys.argv[1:]
+with open(LOG, "a") as log:
+    log.write(" ".join(args) + "\\n")
+if args[:1] == ["-s"]:
+    args = args[2:]
+def local(path):
+    return os.path.join(ROOT, os.path.basename(path))
+if args[:3] == ["shell", "pm", "path"]:
+    for name in sorted(os.listdir(ROOT)):
+        print(f"package:/data/app/{{args[3]}}-1/{{name}}")
+elif args[:2] == ["shell", "sha256sum"] and SHA256SUM:
+    for path in args[2:]:
+        with open(local(path), "rb") as f:
+            print(hashlib.sha256(f.read()).hexdigest() + "  " + path)
+elif args[:2] == ["exec-out", "cat"]:
+    with open(local(args[2]), "rb") as f:
+        data = f.read()
+    sys.stdout.buffer.write(data[:-1] if CORRUPT else data)
+else:
+    sys.exit(1)
+"""
+
+
+def _fake_adb(tmp_path, apks, sha256sum=True, corrupt=False):
+    device_dir = tmp_path / "device"
+    device_dir.mkdir()
+    for name, data in apks.items():
+        (device_dir / name).write_bytes(data)
+    log_path = tmp_path / "adb.log"
+    script = tmp_path / "adb"
+    script.write_text(_FAKE_ADB_SCRIPT.format(
+        python=sys.executable, root=str(device_dir), log=str(log_path),
+        sha256sum=sha256sum, corrupt=corrupt,
+    ))
+    script.chmod(0o755)
+    return _FakeAdb(str(script), device_dir, log_path)
+
+
+def _adb_config(tmp_path, adb):
+    return _make_config_manager(adb_executable_path=adb.path, mobsf_apk_store_dir=str(tmp_path / "store"))
+
+
+class _FakeMobSF:
+    """Minimal MobSF REST API served from a background thread.
+
+    Reports become available after ``polls_until_ready`` report_json requests.
+    """
+
+    def __init__(self, polls_until_ready=2):
+        self.polls_until_ready = polls_until_ready
+        self.requests = []
+        self.report_polls = 0
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body, content_type="application/json"):
+                payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                fake.requests.append(self.path)
+                self._reply(200, {"content": []})
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                endpoint = self.path.rsplit("/", 1)[-1]
+                fake.requests.append(self.path)
+                if self.headers.get("Authorization") != "test_key":
+                    self._reply(401, {"error": "unauthorized"})
+                elif endpoint == "upload":
+                    self._reply(200, {"hash": hashlib.md5(body).hexdigest()})
+                elif endpoint == "scan":
+                    self._reply(200, {"status": "ok"})
+                elif endpoint == "scan_logs":
+                    self._reply(200, {"logs": [{"status": "Running", "message": "Decompiling", "timestamp": "t0"}]})
+                elif endpoint in ("report_json", "download_pdf"):
+                    if endpoint == "report_json":
+                        fake.report_polls += 1
+                    if fake.report_polls <= fake.polls_until_ready:
+                        self._reply(404, {"report": "Report not Found"})
+                    elif endpoint == "report_json":
+                        self._reply(200, {"app_name": "Example", "security_score": 70})
+                    else:
+                        self._reply(200, b"%PDF-fake", content_type="application/pdf")
+                elif endpoint == "scorecard":
+                    self._reply(200, {"score": 70})
+                else:
+                    self._reply(404, {"error": "unknown"})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def endpoint_count(self, endpoint):
+        return sum(1 for path in self.requests if path.endswith(f"/{endpoint}"))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _fake_server_manager(fake, tmp_path, apk_bytes=b"PK\x03\x04 fake apk", **overrides):
+    """MobSFManager pointed at a fake server, with APK extraction stubbed."""
+    settings = {
+        "mobsf_api_url": fake.url,
+        "mobsf_poll_interval": 0.01,
+        "mobsf_poll_max_interval": 0.05,
+        "mobsf_scan_timeout": 10,
+        "mobsf_report_cache_enabled": True,
+        "mobsf_report_cache_dir": str(tmp_path / "cache"),
+    }
+    config = _make_config_manager(**{**settings, **overrides})
+    manager = MobSFManager(config_manager=config)
+    manager._find_api_key_file = Mock(return_value=None)
+    manager._discover_api_key_from_docker_logs = Mock(return_value="")
+
+    def extract(package_name, output_dir=None, device_id=None):
+        apk_path = os.path.join(output_dir, f"{package_name}.apk")
+        Path(apk_path).write_bytes(apk_bytes)
+        return apk_path
+
+    manager.extract_apk_from_device = Mock(side_effect=extract)
+    return manager
+
+
+class TestMobSFPipelineAgainstFakeServer:
+    """End-to-end pipeline runs against a local fake MobSF server."""
+
+    def test_scan_polls_until_report_and_saves_it(self, tmp_path):
+        with _FakeMobSF(polls_until_ready=3) as fake:
+            manager = _fake_server_manager(fake, tmp_path)
+            success, summary = asyncio.run(
+                manager.perform_complete_scan_async("com.example.app", session_path=str(tmp_path / "s1"))
+            )
+
+        assert success is True
+        assert summary["cached"] is False
+        assert fake.report_polls == 5  # four polls, then the saved report
+        assert json.loads(Path(summary["json_report"]).read_text())["app_name"] == "Example"
+        assert Path(summary["pdf_report"]).read_bytes() == b"%PDF-fake"
+        assert summary["security_score"] == {"score": 70}
+
+    def test_repeat_run_with_identical_apk_skips_upload_and_scan(self, tmp_path):
+        with _FakeMobSF(polls_until_ready=1) as fake:
+            first = _fake_server_manager(fake, tmp_path)
+            ok1, summary1 = first.perform_complete_scan("com.example.app", session_path=str(tmp_path / "s1"))
+            second = _fake_server_manager(fake, tmp_path)
+            ok2, summary2 = second.perform_complete_scan("com.example.app", session_path=str(tmp_path / "s2"))
+
+        assert ok1 and ok2
+        assert fake.endpoint_count("upload") == 1
+        assert fake.endpoint_count("scan") == 1
+        assert summary1["apk_sha256"] == file_sha256(summary1["apk_path"])
+        assert summary2["cached"] is True
+        assert summary2["apk_sha256"] == summary1["apk_sha256"]
+        assert summary2["file_hash"] == summary1["file_hash"]
+        assert summary2["json_report"].startswith(str(tmp_path / "s2"))
+        assert Path(summary2["pdf_report"]).read_bytes() == b"%PDF-fake"
+        assert summary2["security_score"] == {"score": 70}
+
+    def test_changed_apk_misses_cache(self, tmp_path):
+        with _FakeMobSF(polls_until_ready=0) as fake:
+            _fake_server_manager(fake, tmp_path, apk_bytes=b"v1").perform_complete_scan(
+                "com.example.app", session_path=str(tmp_path / "s1")
+            )
+            ok, summary = _fake_server_manager(fake, tmp_path, apk_bytes=b"v2").perform_complete_scan(
+                "com.example.app", session_path=str(tmp_path / "s2")
+            )
+
+        assert ok is True
+        assert summary["cached"] is False
+        assert fake.endpoint_count("upload") == 2
+
+    def test_polling_backs_off_and_times_out(self, tmp_path):
+        with _FakeMobSF(polls_until_ready=10_000) as fake:
+            manager = _fake_server_manager(fake, tmp_path, mobsf_scan_timeout=0.5)
+            sleeps = []
+            real_sleep = asyncio.sleep
+
+            async def recording_sleep(delay):
+                sleeps.append(delay)
+                await real_sleep(delay)
+
+            with patch("mobile_crawler.infrastructure.mobsf_manager.asyncio.sleep", recording_sleep):
+                success, summary = asyncio.run(
+                    manager.perform_complete_scan_async("com.example.app", session_path=str(tmp_path))
+                )
+
+        assert success is False
+        assert summary["scan_complete"] is False
+        assert sleeps[:3] == [0.01, 0.02, 0.04]
+        assert max(sleeps) <= 0.05
+
+    def test_cancelling_the_task_stops_polling(self, tmp_path):
+        with _FakeMobSF(polls_until_ready=10_000) as fake:
+            manager = _fake_server_manager(fake, tmp_path)
+
+            async def scenario():
+                task = asyncio.create_task(
+                    manager.perform_complete_scan_async("com.example.app", session_path=str(tmp_path))
+                )
+                while fake.report_polls < 2:
+                    await asyncio.sleep(0.01)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+            asyncio.run(scenario())
+            polls_at_cancel = fake.report_polls
+            threading.Event().wait(0.2)
+
+        assert fake.report_polls <= polls_at_cancel + 1
+        assert fake.endpoint_count("download_pdf") <= polls_at_cancel
+
+
 class TestMobSFAnalysisResult:
     """Tests for MobSFAnalysisResult dataclass."""
 
@@ -206,6 +455,7 @@ class TestMobSFManager:
             return True, {}
 
         manager._make_api_request = Mock(side_effect=mock_api_request)
+        manager.extract_apk_from_device = Mock(return_value="/tmp/com.example.app.apk")
 
         with tempfile.TemporaryDirectory() as tmpdir:
             success, summary = manager.perform_complete_scan(
@@ -216,22 +466,17 @@ class TestMobSFManager:
         assert success is True
         assert summary["file_hash"] == "scan123"
 
-    @patch("subprocess.run")
-    def test_extract_apk_from_device_success(self, mock_subprocess):
-        """Test extracting APK from device."""
-        mock_subprocess.side_effect = [
-            Mock(returncode=0, stdout="package:/data/app/com.example.app/base.apk\n", stderr=""),
-            Mock(returncode=0, stdout="", stderr=""),
-        ]
-
-        config = _make_config_manager()
-        manager = MobSFManager(config_manager=config)
+    def test_extract_apk_from_device_success(self, tmp_path):
+        """A single APK is streamed into the store and linked into the output dir."""
+        adb = _fake_adb(tmp_path, {"base.apk": b"single apk" * 1000})
+        manager = MobSFManager(config_manager=_adb_config(tmp_path, adb))
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = manager.extract_apk_from_device("com.example.app", output_dir=tmpdir)
+        result = manager.extract_apk_from_device("com.example.app", output_dir=str(tmp_path / "out"))
 
         assert result is not None
         assert result.endswith("com.example.app.apk")
+        assert Path(result).read_bytes() == b"single apk" * 1000
+        assert manager._apk_store().path(hashlib.sha256(b"single apk" * 1000).hexdigest())
 
     @patch("subprocess.run")
     def test_extract_apk_uses_configured_adb_and_device(self, mock_subprocess):
@@ -241,10 +486,11 @@ class TestMobSFManager:
             Mock(returncode=0, stdout="", stderr=""),
         ]
 
-        config = _make_config_manager(adb_executable_path="C:/Android/platform-tools/adb.exe")
-        manager = MobSFManager(config_manager=config)
-
         with tempfile.TemporaryDirectory() as tmpdir:
+            config = _make_config_manager(
+                adb_executable_path="C:/Android/platform-tools/adb.exe", mobsf_apk_store_dir=tmpdir
+            )
+            manager = MobSFManager(config_manager=config)
             manager.extract_apk_from_device(
                 "com.example.app",
                 output_dir=tmpdir,
@@ -256,34 +502,60 @@ class TestMobSFManager:
         assert first_cmd[:3] == ["C:/Android/platform-tools/adb.exe", "-s", "emulator-5554"]
         assert second_cmd[:3] == ["C:/Android/platform-tools/adb.exe", "-s", "emulator-5554"]
 
-    @patch("subprocess.run")
-    def test_extract_split_apks_packages_archive(self, mock_subprocess, tmp_path):
+    def test_extract_split_apks_packages_archive(self, tmp_path):
         """Split APK installs should be pulled and zipped as .apks."""
-        remote_paths = (
-            "package:/data/app/com.example.app/base.apk\n"
-            "package:/data/app/com.example.app/split_config.en.apk\n"
-        )
-
-        def run_side_effect(command, **kwargs):
-            if "pm" in command:
-                return Mock(returncode=0, stdout=remote_paths, stderr="")
-            local_path = Path(command[-1])
-            local_path.write_bytes(b"apk")
-            return Mock(returncode=0, stdout="", stderr="")
-
-        mock_subprocess.side_effect = run_side_effect
-        config = _make_config_manager()
-        manager = MobSFManager(config_manager=config)
+        splits = {"base.apk": b"base" * 5000, "split_config.en.apk": b"en" * 300}
+        adb = _fake_adb(tmp_path, splits)
+        manager = MobSFManager(config_manager=_adb_config(tmp_path, adb))
 
         archive_path = manager.extract_apk_from_device(
             "com.example.app",
-            output_dir=str(tmp_path),
+            output_dir=str(tmp_path / "out"),
             device_id="device123",
         )
 
         assert archive_path.endswith("com.example.app.apks")
         with zipfile.ZipFile(archive_path) as archive:
-            assert len(archive.namelist()) == 2
+            assert archive.namelist() == ["00_base.apk", "01_split_config.en.apk"]
+            assert archive.read("01_split_config.en.apk") == splits["split_config.en.apk"]
+        assert os.listdir(tmp_path / "out") == ["com.example.app.apks"]
+        assert sum(line.startswith("-s device123 exec-out cat") for line in adb.commands()) == 2
+
+    def test_unchanged_splits_are_not_pulled_again(self, tmp_path):
+        """Splits whose on-device digest is already stored are skipped, and the archive is reproducible."""
+        adb = _fake_adb(tmp_path, {"base.apk": b"base" * 5000, "split_config.en.apk": b"en" * 300})
+        manager = MobSFManager(config_manager=_adb_config(tmp_path, adb))
+
+        first = manager.extract_apk_from_device("com.example.app", output_dir=str(tmp_path / "a"))
+        pulls_after_first = sum("exec-out" in line for line in adb.commands())
+        (adb.device_dir / "split_config.en.apk").write_bytes(b"fr" * 300)
+        second = manager.extract_apk_from_device("com.example.app", output_dir=str(tmp_path / "b"))
+        third = manager.extract_apk_from_device("com.example.app", output_dir=str(tmp_path / "c"))
+
+        pulled = [line.rsplit("/", 1)[-1] for line in adb.commands() if "exec-out" in line]
+        assert pulls_after_first == 2
+        assert pulled[2:] == ["split_config.en.apk"]
+        assert file_sha256(first) != file_sha256(second) == file_sha256(third)
+
+    def test_extract_rejects_pull_that_does_not_match_device_digest(self, tmp_path):
+        """A truncated or corrupted transfer must not enter the store."""
+        adb = _fake_adb(tmp_path, {"base.apk": b"apk bytes"}, corrupt=True)
+        manager = MobSFManager(config_manager=_adb_config(tmp_path, adb))
+
+        assert manager.extract_apk_from_device("com.example.app", output_dir=str(tmp_path / "out")) is None
+        assert not list((tmp_path / "store").rglob("*.apk"))
+        assert not list((tmp_path / "store").glob("*.tmp"))
+
+    def test_extract_without_device_sha256sum_pulls_everything(self, tmp_path):
+        """Devices lacking sha256sum still extract, hashing locally instead."""
+        adb = _fake_adb(tmp_path, {"base.apk": b"a" * 10, "split_x.apk": b"b" * 10}, sha256sum=False)
+        manager = MobSFManager(config_manager=_adb_config(tmp_path, adb))
+
+        manager.extract_apk_from_device("com.example.app", output_dir=str(tmp_path / "a"))
+        archive = manager.extract_apk_from_device("com.example.app", output_dir=str(tmp_path / "b"))
+
+        assert archive.endswith(".apks")
+        assert sum("exec-out" in line for line in adb.commands()) == 4
 
     @patch("subprocess.run")
     def test_extract_apk_from_device_failure(self, mock_subprocess):
@@ -161,6 +161,20 @@ class TestRunExporter:
         assert user_prompt_data["screenshot"] == "[BASE64_SCREENSHOT_REMOVED]"
         assert user_prompt_data["other_data"] == "keep this"
 
+    def test_clean_request_json_keeps_blob_reference(self, db_manager):
+        """Test that blob digest references survive export cleaning."""
+        exporter = RunExporter(db_manager)
+        ref = "blob:sha256:" + "a" * 64
+
+        request_json = json.dumps({
+            "user_prompt": json.dumps({"screenshot": ref}),
+            "system_prompt": "System prompt text"
+        })
+
+        cleaned = exporter._clean_request_json(request_json)
+
+        assert json.loads(cleaned["user_prompt"])["screenshot"] == ref
+
     def test_export_statistics(self, db_manager, sample_run, tmp_path):
         """Test that statistics are correctly calculated."""
         from mobile_crawler.infrastructure.screen_repository import Screen, ScreenRepository
@@ -1,13 +1,14 @@
 """Tests for run_repository.py."""
 
 import tempfile
+from contextlib import closing
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
 from mobile_crawler.infrastructure.database import DatabaseManager
-from mobile_crawler.infrastructure.run_repository import Run, RunRepository
+from mobile_crawler.infrastructure.run_repository import RUN_SORT_COLUMNS, Run, RunRepository
 
 
 @pytest.fixture
@@ -339,3 +340,99 @@ class TestRunRepository:
         assert retrieved_run.end_time is None
         assert retrieved_run.ai_provider is None
         assert retrieved_run.ai_model is None
+
+
+class TestRunPaging:
+    """Tests for keyset-paginated run history queries."""
+
+    @pytest.fixture
+    def seeded_repository(self, run_repository):
+        """Repository with runs whose start times collide to exercise the id tiebreak."""
+        for i in range(9):
+            run_repository.create_run(Run(
+                id=None,
+                device_id="emulator-5554",
+                app_package=["com.alpha.app", "com.beta.app", "org.gamma"][i % 3],
+                start_activity=None,
+                start_time=datetime(2024, 1, 1, 12, i // 2, 0, tzinfo=UTC),
+                end_time=None if i % 4 == 0 else datetime(2024, 1, 1, 13, i, 0, tzinfo=UTC),
+                status="ERROR" if i % 3 == 1 else "COMPLETED",
+                ai_provider="gemini",
+                ai_model=None if i % 2 else "gemini-1.5-flash",
+                total_steps=i % 4,
+            ))
+        return run_repository
+
+    def _all_pages(self, repository, page_size=2, **kwargs):
+        sort_by = kwargs.get("sort_by", "start_time")
+        runs, after = [], None
+        while True:
+            page = repository.get_runs_page(limit=page_size, after=after, **kwargs)
+            runs.extend(page)
+            if len(page) < page_size:
+                return runs
+            after = repository.page_cursor(page[-1], sort_by)
+
+    def test_pages_cover_all_runs_in_order(self, seeded_repository):
+        runs = self._all_pages(seeded_repository)
+
+        assert [run.id for run in runs] == [9, 8, 7, 6, 5, 4, 3, 2, 1]
+
+    @pytest.mark.parametrize("sort_by", ["end_time", "ai_model", "total_steps", "app_package", "id"])
+    @pytest.mark.parametrize("descending", [True, False])
+    def test_pages_match_single_query(self, seeded_repository, sort_by, descending):
+        paged = self._all_pages(seeded_repository, sort_by=sort_by, descending=descending)
+        single = seeded_repository.get_runs_page(limit=100, sort_by=sort_by, descending=descending)
+
+        assert [run.id for run in paged] == [run.id for run in single]
+        assert len({run.id for run in paged}) == 9
+
+    def test_filters_by_status_and_package_prefix(self, seeded_repository):
+        errors = self._all_pages(seeded_repository, status="ERROR")
+        com_runs = self._all_pages(seeded_repository, app_package="com.")
+        beta_errors = seeded_repository.get_runs_page(status="ERROR", app_package="com.beta")
+
+        assert {run.status for run in errors} == {"ERROR"}
+        assert len(errors) == 3
+        assert len(com_runs) == 6
+        assert all(run.app_package.startswith("com.") for run in com_runs)
+        assert [run.app_package for run in beta_errors] == ["com.beta.app"] * 3
+
+    def test_model_sort_follows_displayed_label(self, run_repository):
+        for provider, model in [("ollama", "llama2"), ("gemini", "pro"), ("openrouter", "gemini-pro"), ("gemini", None)]:
+            run_repository.create_run(Run(
+                id=None,
+                device_id="emulator-5554",
+                app_package="com.example.app",
+                start_activity=None,
+                start_time=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+                end_time=None,
+                status="COMPLETED",
+                ai_provider=provider,
+                ai_model=model,
+            ))
+
+        runs = self._all_pages(run_repository, page_size=1, sort_by="ai_model", descending=False)
+
+        assert [run.model_label for run in runs] == ["", "gemini/pro", "ollama/llama2", "openrouter/gemini-pro"]
+
+    def test_rejects_unknown_sort_column(self, run_repository):
+        with pytest.raises(ValueError):
+            run_repository.get_runs_page(sort_by="session_path; DROP TABLE runs")
+
+    def test_history_indexes_are_used(self, seeded_repository, db_manager):
+        with closing(db_manager.get_connection()) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM runs WHERE status = ? ORDER BY start_time DESC, id DESC LIMIT 10",
+                ("ERROR",),
+            ).fetchall()
+
+        assert any("idx_runs_status" in row["detail"] for row in plan)
+
+    def test_model_label_index_is_used(self, seeded_repository, db_manager):
+        with closing(db_manager.get_connection()) as conn:
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT * FROM runs ORDER BY {RUN_SORT_COLUMNS['ai_model']} DESC, id DESC LIMIT 10"
+            ).fetchall()
+
+        assert any("idx_runs_model_label" in row["detail"] for row in plan)
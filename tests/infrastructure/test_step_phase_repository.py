@@ -287,6 +287,31 @@ class TestStepPhaseRepository:
         assert row is not None
         assert row[0] == "execute"
 
+    def test_record_step_network_updates_latest_transition(self, step_phase_repository, db_manager_with_run):
+        """Test record_step_network stores the step's traffic on its latest transition."""
+        run_id = db_manager_with_run._test_run_id
+        base_time = datetime.now()
+        for offset, to_phase in enumerate(["decide", "execute"]):
+            step_phase_repository.record_transition(
+                StepPhaseTransition(
+                    id=None,
+                    run_id=run_id,
+                    step_number=1,
+                    from_phase="capture",
+                    to_phase=to_phase,
+                    timestamp=base_time + timedelta(seconds=offset),
+                )
+            )
+
+        step_phase_repository.record_step_network(run_id, 1, '{"hosts": ["api.example.com"]}')
+
+        conn = db_manager_with_run.get_connection()
+        rows = conn.execute(
+            "SELECT to_phase, network_json FROM step_phase_transitions WHERE run_id = ? ORDER BY timestamp",
+            (run_id,),
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [("decide", None), ("execute", '{"hosts": ["api.example.com"]}')]
+
     # --- Observability query tests (Plan 03-02) ---
 
     def test_get_run_phase_stats_empty_run(self, step_phase_repository, db_manager_with_run):
@@ -2,13 +2,18 @@
 
 
 from dataclasses import dataclass
+from datetime import datetime
+from unittest.mock import Mock
 
 import pytest
 from PySide6.QtWidgets import QApplication, QGroupBox, QTableWidget
 
+from mobile_crawler.infrastructure.ai_interaction_repository import AIInteraction
 from mobile_crawler.ui.widgets.ai_monitor_panel import (
     AIMonitorPanel,
+    InteractionSearchIndex,
     StepDetailWidget,
+    TimelineRowRole,
     _build_timing_breakdown,
 )
 
@@ -55,13 +60,13 @@ def test_add_request_creates_pending_entry(ai_monitor_panel):
     }
 
     # Initially empty
-    assert ai_monitor_panel.interactions_list.count() == 0
+    assert ai_monitor_panel.interactions_list.model().rowCount() == 0
 
     # Add request
     ai_monitor_panel.add_request(run_id, step_number, request_data)
 
     # Should have one item
-    assert ai_monitor_panel.interactions_list.count() == 1
+    assert ai_monitor_panel.interactions_list.model().rowCount() == 1
 
     # Check internal storage
     assert step_number in ai_monitor_panel._interactions
@@ -87,13 +92,13 @@ def test_add_response_completes_interaction(ai_monitor_panel):
 
     # Add request first
     ai_monitor_panel.add_request(run_id, step_number, request_data)
-    assert ai_monitor_panel.interactions_list.count() == 1
+    assert ai_monitor_panel.interactions_list.model().rowCount() == 1
 
     # Add response
     ai_monitor_panel.add_response(run_id, step_number, response_data)
 
     # Should still have one item (updated, not added)
-    assert ai_monitor_panel.interactions_list.count() == 1
+    assert ai_monitor_panel.interactions_list.model().rowCount() == 1
 
     # Check internal storage updated
     interaction = ai_monitor_panel._interactions[step_number]
@@ -112,17 +117,19 @@ def test_status_filter_shows_only_matching_entries(ai_monitor_panel):
     ai_monitor_panel.add_response(1, 2, {"response": "Error", "success": False, "error_message": "Test error"})
 
     # Initially should show both
-    assert ai_monitor_panel.interactions_list.count() == 2
+    assert ai_monitor_panel.interactions_list.model().rowCount() == 2
 
     # Filter to success only
     ai_monitor_panel.status_filter.setCurrentText("Success Only")
-    # Note: This triggers the filter, but we need to check visibility
+    assert ai_monitor_panel.visible_steps() == [1]
 
     # Filter to failed only
     ai_monitor_panel.status_filter.setCurrentText("Failed Only")
+    assert ai_monitor_panel.visible_steps() == [2]
 
     # Filter to all
     ai_monitor_panel.status_filter.setCurrentText("All")
+    assert ai_monitor_panel.visible_steps() == [1, 2]
 
 
 def test_search_filters_by_text_content(ai_monitor_panel):
@@ -135,17 +142,102 @@ def test_search_filters_by_text_content(ai_monitor_panel):
     ai_monitor_panel.add_response(1, 2, {"response": "Action: scroll", "success": True})
 
     # Initially should show both
-    assert ai_monitor_panel.interactions_list.count() == 2
+    assert ai_monitor_panel.interactions_list.model().rowCount() == 2
 
     # Search for "login" - should show only first
     ai_monitor_panel.search_input.setText("login")
-    # Note: This triggers debounced search, would need to wait or trigger manually
+    ai_monitor_panel._perform_search()
+    assert ai_monitor_panel.visible_steps() == [1]
 
     # Search for "scroll" - should show only second
     ai_monitor_panel.search_input.setText("scroll")
+    ai_monitor_panel._perform_search()
+    assert ai_monitor_panel.visible_steps() == [2]
 
     # Clear search
     ai_monitor_panel.search_input.clear()
+    ai_monitor_panel._perform_search()
+    assert ai_monitor_panel.visible_steps() == [1, 2]
+
+
+def test_response_updates_row_in_place(ai_monitor_panel):
+    """Test that completing a request repaints its row without moving it."""
+    ai_monitor_panel.add_request(1, 1, {"user_prompt": "First"})
+    ai_monitor_panel.add_request(1, 2, {"user_prompt": "Second"})
+    model = ai_monitor_panel.interactions_list.model()
+    assert model.index(0).data(TimelineRowRole).status == "pending"
+
+    ai_monitor_panel.add_response(1, 1, {"response": "Done", "success": True, "latency_ms": 1500})
+
+    row = model.index(0).data(TimelineRowRole)
+    assert ai_monitor_panel.visible_steps() == [1, 2]
+    assert row.status == "success"
+    assert row.response_preview == "Done"
+    assert "AI 1.5s" in row.metrics
+
+
+def test_search_combines_with_status_and_new_rows(ai_monitor_panel):
+    """Test that rows arriving during a search are filtered like existing ones."""
+    ai_monitor_panel.add_request(1, 1, {"user_prompt": '{"screenshot": "aGVsbG8=", "goal": "Open settings"}'})
+    ai_monitor_panel.add_response(1, 1, {"response": "tap Settings", "success": True})
+    ai_monitor_panel.status_filter.setCurrentText("Success Only")
+    ai_monitor_panel.search_input.setText("sett")
+    ai_monitor_panel._perform_search()
+    assert ai_monitor_panel.visible_steps() == [1]
+
+    ai_monitor_panel.add_request(1, 2, {"user_prompt": "Open settings again"})
+    assert ai_monitor_panel.visible_steps() == [1]  # pending is not a success
+    ai_monitor_panel.add_response(1, 2, {"response": "tap", "success": True})
+    ai_monitor_panel.add_request(1, 3, {"user_prompt": "Go back"})
+    ai_monitor_panel.add_response(1, 3, {"response": "back", "success": True})
+
+    assert ai_monitor_panel.visible_steps() == [1, 2]
+
+
+def test_search_index_matches_word_prefixes():
+    """Test that every query word must prefix-match a token of the step."""
+    index = InteractionSearchIndex()
+    index.add_text(1, "Click the login button")
+    index.add_text(2, "Scroll down to Login options")
+    index.add_text(3, '{"screenshot": "' + "A" * 500 + '"}')
+
+    assert index.search("log") == {1, 2}
+    assert index.search("login butt") == {1}
+    assert index.search("logout") == set()
+    assert index.search("AAAA") == set()  # base64 runs are not indexed
+    assert index.matches(2, "scroll log")
+    assert not index.matches(1, "scroll")
+
+
+def test_completed_bodies_are_loaded_from_repository(ai_monitor_panel):
+    """Test that bodies are released after completion and re-read on details."""
+    stored = AIInteraction(
+        id=7, run_id=1, step_number=4, timestamp=datetime.now(),
+        request_json='{"system_prompt": "sys", "user_prompt": "Stored prompt"}',
+        screenshot_path=None, response_raw="Stored response",
+        response_parsed_json='{"actions": [{"action": "click"}]}',
+        tokens_input=1, tokens_output=2, latency_ms=3.0, success=True,
+        error_message=None, retry_count=0,
+    )
+    loader = Mock(return_value=stored)
+    ai_monitor_panel.set_interaction_loader(loader)
+    emitted = []
+    ai_monitor_panel.show_step_details.connect(lambda *args: emitted.append(args))
+
+    ai_monitor_panel.add_request(1, 4, {"user_prompt": "Live prompt"})
+    ai_monitor_panel.add_response(1, 4, {"response": "Live response", "success": True})
+
+    assert ai_monitor_panel._interactions[4]["request_data"] is None
+    assert ai_monitor_panel._interactions[4]["response_data"] is None
+    loader.assert_not_called()
+
+    model = ai_monitor_panel.interactions_list.model()
+    ai_monitor_panel.interactions_list.activated.emit(model.index(0))
+
+    loader.assert_called_once_with(1, 4)
+    step, _, success, prompt, response, actions = emitted[0][:6]
+    assert (step, success, prompt, response) == (4, True, "Stored prompt", "Stored response")
+    assert actions == [{"action": "click"}]
 
 
 def test_clear_resets_all_entries(ai_monitor_panel):
@@ -157,14 +249,14 @@ def test_clear_resets_all_entries(ai_monitor_panel):
     ai_monitor_panel.add_request(1, 2, {"user_prompt": "Test 2"})
     ai_monitor_panel.add_response(1, 2, {"response": "OK", "success": True})
 
-    assert ai_monitor_panel.interactions_list.count() == 2
+    assert ai_monitor_panel.interactions_list.model().rowCount() == 2
     assert len(ai_monitor_panel._interactions) == 2
 
     # Clear
     ai_monitor_panel.clear()
 
     # Should be empty
-    assert ai_monitor_panel.interactions_list.count() == 0
+    assert ai_monitor_panel.interactions_list.model().rowCount() == 0
     assert len(ai_monitor_panel._interactions) == 0
     assert ai_monitor_panel._filter_state["status"] == "all"
     assert ai_monitor_panel._filter_state["search"] == ""
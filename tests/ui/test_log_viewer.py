@@ -1,9 +1,10 @@
 """Tests for LogViewer widget."""
 
 import pytest
+from PySide6.QtWidgets import QAbstractItemView
 
 from mobile_crawler.core.logging_service import LogLevel
-from mobile_crawler.ui.widgets.log_viewer import LogViewer
+from mobile_crawler.ui.widgets.log_viewer import LogListModel, LogRingBuffer, LogViewer
 
 
 def _create_log_viewer():
@@ -29,7 +30,7 @@ class TestLogViewerInit:
     def test_initialization(self, log_viewer):
         """Test that LogViewer initializes correctly."""
         assert log_viewer.level_filter is not None
-        assert log_viewer.log_text is not None
+        assert log_viewer.log_list is not None
         assert log_viewer.clear_button is not None
         assert log_viewer.get_level_filter() == LogLevel.DEBUG
 
@@ -74,15 +75,16 @@ class TestLogDisplay:
     def test_append_log_displays_message(self, log_viewer):
         """Test that append_log() displays message."""
         log_viewer.append_log(LogLevel.INFO, "Test message")
-        text = log_viewer.log_text.toPlainText()
+        text = log_viewer.visible_text()
         assert "[INFO] Test message" in text
 
     def test_append_log_with_newline(self, log_viewer):
-        """Test that append_log() adds newline."""
+        """Test that each appended message gets its own line."""
         log_viewer.append_log(LogLevel.INFO, "Message 1")
         log_viewer.append_log(LogLevel.INFO, "Message 2")
-        text = log_viewer.log_text.toPlainText()
-        assert text.endswith("Message 2\n")
+        lines = log_viewer.visible_text().splitlines()
+        assert lines[0].endswith("Message 1")
+        assert lines[1].endswith("Message 2")
 
     def test_append_log_filters_by_level(self, log_viewer):
         """Test that append_log() filters by level."""
@@ -92,7 +94,7 @@ class TestLogDisplay:
         log_viewer.append_log(LogLevel.INFO, "Info message")
         log_viewer.append_log(LogLevel.WARNING, "Warning message")
 
-        text = log_viewer.log_text.toPlainText()
+        text = log_viewer.visible_text()
         assert "[DEBUG] Debug message" not in text
         assert "[INFO] Info message" not in text
         assert "[WARNING] [WARN] Warning message" in text
@@ -101,7 +103,7 @@ class TestLogDisplay:
         """Test that append_log() allows equal level."""
         log_viewer.set_level_filter(LogLevel.WARNING)
         log_viewer.append_log(LogLevel.WARNING, "Warning message")
-        text = log_viewer.log_text.toPlainText()
+        text = log_viewer.visible_text()
         assert "[WARNING] [WARN] Warning message" in text
 
     def test_append_log_allows_higher_level(self):
@@ -110,7 +112,7 @@ class TestLogDisplay:
         try:
             viewer.set_level_filter(LogLevel.WARNING)
             viewer.append_log(LogLevel.ERROR, "Error message")
-            text = viewer.log_text.toPlainText()
+            text = viewer.visible_text()
             assert "[ERROR] [ERROR] Error message" in text
         finally:
             viewer.close()
@@ -122,7 +124,7 @@ class TestLogDisplay:
             'Manager response:\n{\n  "action": "tap",\n  "target": "Sign in"\n}',
         )
 
-        text = log_viewer.log_text.toPlainText()
+        text = log_viewer.visible_text()
         assert "[INFO] [MANAGER] Manager response:" in text
         assert '{' in text
         assert '  "action": "tap",' in text
@@ -134,7 +136,7 @@ class TestLogDisplay:
         log_viewer.append_log(LogLevel.DEBUG, "[stdout] Step 1 started")
         log_viewer.append_log(LogLevel.DEBUG, "[stderr] retry timeout")
 
-        text = log_viewer.log_text.toPlainText()
+        text = log_viewer.visible_text()
         assert "[DEBUG] [STDOUT] Step 1 started" in text
         assert "[DEBUG] [STDERR] retry timeout" in text
 
@@ -146,7 +148,7 @@ class TestLogDisplay:
         log_viewer.append_log(LogLevel.WARNING, "Warning message")
         log_viewer.append_log(LogLevel.ERROR, "Error message")
 
-        text = log_viewer.log_text.toPlainText()
+        text = log_viewer.visible_text()
         assert "debug stream noise" not in text
         assert "[WARNING] [WARN] Warning message" in text
         assert "[ERROR] [ERROR] Error message" in text
@@ -158,7 +160,7 @@ class TestLogDisplay:
             "Crawl completed: 1 steps in 25.6s - Reached max step count of 1 steps | successful=0 failed=0 total=0",
         )
 
-        text = log_viewer.log_text.toPlainText()
+        text = log_viewer.visible_text()
         assert "[INFO] [ERROR]" not in text
         assert "[INFO] [OK] Crawl completed:" in text
 
@@ -169,7 +171,7 @@ class TestLogDisplay:
         log_viewer.append_log(LogLevel.ERROR, "failed to tap")
 
         log_viewer.set_level_filter(LogLevel.INFO)
-        text = log_viewer.log_text.toPlainText()
+        text = log_viewer.visible_text()
 
         assert "raw line" not in text
         assert text.index("[ACTION] [ACTION]") < text.index("[ERROR] [ERROR]")
@@ -217,18 +219,18 @@ class TestClearLogs:
     def test_clear_button_clears_text(self, log_viewer):
         """Test that clear button clears log text."""
         log_viewer.append_log(LogLevel.INFO, "Test message")
-        assert log_viewer.log_text.toPlainText() != ""
+        assert log_viewer.visible_text() != ""
 
         log_viewer.clear_button.click()
-        assert log_viewer.log_text.toPlainText() == ""
+        assert log_viewer.visible_text() == ""
 
     def test_clear_logs_method_clears_text(self, log_viewer):
         """Test that clear_logs() method clears log text."""
         log_viewer.append_log(LogLevel.INFO, "Test message")
-        assert log_viewer.log_text.toPlainText() != ""
+        assert log_viewer.visible_text() != ""
 
         log_viewer.clear_logs()
-        assert log_viewer.log_text.toPlainText() == ""
+        assert log_viewer.visible_text() == ""
 
     def test_clear_emits_signal(self, log_viewer):
         """Test that clear emits logs_cleared signal."""
@@ -265,14 +267,15 @@ class TestUIComponents:
         assert log_viewer.clear_button is not None
         assert log_viewer.clear_button.text() == "Clear"
 
-    def test_log_text_exists(self, log_viewer):
+    def test_log_list_exists(self, log_viewer):
         """Test that log text area exists."""
-        assert log_viewer.log_text is not None
-        assert log_viewer.log_text.isReadOnly()
+        assert log_viewer.log_list is not None
+        assert log_viewer.log_list.editTriggers() == QAbstractItemView.EditTrigger.NoEditTriggers
+        assert log_viewer.log_list.uniformItemSizes()
 
     def test_log_text_has_minimum_height(self, log_viewer):
         """Test that log text has minimum height."""
-        assert log_viewer.log_text.minimumHeight() >= 300
+        assert log_viewer.log_list.minimumHeight() >= 300
 
 
 class TestAutoScroll:
@@ -285,5 +288,76 @@ class TestAutoScroll:
             log_viewer.append_log(LogLevel.INFO, f"Message {i}")
 
         # Check that scrollbar is at maximum
-        scrollbar = log_viewer.log_text.verticalScrollBar()
+        log_viewer.flush()
+        scrollbar = log_viewer.log_list.verticalScrollBar()
         assert scrollbar.value() == scrollbar.maximum()
+
+
+class TestRingBuffer:
+    """Tests for the fixed-capacity buffer and list model."""
+
+    def test_ring_buffer_overwrites_oldest(self):
+        """Test that the buffer keeps the newest rows and their sequence numbers."""
+        buffer = LogRingBuffer(3)
+        for i in range(5):
+            buffer.append((0, f"line {i}", "#fff"))
+
+        assert len(buffer) == 3
+        assert (buffer.first_seq, buffer.end_seq) == (2, 5)
+        assert [buffer.get(seq)[1] for seq in range(2, 5)] == ["line 2", "line 3", "line 4"]
+
+    def test_model_trims_with_single_removal(self, qt_app):
+        """Test that overflowing the capacity removes the oldest visible rows in one signal."""
+        model = LogListModel(capacity=4)
+        model.append_rows([(0, "a", "#fff"), (1, "b", "#fff"), (0, "c", "#fff")])
+        removals = []
+        model.rowsRemoved.connect(lambda parent, first, last: removals.append((first, last)))
+
+        model.append_rows([(1, "d", "#fff"), (1, "e", "#fff"), (1, "f", "#fff")])
+
+        assert removals == [(0, 1)]
+        assert [model.row_text(row) for row in range(model.rowCount())] == ["c", "d", "e", "f"]
+
+    def test_model_filter_skips_hidden_rows_on_trim(self, qt_app):
+        """Test that trimming rows hidden by the filter emits no removal."""
+        model = LogListModel(capacity=2)
+        model.set_min_order(1)
+        model.append_rows([(0, "debug", "#fff"), (1, "info", "#fff")])
+        removals = []
+        model.rowsRemoved.connect(lambda *args: removals.append(args))
+
+        model.append_rows([(1, "info 2", "#fff")])
+
+        assert removals == []
+        assert [model.row_text(row) for row in range(model.rowCount())] == ["info", "info 2"]
+
+        model.set_min_order(0)
+        assert model.rowCount() == 2
+
+
+class TestBatchedAppends:
+    """Tests for per-tick batching of appended entries."""
+
+    def test_appends_are_inserted_once_per_tick(self, log_viewer, qt_app):
+        """Test that entries queued before the event loop runs arrive in one insertion."""
+        insertions = []
+        log_viewer._model.rowsInserted.connect(lambda parent, first, last: insertions.append((first, last)))
+
+        for i in range(50):
+            log_viewer.append_log(LogLevel.INFO, f"Message {i}")
+        assert insertions == []
+
+        qt_app.processEvents()
+        assert insertions == [(0, 49)]
+
+    def test_capacity_bounds_retained_lines(self, log_viewer, monkeypatch):
+        """Test that only the newest lines are kept once the capacity is exceeded."""
+        monkeypatch.setattr(log_viewer._model, "_buffer", LogRingBuffer(10))
+
+        for i in range(25):
+            log_viewer.append_log(LogLevel.INFO, f"Message {i}")
+
+        lines = log_viewer.visible_text().splitlines()
+        assert len(lines) == 10
+        assert lines[0].endswith("Message 15")
+        assert lines[-1].endswith("Message 24")
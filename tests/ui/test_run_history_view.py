@@ -4,6 +4,7 @@ from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication, QMessageBox
 
 
@@ -107,11 +108,33 @@ def _create_run_history_view(mock_run_repository, mock_report_generator, mock_mo
         RunHistoryView instance with mock dependencies
     """
     from mobile_crawler.ui.widgets.run_history_view import RunHistoryView
-    return RunHistoryView(
+    view = RunHistoryView(
         mock_run_repository,
         mock_report_generator,
         mock_mobsf_manager
     )
+    _wait_for_session_paths(view)
+    return view
+
+
+def _wait_for_session_paths(view):
+    """Let the background session folder lookups finish and deliver results."""
+    app = QApplication.instance()
+    while view._path_thread is not None or view._pending_path_runs:
+        if view._path_thread is not None:
+            view._path_thread.wait(5000)
+        app.processEvents()
+    app.processEvents()
+
+
+def _header(view, column):
+    """Return the horizontal header text for a column."""
+    return view.model.headerData(column, Qt.Orientation.Horizontal)
+
+
+def _cell(view, row, column):
+    """Return the display text of a table cell."""
+    return view.model.index(row, column).data()
 
 
 class TestRunHistoryViewInit:
@@ -149,17 +172,17 @@ class TestRunHistoryTable:
     def test_table_has_correct_columns(self, qt_app, mock_run_repository, mock_report_generator, mock_mobsf_manager):
         """Test that table has correct columns."""
         view = _create_run_history_view(mock_run_repository, mock_report_generator, mock_mobsf_manager)
-        assert view.table.columnCount() == 10
-        assert view.table.horizontalHeaderItem(0).text() == "ID"
-        assert view.table.horizontalHeaderItem(1).text() == "Device"
-        assert view.table.horizontalHeaderItem(2).text() == "Package"
-        assert view.table.horizontalHeaderItem(3).text() == "Start Time"
-        assert view.table.horizontalHeaderItem(4).text() == "End Time"
-        assert view.table.horizontalHeaderItem(5).text() == "Status"
-        assert view.table.horizontalHeaderItem(6).text() == "Steps"
-        assert view.table.horizontalHeaderItem(7).text() == "Screens"
-        assert view.table.horizontalHeaderItem(8).text() == "Model"
-        assert view.table.horizontalHeaderItem(9).text() == "Actions"
+        assert view.model.columnCount() == 10
+        assert _header(view, 0) == "ID"
+        assert _header(view, 1) == "Device"
+        assert _header(view, 2) == "Package"
+        assert _header(view, 3) == "Start Time"
+        assert _header(view, 4) == "End Time"
+        assert _header(view, 5) == "Status"
+        assert _header(view, 6) == "Steps"
+        assert _header(view, 7) == "Screens"
+        assert _header(view, 8) == "Model"
+        assert _header(view, 9) == "Actions"
 
     def test_table_is_read_only(self, qt_app, mock_run_repository, mock_report_generator, mock_mobsf_manager):
         """Test that table is read-only."""
@@ -170,25 +193,25 @@ class TestRunHistoryTable:
         """Test that table loads runs from repository."""
         mock_run_repository.add_run("emulator-5554", "com.example.app", "STOPPED", steps=10, screens=5)
         view = _create_run_history_view(mock_run_repository, mock_report_generator, mock_mobsf_manager)
-        assert view.table.rowCount() == 1
+        assert view.model.rowCount() == 1
 
     def test_table_displays_run_data(self, qt_app, mock_run_repository, mock_report_generator, mock_mobsf_manager):
         """Test that table displays run data correctly."""
         run = mock_run_repository.add_run("emulator-5554", "com.example.app", "STOPPED", steps=10, screens=5)
         view = _create_run_history_view(mock_run_repository, mock_report_generator, mock_mobsf_manager)
 
-        assert view.table.item(0, 0).text() == str(run.id)
-        assert view.table.item(0, 1).text() == "emulator-5554"
-        assert view.table.item(0, 2).text() == "com.example.app"
-        assert view.table.item(0, 6).text() == "10"
-        assert view.table.item(0, 7).text() == "5"
+        assert _cell(view, 0, 0) == str(run.id)
+        assert _cell(view, 0, 1) == "emulator-5554"
+        assert _cell(view, 0, 2) == "com.example.app"
+        assert _cell(view, 0, 6) == "10"
+        assert _cell(view, 0, 7) == "5"
 
     def test_table_displays_model_info(self, qt_app, mock_run_repository, mock_report_generator, mock_mobsf_manager):
         """Test that table displays model info."""
         mock_run_repository.add_run("emulator-5554", "com.example.app", "STOPPED")
         view = _create_run_history_view(mock_run_repository, mock_report_generator, mock_mobsf_manager)
 
-        assert view.table.item(0, 8).text() == "gemini/gemini-1.5-pro"
+        assert _cell(view, 0, 8) == "gemini/gemini-1.5-pro"
 
     def test_table_displays_multiple_runs(self, qt_app, mock_run_repository, mock_report_generator, mock_mobsf_manager):
         """Test that table displays multiple runs."""
@@ -197,7 +220,7 @@ class TestRunHistoryTable:
         mock_run_repository.add_run("emulator-5554", "com.example.app3", "ERROR")
         view = _create_run_history_view(mock_run_repository, mock_report_generator, mock_mobsf_manager)
 
-        assert view.table.rowCount() == 3
+        assert view.model.rowCount() == 3
 
     def test_table_displays_status_colors(self, qt_app, mock_run_repository, mock_report_generator, mock_mobsf_manager):
         """Test that table displays status with correct colors."""
@@ -207,9 +230,9 @@ class TestRunHistoryTable:
         view = _create_run_history_view(mock_run_repository, mock_report_generator, mock_mobsf_manager)
 
         # Check that status items have colors (not just default)
-        assert view.table.item(0, 5).foreground() is not None
-        assert view.table.item(1, 5).foreground() is not None
-        assert view.table.item(2, 5).foreground() is not None
+        assert view.model.index(0, 5).data(Qt.ItemDataRole.ForegroundRole) is not None
+        assert view.model.index(1, 5).data(Qt.ItemDataRole.ForegroundRole) is not None
+        assert view.model.index(2, 5).data(Qt.ItemDataRole.ForegroundRole) is not None
 
 
 class TestButtons:
@@ -283,7 +306,7 @@ class TestDeleteRun:
         view.table.selectRow(0)
         view._on_delete_clicked()
 
-        assert view.table.rowCount() == 0
+        assert view.model.rowCount() == 0
 
     def test_delete_with_no_confirmation(self, qt_app, mock_run_repository, mock_report_generator, mock_mobsf_manager, monkeypatch):
         """Test that delete does not proceed when user cancels."""
@@ -298,7 +321,7 @@ class TestDeleteRun:
         view._on_delete_clicked()
 
         # Row should still be in table
-        assert view.table.rowCount() == 1
+        assert view.model.rowCount() == 1
 
 
 class TestGenerateReport:
@@ -404,6 +427,7 @@ class TestMobSF:
 
         view.table.selectRow(0)
         view._on_mobsf_finished(run.id, Mock(success=False, error="Upload failed"))
+        _wait_for_session_paths(view)
 
         assert messages == ["Upload failed"]
 
@@ -463,8 +487,9 @@ class TestRefresh:
 
         # Click refresh
         view._load_runs()
+        _wait_for_session_paths(view)
 
-        assert view.table.rowCount() == 1
+        assert view.model.rowCount() == 1
 
     def test_refresh_method_works(self, qt_app, mock_run_repository, mock_report_generator, mock_mobsf_manager):
         """Test that refresh method works."""
@@ -475,8 +500,93 @@ class TestRefresh:
 
         # Call refresh method
         view.refresh()
+        _wait_for_session_paths(view)
+
+        assert view.model.rowCount() == 1
+
+
+class TestPagingAndFilters:
+    """Tests for keyset paging, server-side sorting and filtering."""
+
+    @pytest.fixture
+    def run_repository(self, tmp_path):
+        from mobile_crawler.infrastructure.database import DatabaseManager
+        from mobile_crawler.infrastructure.run_repository import Run, RunRepository
+
+        db_manager = DatabaseManager(tmp_path / "crawler.db")
+        db_manager.create_schema()
+        repository = RunRepository(db_manager)
+        for i in range(7):
+            repository.create_run(Run(
+                id=None,
+                device_id="emulator-5554",
+                app_package="com.example.alpha" if i % 2 == 0 else "org.other.beta",
+                start_activity=None,
+                start_time=datetime(2026, 1, 10, 12, i, 0),
+                end_time=None,
+                status="ERROR" if i == 3 else "COMPLETED",
+                ai_provider="gemini",
+                ai_model="gemini-1.5-pro",
+            ))
+        return repository
+
+    def test_model_fetches_pages_on_demand(self, qt_app, run_repository):
+        from mobile_crawler.ui.widgets.run_history_view import RunHistoryModel
+
+        model = RunHistoryModel(run_repository, page_size=3)
+        model.reload()
+
+        assert model.rowCount() == 3
+        assert model.canFetchMore()
+        model.fetchMore()
+        model.fetchMore()
+        assert model.rowCount() == 7
+        assert not model.canFetchMore()
+        # Newest first by default
+        assert [model.run_at(row).id for row in range(7)] == [7, 6, 5, 4, 3, 2, 1]
+
+    def test_model_sort_is_applied_server_side(self, qt_app, run_repository):
+        from mobile_crawler.ui.widgets.run_history_view import RunHistoryModel
+
+        model = RunHistoryModel(run_repository, page_size=3)
+        model.reload()
+        model.sort(2, Qt.SortOrder.AscendingOrder)
+        while model.canFetchMore():
+            model.fetchMore()
+
+        packages = [model.run_at(row).app_package for row in range(model.rowCount())]
+        assert packages == sorted(packages)
+        assert model.rowCount() == 7
+
+    def test_view_filters_by_status_and_package(
+        self, qt_app, run_repository, mock_report_generator, mock_mobsf_manager
+    ):
+        view = _create_run_history_view(run_repository, mock_report_generator, mock_mobsf_manager)
+
+        view.status_filter.setCurrentIndex(view.status_filter.findData("ERROR"))
+        _wait_for_session_paths(view)
+        assert view.model.rowCount() == 1
+        assert _cell(view, 0, 0) == "4"
+
+        view.status_filter.setCurrentIndex(0)
+        view.package_filter.setText("com.example")
+        view._apply_filters()
+        _wait_for_session_paths(view)
+        assert view.model.rowCount() == 4
+        assert all(_cell(view, row, 2) == "com.example.alpha" for row in range(4))
+
+    def test_delete_removes_only_loaded_row(
+        self, qt_app, run_repository, mock_report_generator, mock_mobsf_manager, monkeypatch
+    ):
+        view = _create_run_history_view(run_repository, mock_report_generator, mock_mobsf_manager)
+        monkeypatch.setattr(QMessageBox, 'question', lambda *args, **kwargs: QMessageBox.StandardButton.Yes)
+        monkeypatch.setattr(QMessageBox, 'information', lambda *args, **kwargs: None)
+
+        view.table.selectRow(0)
+        view._on_delete_clicked()
 
-        assert view.table.rowCount() == 1
+        assert view.model.rowCount() == 6
+        assert view.model.row_for_run_id(7) is None
 
 
 class TestGetSelectedRunId:
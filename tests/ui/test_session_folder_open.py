@@ -2,10 +2,11 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
-from PySide6.QtWidgets import QApplication, QPushButton
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
 
 from mobile_crawler.infrastructure.run_repository import Run
-from mobile_crawler.ui.widgets.run_history_view import RunHistoryView
+from mobile_crawler.ui.widgets.run_history_view import ACTIONS_COLUMN, RunHistoryView, SessionPathRole
 
 
 @pytest.fixture
@@ -16,6 +17,16 @@ def qt_app():
         app = QApplication([])
     yield app
 
+
+def _wait_for_session_paths(view):
+    """Let the background session folder lookup finish and deliver results."""
+    app = QApplication.instance()
+    while view._path_thread is not None or view._pending_path_runs:
+        if view._path_thread is not None:
+            view._path_thread.wait(5000)
+        app.processEvents()
+    app.processEvents()
+
 def test_open_folder_button_enables_with_session_path(qt_app):
     """Test that Open Folder button is enabled when session_path exists."""
     # Mock dependencies
@@ -36,18 +47,23 @@ def test_open_folder_button_enables_with_session_path(qt_app):
         ai_model="pro",
         session_path="/tmp/fake_session"
     )
-    mock_run_repo.get_all_runs.return_value = [run]
+    mock_run_repo.get_runs_page.return_value = [run]
 
     # Mock os.path.exists to return True for the session path
     # and provide standard mock for everything else
     with patch('os.path.exists', return_value=True):
         view = RunHistoryView(mock_run_repo, mock_report_gen, mock_mobsf)
+        _wait_for_session_paths(view)
 
-        # Get the cell widget for actions (column 9)
-        open_btn = view.table.cellWidget(0, 9)
-        assert isinstance(open_btn, QPushButton)
-        assert open_btn.isEnabled()
-        assert "Open" in open_btn.text()
+        # The actions cell (column 9) links to the resolved folder
+        index = view.model.index(0, ACTIONS_COLUMN)
+        assert index.data(SessionPathRole) is not None
+        assert "Open" in index.data()
+        assert index.data(Qt.ItemDataRole.ToolTipRole) == "Open Run Folder"
+
+        with patch.object(view, "_open_folder") as open_folder:
+            view._on_table_clicked(index)
+        open_folder.assert_called_once_with(index.data(SessionPathRole))
 
 def test_open_folder_button_disables_when_no_folder_found(qt_app):
     """Test that Open Folder button is disabled when no folder is found anywhere."""
@@ -69,14 +85,18 @@ def test_open_folder_button_disables_when_no_folder_found(qt_app):
         ai_model="pro",
         session_path=None
     )
-    mock_run_repo.get_all_runs.return_value = [run]
+    mock_run_repo.get_runs_page.return_value = [run]
 
     # Mock os.path.exists to return False for everything (no heuristic match either)
     with patch('os.path.exists', return_value=False):
         view = RunHistoryView(mock_run_repo, mock_report_gen, mock_mobsf)
+        _wait_for_session_paths(view)
+
+        # The actions cell (column 9) reports the missing folder
+        index = view.model.index(0, ACTIONS_COLUMN)
+        assert index.data(SessionPathRole) is None
+        assert "Folder not found" in index.data(Qt.ItemDataRole.ToolTipRole)
 
-        # Get the cell widget for actions (column 9)
-        open_btn = view.table.cellWidget(0, 9)
-        assert isinstance(open_btn, QPushButton)
-        assert not open_btn.isEnabled()
-        assert "Folder not found" in open_btn.toolTip()
+        with patch.object(view, "_open_folder") as open_folder:
+            view._on_table_clicked(index)
+        open_folder.assert_not_called()
@@ -3,6 +3,7 @@
 import pytest
 from PySide6.QtWidgets import QApplication
 
+from mobile_crawler.domain.latency_sketch import LatencySummary
 from mobile_crawler.ui.widgets.stats_dashboard import StatsDashboard
 
 
@@ -202,6 +203,33 @@ class TestGetters:
 
 # ---------------------------------------------------------------------------
 # reset
+# ---------------------------------------------------------------------------
+# update_stats — Latency section
+# ---------------------------------------------------------------------------
+
+class TestLatencySection:
+    def test_percentiles_rendered_per_timing(self, dashboard):
+        dashboard.update_stats(latency_summaries={
+            "llm": LatencySummary(count=10, mean=2000.0, p50=1800.0, p95=4200.0, p99=9000.0, max=9100.0),
+            "action": LatencySummary(count=10, mean=80.0, p50=75.0, p95=140.0, p99=300.0, max=310.0),
+        })
+        assert dashboard.latency_labels["llm"].text() == "1.8s / 4.2s / 9.0s"
+        assert dashboard.latency_labels["action"].text() == "75ms / 140ms / 300ms"
+        assert dashboard.latency_labels["ocr"].text() == "—"
+
+    def test_phase_p95s_listed(self, dashboard):
+        dashboard.update_stats(latency_summaries={
+            "phase.decide": LatencySummary(count=3, p95=3500.0),
+            "phase.capture": LatencySummary(count=3, p95=420.0),
+        })
+        assert dashboard.phase_latency_label.text() == "Phases p95: capture 420ms · decide 3.5s"
+
+    def test_dash_without_samples(self, dashboard):
+        dashboard.update_stats()
+        assert dashboard.latency_labels["llm"].text() == "—"
+        assert dashboard.phase_latency_label.text() == "Phases p95: —"
+
+
 # ---------------------------------------------------------------------------
 
 class TestReset:
@@ -71,14 +71,28 @@ class TestCrawlStatistics:
 
     def test_avg_ai_response_time_single(self):
         stats = _make_stats()
-        stats.ai_response_times_ms.append(500.0)
+        stats.ai_response_times.add(500.0)
         assert stats.avg_ai_response_time() == 500.0
 
     def test_avg_ai_response_time_multiple(self):
         stats = _make_stats()
-        stats.ai_response_times_ms.extend([200.0, 400.0])
+        stats.ai_response_times.add(200.0)
+        stats.ai_response_times.add(400.0)
         assert stats.avg_ai_response_time() == 300.0
 
+    def test_latency_summaries_prefer_otel_llm_latency(self):
+        from mobile_crawler.domain.latency_sketch import LatencySummary
+
+        stats = _make_stats()
+        stats.ai_response_times.add(100.0)
+        stats.record_latency("phase.decide", 2000.0)
+        assert stats.latency_summaries()["llm"].p50 == pytest.approx(100.0, rel=0.02)
+
+        stats.otel_latency = LatencySummary(count=1, mean=900.0, p50=900.0, p95=900.0, p99=900.0, max=900.0)
+        summaries = stats.latency_summaries()
+        assert summaries["llm"].p50 == 900.0
+        assert summaries["phase.decide"].count == 1
+
     def test_screens_per_minute_zero_when_no_screens(self):
         stats = _make_stats()
         assert stats.screens_per_minute() == 0.0
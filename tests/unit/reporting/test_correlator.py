@@ -58,3 +58,48 @@ def test_correlator_time_window_matching():
     assert report.timeline[0].network_requests[0].url == "url1"
     assert len(report.timeline[1].network_requests) == 1
     assert report.timeline[1].network_requests[0].url == "url2"
+
+def test_correlator_step_and_host_aggregates():
+    correlator = RunCorrelator(MockPcapParser(), MockMobSFParser())
+
+    def req(minute, second, host, size):
+        return NetworkRequest(datetime(2026, 1, 1, 10, minute, second), "GET", f"https://{host}", host, "TLS",
+                              size_bytes=size)
+
+    requests = [
+        req(4, 0, "b.example", 300),
+        req(0, 30, "early.example", 50),  # before the first step
+        req(1, 0, "a.example", 100),      # exactly at step 1 start
+        req(1, 30, "a.example", 200),
+        req(3, 0, "a.example", 10),       # exactly at step 2 start
+    ]
+    correlator.pcap_parser.parse = lambda path: list(requests)
+
+    run_data = {
+        'start_time': datetime(2026, 1, 1, 10, 0, 0),
+        'end_time': datetime(2026, 1, 1, 10, 5, 0),
+        'steps': [
+            {'timestamp': datetime(2026, 1, 1, 10, 1, 0), 'action': 'c1'},
+            {'timestamp': datetime(2026, 1, 1, 10, 3, 0), 'action': 'c2'},
+        ]
+    }
+
+    report = correlator.correlate("run1", run_data, pcap_path="dummy.pcap")
+
+    step1, step2 = report.timeline
+    assert [r.size_bytes for r in step1.network_requests] == [100, 200]
+    assert (step1.request_count, step1.total_bytes, step1.new_hosts) == (2, 300, ["a.example"])
+    assert (step2.request_count, step2.total_bytes, step2.new_hosts) == (2, 310, ["b.example"])
+
+    hosts = {h.host: h for h in report.host_summary}
+    assert report.host_summary[0].host == "a.example"
+    assert (hosts["a.example"].request_count, hosts["a.example"].total_bytes) == (3, 310)
+    assert hosts["a.example"].first_seen_step == 1
+    assert hosts["b.example"].first_seen_step == 2
+    assert hosts["early.example"].first_seen_step is None
+    assert report.network_summary == {
+        "total_requests": 5,
+        "distinct_hosts": 3,
+        "total_bytes": 660,
+        "unattributed_requests": 1,
+    }
@@ -1,7 +1,7 @@
 import os
 from datetime import datetime
 
-from mobile_crawler.reporting.contracts import RunReportData, RunSummary
+from mobile_crawler.reporting.contracts import HostAggregate, RunReportData, RunSummary
 from mobile_crawler.reporting.generator import JinjaReportGenerator
 
 
@@ -35,3 +35,29 @@ def test_generator_creates_files(tmp_path):
     with open(output_json) as f:
         json_data = f.read()
         assert '"run_id": "test_run"' in json_data
+
+
+def test_generator_renders_host_summary(tmp_path):
+    output_html = tmp_path / "report.html"
+    data = RunReportData(
+        run_id="test_run",
+        summary=RunSummary(
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            duration_seconds=10.0,
+            status="COMPLETED",
+            app_package="com.test",
+            device_id="dev123",
+            total_steps=0
+        ),
+        timeline=[],
+        security_analysis=None,
+        network_summary={"total_requests": 3, "distinct_hosts": 1, "total_bytes": 2048},
+        host_summary=[HostAggregate(host="api.example.com", request_count=3, total_bytes=2048, first_seen_step=2)]
+    )
+
+    JinjaReportGenerator().generate(data, str(output_html))
+
+    html = output_html.read_text(encoding="utf-8")
+    assert "api.example.com" in html
+    assert "2.0 kB" in html
@@ -0,0 +1,272 @@
+"""Tests for the mmap-based streaming pcap/pcapng parser."""
+
+import socket
+import struct
+import tracemalloc
+
+import dpkt
+import pytest
+
+from mobile_crawler.reporting.parsers.pcap_parser import (
+    LINKTYPE_ETHERNET,
+    LINKTYPE_LINUX_SLL,
+    LINKTYPE_LINUX_SLL2,
+    LINKTYPE_RAW,
+    StreamingPcapParser,
+    _client_hello_sni,
+)
+
+CLIENT = "10.0.0.2"
+SERVER = "93.184.216.34"
+RESOLVER = "10.0.0.1"
+
+
+def _ipv4(src, dst, proto, payload):
+    header = struct.pack(
+        ">BBHHHBBH4s4s", 0x45, 0, 20 + len(payload), 0, 0, 64, proto, 0,
+        socket.inet_aton(src), socket.inet_aton(dst),
+    )
+    return header + payload
+
+
+def _ipv6(src, dst, proto, payload):
+    header = struct.pack(">IHBB", 6 << 28, len(payload), proto, 64)
+    return header + socket.inet_pton(socket.AF_INET6, src) + socket.inet_pton(socket.AF_INET6, dst) + payload
+
+
+def _tcp(sport, dport, payload=b""):
+    return struct.pack(">HHIIBBHHH", sport, dport, 1, 0, 5 << 4, 0x18, 65535, 0, 0) + payload
+
+
+def _udp(sport, dport, payload):
+    return struct.pack(">HHHH", sport, dport, 8 + len(payload), 0) + payload
+
+
+def _ethernet(ip_packet, ethertype=0x0800, vlan=False):
+    header = b"\x00" * 12
+    if vlan:
+        header += struct.pack(">HH", 0x8100, 7)
+    return header + struct.pack(">H", ethertype) + ip_packet
+
+
+def _sll(ip_packet, ethertype=0x0800):
+    return struct.pack(">HHH8sH", 0, 1, 6, b"\x00" * 8, ethertype) + ip_packet
+
+
+def _sll2(ip_packet, ethertype=0x0800):
+    return struct.pack(">HHIHBB8s", ethertype, 0, 3, 1, 0, 6, b"\x00" * 8) + ip_packet
+
+
+def _client_hello(sni=None):
+    extensions = b""
+    if sni is not None:
+        name = sni.encode()
+        server_name = struct.pack(">BH", 0, len(name)) + name
+        server_name_list = struct.pack(">H", len(server_name)) + server_name
+        extensions += struct.pack(">HH", 0, len(server_name_list)) + server_name_list
+    # Padding extension, so SNI is not the only extension
+    extensions = struct.pack(">HH", 21, 4) + b"\x00" * 4 + extensions
+    body = (
+        b"\x03\x03" + b"\x11" * 32
+        + b"\x00"
+        + struct.pack(">H", 4) + b"\x13\x01\x13\x02"
+        + b"\x01\x00"
+        + struct.pack(">H", len(extensions)) + extensions
+    )
+    handshake = b"\x01" + len(body).to_bytes(3, "big") + body
+    return b"\x16\x03\x01" + struct.pack(">H", len(handshake)) + handshake
+
+
+def _dns_query(name, txid=0x1234):
+    query = dpkt.dns.DNS(id=txid, qd=[dpkt.dns.DNS.Q(name=name, type=dpkt.dns.DNS_A)])
+    return bytes(query)
+
+
+def _dns_response(name, addresses, txid=0x1234):
+    response = dpkt.dns.DNS(id=txid, qd=[dpkt.dns.DNS.Q(name=name, type=dpkt.dns.DNS_A)])
+    response.qr = dpkt.dns.DNS_R
+    response.an = [
+        dpkt.dns.DNS.RR(name=name, type=dpkt.dns.DNS_A, ttl=60, rdata=socket.inet_aton(address))
+        for address in addresses
+    ]
+    return bytes(response)
+
+
+def _write_pcap(path, packets, linktype=LINKTYPE_ETHERNET, nanoseconds=False):
+    magic = 0xA1B23C4D if nanoseconds else 0xA1B2C3D4
+    with open(path, "wb") as f:
+        f.write(struct.pack("<IHHiIII", magic, 2, 4, 0, 0, 65535, linktype))
+        for ts, data in packets:
+            seconds = int(ts)
+            fraction = round((ts - seconds) * (1e9 if nanoseconds else 1e6))
+            f.write(struct.pack("<IIII", seconds, fraction, len(data), len(data)))
+            f.write(data)
+    return str(path)
+
+
+def _pcapng_block(block_type, body):
+    padded = body + b"\x00" * (-len(body) % 4)
+    length = 12 + len(padded)
+    return struct.pack("<II", block_type, length) + padded + struct.pack("<I", length)
+
+
+def _write_pcapng(path, packets, linktype=LINKTYPE_ETHERNET, tsresol=None):
+    shb = _pcapng_block(0x0A0D0D0A, struct.pack("<IHHq", 0x1A2B3C4D, 1, 0, -1))
+    options = b""
+    if tsresol is not None:
+        options = struct.pack("<HHB3x", 9, 1, tsresol) + struct.pack("<HH", 0, 0)
+    idb = _pcapng_block(1, struct.pack("<HHI", linktype, 0, 65535) + options)
+    units = 10 ** (tsresol if tsresol is not None else 6)
+    with open(path, "wb") as f:
+        f.write(shb + idb)
+        for ts, data in packets:
+            ticks = round(ts * units)
+            epb = struct.pack("<IIIII", 0, ticks >> 32, ticks & 0xFFFFFFFF, len(data), len(data)) + data
+            f.write(_pcapng_block(6, epb))
+    return str(path)
+
+
+def _http_request(host=SERVER, path="/index.html"):
+    return f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: */*\r\n\r\n".encode()
+
+
+def test_missing_and_empty_files(tmp_path):
+    parser = StreamingPcapParser()
+    assert parser.parse(str(tmp_path / "missing.pcap")) == []
+
+    empty = tmp_path / "empty.pcap"
+    empty.write_bytes(b"")
+    assert parser.parse(str(empty)) == []
+
+
+def test_http_and_tls_sni_over_ethernet(tmp_path):
+    packets = [
+        (1000.5, _ethernet(_ipv4(CLIENT, SERVER, 6, _tcp(40000, 80, _http_request("example.com"))))),
+        (1001.0, _ethernet(_ipv4(CLIENT, SERVER, 6, _tcp(40001, 443, _client_hello("api.example.com")))), ),
+        (1002.0, _ethernet(_ipv4(CLIENT, SERVER, 6, _tcp(40001, 443, b""))), ),
+    ]
+    requests = StreamingPcapParser().parse(_write_pcap(tmp_path / "c.pcap", packets))
+
+    assert [r.protocol for r in requests] == ["HTTP/1.1", "TLS"]
+    http, tls = requests
+    assert http.method == "GET"
+    assert http.url == "http://example.com/index.html"
+    assert http.timestamp.timestamp() == pytest.approx(1000.5)
+    assert http.size_bytes == len(_http_request("example.com"))
+    assert tls.host == "api.example.com"
+    assert tls.url == "https://api.example.com"
+    assert (tls.dst_ip, tls.dst_port) == (SERVER, 443)
+    assert tls.size_bytes == len(_client_hello("api.example.com"))
+
+
+@pytest.mark.parametrize(
+    "linktype, frame",
+    [
+        (LINKTYPE_RAW, lambda ip: ip),
+        (LINKTYPE_LINUX_SLL, _sll),
+        (LINKTYPE_LINUX_SLL2, _sll2),
+        (LINKTYPE_ETHERNET, lambda ip: _ethernet(ip, vlan=True)),
+    ],
+)
+def test_link_types(tmp_path, linktype, frame):
+    packets = [(5.0, frame(_ipv4(CLIENT, SERVER, 6, _tcp(40000, 443, _client_hello("cooked.example")))))]
+    requests = StreamingPcapParser().parse(_write_pcap(tmp_path / "c.pcap", packets, linktype=linktype))
+
+    assert [r.host for r in requests] == ["cooked.example"]
+
+
+def test_ipv6_raw_capture(tmp_path):
+    ip = _ipv6("2001:db8::2", "2001:db8::1", 6, _tcp(40000, 443, _client_hello("v6.example")))
+    requests = StreamingPcapParser().parse(_write_pcap(tmp_path / "c.pcap", [(1.0, ip)], linktype=LINKTYPE_RAW))
+
+    assert len(requests) == 1
+    assert requests[0].host == "v6.example"
+    assert requests[0].dst_ip == "2001:db8::1"
+
+
+def test_pcapng_with_nanosecond_resolution(tmp_path):
+    packets = [
+        (1700000000.123456789, _ipv4(CLIENT, SERVER, 6, _tcp(40000, 80, _http_request("ng.example")))),
+    ]
+    path = _write_pcapng(tmp_path / "c.pcapng", packets, linktype=LINKTYPE_RAW, tsresol=9)
+    requests = StreamingPcapParser().parse(path)
+
+    assert len(requests) == 1
+    assert requests[0].url == "http://ng.example/index.html"
+    assert requests[0].timestamp.timestamp() == pytest.approx(1700000000.123457, abs=1e-5)
+
+
+def test_nanosecond_pcap_timestamps(tmp_path):
+    packets = [(42.25, _ipv4(CLIENT, SERVER, 6, _tcp(40000, 80, _http_request())))]
+    path = _write_pcap(tmp_path / "c.pcap", packets, linktype=LINKTYPE_RAW, nanoseconds=True)
+
+    assert StreamingPcapParser().parse(path)[0].timestamp.timestamp() == pytest.approx(42.25)
+
+
+def test_client_hello_split_across_segments(tmp_path):
+    hello = _client_hello("split.example")
+    packets = [
+        (1.0, _ipv4(CLIENT, SERVER, 6, _tcp(40000, 443, hello[:20]))),
+        (1.1, _ipv4(CLIENT, SERVER, 6, _tcp(40000, 443, hello[20:]))),
+    ]
+    requests = StreamingPcapParser().parse(_write_pcap(tmp_path / "c.pcap", packets, linktype=LINKTYPE_RAW))
+
+    assert [r.host for r in requests] == ["split.example"]
+    assert requests[0].timestamp.timestamp() == pytest.approx(1.0)
+
+
+def test_dns_pairs_and_sni_fallback(tmp_path):
+    packets = [
+        (1.0, _ipv4(CLIENT, RESOLVER, 17, _udp(5353, 53, _dns_query("cdn.example")))),
+        (1.2, _ipv4(RESOLVER, CLIENT, 17, _udp(53, 5353, _dns_response("cdn.example", [SERVER])))),
+        # ClientHello without SNI to the resolved address
+        (1.3, _ipv4(CLIENT, SERVER, 6, _tcp(40000, 443, _client_hello()))),
+        # Query that is never answered
+        (1.4, _ipv4(CLIENT, RESOLVER, 17, _udp(5354, 53, _dns_query("lost.example", txid=7)))),
+    ]
+    requests = StreamingPcapParser().parse(_write_pcap(tmp_path / "c.pcap", packets, linktype=LINKTYPE_RAW))
+
+    dns_answered, tls, dns_lost = requests
+    assert dns_answered.protocol == "DNS"
+    assert dns_answered.url == "dns://cdn.example"
+    assert dns_answered.answers == [SERVER]
+    assert dns_answered.timestamp.timestamp() == pytest.approx(1.0)
+    assert tls.host == "cdn.example"
+    assert dns_lost.host == "lost.example"
+    assert dns_lost.answers == []
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    packets = [(1.0, _ipv4(CLIENT, SERVER, 6, _tcp(40000, 80, _http_request())))] * 2
+    path = tmp_path / "c.pcap"
+    _write_pcap(path, packets, linktype=LINKTYPE_RAW)
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+
+    assert len(StreamingPcapParser().parse(str(path))) == 1
+
+
+def test_client_hello_sni_incomplete():
+    hello = _client_hello("partial.example")
+
+    assert _client_hello_sni(hello[:30]) == (False, None)
+    assert _client_hello_sni(hello) == (True, "partial.example")
+    assert _client_hello_sni(_client_hello()) == (True, None)
+
+
+def test_no_request_cap_and_bounded_memory(tmp_path):
+    hello = _ipv4(CLIENT, SERVER, 6, _tcp(40000, 443, _client_hello("many.example")))
+    filler = _ipv4(SERVER, CLIENT, 6, _tcp(443, 40000, b"\x17\x03\x03" + b"\x00" * 1200))
+    packets = []
+    for i in range(5000):
+        packets.append((float(i), hello))
+        packets.extend([(float(i), filler)] * 3)
+    path = _write_pcap(tmp_path / "big.pcap", packets, linktype=LINKTYPE_RAW)
+
+    tracemalloc.start()
+    count = sum(1 for _ in StreamingPcapParser().iter_requests(path))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert count == 5000
+    assert peak < 2 * 1024 * 1024